@@ -0,0 +1,199 @@
+# coding: utf-8
+#------------------------------------------------------------------------------------------#
+# This file is part of Pyccel which is released under MIT License. See the LICENSE file or #
+# go to https://github.com/pyccel/pyccel/blob/master/LICENSE for full license details.     #
+#------------------------------------------------------------------------------------------#
+
+"""
+Micro-benchmark of the overhead of a call to a function accelerated by
+pyccel, i.e. of the C wrapper which collects the python arguments, checks
+their types, calls the translated function and builds the python result.
+The functions of this file do (almost) no work, so the time of a call is the
+overhead of the wrapper. The time of a call to the CPython function is given
+as a reference.
+
+Usage:
+
+    python benchmarks/call_overhead.py [--language fortran c]
+                                       [--output call_overhead.json]
+                                       [--compare previous.json]
+"""
+
+import argparse
+import io
+import sys
+import tempfile
+import timeit
+import warnings
+from collections import namedtuple
+from contextlib import redirect_stdout
+
+import numpy as np
+
+from pyccel.decorators import types
+from pyccel.epyccel import epyccel
+
+from results import save_results, load_results, compare_results, print_comparison
+
+metrics = ['time']
+
+#==============================================================================
+# Functions
+#==============================================================================
+def no_args():
+    return 0
+
+@types('int')
+def int_arg(n):
+    return n + 1
+
+@types('real', 'real', 'real')
+def real_args(x, y, z):
+    return x + y + z
+
+@types('int', 'real', 'bool', 'complex')
+def mixed_args(n, x, b, z):
+    if b:
+        return n + x + z
+    return z
+
+@types('real', 'real', 'int')
+def default_args(x, y = 1.0, n = 2):
+    return x + y + n
+
+@types('real[:]')
+def array_arg(x):
+    return x[0]
+
+@types('real[:,:]', 'real[:,:]')
+def array_args(x, y):
+    return x[0, 0] + y[0, 0]
+
+@types('int')
+@types('real')
+def overloaded(x):
+    return x
+
+#==============================================================================
+Case = namedtuple('Case', ['name', 'function', 'args', 'kwargs'])
+Case.__doc__ = """
+Description of a call measured by the benchmark
+
+Parameters
+----------
+name : str
+    The name of the case
+
+function : function
+    The python function which is accelerated by pyccel
+
+args : tuple
+    The positional arguments of the call
+
+kwargs : dict
+    The keyword arguments of the call
+"""
+
+catalog = [
+    Case('no_args',      no_args,      (),                       {}),
+    Case('int_arg',      int_arg,      (1,),                     {}),
+    Case('real_args',    real_args,    (1.0, 2.0, 3.0),          {}),
+    Case('mixed_args',   mixed_args,   (1, 2.0, True, 1+2j),     {}),
+    Case('keywords',     real_args,    (),                       {'x' : 1.0, 'y' : 2.0, 'z' : 3.0}),
+    Case('default_args', default_args, (1.0,),                   {}),
+    Case('array_arg',    array_arg,    (np.ones(4),),            {}),
+    Case('array_args',   array_args,   (np.ones((2, 2)), np.ones((2, 2))[::-1]), {}),
+    Case('overloaded',   overloaded,   (1.5,),                   {}),
+]
+
+#==============================================================================
+def measure(func, args, kwargs, repeat = 7):
+    """
+    Returns the smallest time (in seconds) of a call to func(*args, **kwargs).
+    Each measure calls the function enough times to last at least 0.2s.
+    The call is written out in the statement which is timed, so that the
+    time does not include the unpacking of args and kwargs.
+    """
+    namespace = {'func' : func}
+    call_args = []
+    for i, a in enumerate(args):
+        namespace['a{}'.format(i)] = a
+        call_args.append('a{}'.format(i))
+    for k, a in kwargs.items():
+        namespace['k_{}'.format(k)] = a
+        call_args.append('{0}=k_{0}'.format(k))
+    timer = timeit.Timer('func({})'.format(', '.join(call_args)), globals = namespace)
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat, number)) / number
+
+def run_benchmark(cases, languages, repeat, folder):
+    """
+    Accelerate each function for each language and measure the time of a call
+    """
+    results = []
+    for case in cases:
+        python_time = measure(case.function, case.args, case.kwargs, repeat)
+        for language in languages:
+            result = {'case'     : case.name,
+                      'language' : language}
+            name = '{} {}'.format(case.name, language)
+            try:
+                with redirect_stdout(io.StringIO()), warnings.catch_warnings():
+                    warnings.simplefilter('ignore')
+                    func = epyccel(case.function, language = language, folder = folder)
+                result['time']        = measure(func, case.args, case.kwargs, repeat)
+                result['python_time'] = python_time
+            except Exception as e: # pylint: disable=broad-except
+                result['error'] = '{}: {}'.format(type(e).__name__, e)
+                print('{:<24} failed ({})'.format(name, result['error']))
+            else:
+                print('{:<24} {:>10.1f} {:>10.1f}'.format(name, result['time'] * 1e9,
+                            python_time * 1e9))
+            results.append(result)
+    return results
+
+#==============================================================================
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark of the overhead of a call to '
+                                                 'a function accelerated by pyccel')
+    parser.add_argument('--language', nargs='+', default=['fortran', 'c'], choices=('fortran', 'c'),
+                        help='languages which are benchmarked')
+    parser.add_argument('--cases', nargs='+', default=None,
+                        help='names of the cases which are benchmarked (default: all)')
+    parser.add_argument('--repeat', type=int, default=7,
+                        help='number of measures of each call')
+    parser.add_argument('--output', type=str, default='call_overhead.json',
+                        help='JSON file where the results are stored')
+    parser.add_argument('--compare', type=str, default=None,
+                        help='JSON file containing the results of a previous run')
+    parser.add_argument('--threshold', type=float, default=1.2,
+                        help='ratio above which a slower call is reported as a regression')
+    args = parser.parse_args()
+
+    cases = catalog
+    if args.cases:
+        names = [c.name for c in catalog]
+        unknown = [c for c in args.cases if c not in names]
+        if unknown:
+            parser.error('unknown cases: {}'.format(', '.join(unknown)))
+        cases = [c for c in catalog if c.name in args.cases]
+
+    # The reference is read before the results are saved, as it may be the same file
+    reference = load_results(args.compare)['results'] if args.compare else None
+
+    print('{:<24} {:>10} {:>10}'.format('Case', 'Time (ns)', 'Python (ns)'))
+    with tempfile.TemporaryDirectory() as folder:
+        results = run_benchmark(cases, args.language, args.repeat, folder)
+
+    save_results(args.output, 'call_overhead', results)
+    print('Results saved in {}'.format(args.output))
+
+    if reference is not None:
+        comparison = compare_results(results, reference, metrics, args.threshold)
+        print()
+        print_comparison(comparison)
+        if any(c[-1] for c in comparison):
+            sys.exit(1)
+
+if __name__ == '__main__':
+    main()
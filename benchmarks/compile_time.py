@@ -0,0 +1,190 @@
+# coding: utf-8
+#------------------------------------------------------------------------------------------#
+# This file is part of Pyccel which is released under MIT License. See the LICENSE file or #
+# go to https://github.com/pyccel/pyccel/blob/master/LICENSE for full license details.     #
+#------------------------------------------------------------------------------------------#
+
+"""
+Benchmark of the time spent by pyccel to translate and compile a corpus of
+files: the modules used by the epyccel tests, samples/mxm.py and large
+synthetic modules (many functions, deeply nested expressions, many template
+instantiations).
+
+The time spent in the syntactic, semantic, code generation and compilation
+stages is measured for each file and each language. Each file is translated
+once before the measures, so that the lazy imports and the runtime libraries
+of pyccel are not included. The smallest time of all the runs is kept.
+
+Usage:
+
+    python benchmarks/compile_time.py [--language fortran c] [--repeat 3]
+                                      [--output compile_time.json]
+                                      [--compare previous.json]
+"""
+
+import argparse
+import glob
+import io
+import os
+import sys
+import tempfile
+import time
+import warnings
+from collections import OrderedDict
+from contextlib import redirect_stdout
+
+from pyccel.codegen.pipeline import execute_pyccel
+from pyccel.codegen.timings  import Timings
+
+from results   import save_results, load_results, compare_results, print_comparison
+from synthetic import many_functions, nested_expressions, many_templates
+
+base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Stages of pyccel reported in each category
+categories = OrderedDict([
+    ('syntax'   , ('syntax',)),
+    ('semantic' , ('semantic', 'interface')),
+    ('codegen'  , ('codegen', 'bind_c', 'wrapper')),
+    ('compile'  , ('compile', 'wrapper compilation', 'link', 'setuptools build')),
+])
+
+metrics = [*categories, 'total']
+
+# Modules of tests/epyccel/modules which cannot be translated as a whole,
+# because the tests only accelerate some of their functions
+excluded_modules = ('__init__', 'arrays', 'tuples', 'openmp')
+
+#==============================================================================
+def get_cases(quick = False):
+    """
+    Returns the files of the corpus. Each file is described by its name, its
+    source code and the options passed to execute_pyccel.
+
+    Parameters
+    ----------
+    quick : bool
+        Use smaller synthetic modules
+    """
+    cases = OrderedDict()
+
+    modules = sorted(glob.glob(os.path.join(base_dir, 'tests', 'epyccel', 'modules', '*.py')))
+    for filename in modules:
+        name = os.path.splitext(os.path.basename(filename))[0]
+        if name in excluded_modules or name.startswith('mpi_'):
+            continue
+        with open(filename) as f:
+            cases[name] = (f.read(), {})
+
+    with open(os.path.join(base_dir, 'samples', 'mxm.py')) as f:
+        cases['mxm'] = (f.read(), {})
+
+    # The time of the semantic stage grows exponentially with the depth
+    # of the expressions, so the depth is kept small
+    scale = 10 if quick else 1
+    cases['synthetic_functions'] = (many_functions(2000 // scale), {})
+    cases['synthetic_nested']    = (nested_expressions(15 if quick else 25), {})
+    cases['synthetic_templates'] = (many_templates(300 // scale), {})
+
+    return cases
+
+#==============================================================================
+def run_case(name, code, language, options, convert_only = False):
+    """
+    Translate (and compile) a file in a temporary folder and return the time
+    spent in each category of stages.
+    """
+    with tempfile.TemporaryDirectory() as folder:
+        filename = os.path.join(folder, 'bench_{}.py'.format(name))
+        with open(filename, 'w') as f:
+            f.write(code)
+
+        timings = Timings(trace_memory = False)
+        base_dirpath = os.getcwd()
+        start = time.perf_counter()
+        try:
+            with timings.record(), redirect_stdout(io.StringIO()), warnings.catch_warnings():
+                warnings.simplefilter('ignore')
+                execute_pyccel(filename,
+                               language     = language,
+                               convert_only = convert_only,
+                               **options)
+        finally:
+            # pyccel does not always go back to the starting folder after an error
+            os.chdir(base_dirpath)
+        total = time.perf_counter() - start
+
+    result = {c : sum(r['time'] for r in timings.records if r['stage'] in stages)
+                for c, stages in categories.items()}
+    result['total'] = total
+    return result
+
+def run_benchmark(cases, languages, repeat, convert_only = False):
+    """
+    Measure each file of the corpus for each language. The smallest time
+    of all the runs is kept for each category.
+    """
+    results = []
+    for name, (code, options) in cases.items():
+        for language in languages:
+            result = {'case' : name, 'language' : language}
+            try:
+                # The first run imports and builds everything pyccel needs
+                run_case(name, code, language, options, convert_only)
+                runs = [run_case(name, code, language, options, convert_only) for _ in range(repeat)]
+            except Exception as e: # pylint: disable=broad-except
+                result['error'] = '{}: {}'.format(type(e).__name__, e)
+                print('{:<30} {:<8} failed ({})'.format(name, language, result['error']))
+            else:
+                result.update((m, min(r[m] for r in runs)) for m in metrics)
+                print('{:<30} {:<8} '.format(name, language) + \
+                        ' '.join('{:>9.3f}'.format(result[m]) for m in metrics))
+            results.append(result)
+    return results
+
+#==============================================================================
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark of the time spent in each stage of pyccel')
+    parser.add_argument('--language', nargs='+', default=['fortran', 'c'], choices=('fortran', 'c'),
+                        help='languages which are benchmarked')
+    parser.add_argument('--repeat', type=int, default=3,
+                        help='number of measured runs of each file')
+    parser.add_argument('--cases', nargs='+', default=None,
+                        help='names of the files of the corpus which are benchmarked (default: all)')
+    parser.add_argument('--quick', action='store_true',
+                        help='uses smaller synthetic modules')
+    parser.add_argument('--convert-only', action='store_true',
+                        help='stops after the code generation (the compiler is not called)')
+    parser.add_argument('--output', type=str, default='compile_time.json',
+                        help='JSON file where the results are stored')
+    parser.add_argument('--compare', type=str, default=None,
+                        help='JSON file containing the results of a previous run')
+    parser.add_argument('--threshold', type=float, default=1.2,
+                        help='ratio above which a slower stage is reported as a regression')
+    args = parser.parse_args()
+
+    cases = get_cases(args.quick)
+    if args.cases:
+        unknown = [c for c in args.cases if c not in cases]
+        if unknown:
+            parser.error('unknown cases: {}'.format(', '.join(unknown)))
+        cases = OrderedDict((c, cases[c]) for c in args.cases)
+
+    print('{:<30} {:<8} '.format('Case', 'Language') + ' '.join('{:>9}'.format(m) for m in metrics))
+    results = run_benchmark(cases, args.language, args.repeat, args.convert_only)
+
+    # The reference is read before the results are saved, as it may be the same file
+    reference = load_results(args.compare)['results'] if args.compare else None
+
+    save_results(args.output, 'compile_time', results)
+    print('Results saved in {}'.format(args.output))
+
+    if reference is not None:
+        comparison = compare_results(results, reference, metrics, args.threshold)
+        print()
+        print_comparison(comparison)
+        if any(c[-1] for c in comparison):
+            sys.exit(1)
+
+if __name__ == '__main__':
+    main()
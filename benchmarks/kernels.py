@@ -0,0 +1,248 @@
+# coding: utf-8
+#------------------------------------------------------------------------------------------#
+# This file is part of Pyccel which is released under MIT License. See the LICENSE file or #
+# go to https://github.com/pyccel/pyccel/blob/master/LICENSE for full license details.     #
+#------------------------------------------------------------------------------------------#
+# pylint: disable=missing-function-docstring
+
+"""
+Kernels used by the runtime benchmark. Each kernel is written in the subset of
+python accepted by pyccel (it is also run by CPython as a baseline) and comes
+with an equivalent NumPy implementation.
+"""
+
+from collections import namedtuple
+
+import numpy as np
+
+from pyccel.decorators import types, vectorize
+
+__all__ = ['Kernel', 'catalog']
+
+#==============================================================================
+# Kernels accelerated by pyccel
+#==============================================================================
+@types('real[:,:]', 'real[:,:]', 'real[:,:]')
+def mxm(a, b, c):
+    n = a.shape[0]
+    m = a.shape[1]
+    p = b.shape[1]
+    for i in range(n):
+        for j in range(p):
+            s = 0.0
+            for k in range(m):
+                s = s + a[i,k] * b[k,j]
+            c[i,j] = s
+
+@types('real[:,:]', 'real[:,:]', 'real[:,:]')
+def mxm_openmp(a, b, c):
+    n = a.shape[0]
+    m = a.shape[1]
+    p = b.shape[1]
+    #$ omp parallel
+    #$ omp for schedule(static) private(j, k, s)
+    for i in range(n):
+        for j in range(p):
+            s = 0.0
+            for k in range(m):
+                s = s + a[i,k] * b[k,j]
+            c[i,j] = s
+    #$ omp end for
+    #$ omp end parallel
+
+@types('real[:,:]', 'real[:,:]')
+def laplace(u, v):
+    n = u.shape[0]
+    m = u.shape[1]
+    for i in range(1, n-1):
+        for j in range(1, m-1):
+            v[i,j] = u[i-1,j] + u[i+1,j] + u[i,j-1] + u[i,j+1] - 4.0 * u[i,j]
+
+@types('int')
+def laplace_local(n):
+    from numpy import zeros
+    u = zeros((n, n))
+    v = zeros((n, n))
+    for i in range(n):
+        for j in range(n):
+            u[i,j] = i * j + 0.5 * j * j
+    for i in range(1, n-1):
+        for j in range(1, n-1):
+            v[i,j] = u[i-1,j] + u[i+1,j] + u[i,j-1] + u[i,j+1] - 4.0 * u[i,j]
+    s = 0.0
+    for i in range(n):
+        for j in range(n):
+            s = s + v[i,j] * v[i,j]
+    return s
+
+@types('int')
+def small_arrays(n):
+    from numpy import zeros
+    s = 0.0
+    for k in range(n):
+        a = zeros((2, 3))
+        for i in range(2):
+            for j in range(3):
+                a[i,j] = k + i - j
+        s = s + a[1,2] * a[0,1]
+    return s
+
+@types('int')
+def row_slices(n):
+    from numpy import zeros
+    u = zeros((n, 8))
+    s = 0.0
+    for k in range(n):
+        r = u[k, :]
+        r[k % 8] = 1.0
+        s = s + r[0]
+    return s
+
+@types('real[:]', 'real[:]')
+def dot(x, y):
+    s = 0.0
+    for i in range(x.shape[0]):
+        s = s + x[i] * y[i]
+    return s
+
+@types('real[:]', 'real[:]')
+def dot_openmp(x, y):
+    s = 0.0
+    #$ omp parallel
+    #$ omp for reduction(+:s)
+    for i in range(x.shape[0]):
+        s = s + x[i] * y[i]
+    #$ omp end for
+    #$ omp end parallel
+    return s
+
+@types('real[:]', 'real[:]', 'real[:]')
+def ufunc_chain(x, y, z):
+    from numpy import sqrt, exp
+    for i in range(x.shape[0]):
+        z[i] = sqrt(x[i] * x[i] + y[i] * y[i]) * exp(-x[i])
+
+@vectorize
+@types('real', 'real')
+def ufunc_vectorize(x, y):
+    from numpy import sqrt, exp
+    return sqrt(x * x + y * y) * exp(-x)
+
+@types('real[:]')
+def min_max(x):
+    lo = x[0]
+    hi = x[0]
+    for i in range(1, x.shape[0]):
+        if x[i] < lo:
+            lo = x[i]
+        if x[i] > hi:
+            hi = x[i]
+    return lo, hi
+
+@types('real', 'real')
+def axpy_scalar(x, y):
+    return 2.0 * x + y
+
+#==============================================================================
+# NumPy implementations
+#==============================================================================
+def mxm_numpy(a, b, c):
+    np.matmul(a, b, out=c)
+
+def laplace_numpy(u, v):
+    v[1:-1,1:-1] = u[:-2,1:-1] + u[2:,1:-1] + u[1:-1,:-2] + u[1:-1,2:] - 4.0 * u[1:-1,1:-1]
+
+def laplace_local_numpy(n):
+    i, j = np.indices((n, n), dtype=float)
+    u = i * j + 0.5 * j * j
+    v = np.zeros((n, n))
+    laplace_numpy(u, v)
+    return np.sum(v * v)
+
+def dot_numpy(x, y):
+    return np.dot(x, y)
+
+def ufunc_chain_numpy(x, y, z):
+    np.multiply(np.sqrt(x * x + y * y), np.exp(-x), out=z)
+
+def ufunc_vectorize_numpy(x, y):
+    return np.sqrt(x * x + y * y) * np.exp(-x)
+
+def min_max_numpy(x):
+    return x.min(), x.max()
+
+#==============================================================================
+# Arguments
+#==============================================================================
+def _matrices(n):
+    a = np.random.random((n, n))
+    b = np.random.random((n, n))
+    return a, b, np.zeros((n, n))
+
+def _grid(n):
+    return np.random.random((n, n)), np.zeros((n, n))
+
+def _size(n):
+    return (n,)
+
+def _vectors(n):
+    return np.random.random(n), np.random.random(n)
+
+def _vectors_out(n):
+    return np.random.random(n), np.random.random(n), np.zeros(n)
+
+def _vector(n):
+    return (np.random.random(n),)
+
+def _scalars(n): # pylint: disable=unused-argument
+    return 1.5, 2.5
+
+#==============================================================================
+Kernel = namedtuple('Kernel', ['name', 'function', 'numpy', 'arguments', 'work',
+                               'size', 'python_size', 'openmp'])
+Kernel.__doc__ = """
+Description of a kernel of the benchmark
+
+Parameters
+----------
+name : str
+    The name of the kernel
+
+function : function
+    The python function which is accelerated by pyccel
+
+numpy : function
+    The equivalent NumPy function, or None
+
+arguments : function
+    Function returning the arguments of the kernel for a given size
+
+work : function
+    Function returning the number of operations done by the kernel for a
+    given size, used to compute its throughput
+
+size : int
+    The size of the problem
+
+python_size : int
+    The (smaller) size of the problem used to run the kernel with CPython
+
+openmp : bool
+    True if the kernel contains OpenMP directives, in which case it is also
+    built with the openmp accelerator
+"""
+
+catalog = [
+    Kernel('mxm',           mxm,           mxm_numpy,           _matrices,    lambda n: 2*n**3,  200,   40,    False),
+    Kernel('mxm_openmp',    mxm_openmp,    mxm_numpy,           _matrices,    lambda n: 2*n**3,  200,   40,    True),
+    Kernel('laplace',       laplace,       laplace_numpy,       _grid,        lambda n: 5*n**2,  1000,  100,   False),
+    Kernel('laplace_local', laplace_local, laplace_local_numpy, _size,        lambda n: 10*n**2, 1000,  100,   False),
+    Kernel('small_arrays',  small_arrays,  None,                _size,        lambda n: 8*n,     10**6, 10**4, False),
+    Kernel('row_slices',    row_slices,    None,                _size,        lambda n: 2*n,     10**6, 10**4, False),
+    Kernel('dot',           dot,           dot_numpy,           _vectors,     lambda n: 2*n,     10**6, 10**4, False),
+    Kernel('dot_openmp',    dot_openmp,    dot_numpy,           _vectors,     lambda n: 2*n,     10**6, 10**4, True),
+    Kernel('ufunc_chain',   ufunc_chain,   ufunc_chain_numpy,   _vectors_out, lambda n: 6*n,     10**6, 10**4, False),
+    Kernel('ufunc_vectorize', ufunc_vectorize, ufunc_vectorize_numpy, _vectors, lambda n: 6*n,   10**6, 10**6, False),
+    Kernel('min_max',       min_max,       min_max_numpy,       _vector,      lambda n: 2*n,     10**6, 10**4, False),
+    Kernel('axpy_scalar',   axpy_scalar,   None,                _scalars,     lambda n: 2,       1,     1,     False),
+]
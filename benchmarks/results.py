@@ -0,0 +1,132 @@
+# coding: utf-8
+#------------------------------------------------------------------------------------------#
+# This file is part of Pyccel which is released under MIT License. See the LICENSE file or #
+# go to https://github.com/pyccel/pyccel/blob/master/LICENSE for full license details.     #
+#------------------------------------------------------------------------------------------#
+
+"""
+Functions used by the benchmarks to save their results as JSON, together
+with a description of the environment in which they were run, and to compare
+them with the results of a previous run (e.g. with an older version of pyccel).
+"""
+
+import datetime
+import json
+import os
+import platform
+import shutil
+import subprocess
+
+from pyccel.version import __version__
+
+__all__ = ['get_environment', 'save_results', 'load_results', 'compare_results',
+           'print_comparison']
+
+#==============================================================================
+def _compiler_version(compiler):
+    """ Returns the first line printed by `compiler --version`, or None if it is not available """
+    if shutil.which(compiler) is None:
+        return None
+    try:
+        output = subprocess.check_output([compiler, '--version'], stderr=subprocess.STDOUT,
+                                         universal_newlines=True)
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return output.splitlines()[0] if output else None
+
+def get_environment():
+    """ Returns a description of the machine and of the versions of the tools used by the benchmarks """
+    import numpy
+    return {'pyccel'    : __version__,
+            'python'    : platform.python_version(),
+            'numpy'     : numpy.__version__,
+            'platform'  : platform.platform(),
+            'machine'   : platform.machine(),
+            'processor' : platform.processor(),
+            'cpus'      : os.cpu_count(),
+            'omp_num_threads' : os.environ.get('OMP_NUM_THREADS', None),
+            'compilers' : {c : _compiler_version(c) for c in ('gfortran', 'gcc')},
+            'date'      : datetime.datetime.now().isoformat(timespec='seconds')}
+
+#==============================================================================
+def save_results(filename, benchmark, results):
+    """
+    Save the results of a benchmark in a JSON file
+
+    Parameters
+    ----------
+    filename : str
+        The JSON file
+
+    benchmark : str
+        The name of the benchmark (e.g. 'compile_time')
+
+    results : list of dict
+        The results. Each result must contain the keys 'case' and 'language'
+    """
+    with open(filename, 'w') as f:
+        json.dump({'benchmark'   : benchmark,
+                   'environment' : get_environment(),
+                   'results'     : results}, f, indent=1)
+
+def load_results(filename):
+    """ Load the results of a benchmark saved by save_results """
+    with open(filename, 'r') as f:
+        return json.load(f)
+
+#==============================================================================
+def _result_key(result):
+    """ Returns the key identifying a result in different runs of a benchmark """
+    return tuple((k, result[k]) for k in sorted(result) if isinstance(result[k], (str, bool)) \
+                    and k != 'error')
+
+def compare_results(results, reference, metrics, threshold = 1.2):
+    """
+    Compare the results of a benchmark with the results of a previous run.
+    The results are matched using all their str and bool fields (case,
+    language, accelerator, ...).
+
+    Parameters
+    ----------
+    results : list of dict
+        The new results
+
+    reference : list of dict
+        The results of the previous run
+
+    metrics : list of str
+        The fields which are compared (smaller is better)
+
+    threshold : float
+        A metric is reported as a regression if it is larger than its
+        reference value multiplied by this factor
+
+    Returns
+    -------
+    comparison : list of tuple
+        Each element contains the key of the result, the metric, the
+        reference value, the new value, their ratio and a boolean
+        indicating whether it is a regression
+    """
+    previous = {_result_key(r) : r for r in reference}
+    comparison = []
+    for r in results:
+        key = _result_key(r)
+        if key not in previous:
+            continue
+        for m in metrics:
+            old = previous[key].get(m, None)
+            new = r.get(m, None)
+            if not old or new is None:
+                continue
+            ratio = new / old
+            comparison.append((key, m, old, new, ratio, ratio > threshold))
+    return comparison
+
+def print_comparison(comparison):
+    """ Print the comparison returned by compare_results """
+    print('{:<50} {:<12} {:>12} {:>12} {:>8}'.format('Case', 'Metric', 'Reference', 'New', 'Ratio'))
+    for key, metric, old, new, ratio, regression in comparison:
+        name = ' '.join(str(v) for _, v in key)
+        print('{:<50} {:<12} {:>12.4g} {:>12.4g} {:>8.2f}{}'.format(name, metric, old, new, ratio,
+                            '  REGRESSION' if regression else ''))
@@ -0,0 +1,160 @@
+# coding: utf-8
+#------------------------------------------------------------------------------------------#
+# This file is part of Pyccel which is released under MIT License. See the LICENSE file or #
+# go to https://github.com/pyccel/pyccel/blob/master/LICENSE for full license details.     #
+#------------------------------------------------------------------------------------------#
+
+"""
+Benchmark of the code generated by pyccel. The kernels of kernels.py are
+accelerated with epyccel in Fortran and in C, with and without OpenMP (for the
+kernels which contain OpenMP directives), and compared with their NumPy
+implementation and with CPython.
+
+For each kernel the time of a call is split into the call overhead (the time
+of a call on a problem of size 1, which is mostly spent in the C wrapper) and
+the time spent in the kernel itself. The throughput of each implementation is
+the number of operations of the kernel divided by its time.
+
+Usage:
+
+    python benchmarks/runtime.py [--language fortran c] [--no-openmp]
+                                 [--output runtime.json]
+                                 [--compare previous.json]
+"""
+
+import argparse
+import io
+import sys
+import tempfile
+import timeit
+import warnings
+from contextlib import redirect_stdout
+
+from pyccel.epyccel import epyccel
+
+from kernels import catalog
+from results import save_results, load_results, compare_results, print_comparison
+
+metrics = ['time', 'overhead']
+
+#==============================================================================
+def measure(func, args, repeat = 5):
+    """
+    Returns the smallest time (in seconds) of a call to func(*args).
+    Each measure calls the function enough times to last at least 0.2s.
+    """
+    timer = timeit.Timer(lambda: func(*args))
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat, number)) / number
+
+def run_kernel(kernel, func, language, openmp, size, repeat):
+    """
+    Measure a kernel accelerated by pyccel and compare it with NumPy and CPython
+    """
+    result = {'kernel'   : kernel.name,
+              'language' : language,
+              'openmp'   : openmp,
+              'size'     : size}
+
+    args = kernel.arguments(size)
+    result['time']     = measure(func, args, repeat)
+    result['overhead'] = measure(func, kernel.arguments(1), repeat)
+    result['kernel_time'] = max(result['time'] - result['overhead'], 0.0)
+    result['throughput']  = kernel.work(size) / result['time']
+
+    if kernel.numpy is not None:
+        numpy_time = measure(kernel.numpy, args, repeat)
+        result['numpy_time']       = numpy_time
+        result['speedup_numpy']    = numpy_time / result['time']
+
+    python_size = min(kernel.python_size, size)
+    python_time = measure(kernel.function, kernel.arguments(python_size), repeat)
+    result['python_size']       = python_size
+    result['python_time']       = python_time
+    result['speedup_python']    = result['throughput'] * python_time / kernel.work(python_size)
+
+    return result
+
+def run_benchmark(kernels, languages, openmp, scale, repeat, folder):
+    """
+    Accelerate and measure each kernel for each language, with and
+    without OpenMP.
+    """
+    results = []
+    for kernel in kernels:
+        size = max(kernel.size // scale, 1)
+        for language in languages:
+            for accelerator in (None, 'openmp') if (kernel.openmp and openmp) else (None,):
+                result = {'kernel'   : kernel.name,
+                          'language' : language,
+                          'openmp'   : accelerator is not None}
+                name = '{} {}{}'.format(kernel.name, language, ' openmp' if accelerator else '')
+                try:
+                    with redirect_stdout(io.StringIO()), warnings.catch_warnings():
+                        warnings.simplefilter('ignore')
+                        func = epyccel(kernel.function,
+                                       language    = language,
+                                       accelerator = accelerator,
+                                       folder      = folder)
+                    result = run_kernel(kernel, func, language, accelerator is not None, size, repeat)
+                except Exception as e: # pylint: disable=broad-except
+                    result['error'] = '{}: {}'.format(type(e).__name__, e)
+                    print('{:<28} failed ({})'.format(name, result['error']))
+                else:
+                    print('{:<28} {:>10.3e} {:>10.3e} {:>10.3e} {:>10} {:>10.1f}'.format(name,
+                            result['time'], result['overhead'], result['throughput'],
+                            '{:.2f}'.format(result['speedup_numpy']) if 'speedup_numpy' in result else '-',
+                            result['speedup_python']))
+                results.append(result)
+    return results
+
+#==============================================================================
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark of the code generated by pyccel')
+    parser.add_argument('--language', nargs='+', default=['fortran', 'c'], choices=('fortran', 'c'),
+                        help='languages which are benchmarked')
+    parser.add_argument('--no-openmp', action='store_true',
+                        help='does not build the kernels with OpenMP')
+    parser.add_argument('--kernels', nargs='+', default=None,
+                        help='names of the kernels which are benchmarked (default: all)')
+    parser.add_argument('--quick', action='store_true',
+                        help='uses smaller problems')
+    parser.add_argument('--repeat', type=int, default=5,
+                        help='number of measures of each kernel')
+    parser.add_argument('--output', type=str, default='runtime.json',
+                        help='JSON file where the results are stored')
+    parser.add_argument('--compare', type=str, default=None,
+                        help='JSON file containing the results of a previous run')
+    parser.add_argument('--threshold', type=float, default=1.2,
+                        help='ratio above which a slower kernel is reported as a regression')
+    args = parser.parse_args()
+
+    kernels = catalog
+    if args.kernels:
+        names = [k.name for k in catalog]
+        unknown = [k for k in args.kernels if k not in names]
+        if unknown:
+            parser.error('unknown kernels: {}'.format(', '.join(unknown)))
+        kernels = [k for k in catalog if k.name in args.kernels]
+
+    # The reference is read before the results are saved, as it may be the same file
+    reference = load_results(args.compare)['results'] if args.compare else None
+
+    print('{:<28} {:>10} {:>10} {:>10} {:>10} {:>10}'.format('Kernel', 'Time (s)', 'Overhead',
+            'Ops/s', 'vs NumPy', 'vs Python'))
+    with tempfile.TemporaryDirectory() as folder:
+        results = run_benchmark(kernels, args.language, not args.no_openmp,
+                                10 if args.quick else 1, args.repeat, folder)
+
+    save_results(args.output, 'runtime', results)
+    print('Results saved in {}'.format(args.output))
+
+    if reference is not None:
+        comparison = compare_results(results, reference, metrics, args.threshold)
+        print()
+        print_comparison(comparison)
+        if any(c[-1] for c in comparison):
+            sys.exit(1)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,91 @@
+# coding: utf-8
+#------------------------------------------------------------------------------------------#
+# This file is part of Pyccel which is released under MIT License. See the LICENSE file or #
+# go to https://github.com/pyccel/pyccel/blob/master/LICENSE for full license details.     #
+#------------------------------------------------------------------------------------------#
+
+"""
+Generators of large synthetic modules, used to measure how the time spent in
+each stage of pyccel grows with the size of the translated code.
+"""
+
+__all__ = ['many_functions', 'nested_expressions', 'many_templates']
+
+#==============================================================================
+def many_functions(n):
+    """
+    Returns the code of a module containing n small functions. Each
+    function contains a loop and calls the previous function.
+
+    Parameters
+    ----------
+    n : int
+        The number of functions
+    """
+    lines = ['from pyccel.decorators import types', '']
+    for i in range(n):
+        lines += ["@types('int', 'real')",
+                  'def f_{}(n, x):'.format(i),
+                  '    s = 0.0',
+                  '    for i in range(n):',
+                  '        s = s + x * i - {}.0'.format(i)]
+        if i > 0:
+            lines.append('    s = s + f_{}(n, x)'.format(i-1))
+        lines += ['    return s', '']
+    return '\n'.join(lines)
+
+def _nested_expression(depth):
+    """ Returns an expression of the variables x and y containing depth nested parentheses """
+    operators = ('+', '*', '-', '/')
+    expr = 'x'
+    for i in range(depth):
+        op = operators[i % len(operators)]
+        constant = '{}.0'.format(i % 7 + 1)
+        if i % 3 == 0:
+            expr = '({} {} y)'.format(expr, op)
+        else:
+            expr = '({} {} {})'.format(expr, op, constant)
+    return expr
+
+def nested_expressions(depth, n = 10):
+    """
+    Returns the code of a module containing n functions, each of which
+    evaluates an arithmetic expression with depth nested parentheses.
+
+    Parameters
+    ----------
+    depth : int
+        The number of nested parentheses in each expression
+
+    n : int
+        The number of functions
+    """
+    lines = ['from pyccel.decorators import types', '']
+    for i in range(n):
+        lines += ["@types('real', 'real')",
+                  'def expr_{}(x, y):'.format(i),
+                  '    z = {} + {}.0'.format(_nested_expression(depth), i),
+                  '    return z',
+                  '']
+    return '\n'.join(lines)
+
+def many_templates(n):
+    """
+    Returns the code of a module containing n generic functions. Each
+    function uses two templates, so it is instantiated 6 times.
+
+    Parameters
+    ----------
+    n : int
+        The number of generic functions
+    """
+    lines = ['from pyccel.decorators import types, template', '']
+    for i in range(n):
+        lines += ["@template('T', types=['int', 'real', 'complex'])",
+                  "@template('R', types=['int', 'real'])",
+                  "@types('T', 'T', 'R')",
+                  'def gen_{}(x, y, z):'.format(i),
+                  '    w = x * y + z * {}'.format(i),
+                  '    return w',
+                  '']
+    return '\n'.join(lines)
@@ -0,0 +1,192 @@
+# coding: utf-8
+#------------------------------------------------------------------------------------------#
+# This file is part of Pyccel which is released under MIT License. See the LICENSE file or #
+# go to https://github.com/pyccel/pyccel/blob/master/LICENSE for full license details.     #
+#------------------------------------------------------------------------------------------#
+
+"""
+Benchmark of functions accelerated by pyccel called from several python
+threads (concurrent.futures.ThreadPoolExecutor). The wrapper releases the
+global interpreter lock while the translated function runs, so the calls
+of different threads run in parallel. The same number of calls is made with
+1, 2, 4, ... threads and the speedup compared with a single thread is
+reported for each kernel.
+
+Usage:
+
+    python benchmarks/threads.py [--language fortran c]
+                                 [--threads 1 2 4]
+                                 [--output threads.json]
+                                 [--compare previous.json]
+"""
+
+import argparse
+import io
+import os
+import sys
+import tempfile
+import time
+import warnings
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import redirect_stdout
+
+import numpy as np
+
+from pyccel.decorators import types, nogil
+from pyccel.epyccel import epyccel
+
+from results import save_results, load_results, compare_results, print_comparison
+
+#==============================================================================
+# Kernels
+#==============================================================================
+@nogil
+@types('int')
+def scalar_loop(n):
+    s = 0.0
+    for i in range(n):
+        s += 1.0 / (1.0 + i * i)
+    return s
+
+@types('real[:]')
+def array_sum(x):
+    s = 0.0
+    for i in range(x.shape[0]):
+        s += x[i] * x[i]
+    return s
+
+@types('real[:,:]', 'real[:,:]', 'real[:,:]')
+def stencil(x, y, c):
+    n, m = x.shape
+    for i in range(1, n - 1):
+        for j in range(1, m - 1):
+            y[i, j] = c[0, 0] * x[i, j] + c[0, 1] * (x[i - 1, j] + x[i + 1, j] + x[i, j - 1] + x[i, j + 1])
+
+#==============================================================================
+Kernel = namedtuple('Kernel', ['name', 'function', 'args'])
+Kernel.__doc__ = """
+Description of a kernel measured by the benchmark
+
+Parameters
+----------
+name : str
+    The name of the kernel
+
+function : function
+    The python function which is accelerated by pyccel
+
+args : function
+    A function returning the arguments of a call (each call gets its
+    own arguments so that the threads do not write to the same arrays)
+"""
+
+catalog = [
+    Kernel('scalar_loop', scalar_loop, lambda : (2000000,)),
+    Kernel('array_sum',   array_sum,   lambda : (np.random.random(2000000),)),
+    Kernel('stencil',     stencil,     lambda : (np.random.random((1000, 1000)), np.zeros((1000, 1000)),
+                                                 np.array([[0.5, 0.125]]))),
+]
+
+#==============================================================================
+def measure(func, calls, threads, repeat = 5):
+    """
+    Returns the smallest time (in seconds) of the calls to func made by a
+    pool of threads. calls is a list containing the arguments of each call
+    """
+    times = []
+    with ThreadPoolExecutor(threads) as executor:
+        for _ in range(repeat):
+            start = time.perf_counter()
+            futures = [executor.submit(func, *args) for args in calls]
+            for f in futures:
+                f.result()
+            times.append(time.perf_counter() - start)
+    return min(times)
+
+def run_benchmark(kernels, languages, threads, ncalls, repeat, folder):
+    """
+    Accelerate each kernel for each language and measure the time of ncalls
+    calls made by pools of threads of different sizes
+    """
+    results = []
+    for kernel in kernels:
+        calls = [kernel.args() for _ in range(ncalls)]
+        for language in languages:
+            result = {'case'     : kernel.name,
+                      'language' : language}
+            name = '{} {}'.format(kernel.name, language)
+            try:
+                with redirect_stdout(io.StringIO()), warnings.catch_warnings():
+                    warnings.simplefilter('ignore')
+                    func = epyccel(kernel.function, language = language, folder = folder)
+                for t in threads:
+                    result['time_{}'.format(t)] = measure(func, calls, t, repeat)
+            except Exception as e: # pylint: disable=broad-except
+                result['error'] = '{}: {}'.format(type(e).__name__, e)
+                print('{:<24} failed ({})'.format(name, result['error']))
+            else:
+                reference = result['time_{}'.format(threads[0])]
+                speedups = ['{:>8.2f}'.format(reference / result['time_{}'.format(t)]) for t in threads]
+                print('{:<24} {:>10.1f} {}'.format(name, reference * 1e3, ' '.join(speedups)))
+            results.append(result)
+    return results
+
+#==============================================================================
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark of functions accelerated by pyccel '
+                                                 'called from several python threads')
+    parser.add_argument('--language', nargs='+', default=['fortran', 'c'], choices=('fortran', 'c'),
+                        help='languages which are benchmarked')
+    parser.add_argument('--kernels', nargs='+', default=None,
+                        help='names of the kernels which are benchmarked (default: all)')
+    parser.add_argument('--threads', nargs='+', type=int, default=None,
+                        help='numbers of threads (default: powers of 2 up to the number of cpus)')
+    parser.add_argument('--calls', type=int, default=None,
+                        help='number of calls made by the threads (default: the largest number of threads times 4)')
+    parser.add_argument('--repeat', type=int, default=5,
+                        help='number of measures of each kernel')
+    parser.add_argument('--output', type=str, default='threads.json',
+                        help='JSON file where the results are stored')
+    parser.add_argument('--compare', type=str, default=None,
+                        help='JSON file containing the results of a previous run')
+    parser.add_argument('--threshold', type=float, default=1.2,
+                        help='ratio above which a slower kernel is reported as a regression')
+    args = parser.parse_args()
+
+    kernels = catalog
+    if args.kernels:
+        names = [k.name for k in catalog]
+        unknown = [k for k in args.kernels if k not in names]
+        if unknown:
+            parser.error('unknown kernels: {}'.format(', '.join(unknown)))
+        kernels = [k for k in catalog if k.name in args.kernels]
+
+    threads = args.threads
+    if threads is None:
+        threads = [1]
+        while threads[-1] * 2 <= (os.cpu_count() or 1):
+            threads.append(threads[-1] * 2)
+    ncalls = args.calls or 4 * max(threads)
+
+    # The reference is read before the results are saved, as it may be the same file
+    reference = load_results(args.compare)['results'] if args.compare else None
+
+    print('{:<24} {:>10} {}'.format('Kernel', 'Time (ms)',
+                    ' '.join('{:>8}'.format('x{}'.format(t)) for t in threads)))
+    with tempfile.TemporaryDirectory() as folder:
+        results = run_benchmark(kernels, args.language, threads, ncalls, args.repeat, folder)
+
+    save_results(args.output, 'threads', results)
+    print('Results saved in {}'.format(args.output))
+
+    if reference is not None:
+        metrics = ['time_{}'.format(t) for t in threads]
+        comparison = compare_results(results, reference, metrics, args.threshold)
+        print()
+        print_comparison(comparison)
+        if any(c[-1] for c in comparison):
+            sys.exit(1)
+
+if __name__ == '__main__':
+    main()
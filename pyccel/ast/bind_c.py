@@ -4,8 +4,6 @@
 # go to https://github.com/pyccel/pyccel/blob/master/LICENSE for full license details.     #
 #------------------------------------------------------------------------------------------#
 
-from sympy import Tuple
-
 from pyccel.ast.core import FunctionCall
 from pyccel.ast.core import FunctionAddress
 from pyccel.ast.core import FunctionDef, BindCFunctionDef
@@ -45,64 +43,31 @@ def as_static_function(func, name=None):
     _results = []
     interfaces = func.interfaces
 
-    # Convert array results to inout arguments
+    # Array results allocated by the function are returned through
+    # allocatable arguments, the caller becomes the owner of their memory
+    array_results = []
     for r in results:
         if r.rank > 0 and r not in args:
-            args += [r]
-            arguments_inout += [False]
+            array_results += [Variable( r.dtype, r.name,
+                                        allocatable = True,
+                                        rank        = r.rank,
+                                        order       = r.order,
+                                        precision   = r.precision)]
         elif r.rank == 0:
             _results += [r]
 
     if name is None:
         name = 'bind_c_{}'.format(func.name).lower()
 
-    # ...
-    results_names = [i.name for i in _results]
-    _args = []
-    _arguments_inout = []
-
-    for i_a, a in enumerate(args):
+    # Arrays are passed as assumed-shape arrays, i.e. through C descriptors
+    # (ISO_Fortran_binding) holding their shape and their strides
+    for a in args:
         if not isinstance(a, (Variable, FunctionAddress)):
             raise TypeError('Expecting a Variable or FunctionAddress type for {}'.format(a))
-        if not isinstance(a, FunctionAddress) and a.rank > 0:
-            # ...
-            additional_args = []
-            for i in range(a.rank):
-                n_name = 'n{i}_{name}'.format(name=str(a.name), i=i)
-                n_arg  = Variable('int', n_name, precision=4)
-
-                additional_args += [n_arg]
-
-            shape_new = Tuple(*additional_args, sympify=False)
-            # ...
-
-            _args += additional_args
-            _arguments_inout += [False] * len(additional_args)
-
-            a_new = Variable( a.dtype, a.name,
-                              allocatable = a.allocatable,
-                              is_pointer  = a.is_pointer,
-                              is_target   = a.is_target,
-                              is_optional = a.is_optional,
-                              shape       = shape_new,
-                              rank        = a.rank,
-                              order       = a.order,
-                              precision   = a.precision)
-
-            if not( a.name in results_names ):
-                _args += [a_new]
-
-            else:
-                _results += [a_new]
-
-        else:
-            _args += [a]
 
-        intent = arguments_inout[i_a]
-        _arguments_inout += [intent]
-    args = _args
+    args = args + array_results
     results = _results
-    arguments_inout = _arguments_inout
+    arguments_inout = list(arguments_inout) + [True] * len(array_results)
     # ...
     return BindCFunctionDef( name, list(args), results, body,
                         local_vars = func.local_vars,
@@ -40,6 +40,7 @@ __all__ = (
     'PythonMap',
     'PythonPrint',
     'PythonRange',
+    'ParallelRange',
     'PythonZip',
     'PythonMax',
     'PythonMin',
@@ -538,6 +539,52 @@ class PythonRange(Basic):
     def step(self):
         return self._args[2]
 
+#==============================================================================
+class ParallelRange(PythonRange):
+
+    """
+    Represents the range of a loop whose iterations are shared between the
+    threads (prange). It is a range when no accelerator is used.
+
+    The semantic stage finds the scalars assigned in the loop, which are
+    private to each iteration, and the scalars updated with +=, -= or *=,
+    which are reductions. The loops parallelised automatically may also
+    require pairs of arrays not to overlap (e.g. two array arguments which
+    may be views on the same data): in C the loop only runs in parallel if
+    their memory is disjoint.
+
+    Examples
+
+    >>> from pyccel.ast.core import Variable
+    >>> n = Variable('int', 'n')
+    >>> s = Variable('real', 's')
+    >>> ParallelRange(0, n, 1, reductions = [('+', s)])
+    ParallelRange(0, n, 1)
+    """
+
+    def __new__(cls, *args, private = (), reductions = (), disjoint = ()):
+        return PythonRange.__new__(cls, *args)
+
+    def __init__(self, *args, private = (), reductions = (), disjoint = ()):
+        self._private    = tuple(private)
+        self._reductions = tuple(reductions)
+        self._disjoint   = tuple(disjoint)
+
+    @property
+    def private(self):
+        """ The variables which are private to each iteration """
+        return self._private
+
+    @property
+    def reductions(self):
+        """ The reductions of the loop, as (operator, variable) pairs """
+        return self._reductions
+
+    @property
+    def disjoint(self):
+        """ The pairs of arrays which must not overlap for the loop to run in parallel """
+        return self._disjoint
+
 
 #==============================================================================
 class PythonZip(Basic):
@@ -654,6 +701,7 @@ def python_builtin_datatype(name):
 builtin_functions_dict = {
     'abs'      : PythonAbs,
     'range'    : PythonRange,
+    'prange'   : ParallelRange,
     'zip'      : PythonZip,
     'enumerate': PythonEnumerate,
     'int'      : PythonInt,
@@ -41,7 +41,7 @@ from sympy.utilities.misc               import filldedent
 from .basic     import Basic, PyccelAstNode
 from .builtins  import (PythonEnumerate, PythonLen, PythonList, PythonMap,
                         PythonRange, PythonZip, PythonTuple, PythonBool,
-                        PythonInt)
+                        PythonInt, ParallelRange)
 from .datatypes import (datatype, DataType, CustomDataType, NativeSymbol,
                         NativeInteger, NativeBool, NativeReal,
                         NativeComplex, NativeRange, NativeTensor, NativeString,
@@ -164,6 +164,16 @@ __all__ = (
     'OMP_For_Loop',
     'OMP_Parallel_Construct',
     'OMP_Single_Construct',
+    'OMP_Parallel_For_Loop',
+    'OMP_Simd_Construct',
+    'OMP_Critical_Construct',
+    'OMP_Atomic_Construct',
+    'OMP_Barrier_Construct',
+    'OMP_Sections_Construct',
+    'OMP_Section_Construct',
+    'OMP_Task_Construct',
+    'OMP_TaskLoop_Construct',
+    'OMP_TaskWait_Construct',
     'Omp_End_Clause'
 )
 
@@ -187,6 +197,11 @@ local_sympify = {
 #==============================================================================
 def apply(func, args, kwargs):return func(*args, **kwargs)
 
+def restore(cls, args):
+    """ Create an object from its sympy arguments without calling __init__.
+    Used by pickle when the attributes are restored separately """
+    return Basic.__new__(cls, *args)
+
 #==============================================================================
 def subs(expr, new_elements):
     """
@@ -1356,19 +1371,6 @@ class Tile(PythonRange):
         return self.stop - self.start
 
 
-class ParallelRange(PythonRange):
-
-    """
-    Representes a parallel range using OpenMP/OpenACC.
-
-    Examples
-    --------
-    >>> from pyccel.ast.core import Variable
-    """
-
-    pass
-
-
 # TODO: implement it as an extension of sympy Tensor?
 
 class Tensor(Basic):
@@ -2440,25 +2442,14 @@ class Variable(Symbol, PyccelAstNode):
           -------
 
           out : tuple
-           A tuple of two elements
+           A tuple of three elements
            a callable function that can be called
-           to create the initial version of the object
-           and its arguments.
+           to create the initial version of the object,
+           its arguments and the attributes of the object.
+           The attributes are restored once the object exists
+           as the shape of a variable refers to the variable itself.
         """
-        args = (
-            self.dtype,
-            self.name)
-        kwargs = {
-            'rank' : self.rank,
-            'allocatable': self.allocatable,
-            'is_pointer':self.is_pointer,
-            'is_polymorphic':self.is_polymorphic,
-            'is_optional':self.is_optional,
-            'shape':self.shape,
-            'cls_base':self.cls_base,
-            }
-
-        out =  (apply, (Variable, args, kwargs))
+        out = (restore, (self.__class__, self._args), self.__dict__)
         return out
 
     def _eval_subs(self, old, new):
@@ -3228,6 +3219,12 @@ class FunctionDef(Basic):
         is not provided False otherwise """
         return self._is_header
 
+    @property
+    def allocated_results(self):
+        """ The arrays allocated by the function and returned to the
+        caller which becomes the owner of their memory """
+        return [r for r in self.results if r.rank > 0 and r not in self.arguments]
+
     @property
     def arguments_inout(self):
         """ List of variables which are the modifiable function arguments """
@@ -3308,7 +3305,9 @@ class FunctionDef(Basic):
         'is_private':self._is_private,
         'is_header':self._is_header,
         'arguments_inout':self._arguments_inout,
-        'functions':self._functions}
+        'functions':self._functions,
+        'interfaces':self._interfaces,
+        'doc_string':self._doc_string}
         return args, kwargs
 
     def __reduce_ex__(self, i):
@@ -3395,6 +3394,10 @@ class Interface(Basic):
         """True if the interface is used for a function argument."""
         return self._is_argument
 
+    def __getnewargs__(self):
+        """used for Pickling self."""
+        return (self._name, self._functions, self._is_argument)
+
     @property
     def doc_string(self):
         return self._functions[0].doc_string
@@ -3613,6 +3616,15 @@ class BindCFunctionDef(FunctionDef):
     def original_function(self):
         return self._original_function
 
+    @property
+    def allocated_results(self):
+        """ The allocatable arguments through which the arrays allocated by
+        the original function are handed over to the caller
+        """
+        return [a for a in self.arguments if isinstance(a, Variable) and a.rank > 0 \
+                and a in self._original_function.results \
+                and a not in self._original_function.arguments]
+
 
 class GetDefaultFunctionArg(Basic):
 
@@ -4610,6 +4622,56 @@ class OMP_Single_Construct(AnnotatedComment):
     def __new__(cls, txt):
         return AnnotatedComment.__new__(cls, 'omp', txt)
 
+class OMP_Parallel_For_Loop(AnnotatedComment):
+    """ Represents an OpenMP combined Parallel Loop construct. """
+    def __new__(cls, txt):
+        return AnnotatedComment.__new__(cls, 'omp', txt)
+
+class OMP_Simd_Construct(AnnotatedComment):
+    """ Represents an OpenMP Simd construct. """
+    def __new__(cls, txt):
+        return AnnotatedComment.__new__(cls, 'omp', txt)
+
+class OMP_Critical_Construct(AnnotatedComment):
+    """ Represents an OpenMP Critical construct. """
+    def __new__(cls, txt):
+        return AnnotatedComment.__new__(cls, 'omp', txt)
+
+class OMP_Atomic_Construct(AnnotatedComment):
+    """ Represents an OpenMP Atomic construct. """
+    def __new__(cls, txt):
+        return AnnotatedComment.__new__(cls, 'omp', txt)
+
+class OMP_Barrier_Construct(AnnotatedComment):
+    """ Represents an OpenMP Barrier directive. """
+    def __new__(cls, txt):
+        return AnnotatedComment.__new__(cls, 'omp', txt)
+
+class OMP_Sections_Construct(AnnotatedComment):
+    """ Represents an OpenMP Sections construct. """
+    def __new__(cls, txt):
+        return AnnotatedComment.__new__(cls, 'omp', txt)
+
+class OMP_Section_Construct(AnnotatedComment):
+    """ Represents a Section of an OpenMP Sections construct. """
+    def __new__(cls, txt):
+        return AnnotatedComment.__new__(cls, 'omp', txt)
+
+class OMP_Task_Construct(AnnotatedComment):
+    """ Represents an OpenMP Task construct. """
+    def __new__(cls, txt):
+        return AnnotatedComment.__new__(cls, 'omp', txt)
+
+class OMP_TaskLoop_Construct(AnnotatedComment):
+    """ Represents an OpenMP TaskLoop construct. """
+    def __new__(cls, txt):
+        return AnnotatedComment.__new__(cls, 'omp', txt)
+
+class OMP_TaskWait_Construct(AnnotatedComment):
+    """ Represents an OpenMP TaskWait directive. """
+    def __new__(cls, txt):
+        return AnnotatedComment.__new__(cls, 'omp', txt)
+
 class Omp_End_Clause(AnnotatedComment):
     """ Represents the End of an OpenMP block. """
     def __new__(cls, txt):
@@ -4639,6 +4701,10 @@ class CommentBlock(Basic):
     def comments(self):
         return self._args[0]
 
+    def __getnewargs__(self):
+        """used for Pickling self."""
+        return ('\n'.join(self.comments), self._header)
+
     @property
     def header(self):
         return self._header
@@ -22,7 +22,7 @@ from .datatypes import NativeInteger, NativeReal, NativeComplex
 from .datatypes import NativeBool, NativeString, NativeGeneric, NativeVoid
 
 from .core      import FunctionCall, FunctionDef, Variable, ValuedVariable, VariableAddress, FunctionAddress
-from .core      import AliasAssign, Assign, Return, If
+from .core      import AliasAssign, Assign, Return, If, CodeBlock
 
 from .literals  import LiteralTrue
 
@@ -39,9 +39,15 @@ __all__ = (
 #
     'PyccelPyObject',
     'PyccelPyArrayObject',
+    'PyccelCFIArray',
     'PyArgKeywords',
-    'PyArg_ParseTupleNode',
+    'PyccelPyArgs',
+    'PyccelPySsize',
+    'PyccelPyTypeObject',
+    'PyArgCollectNode',
     'PyBuildValueNode',
+    'Switch',
+    'PyAllowThreads',
 #--------- CONSTANTS ----------
     'Py_True',
     'Py_False',
@@ -62,9 +68,11 @@ __all__ = (
     'complex_to_pycomplex',
     'pybool_to_bool',
 #--------- Numpy ----------
+    'numpy_check_array',
     'numpy_get_ndims',
     'numpy_get_data',
     'numpy_get_dim',
+    'numpy_get_size',
     'numpy_get_stride',
     'numpy_check_flag',
     'numpy_get_base',
@@ -73,6 +81,20 @@ __all__ = (
     'numpy_flag_c_contig',
     'numpy_flag_f_contig',
     'numpy_dtype_registry',
+#------- ARRAY RESULTS -------
+    'ndarray_to_pyarray',
+    'cfi_array_new',
+    'cfi_array_to_pyarray',
+    'cfi_type_registry',
+#------ ARRAY ARGUMENTS ------
+    'pyarray_get_view',
+    'pyarray_release_view',
+    'pyarray_to_ndarray',
+    'pyarray_to_cfi_array',
+#------ SCALAR ARGUMENTS -----
+    'pyarg_type',
+    'pyarg_array_type',
+    'pyarg_converter_registry',
 )
 
 class PyccelPyObject(DataType):
@@ -83,6 +105,24 @@ class PyccelPyArrayObject(DataType):
     class used to hold numpy objects"""
     _name = 'pyarrayobject'
 
+class PyccelCFIArray(DataType):
+    """ Datatype representing the C descriptor (ISO_Fortran_binding.h)
+    of a Fortran array"""
+    _name = 'cfiarray'
+
+class PyccelPyArgs(DataType):
+    """ Datatype representing the array of arguments (PyObject *const *)
+    passed to a function with the vectorcall protocol"""
+    _name = 'pyargs'
+
+class PyccelPyTypeObject(DataType):
+    """ Datatype representing a PyTypeObject, the type of a python object"""
+    _name = 'pytypeobject'
+
+class PyccelPySsize(DataType):
+    """ Datatype representing a Py_ssize_t"""
+    _name = 'pyssize'
+
 PyArray_Type = Variable(NativeGeneric(), 'PyArray_Type')
 
 #TODO: Is there an equivalent to static so this can be a static list of strings?
@@ -110,7 +150,7 @@ class PyArgKeywords(Basic):
     def arg_names(self):
         return self._arg_names
 
-#using the documentation of PyArg_ParseTuple() and Py_BuildValue https://docs.python.org/3/c-api/arg.html
+#using the documentation of Py_BuildValue https://docs.python.org/3/c-api/arg.html
 pytype_parse_registry = {
     (NativeInteger(), 4)       : 'i',
     (NativeInteger(), 8)       : 'l',
@@ -126,94 +166,94 @@ pytype_parse_registry = {
     (PyccelPyArrayObject(), 0) : 'O!',
     }
 
-class PyArg_ParseTupleNode(Basic):
+class PyArgCollectNode(Basic):
     """
-    Represents a call to the function from Python.h which collects the expected arguments
+    Represents a call to the function printed in the wrapper which collects
+    the arguments passed to the function from Python with the vectorcall
+    protocol (METH_FASTCALL). The positional arguments are collected without
+    looking at the keywords, which are only matched with the names of the
+    arguments if they are provided.
 
     Parameters
     ----------
-    python_func_args: Variable
-        Args provided to the function in python
-    python_func_kwargs: Variable
-        Kwargs provided to the function in python
-    c_func_args: list of Variable
-        List of expected arguments. This helps determine the expected output types
-    parse_args: list of Variable
-        List of arguments into which the result will be collected
-    arg_names : list of str
-        A list of the names of the function arguments
-    is_interface : boolean
-        Default value False and True when working with interface functions
+    func_name : str
+        The name of the function in python (used in the error messages)
+    python_func_args : Variable
+        The array of arguments provided to the function in python
+    python_func_nargs : Variable
+        The number of positional arguments provided to the function
+    python_func_kwnames : Variable
+        The tuple containing the names of the keyword arguments (or NULL)
+    c_func_args : list of Variable
+        List of expected arguments
+    parse_args : list of Variable
+        List of PyObjects into which the arguments will be collected
+    arg_names : PyArgKeywords
+        The list of the names of the function arguments
     """
 
-    def __init__(self, python_func_args,
-                        python_func_kwargs,
+    def __init__(self, func_name,
+                        python_func_args,
+                        python_func_nargs,
+                        python_func_kwnames,
                         c_func_args, parse_args,
-                        arg_names,
-                        is_interface=False):
+                        arg_names):
         Basic.__init__(self)
         if not isinstance(python_func_args, Variable):
             raise TypeError('Python func args should be a Variable')
-        if not isinstance(python_func_kwargs, Variable):
-            raise TypeError('Python func kwargs should be a Variable')
+        if not isinstance(python_func_nargs, Variable):
+            raise TypeError('Python func nargs should be a Variable')
+        if not isinstance(python_func_kwnames, Variable):
+            raise TypeError('Python func kwnames should be a Variable')
         if not all(isinstance(c, (Variable, FunctionAddress)) for c in c_func_args):
             raise TypeError('C func args should be a list of Variables')
-        if not isinstance(parse_args, list) and any(not isinstance(c, Variable) for c in parse_args):
+        if not isinstance(parse_args, list) or any(not isinstance(c, Variable) for c in parse_args):
             raise TypeError('Parse args should be a list of Variables')
         if not isinstance(arg_names, PyArgKeywords):
-            raise TypeError('Parse args should be a list of Variables')
+            raise TypeError('Arg names should be a PyArgKeywords')
         if len(parse_args) != len(c_func_args):
             raise TypeError('There should be the same number of c_func_args and parse_args')
-        if not isinstance(is_interface, bool):
-            raise TypeError('is_interface should be a boolean')
-
-        self._is_interface = is_interface
-        self._flags      = ''
-        i = 0
-
-        while i < len(c_func_args) and not isinstance(c_func_args[i], ValuedVariable):
-            self._flags += self.get_pytype(c_func_args[i], parse_args[i])
-            i+=1
-        if i < len(c_func_args):
-            self._flags += '|'
-        while i < len(c_func_args):
-            self._flags += self.get_pytype(c_func_args[i], parse_args[i])
-            i+=1
-
-        # Restriction as of python 3.8
-        if any([isinstance(a, (Variable, FunctionAddress)) and a.is_kwonly for a in c_func_args]):
-            errors.report('Kwarg only arguments without default values will not raise an error if they are not passed',
-                          symbol=c_func_args, severity='warning')
-
-        parse_args = [[PyArray_Type, a] if isinstance(a, Variable) and a.dtype is PyccelPyArrayObject()
-                else [a] for a in parse_args]
-        parse_args = [a for arg in parse_args for a in arg]
 
+        is_valued = [isinstance(a, ValuedVariable) for a in c_func_args]
+        is_kwonly = [isinstance(a, (Variable, FunctionAddress)) and a.is_kwonly for a in c_func_args]
+
+        # The arguments which can be passed by position
+        self._npositional = is_kwonly.index(True) if any(is_kwonly) else len(c_func_args)
+        # The arguments which must be passed before the first argument with a default value
+        self._nrequired   = is_valued.index(True) if any(is_valued) else len(c_func_args)
+
+        self._func_name  = func_name
         self._pyarg      = python_func_args
-        self._pykwarg    = python_func_kwargs
+        self._pynargs    = python_func_nargs
+        self._pykwnames  = python_func_kwnames
         self._parse_args = parse_args
         self._arg_names  = arg_names
 
-    def get_pytype(self, c_arg, parse_arg):
-        if isinstance(c_arg, FunctionAddress) or (self._is_interface and c_arg.rank == 0):
-            return 'O'
-        else:
-            try:
-                return pytype_parse_registry[(parse_arg.dtype, parse_arg.precision)]
-            except KeyError as e:
-                raise NotImplementedError("Type not implemented for argument collection : "+str(type(parse_arg))) from e
+    @property
+    def func_name(self):
+        return self._func_name
 
     @property
     def pyarg(self):
         return self._pyarg
 
     @property
-    def pykwarg(self):
-        return self._pykwarg
+    def pynargs(self):
+        return self._pynargs
 
     @property
-    def flags(self):
-        return self._flags
+    def pykwnames(self):
+        return self._pykwnames
+
+    @property
+    def npositional(self):
+        """ The number of arguments which can be passed by position """
+        return self._npositional
+
+    @property
+    def nrequired(self):
+        """ The number of leading arguments which have no default value """
+        return self._nrequired
 
     @property
     def args(self):
@@ -247,6 +287,73 @@ class PyBuildValueNode(Basic):
     def args(self):
         return self._result_args
 
+class Switch(Basic):
+    """
+    Represents a switch statement of C, used by the wrapper of an interface
+    to jump to the function matching the types of the arguments. Each body
+    is expected to end with a return statement
+
+    Parameters
+    ----------
+    expr : Variable
+        The integer which selects the case
+    cases : list of tuple
+        Every case is a tuple (value, body) where value is an integer
+        and body a list of statements
+    default : list
+        The statements executed if no case matches the value
+    """
+    def __init__(self, expr, cases, default = ()):
+        Basic.__init__(self)
+        if not isinstance(expr, Variable):
+            raise TypeError('The switch expression should be a Variable')
+        if len(set(v for v, _ in cases)) != len(cases):
+            raise ValueError('The values of the cases should be distinct')
+        self._expr    = expr
+        self._cases   = [(v, CodeBlock(b)) for v, b in cases]
+        self._default = CodeBlock(default)
+
+    @property
+    def expr(self):
+        return self._expr
+
+    @property
+    def cases(self):
+        return self._cases
+
+    @property
+    def default(self):
+        return self._default
+
+#-------------------------------------------------------------------
+class PyAllowThreads(Basic):
+    """
+    Represents a block of statements executed without holding the global
+    interpreter lock (between Py_BEGIN_ALLOW_THREADS and Py_END_ALLOW_THREADS)
+    so that other python threads run at the same time. The statements must
+    not use any python object
+
+    Parameters
+    ----------
+    body : list
+        The statements executed without the GIL
+    condition : PyccelAstNode
+        If provided the GIL is only released when the condition is true
+        (e.g. when the arrays are large enough for the release to pay off)
+    """
+    def __init__(self, body, condition = None):
+        Basic.__init__(self)
+        self._body      = CodeBlock(body)
+        self._condition = condition
+
+    @property
+    def body(self):
+        return self._body
+
+    @property
+    def condition(self):
+        return self._condition
+
 #-------------------------------------------------------------------
 #                      Python.h functions
 #-------------------------------------------------------------------
@@ -302,13 +409,18 @@ numpy_get_dim  = FunctionDef(name      = 'PyArray_DIM',
                            body      = [],
                            arguments = [Variable(dtype=PyccelPyArrayObject(), name = 'o', is_pointer=True),
                                         Variable(dtype=NativeInteger(), name = 'idx')],
-                           results   = [Variable(dtype=NativeInteger(), name = 'd')])
+                           results   = [Variable(dtype=NativeInteger(), name = 'd', precision = 8)])
+
+numpy_get_size = FunctionDef(name      = 'PyArray_SIZE',
+                           body      = [],
+                           arguments = [Variable(dtype=PyccelPyArrayObject(), name = 'o', is_pointer=True)],
+                           results   = [Variable(dtype=NativeInteger(), name = 'n', precision = 8)])
 
 numpy_get_stride = FunctionDef(name      = 'PyArray_STRIDE',
                            body      = [],
                            arguments = [Variable(dtype=PyccelPyArrayObject(), name = 'o', is_pointer=True),
                                         Variable(dtype=NativeInteger(), name = 'idx')],
-                           results   = [Variable(dtype=NativeInteger(), name = 's')])
+                           results   = [Variable(dtype=NativeInteger(), name = 's', precision = 8)])
 
 numpy_check_flag = FunctionDef(name      = 'PyArray_CHKFLAGS',
                        body      = [],
@@ -331,6 +443,101 @@ numpy_get_type = FunctionDef(name      = 'PyArray_TYPE',
                        arguments = [Variable(dtype=PyccelPyArrayObject(), name = 'o', is_pointer=True)],
                        results   = [Variable(dtype=NativeInteger(), name = 'i', precision = 4)])
 
+numpy_check_array = FunctionDef(name      = 'PyArray_Check',
+                       body      = [],
+                       arguments = [Variable(dtype=PyccelPyArrayObject(), name = 'o', is_pointer=True)],
+                       results   = [Variable(dtype=NativeBool(), name = 'r')])
+
+#-------------------------------------------------------------------
+#         Functions handing returned arrays over to numpy
+#         (printed in the wrapper by CWrapperCodePrinter)
+#-------------------------------------------------------------------
+ndarray_to_pyarray = FunctionDef(name      = 'ndarray_to_pyarray',
+                       body      = [],
+                       arguments = [Variable(dtype=NativeGeneric(), name = 'a'),
+                                    Variable(dtype=NativeInteger(), name = 'typenum', precision = 4)],
+                       results   = [Variable(dtype=PyccelPyObject(), name = 'o', is_pointer=True)])
+
+cfi_array_new = FunctionDef(name      = 'cfi_array_new',
+                       body      = [],
+                       arguments = [Variable(dtype=NativeInteger(), name = 'rank', precision = 4),
+                                    Variable(dtype=NativeInteger(), name = 'type', precision = 4)],
+                       results   = [Variable(dtype=PyccelCFIArray(), name = 'desc', is_pointer=True)])
+
+cfi_array_to_pyarray = FunctionDef(name      = 'cfi_array_to_pyarray',
+                       body      = [],
+                       arguments = [Variable(dtype=PyccelCFIArray(), name = 'desc', is_pointer=True),
+                                    Variable(dtype=NativeInteger(), name = 'typenum', precision = 4),
+                                    Variable(dtype=NativeInteger(), name = 'c_order', precision = 4)],
+                       results   = [Variable(dtype=PyccelPyObject(), name = 'o', is_pointer=True)])
+
+#-------------------------------------------------------------------
+#         Functions passing numpy arrays to the translated functions
+#         (printed in the wrapper by CWrapperCodePrinter)
+#-------------------------------------------------------------------
+pyarray_get_view = FunctionDef(name      = 'pyarray_get_view',
+                       body      = [],
+                       arguments = [Variable(dtype=PyccelPyArrayObject(), name = 'o', is_pointer=True),
+                                    Variable(dtype=NativeInteger(), name = 'writeback', precision = 4),
+                                    Variable(dtype=NativeInteger(), name = 'warn', precision = 4)],
+                       results   = [Variable(dtype=PyccelPyArrayObject(), name = 'v', is_pointer=True)])
+
+pyarray_release_view = FunctionDef(name      = 'pyarray_release_view',
+                       body      = [],
+                       arguments = [Variable(dtype=PyccelPyArrayObject(), name = 'v', is_pointer=True)],
+                       results   = [])
+
+pyarray_to_ndarray = FunctionDef(name      = 'pyarray_to_ndarray',
+                       body      = [],
+                       arguments = [Variable(dtype=PyccelPyArrayObject(), name = 'o', is_pointer=True),
+                                    Variable(dtype=NativeInteger(), name = 'type', precision = 4)],
+                       results   = [Variable(dtype=NativeGeneric(), name = 'a')])
+
+pyarray_to_cfi_array = FunctionDef(name      = 'pyarray_to_cfi_array',
+                       body      = [],
+                       arguments = [Variable(dtype=PyccelPyArrayObject(), name = 'o', is_pointer=True),
+                                    Variable(dtype=PyccelCFIArray(), name = 'desc', is_pointer=True),
+                                    Variable(dtype=NativeInteger(), name = 'type', precision = 4),
+                                    Variable(dtype=NativeInteger(), name = 'c_order', precision = 4)],
+                       results   = [])
+
+#-------------------------------------------------------------------
+#         Functions describing the type of an argument of an interface
+#         (printed in the wrapper by CWrapperCodePrinter)
+#-------------------------------------------------------------------
+pyarg_type = FunctionDef(name      = 'pyarg_type',
+                       body      = [],
+                       arguments = [Variable(dtype=PyccelPyObject(), name = 'o', is_pointer=True)],
+                       results   = [Variable(dtype=PyccelPyTypeObject(), name = 't', is_pointer=True)])
+
+pyarg_array_type = FunctionDef(name      = 'pyarg_array_type',
+                       body      = [],
+                       arguments = [Variable(dtype=PyccelPyObject(), name = 'o', is_pointer=True)],
+                       results   = [Variable(dtype=NativeInteger(), name = 'i', precision = 4)])
+
+#-------------------------------------------------------------------
+#         Functions collecting the value of a scalar argument
+#         (printed in the wrapper by CWrapperCodePrinter)
+#-------------------------------------------------------------------
+def pyarg_converter(name, dtype, precision):
+    """ Function converting a python object to a scalar of the given type
+    which returns 0 (with a python exception set) if the conversion fails """
+    return FunctionDef(name      = name,
+                       body      = [],
+                       arguments = [Variable(dtype=PyccelPyObject(), name = 'o', is_pointer=True),
+                                    Variable(dtype=dtype, name = 'x', precision = precision, is_pointer=True)],
+                       results   = [Variable(dtype=NativeInteger(), name = 'r', precision = 4)])
+
+pyarg_converter_registry = {
+    (NativeInteger(), 8) : pyarg_converter('pyarg_to_int64',  NativeInteger(), 8),
+    (NativeInteger(), 4) : pyarg_converter('pyarg_to_int32',  NativeInteger(), 4),
+    (NativeInteger(), 2) : pyarg_converter('pyarg_to_int16',  NativeInteger(), 2),
+    (NativeInteger(), 1) : pyarg_converter('pyarg_to_int8',   NativeInteger(), 1),
+    (NativeReal(), 8)    : pyarg_converter('pyarg_to_double', NativeReal(), 8),
+    (NativeReal(), 4)    : pyarg_converter('pyarg_to_float',  NativeReal(), 4),
+    (NativeBool(), 4)    : pyarg_converter('pyarg_to_bool',   NativeBool(), 4),
+}
+
 numpy_flag_own_data = Variable(dtype=NativeInteger(),  name = 'NPY_ARRAY_OWNDATA')
 numpy_flag_c_contig = Variable(dtype=NativeInteger(),  name = 'NPY_ARRAY_C_CONTIGUOUS')
 numpy_flag_f_contig = Variable(dtype=NativeInteger(),  name = 'NPY_ARRAY_F_CONTIGUOUS')
@@ -389,6 +596,16 @@ numpy_dtype_registry = {('bool',4)     : numpy_bool_type,
                         ('complex',8)  : numpy_cdouble_type,
                         ('complex',16) : numpy_clongdouble_type}
 
+cfi_type_registry = {('bool',4)     : Variable(dtype=NativeInteger(), name = 'CFI_type_Bool'),
+                     ('int',1)      : Variable(dtype=NativeInteger(), name = 'CFI_type_int8_t'),
+                     ('int',2)      : Variable(dtype=NativeInteger(), name = 'CFI_type_int16_t'),
+                     ('int',4)      : Variable(dtype=NativeInteger(), name = 'CFI_type_int32_t'),
+                     ('int',8)      : Variable(dtype=NativeInteger(), name = 'CFI_type_int64_t'),
+                     ('real',4)     : Variable(dtype=NativeInteger(), name = 'CFI_type_float'),
+                     ('real',8)     : Variable(dtype=NativeInteger(), name = 'CFI_type_double'),
+                     ('complex',4)  : Variable(dtype=NativeInteger(), name = 'CFI_type_float_Complex'),
+                     ('complex',8)  : Variable(dtype=NativeInteger(), name = 'CFI_type_double_Complex')}
+
 def PythonType_Check(variable, argument):
     """
     Create FunctionCall responsible of checking python argument data type
@@ -582,15 +799,3 @@ numpy_type_check_registry = {
     (NativeBool(), 4)          : Numpy_Bool_ref
 }
 
-flags_registry = {
-    (NativeInteger(), 4)       : 1,
-    (NativeInteger(), 8)       : 2,
-    (NativeInteger(), 2)       : 3,
-    (NativeInteger(), 1)       : 4,
-    (NativeReal(), 8)          : 5,
-    (NativeReal(), 4)          : 6,
-    (NativeComplex(), 4)       : 7,
-    (NativeComplex(), 8)       : 8,
-    (NativeBool(), 4)          : 9,
-    (NativeString(), 0)        : 10
-}
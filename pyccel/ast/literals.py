@@ -112,6 +112,10 @@ class LiteralFloat(Literal, sp_Float):
     def python_value(self):
         return float(self)
 
+    def __getnewargs__(self):
+        """used for Pickling self."""
+        return (float(self),)
+
 
 #------------------------------------------------------------------------------
 class LiteralComplex(Literal, Basic):
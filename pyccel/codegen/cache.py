@@ -0,0 +1,455 @@
+# coding: utf-8
+#------------------------------------------------------------------------------------------#
+# This file is part of Pyccel which is released under MIT License. See the LICENSE file or #
+# go to https://github.com/pyccel/pyccel/blob/master/LICENSE for full license details.     #
+#------------------------------------------------------------------------------------------#
+
+"""
+This file contains the persistent on-disk cache which allows pyccel to skip
+the whole pipeline (parsing, annotation, code generation and compilation)
+when a file which has already been built is built again with the same options.
+
+Entries are content-addressed: the key is a hash of the source code, of the
+source code of all the imported user modules, of the pyccel version, of the
+version of the compiler and of all the options which may change the generated
+files.
+"""
+
+import ast
+import hashlib
+import json
+import os
+import shutil
+import subprocess
+import sys
+import sysconfig
+import tempfile
+from contextlib import contextmanager
+from functools  import lru_cache
+
+try:
+    import fcntl
+except ImportError: # pragma: no cover
+    fcntl = None
+
+import numpy as np
+
+from pyccel.version import __version__
+
+__all__ = ['BuildCache', 'compute_cache_key', 'get_compiler_version', 'get_imported_files', 'get_default_cache',
+           'cache_stats', 'clear_cache']
+
+#==============================================================================
+# Default maximum size of the cache (in MB), can be changed with PYCCEL_CACHE_SIZE
+default_cache_size = 1024
+
+# Names of the modules which are handled internally by pyccel
+_internal_modules = ('numpy', 'math', 'itertools', 'scipy', 'mpi4py', 'pyccel')
+
+_manifest_name = 'manifest.json'
+_stats_name    = 'stats.json'
+
+#==============================================================================
+def get_default_cache_folder():
+    """
+    Returns the folder in which the build cache is stored.
+    The environment variable PYCCEL_CACHE_DIR is used if it is defined,
+    otherwise the cache is stored in $XDG_CACHE_HOME/pyccel (~/.cache/pyccel).
+    """
+    folder = os.environ.get('PYCCEL_CACHE_DIR', None)
+    if not folder:
+        cache_home = os.environ.get('XDG_CACHE_HOME', None) or \
+                os.path.join(os.path.expanduser('~'), '.cache')
+        folder = os.path.join(cache_home, 'pyccel')
+    return os.path.abspath(folder)
+
+#==============================================================================
+def _resolve_import(name, level, folder):
+    """
+    Find the file (.pyh or .py) corresponding to an import statement.
+    Only files which are found relative to the importing file or to the
+    current working directory are considered. Returns None if no such
+    file exists.
+    """
+    if level > 0:
+        base = folder
+        for _ in range(level-1):
+            base = os.path.dirname(base)
+        bases = [base]
+    else:
+        bases = [folder, os.getcwd()]
+
+    root = name.replace('.', os.sep)
+    for base in bases:
+        for ext in ('.pyh', '.py'):
+            filename = os.path.join(base, root + ext)
+            if os.path.isfile(filename):
+                return os.path.abspath(filename)
+    return None
+
+def _collect_imports(filename, code):
+    """
+    Returns a list of tuples (name, level) describing the modules imported
+    in the code. Modules handled internally by pyccel are ignored.
+    """
+    try:
+        tree = ast.parse(code, filename=filename)
+    except SyntaxError:
+        return []
+
+    imports = []
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            names = [(a.name, 0) for a in node.names]
+        elif isinstance(node, ast.ImportFrom):
+            if node.module is None:
+                names = [(a.name, node.level) for a in node.names]
+            else:
+                names = [(node.module, node.level)]
+        else:
+            continue
+        imports.extend((n, l) for n, l in names
+                if l > 0 or n.split('.')[0] not in _internal_modules)
+    return imports
+
+def get_imported_files(filename, code = None):
+    """
+    Returns the list of files (.py or .pyh) containing the user modules which
+    are (directly or indirectly) imported by the file. Modules which cannot be
+    found relative to the file or to the current working directory are ignored.
+    """
+    if code is None:
+        with open(filename, 'r') as f:
+            code = f.read()
+
+    imported = []
+    to_treat = [(os.path.abspath(filename), code)]
+    while to_treat:
+        current, current_code = to_treat.pop(0)
+        folder = os.path.dirname(current)
+        for name, level in _collect_imports(current, current_code):
+            dependency = _resolve_import(name, level, folder)
+            if dependency is None or dependency in imported:
+                continue
+            imported.append(dependency)
+            if dependency.endswith('.py'):
+                with open(dependency, 'r') as f:
+                    to_treat.append((dependency, f.read()))
+    return imported
+
+@lru_cache(maxsize=None)
+def _run_compiler_version(executable, mtime): # pylint: disable=unused-argument
+    """ Returns the output of `executable --version` (mtime is part of the key of the lru_cache) """
+    try:
+        output = subprocess.run([executable, '--version'], stdout=subprocess.PIPE,
+                                stderr=subprocess.STDOUT, check=False, timeout=60).stdout
+    except (OSError, subprocess.SubprocessError):
+        return ''
+    return output.decode('utf-8', 'replace')
+
+def get_compiler_version(compiler):
+    """
+    Returns the output of `compiler --version`, so that the objects built
+    by a compiler are not reused after it is upgraded. An empty string is
+    returned if the compiler cannot be found
+    """
+    executable = shutil.which(compiler) if compiler else None
+    if executable is None:
+        return ''
+    return _run_compiler_version(executable, os.stat(executable).st_mtime_ns)
+
+def compute_cache_key(filename, **options):
+    """
+    Compute the key which identifies the result of the build of a file.
+
+    Parameters
+    ----------
+    filename : str
+        Name of the python file which is translated
+
+    options : dict
+        All the options which have an influence on the generated files
+        (language, compiler, flags, accelerator, ...)
+
+    Returns
+    -------
+    key : str
+        A hexadecimal string uniquely identifying the build
+    """
+    with open(filename, 'r') as f:
+        code = f.read()
+
+    hasher = hashlib.sha256()
+    hasher.update(__version__.encode('utf-8'))
+    hasher.update(get_compiler_version(options.get('compiler', None)).encode('utf-8'))
+    hasher.update(sys.version.encode('utf-8'))
+    hasher.update(np.version.version.encode('utf-8'))
+    hasher.update(str(sysconfig.get_config_var('EXT_SUFFIX')).encode('utf-8'))
+    hasher.update(os.path.basename(filename).encode('utf-8'))
+    hasher.update(code.encode('utf-8'))
+    for key in sorted(options):
+        hasher.update('{}={!r}'.format(key, options[key]).encode('utf-8'))
+
+    for name, level in _collect_imports(filename, code):
+        hasher.update('import:{}:{}'.format(level, name).encode('utf-8'))
+
+    for dependency in get_imported_files(filename, code):
+        with open(dependency, 'rb') as f:
+            hasher.update(f.read())
+
+    return hasher.hexdigest()
+
+#==============================================================================
+class BuildCache:
+    """
+    Persistent cache of build results.
+
+    Each entry is a folder named after its key, containing the files produced
+    by the build and a manifest describing where these files must be restored.
+    Entries are written in a temporary folder and moved into place with an
+    atomic rename so several processes can share the same cache. The least
+    recently used entries are removed when the size of the cache exceeds
+    its maximum size.
+
+    Parameters
+    ----------
+    folder : str
+        The folder where the cache is stored
+        Default : provided by get_default_cache_folder
+
+    max_size : int
+        The maximum size of the cache in bytes
+        Default : PYCCEL_CACHE_SIZE (in MB) or 1 GB
+    """
+    def __init__(self, folder = None, max_size = None):
+        if folder is None:
+            folder = get_default_cache_folder()
+        if max_size is None:
+            max_size = int(os.environ.get('PYCCEL_CACHE_SIZE', default_cache_size)) * 1024**2
+
+        self._folder   = os.path.abspath(folder)
+        self._max_size = max_size
+        self._hits     = 0
+        self._misses   = 0
+
+    @property
+    def folder(self):
+        """ The folder where the cache is stored """
+        return self._folder
+
+    @property
+    def max_size(self):
+        """ The maximum size of the cache in bytes """
+        return self._max_size
+
+    @property
+    def hits(self):
+        """ Number of cache hits recorded by this object """
+        return self._hits
+
+    @property
+    def misses(self):
+        """ Number of cache misses recorded by this object """
+        return self._misses
+
+    def _entry_path(self, key):
+        return os.path.join(self._folder, key)
+
+    @contextmanager
+    def _lock(self):
+        """ Context manager holding an exclusive lock on the cache folder """
+        os.makedirs(self._folder, exist_ok=True)
+        with open(os.path.join(self._folder, '.lock'), 'a') as lock_file:
+            if fcntl:
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                if fcntl:
+                    fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def _read_stats(self):
+        try:
+            with open(os.path.join(self._folder, _stats_name), 'r') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {'hits' : 0, 'misses' : 0}
+
+    def _record(self, hit):
+        """ Update the persistent hit/miss counters """
+        if hit:
+            self._hits += 1
+        else:
+            self._misses += 1
+        try:
+            with self._lock():
+                stats = self._read_stats()
+                stats['hits' if hit else 'misses'] += 1
+                tmp_file = os.path.join(self._folder, _stats_name + '.tmp')
+                with open(tmp_file, 'w') as f:
+                    json.dump(stats, f)
+                os.replace(tmp_file, os.path.join(self._folder, _stats_name))
+        except OSError:
+            pass
+
+    def entries(self):
+        """ Returns the list of keys of all the entries in the cache """
+        if not os.path.isdir(self._folder):
+            return []
+        return [e for e in os.listdir(self._folder)
+                if not e.startswith('.') and os.path.isdir(self._entry_path(e))]
+
+    @staticmethod
+    def _folder_size(folder):
+        size = 0
+        for root, _, files in os.walk(folder):
+            size += sum(os.path.getsize(os.path.join(root, f)) for f in files)
+        return size
+
+    def fetch(self, key, destination):
+        """
+        Restore the files of an entry.
+
+        Parameters
+        ----------
+        key : str
+            The key of the entry
+
+        destination : str
+            The folder relative to which the files are restored
+
+        Returns
+        -------
+        files : list of str
+            The absolute paths of the restored files, or None if the key
+            is not in the cache
+        """
+        entry = self._entry_path(key)
+        try:
+            # The lock prevents the entry from being evicted while it is read
+            with self._lock():
+                with open(os.path.join(entry, _manifest_name), 'r') as f:
+                    manifest = json.load(f)
+                restored = []
+                for stored_name, rel_path in manifest['files'].items():
+                    target = os.path.join(destination, rel_path)
+                    os.makedirs(os.path.dirname(target), exist_ok=True)
+                    # The file is replaced atomically: a shared library which
+                    # is already loaded must not be overwritten in place
+                    fd, tmp_file = tempfile.mkstemp(prefix='.tmp-', dir=os.path.dirname(target))
+                    os.close(fd)
+                    try:
+                        shutil.copy2(os.path.join(entry, stored_name), tmp_file)
+                        os.replace(tmp_file, target)
+                    except OSError:
+                        os.remove(tmp_file)
+                        raise
+                    restored.append(target)
+                # Mark entry as recently used
+                os.utime(entry)
+        except (OSError, ValueError, KeyError):
+            self._record(hit = False)
+            return None
+
+        self._record(hit = True)
+        return restored
+
+    def store(self, key, files, source):
+        """
+        Store the files resulting from a build in the cache.
+
+        Parameters
+        ----------
+        key : str
+            The key of the entry
+
+        files : list of str
+            The absolute paths of the files to store
+
+        source : str
+            The folder relative to which the files will be restored
+        """
+        os.makedirs(self._folder, exist_ok=True)
+        tmp_entry = tempfile.mkdtemp(prefix='.tmp-', dir=self._folder)
+        try:
+            manifest = {'files' : {}}
+            for i, f in enumerate(files):
+                stored_name = '{}_{}'.format(i, os.path.basename(f))
+                shutil.copy2(f, os.path.join(tmp_entry, stored_name))
+                manifest['files'][stored_name] = os.path.relpath(f, source)
+            with open(os.path.join(tmp_entry, _manifest_name), 'w') as f:
+                json.dump(manifest, f)
+
+            with self._lock():
+                entry = self._entry_path(key)
+                if os.path.exists(entry):
+                    shutil.rmtree(tmp_entry)
+                else:
+                    os.rename(tmp_entry, entry)
+                self._evict(keep = key)
+        except OSError:
+            shutil.rmtree(tmp_entry, ignore_errors=True)
+
+    def _evict(self, keep = None):
+        """
+        Remove the least recently used entries until the size of the cache
+        is smaller than its maximum size. Must be called with the lock held.
+        """
+        entries = [(os.path.getmtime(self._entry_path(e)), e) for e in self.entries()]
+        sizes   = {e : self._folder_size(self._entry_path(e)) for _, e in entries}
+        total   = sum(sizes.values())
+        for _, e in sorted(entries):
+            if total <= self._max_size:
+                break
+            if e == keep:
+                continue
+            self._remove_entry(e)
+            total -= sizes[e]
+
+    def _remove_entry(self, key):
+        # Rename before removing so that no process can see a partial entry
+        trash = tempfile.mkdtemp(prefix='.trash-', dir=self._folder)
+        try:
+            os.rename(self._entry_path(key), os.path.join(trash, key))
+        except OSError:
+            pass
+        shutil.rmtree(trash, ignore_errors=True)
+
+    def clear(self):
+        """ Remove all the entries and the statistics of the cache """
+        with self._lock():
+            for e in self.entries():
+                self._remove_entry(e)
+            stats_file = os.path.join(self._folder, _stats_name)
+            if os.path.exists(stats_file):
+                os.remove(stats_file)
+        self._hits   = 0
+        self._misses = 0
+
+    def stats(self):
+        """
+        Returns a dictionary describing the state of the cache:
+        the number of hits and misses (for all processes), the
+        number of entries, the size of the cache and its maximum size
+        """
+        stats = self._read_stats()
+        entries = self.entries()
+        return {'folder'   : self._folder,
+                'hits'     : stats['hits'],
+                'misses'   : stats['misses'],
+                'entries'  : len(entries),
+                'size'     : sum(self._folder_size(self._entry_path(e)) for e in entries),
+                'max_size' : self._max_size}
+
+#==============================================================================
+def get_default_cache():
+    """ Returns a BuildCache using the default folder and size """
+    return BuildCache()
+
+def cache_stats():
+    """ Returns the statistics of the default build cache """
+    return get_default_cache().stats()
+
+def clear_cache():
+    """ Remove all the entries of the default build cache """
+    get_default_cache().clear()
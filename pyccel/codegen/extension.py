@@ -0,0 +1,205 @@
+# coding: utf-8
+#------------------------------------------------------------------------------------------#
+# This file is part of Pyccel which is released under MIT License. See the LICENSE file or #
+# go to https://github.com/pyccel/pyccel/blob/master/LICENSE for full license details.     #
+#------------------------------------------------------------------------------------------#
+"""
+Functions used to compile the C wrapper of a module and to link it into a
+python extension module by calling the C compiler directly, instead of
+running setuptools in a new python interpreter.
+
+The information needed for the build (compiler, flags, include folders,
+link command and extension suffix) is computed once from sysconfig.
+"""
+
+import os
+import shlex
+import sys
+import sysconfig
+import warnings
+from collections import OrderedDict
+
+import numpy as np
+
+from pyccel.codegen.timings import timed, run_command
+
+__all__ = ['get_python_build_config', 'build_extension', 'compile_extension_wrapper',
+           'link_extension']
+
+_python_build_config = None
+
+#==============================================================================
+def get_python_build_config():
+    """
+    Returns a dictionary describing how python extension modules are built
+    on this platform, or None if they cannot be built without setuptools
+    (e.g. on Windows where the compiler is not described by sysconfig).
+
+    As with setuptools, the environment variables CC, CFLAGS, LDSHARED and
+    LDFLAGS can be used to change the compiler and the flags.
+    """
+    global _python_build_config # pylint: disable=global-statement
+
+    if _python_build_config is None:
+        cc       = os.environ.get('CC', None) or sysconfig.get_config_var('CC')
+        ldshared = os.environ.get('LDSHARED', None) or sysconfig.get_config_var('LDSHARED')
+
+        if sys.platform == 'win32' or not cc or not ldshared:
+            _python_build_config = {}
+        else:
+            cflags = sysconfig.get_config_var('CFLAGS') or ''
+            if 'CFLAGS' in os.environ:
+                cflags += ' ' + os.environ['CFLAGS']
+            cflags += ' ' + (sysconfig.get_config_var('CCSHARED') or '')
+            if 'LDFLAGS' in os.environ:
+                ldshared += ' ' + os.environ['LDFLAGS']
+
+            paths    = sysconfig.get_paths()
+            includes = [paths['include'], paths['platinclude'], np.get_include()]
+
+            _python_build_config = {
+                    'compiler'   : shlex.split(cc),
+                    'cflags'     : shlex.split(cflags),
+                    'linker'     : shlex.split(ldshared),
+                    'includes'   : list(OrderedDict.fromkeys(includes)),
+                    'ext_suffix' : sysconfig.get_config_var('EXT_SUFFIX')}
+
+    return _python_build_config or None
+
+#==============================================================================
+def _run_build_command(cmd, verbose):
+    """
+    Run a compiler command.
+    The output of a successful command is raised as a warning.
+    """
+    if verbose:
+        print(' '.join(cmd))
+
+    returncode, output = run_command(cmd)
+
+    if returncode != 0:
+        err_msg = "Failed to build module"
+        if verbose:
+            err_msg += "\n" + output
+        raise RuntimeError(err_msg)
+    if output:
+        warnings.warn(UserWarning(output))
+
+#==============================================================================
+def compile_extension_wrapper(wrapper_file, obj_file, include = (), flags = (), verbose = False):
+    """
+    Compile the C wrapper of a module to an object file.
+
+    Parameters
+    ----------
+    wrapper_file : str
+            The C file containing the wrapper
+    obj_file : str
+            The object file which is created
+    include : list
+            Include directories needed for compiling
+    flags : list
+            Additional flags to pass to the compiler
+    verbose : bool
+            Print the commands
+    """
+    config = get_python_build_config()
+    if config is None:
+        raise NotImplementedError("Python extensions cannot be built without setuptools on this platform")
+
+    include_flags = ['-I' + i for i in (*include, *config['includes'])]
+
+    compile_cmd = [*config['compiler'], *config['cflags'], *include_flags,
+                   '-c', wrapper_file, '-o', obj_file, *flags]
+
+    with timed('wrapper compilation', wrapper_file):
+        _run_build_command(compile_cmd, verbose)
+
+#==============================================================================
+def link_extension(target, obj_file, dependencies, libs = (), libdirs = (), flags = (), verbose = False):
+    """
+    Link the compiled C wrapper of a module with the object files of the
+    module to create a python extension module.
+
+    Parameters
+    ----------
+    target : str
+            The shared library which is created
+    obj_file : str
+            The object file of the compiled wrapper
+    dependencies : list
+            A list of all object files (without extension) needed for the module
+    libs : list
+            Libraries needed for linking
+    libdirs : list
+            Library directories needed for linking
+    flags : list
+            Additional flags to pass to the compiler. Only the linker flags (-Wl) are used
+    verbose : bool
+            Print the commands
+    """
+    config = get_python_build_config()
+    if config is None:
+        raise NotImplementedError("Python extensions cannot be built without setuptools on this platform")
+
+    linker_flags = [f for f in flags if f.startswith('-Wl')]
+    link_cmd = [*config['linker'], obj_file, *('{}.o'.format(d) for d in dependencies),
+                *('-L' + d for d in libdirs), *('-l' + l for l in libs),
+                *linker_flags, '-o', target]
+
+    with timed('link', target):
+        _run_build_command(link_cmd, verbose)
+
+#==============================================================================
+def build_extension(mod_name,
+        wrapper_file,
+        dependencies,
+        include = (),
+        libs    = (),
+        libdirs = (),
+        flags   = (),
+        output_folder = '',
+        verbose = False):
+    """
+    Compile the C wrapper of a module and link it with the object files of
+    the module to create a python extension module.
+
+    Parameters
+    ----------
+    mod_name : str
+            The name of the module that will be created
+    wrapper_file : str
+            The C file containing the wrapper
+    dependencies : list
+            A list of all object files (without extension) needed for the module
+    include : list
+            Include directories needed for compiling
+    libs : list
+            Libraries needed for linking
+    libdirs : list
+            Library directories needed for linking
+    flags : list
+            Additional flags to pass to the compiler
+    output_folder : str
+            The folder where the object file and the shared library are created
+    verbose : bool
+            Print the commands
+
+    Returns
+    -------
+    sharedlib_filepath : str
+            The absolute path of the created shared library
+    """
+    config = get_python_build_config()
+    if config is None:
+        raise NotImplementedError("Python extensions cannot be built without setuptools on this platform")
+
+    output_folder = os.path.abspath(output_folder)
+    root     = os.path.splitext(os.path.basename(wrapper_file))[0]
+    obj_file = os.path.join(output_folder, root + '.o')
+    target   = os.path.join(output_folder, mod_name + config['ext_suffix'])
+
+    compile_extension_wrapper(wrapper_file, obj_file, include, flags, verbose)
+    link_extension(target, obj_file, dependencies, libs, libdirs, flags, verbose)
+
+    return target
@@ -0,0 +1,169 @@
+# coding: utf-8
+#------------------------------------------------------------------------------------------#
+# This file is part of Pyccel which is released under MIT License. See the LICENSE file or #
+# go to https://github.com/pyccel/pyccel/blob/master/LICENSE for full license details.     #
+#------------------------------------------------------------------------------------------#
+
+"""
+This file contains the tools used by the incremental build mode of pyccel.
+
+The result of each build is described by a record stored next to the generated
+files in the __pyccel__ folder. It contains the hashes of the inputs of the
+build (source file, options, interfaces and object files of the imported
+modules), the hash of the generated code and the timestamps of the produced
+files. This allows a new build to be skipped, or to reuse the object file of
+the module, when nothing which could change it has been modified.
+"""
+
+import hashlib
+import json
+import os
+
+from pyccel.version import __version__
+from pyccel.codegen.cache import get_imported_files
+
+__all__ = ['BuildRecord', 'file_hash']
+
+# Extension of the file describing the interface of a compiled module
+interface_extension = {'fortran' : '.mod', 'c' : '.h'}
+
+#==============================================================================
+def file_hash(filename):
+    """ Returns the sha256 hash of the contents of a file, or None if the file does not exist """
+    try:
+        with open(filename, 'rb') as f:
+            return hashlib.sha256(f.read()).hexdigest()
+    except OSError:
+        return None
+
+def _file_time(filename):
+    """ Returns the modification time of a file, or None if the file does not exist """
+    try:
+        return os.path.getmtime(filename)
+    except OSError:
+        return None
+
+#==============================================================================
+class BuildRecord:
+    """
+    Description of the last build of a python file, stored in the file
+    __pyccel__/<name>.build.json
+
+    Parameters
+    ----------
+    pyccel_dirpath : str
+        The folder containing the generated files
+
+    name : str
+        The name of the file which is built (without extension)
+    """
+    def __init__(self, pyccel_dirpath, name):
+        self._pyccel_dirpath = pyccel_dirpath
+        self._filename = os.path.join(pyccel_dirpath, '{}.build.json'.format(name))
+        self._previous = self._load()
+        self._current  = {'inputs' : None, 'modules' : {}, 'products' : {}}
+
+    @property
+    def filename(self):
+        """ The file where the record is saved """
+        return self._filename
+
+    def _load(self):
+        try:
+            with open(self._filename, 'r') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    @staticmethod
+    def _dependency_info(filename, language):
+        """
+        Collect the hash of the interface and the timestamp of the object
+        file of an imported module. If the module has not been compiled, the
+        hash of its source is used instead.
+        """
+        folder, basename = os.path.split(filename)
+        name = os.path.splitext(basename)[0]
+        pyccel_dirpath = os.path.join(folder, '__pyccel__')
+
+        ext = interface_extension.get(language, '')
+        interface = file_hash(os.path.join(pyccel_dirpath, name.lower() + ext)) or \
+                    file_hash(os.path.join(pyccel_dirpath, name + ext)) or \
+                    file_hash(filename)
+        return {'interface' : interface,
+                'object'    : _file_time(os.path.join(pyccel_dirpath, name + '.o'))}
+
+    def collect_inputs(self, filename, language, **options):
+        """
+        Collect all the inputs of the build of the file
+
+        Parameters
+        ----------
+        filename : str
+            The python file which is built
+
+        language : str
+            The language which pyccel is translating to
+
+        options : dict
+            All the other options which may change the generated files
+        """
+        settings = ';'.join('{}={!r}'.format(k, options[k]) for k in sorted(options))
+        settings = hashlib.sha256(settings.encode('utf-8')).hexdigest()
+        dependencies = {f : self._dependency_info(f, language) for f in get_imported_files(filename)}
+        self._current['inputs'] = {'version'      : __version__,
+                                   'source'       : file_hash(filename),
+                                   'language'     : language,
+                                   'options'      : settings,
+                                   'dependencies' : dependencies}
+
+    def is_up_to_date(self):
+        """
+        Returns True if the inputs are identical to the inputs of the last
+        build and if all the files produced by this build still exist
+        and have not been modified
+        """
+        if self._previous is None or self._previous['inputs'] != self._current['inputs']:
+            return False
+        products = self._previous['products']
+        return len(products) > 0 and all(_file_time(f) == t for f, t in products.items())
+
+    def can_reuse_object(self, module_name, code_filename, object_filename):
+        """
+        Returns True if the generated code of the module is identical to the code
+        generated in the last build, and the module was compiled against the same
+        interfaces and with the same options. In this case the object file of the
+        last build can be used.
+        """
+        if self._previous is None:
+            return False
+
+        previous_inputs = self._previous['inputs']
+        current_inputs  = self._current['inputs']
+        previous_interfaces = {f : d['interface'] for f, d in previous_inputs['dependencies'].items()}
+        current_interfaces  = {f : d['interface'] for f, d in current_inputs['dependencies'].items()}
+        if previous_inputs['options'] != current_inputs['options'] or \
+                previous_inputs['language'] != current_inputs['language'] or \
+                previous_interfaces != current_interfaces:
+            return False
+
+        previous_module = self._previous['modules'].get(module_name, None)
+        return previous_module is not None and \
+                previous_module['code'] == file_hash(code_filename) and \
+                previous_module['object'] == _file_time(object_filename)
+
+    def add_module(self, module_name, code_filename, object_filename):
+        """ Save the hash of the generated code and the timestamp of the object file of a module """
+        self._current['modules'][module_name] = {'code'   : file_hash(code_filename),
+                                                 'object' : _file_time(object_filename)}
+
+    def add_product(self, filename):
+        """ Save the timestamp of a file produced by the build (executable or shared library) """
+        self._current['products'][filename] = _file_time(filename)
+
+    def save(self):
+        """ Write the record of the current build """
+        tmp_filename = self._filename + '.tmp'
+        with open(tmp_filename, 'w') as f:
+            json.dump(self._current, f, indent=1)
+        os.replace(tmp_filename, self._filename)
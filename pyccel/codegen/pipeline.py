@@ -14,16 +14,23 @@ from collections import OrderedDict
 
 from pyccel.errors.errors          import Errors, PyccelError
 from pyccel.errors.errors          import PyccelSyntaxError, PyccelSemanticError, PyccelCodegenError
-from pyccel.errors.messages        import PYCCEL_RESTRICTION_TODO
+from pyccel.errors.messages        import PYCCEL_RESTRICTION_TODO, ARRAY_ALIGNMENT_IGNORED
+from pyccel.parser.base            import get_filename_from_import
 from pyccel.parser.parser          import Parser
 from pyccel.codegen.codegen        import Codegen
 from pyccel.codegen.utilities      import construct_flags
+from pyccel.codegen.utilities      import parallel_threshold
 from pyccel.codegen.utilities      import compile_files
+from pyccel.codegen.utilities      import CompileGraph
+from pyccel.codegen.cache          import compute_cache_key, get_default_cache
+from pyccel.codegen.incremental    import BuildRecord
+from pyccel.codegen.runtime        import get_runtime_library, build_runtime_library
 from pyccel.codegen.python_wrapper import create_shared_library
+from pyccel.codegen.timings        import timed
 
 import pyccel.stdlib as stdlib_folder
 
-__all__ = ['execute_pyccel']
+__all__ = ['execute_pyccel', 'execute_pyccel_files', 'get_package_files']
 
 # map internal libraries to their folders inside pyccel/stdlib
 internal_libs = {
@@ -60,7 +67,14 @@ def execute_pyccel(fname, *,
                    libs          = (),
                    debug         = False,
                    accelerator   = None,
-                   output_name   = None):
+                   array_alignment = None,
+                   warn_array_copy = False,
+                   auto_parallel = False,
+                   output_name   = None,
+                   cache         = False,
+                   incremental   = False,
+                   jobs          = 1,
+                   d_parsers     = None):
     """
     Carries out the main steps required to execute pyccel
     - Parses the python file (syntactic stage)
@@ -133,9 +147,60 @@ def execute_pyccel(fname, *,
     accelerator   : str
                     Tool used to accelerate the code (e.g. openmp openacc)
 
+    array_alignment : int
+                    Alignment in bytes requested for the local allocatable
+                    arrays in Fortran (with !DIR$ ATTRIBUTES ALIGN directives,
+                    which are only honoured by ifort: the alignment is ignored
+                    with a warning with the other compilers). The arrays
+                    created in C are always aligned on 64 bytes.
+                    Default : None
+
+    warn_array_copy : bool
+                    If True the python wrappers emit a RuntimeWarning when a
+                    numpy array argument must be copied (strided arrays are
+                    passed without copy, only the data which is not aligned or
+                    whose strides are not a multiple of the item size is copied).
+                    Default : False
+
+    auto_parallel : bool
+                    If True the loops over a range whose iterations are
+                    independent are parallelised with OpenMP (this implies
+                    accelerator='openmp') and a report of the loops which were
+                    parallelised, or why they were not, is printed.
+                    Default : False
+
     output_name   : str
                     Name of the generated module
                     Default : Same name as the file which was translated
+
+    cache         : bool or BuildCache
+                    If True the default build cache is used. If the same file
+                    (with the same imports) has already been built with the same
+                    options, the results are restored from the cache instead of
+                    running the pipeline. A BuildCache can also be provided.
+                    Default : False
+
+    incremental   : bool
+                    Boolean indicating whether the results of the previous build
+                    found in the __pyccel__ folder should be reused if its inputs
+                    (source, options, interfaces and objects of the imported modules)
+                    have not changed. The object file of the module is also reused
+                    if the generated code is unchanged.
+                    Default : False
+
+    jobs          : int
+                    The maximum number of files which are compiled at the same time.
+                    Independent files (e.g. the internal libraries and the module
+                    in C) are compiled concurrently. If None or 0 the number of
+                    available cpus is used.
+                    Default : 1
+
+    d_parsers     : OrderedDict
+                    Dictionary of parsers shared between several calls (see
+                    execute_pyccel_files). If the file or the modules it imports
+                    have already been parsed or annotated in a previous call,
+                    their parsers are reused.
+                    Default : None
     """
 
     # Reset Errors singleton before parsing a new file
@@ -189,6 +254,14 @@ def execute_pyccel(fname, *,
     if language is None:
         language = 'fortran'
 
+    if auto_parallel and accelerator is None:
+        accelerator = 'openmp'
+
+    if array_alignment is not None and \
+            (array_alignment <= 0 or array_alignment & (array_alignment - 1)):
+        os.chdir(base_dirpath)
+        raise ValueError('The array alignment must be a power of 2')
+
     # Choose Fortran compiler
     if compiler is None:
         if language == 'fortran':
@@ -196,6 +269,13 @@ def execute_pyccel(fname, *,
         elif language == 'c':
             compiler = 'gcc'
 
+    # The !DIR$ ATTRIBUTES ALIGN directives are only honoured by ifort
+    if array_alignment and language == 'fortran' and compiler != 'ifort':
+        errors.report(ARRAY_ALIGNMENT_IGNORED.format(compiler),
+                      filename = pymod_filepath,
+                      severity = 'warning')
+        array_alignment = None
+
     f90exec = mpi_compiler if mpi_compiler else compiler
 
     if (language == "c"):
@@ -223,10 +303,65 @@ def execute_pyccel(fname, *,
     fflags = ' {} -fPIC '.format(fflags)
     # ...
 
+    # Look for the results of an identical build in the cache
+    build_cache = None
+    cache_key   = None
+    if cache and language != 'python' and not (syntax_only or semantic_only or convert_only):
+        build_cache = get_default_cache() if cache is True else cache
+        cache_key   = compute_cache_key(pymod_filepath,
+                                        language     = language,
+                                        compiler     = f90exec,
+                                        fflags       = fflags,
+                                        includes     = includes,
+                                        libdirs      = libdirs,
+                                        modules      = modules,
+                                        libs         = libs,
+                                        debug        = debug,
+                                        accelerator  = accelerator,
+                                        array_alignment = array_alignment,
+                                        warn_array_copy = warn_array_copy,
+                                        auto_parallel = auto_parallel,
+                                        output_name  = output_name)
+        if build_cache.fetch(cache_key, folder) is not None:
+            if verbose:
+                print('> Build results restored from cache: {}'.format(cache_key))
+            os.chdir(base_dirpath)
+            return
+
+    # Check whether the results of the previous build are still valid
+    build_record = None
+    if incremental and language != 'python' and not (syntax_only or semantic_only or convert_only):
+        build_record = BuildRecord(pyccel_dirpath, module_name)
+        build_record.collect_inputs(pymod_filepath, language,
+                                    compiler     = f90exec,
+                                    fflags       = fflags,
+                                    includes     = includes,
+                                    libdirs      = libdirs,
+                                    modules      = modules,
+                                    libs         = libs,
+                                    debug        = debug,
+                                    accelerator  = accelerator,
+                                    array_alignment = array_alignment,
+                                    warn_array_copy = warn_array_copy,
+                                    auto_parallel = auto_parallel,
+                                    output_name  = output_name)
+        if build_record.is_up_to_date():
+            if verbose:
+                print('> Build is up to date: {}'.format(pymod_filepath))
+            os.chdir(base_dirpath)
+            return
+
+    # The interfaces of the imported modules are saved and reused with the
+    # other caches
+    use_interfaces = bool(cache or incremental) and language != 'python'
+
     # Parse Python file
     try:
-        parser = Parser(pymod_filepath, show_traceback=verbose)
-        parser.parse(verbose=verbose)
+        if d_parsers is None:
+            parser = Parser(pymod_filepath, use_interfaces=use_interfaces, show_traceback=verbose)
+            parser.parse(verbose=verbose)
+        else:
+            parser = get_shared_parser(pymod_filepath, d_parsers, verbose, use_interfaces)
     except NotImplementedError as error:
         msg = str(error)
         errors.report(msg+'\n'+PYCCEL_RESTRICTION_TODO,
@@ -244,6 +379,8 @@ def execute_pyccel(fname, *,
     # Annotate abstract syntax Tree
     try:
         settings = {'verbose':verbose}
+        if auto_parallel and language != 'python':
+            settings['auto_parallel'] = True
         parser.annotate(**settings)
     except NotImplementedError as error:
         msg = str(error)
@@ -275,14 +412,44 @@ def execute_pyccel(fname, *,
 
     internal_libs_name = set()
     internal_libs_path = []
-    internal_libs_files = []
+    internal_libs_lib  = []
+
+    # Compilation jobs of all the modules, which are run concurrently when possible
+    compile_graph = CompileGraph(jobs)
+    # Map each job to the stage which is reported if it fails
+    job_stages = {}
+    # Jobs building the internal libraries and compiling the modules
+    library_jobs = []
+    module_jobs  = []
+    # The files created by the jobs, which are handled once all the jobs have run
+    products = []
+
+    # Files which are stored in the cache at the end of the build
+    cached_files = []
+    def collect_cached_files(module_name):
+        stems = (module_name.lower(),
+                 'bind_c_{}'.format(module_name.lower()),
+                 '{}_wrapper'.format(module_name.lower()))
+        for f in os.listdir(pyccel_dirpath):
+            filepath = os.path.join(pyccel_dirpath, f)
+            if os.path.splitext(f)[0].lower() in stems and os.path.isfile(filepath):
+                cached_files.append(filepath)
+
+    # Settings of the printer of the generated files
+    printer_settings = {}
+    if language == 'fortran' and array_alignment:
+        printer_settings['array_alignment'] = array_alignment
+    if language == 'fortran' and accelerator == 'openmp':
+        printer_settings['parallel_threshold'] = parallel_threshold
+
     for parser, module_name in zip(parsers, module_names):
         semantic_parser = parser.semantic_parser
         # Generate .f90 file
         try:
-            codegen = Codegen(semantic_parser, module_name)
             fname = os.path.join(pyccel_dirpath, module_name)
-            fname = codegen.export(fname, language=language)
+            with timed('codegen', parser.filename):
+                codegen = Codegen(semantic_parser, module_name)
+                fname = codegen.export(fname, language=language, **printer_settings)
         except NotImplementedError as error:
             msg = str(error)
             errors.report(msg+'\n'+PYCCEL_RESTRICTION_TODO,
@@ -322,44 +489,35 @@ def execute_pyccel(fname, *,
                     lib_name = internal_libs[lib]
                     # get lib path (stdlib_path/lib_name)
                     lib_path = os.path.join(stdlib_path, lib_name)
-                    # remove library folder to avoid missing files and copy
-                    # new one from pyccel stdlib
-                    lib_dest_path = os.path.join(pyccel_dirpath, lib_name)
-                    if os.path.exists(lib_dest_path):
-                        shutil.rmtree(lib_dest_path)
-                    shutil.copytree(lib_path, lib_dest_path)
-
-                    # stop after copying lib to __pyccel__ directory for
-                    # convert only
+
+                    # copy the library to the __pyccel__ directory for convert
+                    # only so the generated files can be compiled by hand
                     if convert_only:
+                        lib_dest_path = os.path.join(pyccel_dirpath, lib_name)
+                        if os.path.exists(lib_dest_path):
+                            shutil.rmtree(lib_dest_path)
+                        shutil.copytree(lib_path, lib_dest_path)
                         continue
 
-                    # get library source files
-                    source_files = []
-                    for e in os.listdir(lib_dest_path):
-                        if e.endswith(lang_ext_dict[language]):
-                            source_files.append(os.path.join(lib_dest_path, e))
-
-                    # compile library source files
+                    # compile flags for library source files
                     flags = construct_flags(f90exec,
                                             fflags=fflags,
-                                            debug=debug,
-                                            includes=[lib_dest_path])
-                    try:
-                        for f in source_files:
-                            compile_files(f, f90exec, flags,
-                                            binary=None,
-                                            verbose=verbose,
-                                            is_module=True,
-                                            output=lib_dest_path,
-                                            language=language)
-                    except Exception:
-                        handle_error('C {} library compilation'.format(lib))
-                        raise
+                                            debug=debug)
+
+                    # the library is compiled once for these flags and stored
+                    # in the runtime folder (see pyccel.codegen.runtime)
+                    lib_dest_path, runtime_lib = get_runtime_library(lib_name, lib_path,
+                                                        language, f90exec, flags)
+                    compile_graph.add_job(lib_dest_path, build_runtime_library,
+                                            lib_name, lib_path, language, f90exec, flags,
+                                            verbose=verbose)
+                    job_stages[lib_dest_path] = 'C {} library compilation'.format(lib)
+                    library_jobs.append(lib_dest_path)
+
                     # Add internal lib to internal_libs_name set
                     internal_libs_name.add(lib)
-                    # add source file without extension to internal_libs_files
-                    internal_libs_files.extend(os.path.splitext(f)[0] for f in source_files)
+                    # add library to the list of libraries which are linked
+                    internal_libs_lib.append(runtime_lib)
                     # add library path to internal_libs_path
                     internal_libs_path.append(lib_dest_path)
 
@@ -390,8 +548,9 @@ def execute_pyccel(fname, *,
         dep_mods, inc_dirs = get_module_dependencies(parser)
 
         # Add internal dependencies
-        dep_mods = [*dep_mods, *internal_libs_files]
         inc_dirs = [*inc_dirs, *internal_libs_path]
+        link_libs    = [*internal_libs_lib, *libs]
+        link_libdirs = [*internal_libs_path, *libdirs]
 
         # Remove duplicates without changing order
         dep_mods = tuple(OrderedDict.fromkeys(dep_mods))
@@ -401,7 +560,7 @@ def execute_pyccel(fname, *,
         includes += inc_dirs
 
         if codegen.is_program:
-            modules += [os.path.join(pyccel_dirpath, m) for m in dep_mods[1:]]
+            modules = [*modules, *(os.path.join(pyccel_dirpath, m) for m in dep_mods[1:])]
 
 
         # Construct compiler flags
@@ -416,29 +575,35 @@ def execute_pyccel(fname, *,
         # TODO: stop at object files, do not compile executable
         #       This allows for properly linking program to modules
         #
-        try:
-            compile_files(fname, f90exec, flags,
+        object_filepath = os.path.join(pyccel_dirpath, module_name + '.o')
+        module_job = None
+        if build_record is not None and codegen.is_module and \
+                build_record.can_reuse_object(module_name, fname, object_filepath):
+            if verbose:
+                print('> Reusing object file: {}'.format(object_filepath))
+        else:
+            # The module needs the headers (or .mod files) of the internal libraries,
+            # and a program also needs the .mod files of the modules and is linked to them
+            depends = [*library_jobs, *module_jobs] if codegen.is_program else library_jobs
+            module_job = compile_graph.add_job(fname, compile_files, fname, f90exec, flags,
                             binary=None,
                             verbose=verbose,
                             modules=modules,
                             is_module=codegen.is_module,
                             output=pyccel_dirpath,
-                            libs=libs,
-                            libdirs=libdirs,
-                            language=language)
-        except Exception:
-            handle_error('Fortran compilation')
-            raise
+                            libs=link_libs,
+                            libdirs=link_libdirs,
+                            language=language,
+                            depends=depends)
+            job_stages[fname] = 'Fortran compilation'
+            module_jobs.append(fname)
 
         # For a program stop here
         if codegen.is_program:
-            if verbose:
-                exec_filepath = os.path.join(folder, module_name)
-                print( '> Executable has been created: {}'.format(exec_filepath))
-            os.chdir(base_dirpath)
+            products.append((codegen, module_name, fname, object_filepath, None))
             continue
 
-        # Create shared library
+        # Generate the wrapper and add the jobs creating the shared library
         try:
             sharedlib_filepath = create_shared_library(codegen,
                                                        language,
@@ -447,12 +612,16 @@ def execute_pyccel(fname, *,
                                                        mpi_compiler,
                                                        accelerator,
                                                        dep_mods,
-                                                       libs,
-                                                       libdirs,
+                                                       link_libs,
+                                                       link_libdirs,
                                                        includes,
                                                        flags,
                                                        output_name,
-                                                       verbose)
+                                                       verbose,
+                                                       warn_array_copy = warn_array_copy,
+                                                       compile_graph = compile_graph,
+                                                       depends = library_jobs,
+                                                       module_job = module_job)
         except NotImplementedError as error:
             msg = str(error)
             errors.report(msg+'\n'+PYCCEL_RESTRICTION_TODO,
@@ -470,6 +639,33 @@ def execute_pyccel(fname, *,
             handle_error('code generation (wrapping)')
             raise PyccelCodegenError('Code generation failed')
 
+        products.append((codegen, module_name, fname, object_filepath, sharedlib_filepath))
+
+    # Run the compilation jobs of all the modules
+    try:
+        compile_graph.run()
+    except Exception:
+        # The jobs added by create_shared_library create the shared library
+        handle_error(job_stages.get(compile_graph.failed_job, 'shared library generation'))
+        raise
+
+    for codegen, module_name, fname, object_filepath, sharedlib_filepath in products:
+        if build_record is not None and codegen.is_module:
+            build_record.add_module(module_name, fname, object_filepath)
+
+        if codegen.is_program:
+            exec_filepath = os.path.join(folder, module_name)
+            if sys.platform == "win32":
+                exec_filepath += '.exe'
+            if cache_key is not None:
+                collect_cached_files(module_name)
+                cached_files.append(exec_filepath)
+            if build_record is not None:
+                build_record.add_product(exec_filepath)
+            if verbose:
+                print( '> Executable has been created: {}'.format(exec_filepath))
+            continue
+
         # Move shared library to folder directory
         # (First construct absolute path of target location)
         sharedlib_filename = os.path.basename(sharedlib_filepath)
@@ -477,12 +673,174 @@ def execute_pyccel(fname, *,
         shutil.move(sharedlib_filepath, target)
         sharedlib_filepath = target
 
+        if cache_key is not None:
+            collect_cached_files(module_name)
+            cached_files.append(sharedlib_filepath)
+        if build_record is not None:
+            build_record.add_product(sharedlib_filepath)
+
         if verbose:
             print( '> Shared library has been created: {}'.format(sharedlib_filepath))
 
+    # Store the results of the build so they can be reused
+    if cache_key is not None:
+        build_cache.store(cache_key, cached_files, folder)
+    if build_record is not None:
+        build_record.save()
+
     # Print all warnings now
     if errors.has_warnings():
         errors.check()
 
     # Change working directory back to starting point
     os.chdir(base_dirpath)
+
+#==============================================================================
+def _find_parser(filename, d_parsers):
+    """ Returns the parser of the file stored in d_parsers, or None if there is none """
+    if filename in d_parsers:
+        return d_parsers[filename]
+    for p in d_parsers.values():
+        if p.filename == filename:
+            return p
+    return None
+
+def get_shared_parser(filename, d_parsers, verbose = False, use_interfaces = False):
+    """
+    Returns the parser of a file, reusing the parser found in d_parsers if the
+    file was already parsed (e.g. because it is imported by another file).
+    The new parser is added to d_parsers so that later imports of the file
+    use it.
+
+    Parameters
+    ----------
+    filename : str
+        Absolute path of the python file
+
+    d_parsers : OrderedDict
+        The parsers shared by all the files of the same folder
+
+    verbose : bool
+        Boolean indicating whether the progress should be printed
+
+    use_interfaces : bool
+        Boolean indicating whether the interfaces of the imported modules
+        are saved and reused (see ModuleInterface)
+    """
+    parser = _find_parser(filename, d_parsers)
+    if parser is not None and not parser.from_interface:
+        return parser
+
+    interface_parser = parser
+    parser = Parser(filename, use_interfaces=use_interfaces, show_traceback=verbose)
+    parser.parse(d_parsers=d_parsers, verbose=verbose)
+
+    # The interface of the module was loaded when it was imported,
+    # but the module itself must be parsed to be translated
+    if interface_parser is not None:
+        for key, p in d_parsers.items():
+            if p is interface_parser:
+                d_parsers[key] = parser
+        return parser
+
+    # Register the parser under the name used to import the file from its folder
+    # if possible. Otherwise the absolute path (which cannot be imported) is used.
+    folder, basename = os.path.split(filename)
+    name = os.path.splitext(basename)[0]
+    if name not in d_parsers and not parser.module_parser and \
+            get_filename_from_import(name, folder) == filename:
+        d_parsers[name] = parser
+    else:
+        d_parsers[filename] = parser
+    return parser
+
+#==============================================================================
+def get_package_files(path):
+    """
+    Returns the python files which must be translated when a folder is passed
+    to pyccel. All the python files of the folder and its sub-folders are
+    used, except the __init__.py files and the folders generated by pyccel.
+    """
+    files = []
+    for root, dirs, filenames in os.walk(path):
+        dirs[:] = sorted(d for d in dirs if not d.startswith(('__', '.')))
+        files.extend(os.path.join(root, f) for f in sorted(filenames)
+                        if f.endswith('.py') and f != '__init__.py')
+    return files
+
+#==============================================================================
+def execute_pyccel_files(fnames, *, syntax_only = False, verbose = False, **kwargs):
+    """
+    Carries out the main steps required to execute pyccel on several files.
+
+    All the files are parsed first. The files of a folder share their
+    dependency graph (d_parsers), so the modules they import are only parsed
+    and annotated once. The files are then translated and compiled one after
+    the other, each file after the files it imports.
+
+    Parameters
+    ----------
+    fnames : list of str
+        The python files to translate
+
+    syntax_only : bool
+        Boolean indicating whether the pipeline should stop after the syntax stage
+
+    verbose : bool
+        Boolean indicating whether debugging messages should be printed
+
+    kwargs : dict
+        All the other options of execute_pyccel
+    """
+    fnames = list(OrderedDict.fromkeys(os.path.abspath(f) for f in fnames))
+
+    if len(fnames) == 1:
+        execute_pyccel(fnames[0], syntax_only=syntax_only, verbose=verbose, **kwargs)
+        return
+
+    # Parse all the files first so that all the files importing
+    # a module are known before it is annotated
+    shared_parsers = {}
+    for f in fnames:
+        d_parsers = shared_parsers.setdefault(os.path.dirname(f), OrderedDict())
+        execute_pyccel(f, syntax_only=True, verbose=verbose, d_parsers=d_parsers, **kwargs)
+
+    if syntax_only:
+        return
+
+    parsers = {f : _find_parser(f, shared_parsers[os.path.dirname(f)]) for f in fnames}
+
+    def imported_files(parser):
+        """ Returns the files of fnames which are imported (directly or not) by the parser """
+        found   = []
+        treated = set()
+        to_treat = list(parser.sons)
+        while to_treat:
+            son = to_treat.pop()
+            if son.filename in treated:
+                continue
+            treated.add(son.filename)
+            if son.filename in parsers:
+                found.append(son.filename)
+            else:
+                to_treat.extend(son.sons)
+        return found
+
+    # Sort the files so each file is treated after the files it imports
+    ordered = []
+    def visit(f, visiting):
+        if f in ordered or f in visiting:
+            return
+        visiting.add(f)
+        for dependency in imported_files(parsers[f]):
+            visit(dependency, visiting)
+        ordered.append(f)
+
+    for f in fnames:
+        visit(f, set())
+
+    for f in ordered:
+        if verbose:
+            print('> Translating {}'.format(f))
+        execute_pyccel(f, verbose=verbose,
+                       d_parsers=shared_parsers[os.path.dirname(f)], **kwargs)
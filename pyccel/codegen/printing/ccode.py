@@ -7,9 +7,10 @@
 # pylint: disable=missing-function-docstring
 import functools
 import operator
+import re
 
 from sympy.core           import Tuple
-from pyccel.ast.builtins  import PythonRange, PythonFloat, PythonComplex
+from pyccel.ast.builtins  import PythonRange, PythonFloat, PythonComplex, ParallelRange
 
 from pyccel.ast.core      import Declare, Slice, ValuedVariable
 from pyccel.ast.core      import FuncAddressDeclare, FunctionCall
@@ -40,7 +41,7 @@ from pyccel.codegen.printing.codeprinter import CodePrinter
 
 from pyccel.errors.errors   import Errors
 from pyccel.errors.messages import (PYCCEL_RESTRICTION_TODO, INCOMPATIBLE_TYPEVAR_TO_FUNC,
-                                    PYCCEL_RESTRICTION_IS_ISNOT )
+                                    PYCCEL_RESTRICTION_IS_ISNOT, PRANGE_PRIVATE_POINTER )
 
 from .fcode import python_builtin_datatypes
 
@@ -221,6 +222,13 @@ ndarray_type_registry = {('real',8)    : 'nd_double',
 
 import_dict = {'omp_lib' : 'omp' }
 
+# The arrays are structures in C, so the aligned clause of a simd
+# directive (which is only a hint) cannot be given for them
+omp_aligned_clause = re.compile(r'\s*aligned\([^)]*\)')
+
+# maximum rank of a t_ndarray (MAX_NDIM in ndarrays.h)
+max_ndarray_rank = 8
+
 class CCodePrinter(CodePrinter):
     """A printer to convert python expressions to strings of c code"""
     printmethod = "_ccode"
@@ -572,6 +580,11 @@ class CCodePrinter(CodePrinter):
         dtype = self.find_in_dtype_registry(dtype, prec)
         if rank > 0:
             if expr.is_ndarray:
+                if rank > max_ndarray_rank:
+                    errors.report(PYCCEL_RESTRICTION_TODO,
+                            symbol="rank > {}".format(max_ndarray_rank),
+                            severity='fatal')
+                self._additional_imports.add('ndarrays')
                 return 't_ndarray '
             errors.report(PYCCEL_RESTRICTION_TODO, symbol="rank > 0",severity='fatal')
 
@@ -603,6 +616,9 @@ class CCodePrinter(CodePrinter):
         declaration_type = self.get_declare_type(expr.variable)
         variable = self._print(expr.variable.name)
 
+        if expr.variable.is_ndarray and not self.stored_in_c_pointer(expr.variable):
+            # The data pointer is tested before reallocating the array
+            return '{0}{1} = {{.raw_data = NULL}};'.format(declaration_type, variable)
         return '{0}{1};'.format(declaration_type, variable)
 
     def _print_NativeBool(self, expr):
@@ -637,8 +653,11 @@ class CCodePrinter(CodePrinter):
         if not args:
             arg_code = 'void'
         else:
+            # The arrays allocated by a function with several results are
+            # returned through pointers to their structures
             arg_code = ', '.join('{}'.format(self.function_signature(i))
-                        if isinstance(i, FunctionAddress) else '{0}{1}'.format(self.get_declare_type(i), i)
+                        if isinstance(i, FunctionAddress) else '{0}{1}{2}'.format(self.get_declare_type(i),
+                            '*' if i in expr.allocated_results and len(expr.results) > 1 else '', i)
                         for i in args)
         if isinstance(expr, FunctionAddress):
             return '{}(*{})({})'.format(ret_type, name, arg_code)
@@ -664,7 +683,7 @@ class CCodePrinter(CodePrinter):
         #set dtype to the C struct types
         dtype = self._print(expr.dtype)
         dtype = self.find_in_ndarray_type_registry(dtype, expr.precision)
-        base_name = self._print(base.name)
+        base_name = self._print(base)
         if base.is_ndarray:
             if expr.rank > 0:
                 #managing the Slice input
@@ -674,10 +693,34 @@ class CCodePrinter(CodePrinter):
                             allow_negative_indexes)
                 inds = [self._print(i) for i in inds]
                 return "array_slicing(%s, %s)" % (base_name, ", ".join(inds))
-            inds = [self._print(i) for i in inds]
         else:
             raise NotImplementedError(expr)
-        return "%s.%s[get_index(%s, %s)]" % (base_name, dtype, base_name, ", ".join(inds))
+        return "%s.%s[%s]" % (base_name, dtype, self._get_flat_index(base_name, inds))
+
+    def _get_flat_index(self, base_name, inds):
+        """ Print the index of an element in the data buffer of an array
+
+        The index is computed directly from the strides of the array
+        (instead of calling the variadic function get_index) so that the
+        C compiler can inline it and vectorise the loops.
+
+        Parameters
+        ----------
+            base_name : str
+                The name of the array
+            inds : list
+                The indices of the element (one per dimension)
+        Returns
+        -------
+            str
+        """
+        terms = []
+        for i, ind in enumerate(inds):
+            ind_code = self._print(ind)
+            if not isinstance(ind, (Variable, Literal)):
+                ind_code = '({})'.format(ind_code)
+            terms.append('{} * {}.strides[{}]'.format(ind_code, base_name, i))
+        return ' + '.join(terms)
 
     @staticmethod
     def _new_slice_with_processed_arguments(_slice, array_size, allow_negative_index):
@@ -731,13 +774,13 @@ class CCodePrinter(CodePrinter):
         return Slice(start, stop, step)
 
     def _print_PyccelArraySize(self, expr):
-        return '{}.shape[{}]'.format(expr.arg, expr.index)
+        return '{}.shape[{}]'.format(self._print(expr.arg), expr.index)
 
     def _print_Allocate(self, expr):
         free_code = ''
         #free the array if its already allocated and checking if its not null if the status is unknown
         if  (expr.status == 'unknown'):
-            free_code = 'if (%s.shape != NULL)\n' % self._print(expr.variable.name)
+            free_code = 'if (%s.raw_data != NULL)\n' % self._print(expr.variable)
             free_code += "{{\n{};\n}}\n".format(self._print(Deallocate(expr.variable)))
         elif  (expr.status == 'allocated'):
             free_code += self._print(Deallocate(expr.variable))
@@ -747,14 +790,16 @@ class CCodePrinter(CodePrinter):
         shape = ", ".join(a for a in shape)
         dtype = self._print(expr.variable.dtype)
         dtype = self.find_in_ndarray_type_registry(dtype, expr.variable.precision)
-        shape_dtype = self.find_in_dtype_registry('int', 4)
+        shape_dtype = self.find_in_dtype_registry('int', 8)
         shape_Assign = "("+ shape_dtype +"[]){" + shape + "}"
-        alloc_code = "{} = array_create({}, {}, {});".format(expr.variable, len(expr.shape), shape_Assign, dtype)
+        alloc_code = "{} = array_create({}, {}, {});".format(self._print(expr.variable), len(expr.shape), shape_Assign, dtype)
         return '{}\n{}'.format(free_code, alloc_code)
 
     def _print_Deallocate(self, expr):
+        # The shape and the strides of a view are stored in the view itself
+        # so there is nothing to free
         if expr.variable.is_pointer:
-            return 'free_pointer({});'.format(self._print(expr.variable))
+            return ''
         return 'free_array({});'.format(self._print(expr.variable))
 
     def _print_Slice(self, expr):
@@ -1089,8 +1134,18 @@ class CCodePrinter(CodePrinter):
 
     def _print_Assign(self, expr):
         if isinstance(expr.rhs, FunctionCall) and isinstance(expr.rhs.dtype, NativeTuple):
-            self._temporary_args = [VariableAddress(a) for a in expr.lhs]
-            return '{};'.format(self._print(expr.rhs))
+            allocated = expr.rhs.funcdef.allocated_results
+            free_code = ''
+            self._temporary_args = []
+            for a, r in zip(expr.lhs, expr.rhs.funcdef.results):
+                if r in allocated and not self.stored_in_c_pointer(a):
+                    # Arrays are structures which must also be passed by address
+                    free_code += 'if ({0}.raw_data != NULL)\n{{\n{1}\n}}\n'.format(
+                            self._print(a), self._print(Deallocate(a)))
+                    self._temporary_args.append('&{}'.format(self._print(a)))
+                else:
+                    self._temporary_args.append(VariableAddress(a))
+            return '{}{};'.format(free_code, self._print(expr.rhs))
         lhs = self._print(expr.lhs)
         rhs = expr.rhs
         if isinstance(rhs, (NumpyArray)):
@@ -1107,6 +1162,14 @@ class CCodePrinter(CodePrinter):
             cpy_data = "memcpy({0}.{2}, {1}, {0}.buffer_size);".format(lhs, dummy_array_name, dtype)
             return  '%s%s\n' % (dummy_array, cpy_data)
 
+        if isinstance(rhs, FunctionCall) and rhs.rank > 0 and rhs.funcdef.allocated_results \
+                and isinstance(expr.lhs, Variable) and not self.stored_in_c_pointer(expr.lhs):
+            # The array returned by the function is owned by the lhs,
+            # the array previously stored in the lhs must be freed
+            free_code = 'if ({0}.raw_data != NULL)\n{{\n{1}\n}}\n'.format(lhs,
+                    self._print(Deallocate(expr.lhs)))
+            return '{}{} = {};'.format(free_code, lhs, self._print(rhs))
+
         if isinstance(rhs, (NumpyFull)):
             code_init = ''
             if rhs.fill_value is not None:
@@ -1132,7 +1195,7 @@ class CCodePrinter(CodePrinter):
         rhs = self._print(rhs)
 
         # the below condition handles the case of reassinging a pointer to an array view.
-        # setting the pointer's is_view attribute to false so it can be ignored by the free_pointer function.
+        # setting the pointer's is_view attribute to true as it does not own the data.
         if isinstance(expr.lhs, Variable) and expr.lhs.is_ndarray \
                 and isinstance(expr.rhs, Variable) and expr.rhs.is_ndarray and expr.rhs.is_pointer:
             return 'alias_assign(&{}, {});'.format(lhs, rhs)
@@ -1146,9 +1209,31 @@ class CCodePrinter(CodePrinter):
             start, stop, step = [self._print(e) for e in expr.iterable.args]
         else:
             raise NotImplementedError("Only iterable currently supported is Range")
-        return ('for ({target} = {start}; {target} < {stop}; {target} += '
+        code = ('for ({target} = {start}; {target} < {stop}; {target} += '
                 '{step})\n{{\n{body}\n}}').format(target=target, start=start,
                 stop=stop, step=step, body=body)
+        # The iterations of a prange loop are shared between the threads
+        if isinstance(expr.iterable, ParallelRange):
+            for v in expr.iterable.private:
+                if self.stored_in_c_pointer(v):
+                    errors.report(PRANGE_PRIVATE_POINTER, symbol=v, severity='fatal')
+            code = '#pragma omp parallel for {}\n{}'.format(
+                    self._get_parallel_loop_clauses(expr.iterable), code)
+        return code
+
+    def _get_disjoint_condition(self, disjoint):
+        # The arrays passed as arguments may be views on the same data
+        if not disjoint:
+            return None
+        return ' && '.join('!ndarray_overlap({}, {})'.format(self._print(a), self._print(b))
+                            for a, b in disjoint)
+
+    def _print_reduction_variable(self, var):
+        # The reduction of a variable passed by address is the reduction
+        # of the array section containing it
+        if self.stored_in_c_pointer(var):
+            return '{}[:1]'.format(var.name)
+        return self._print(var)
 
     def _print_CodeBlock(self, expr):
         body = []
@@ -1288,8 +1373,8 @@ class CCodePrinter(CodePrinter):
 
     #=================== OMP ==================
     def _print_OMP_For_Loop(self, expr):
-        omp_expr   = str(expr.txt)
-        return '#pragma omp for{}\n{{'.format(omp_expr)
+        omp_expr   = omp_aligned_clause.sub('', str(expr.txt))
+        return '#pragma omp for{}'.format(omp_expr)
 
     def _print_OMP_Parallel_Construct(self, expr):
         omp_expr   = str(expr.txt)
@@ -1299,7 +1384,52 @@ class CCodePrinter(CodePrinter):
         omp_expr   = str(expr.txt)
         return '#pragma omp {}\n{{'.format(omp_expr)
 
+    def _print_OMP_Parallel_For_Loop(self, expr):
+        omp_expr   = omp_aligned_clause.sub('', str(expr.txt))
+        return '#pragma omp parallel for{}'.format(omp_expr)
+
+    def _print_OMP_Simd_Construct(self, expr):
+        omp_expr   = omp_aligned_clause.sub('', str(expr.txt))
+        return '#pragma omp {}'.format(omp_expr)
+
+    def _print_OMP_Critical_Construct(self, expr):
+        omp_expr   = str(expr.txt)
+        return '#pragma omp {}\n{{'.format(omp_expr)
+
+    def _print_OMP_Atomic_Construct(self, expr):
+        omp_expr   = str(expr.txt)
+        return '#pragma omp {}'.format(omp_expr)
+
+    def _print_OMP_Barrier_Construct(self, expr):
+        omp_expr   = str(expr.txt)
+        return '#pragma omp {}'.format(omp_expr)
+
+    def _print_OMP_Sections_Construct(self, expr):
+        omp_expr   = str(expr.txt)
+        return '#pragma omp {}\n{{'.format(omp_expr)
+
+    def _print_OMP_Section_Construct(self, expr):
+        omp_expr   = str(expr.txt)
+        return '#pragma omp {}\n{{'.format(omp_expr)
+
+    def _print_OMP_Task_Construct(self, expr):
+        omp_expr   = str(expr.txt)
+        return '#pragma omp {}\n{{'.format(omp_expr)
+
+    def _print_OMP_TaskLoop_Construct(self, expr):
+        omp_expr   = omp_aligned_clause.sub('', str(expr.txt))
+        return '#pragma omp {}'.format(omp_expr)
+
+    def _print_OMP_TaskWait_Construct(self, expr):
+        omp_expr   = str(expr.txt)
+        return '#pragma omp {}'.format(omp_expr)
+
     def _print_Omp_End_Clause(self, expr):
+        # The loop constructs and atomic apply to the next statement,
+        # they do not open a block
+        construct = str(expr.txt).split()[1:]
+        if construct[0] in ('for', 'simd', 'taskloop', 'atomic') or construct[:2] == ['parallel', 'for']:
+            return ''
         return '}'
     #=====================================
 
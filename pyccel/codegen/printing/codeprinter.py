@@ -6,6 +6,7 @@
 # pylint: disable=R0201
 
 
+from collections import OrderedDict
 
 from sympy.core.basic import Basic
 from sympy.core.symbol import Symbol
@@ -88,6 +89,30 @@ class CodePrinter(StrPrinter):
                                   "subclass of CodePrinter.")
 
 
+    def _get_parallel_loop_clauses(self, iterable):
+        """Returns the private and reduction clauses of the OpenMP
+        worksharing construct of a prange loop"""
+        clauses = []
+        condition = self._get_disjoint_condition(iterable.disjoint)
+        if condition:
+            clauses.append('if({})'.format(condition))
+        if iterable.private:
+            clauses.append('private({})'.format(', '.join(self._print(v) for v in iterable.private)))
+        operators = OrderedDict()
+        for op, v in iterable.reductions:
+            operators.setdefault(op, []).append(self._print_reduction_variable(v))
+        clauses.extend('reduction({}:{})'.format(op, ', '.join(v)) for op, v in operators.items())
+        return ' '.join(clauses)
+
+    def _print_reduction_variable(self, var):
+        """Prints a variable in the reduction clause of an OpenMP construct"""
+        return self._print(var)
+
+    def _get_disjoint_condition(self, disjoint):
+        """Returns the condition under which the arrays of the pairs of
+        disjoint do not overlap, or None if the language does not need it"""
+        return None
+
     def _print_NumberSymbol(self, expr):
         return str(expr)
 
@@ -6,10 +6,11 @@
 # pylint: disable=R0201
 
 from collections import OrderedDict
+import re
 
 import numpy as np
 
-from pyccel.codegen.printing.ccode import CCodePrinter
+from pyccel.codegen.printing.ccode import CCodePrinter, ndarray_type_registry
 
 from pyccel.ast.literals  import LiteralTrue, LiteralInteger, LiteralString
 from pyccel.ast.literals  import Nil
@@ -19,39 +20,491 @@ from pyccel.ast.builtins import PythonPrint
 from pyccel.ast.core import Variable, ValuedVariable, Assign, AliasAssign, FunctionDef, FunctionAddress
 from pyccel.ast.core import If, Return, FunctionCall
 from pyccel.ast.core import create_incremented_string, SeparatorComment
-from pyccel.ast.core import VariableAddress, Import, IfTernaryOperator
+from pyccel.ast.core import VariableAddress, Import, Declare
 from pyccel.ast.core import AugAssign
 
 from pyccel.ast.operators import PyccelEq, PyccelNot, PyccelAnd, PyccelNe, PyccelOr, PyccelAssociativeParenthesis
+from pyccel.ast.operators import PyccelGe, PyccelLt, PyccelAdd
 
 from pyccel.ast.datatypes import NativeInteger, NativeBool, NativeComplex, NativeReal, str_dtype, default_precision
 
-from pyccel.ast.cwrapper import PyccelPyObject, PyArg_ParseTupleNode, PyBuildValueNode
+from pyccel.ast.cwrapper import PyccelPyObject, PyccelPyArgs, PyccelPySsize, PyccelPyTypeObject
+from pyccel.ast.cwrapper import PyArgCollectNode, PyBuildValueNode
 from pyccel.ast.cwrapper import PyArgKeywords, collect_function_registry
-from pyccel.ast.cwrapper import Py_None, flags_registry
+from pyccel.ast.cwrapper import Py_None, Switch, PyAllowThreads
 from pyccel.ast.cwrapper import PyErr_SetString, PythonType_Check
 from pyccel.ast.cwrapper import cast_function_registry, Py_DECREF
 from pyccel.ast.cwrapper import PyccelPyArrayObject, NumpyType_Check
-from pyccel.ast.cwrapper import numpy_get_ndims, numpy_get_data, numpy_get_dim
-from pyccel.ast.cwrapper import numpy_get_type, numpy_dtype_registry
-from pyccel.ast.cwrapper import numpy_check_flag, numpy_flag_c_contig, numpy_flag_f_contig
+from pyccel.ast.cwrapper import numpy_get_ndims, numpy_check_array, numpy_get_size
+from pyccel.ast.cwrapper import numpy_get_type, numpy_dtype_registry, numpy_num_to_type
 from pyccel.ast.cwrapper import PyArray_CheckScalar, PyArray_ScalarAsCtype
+from pyccel.ast.cwrapper import PyccelCFIArray, cfi_type_registry
+from pyccel.ast.cwrapper import ndarray_to_pyarray, cfi_array_new, cfi_array_to_pyarray
+from pyccel.ast.cwrapper import pyarray_get_view, pyarray_release_view
+from pyccel.ast.cwrapper import pyarray_to_ndarray, pyarray_to_cfi_array
+from pyccel.ast.cwrapper import pyarg_converter_registry, pyarg_type, pyarg_array_type
 
 from pyccel.ast.bind_c   import as_static_function_call
 
 from pyccel.errors.errors import Errors
 from pyccel.errors.messages import PYCCEL_RESTRICTION_TODO
+from pyccel.errors.messages import UFUNC_SCALAR_ARGUMENTS, GUFUNC_INVALID_SIGNATURE
+from pyccel.errors.messages import GUFUNC_RESULTS, GUFUNC_ARGUMENT_RANK
 
 errors = Errors()
 
 __all__ = ["CWrapperCodePrinter", "cwrappercode"]
 
 dtype_registry = {('pyobject'     , 0) : 'PyObject',
-                  ('pyarrayobject', 0) : 'PyArrayObject'}
+                  ('pyarrayobject', 0) : 'PyArrayObject',
+                  ('cfiarray'     , 0) : 't_cfi_array',
+                  ('pyargs'       , 0) : 'PyObject *const',
+                  ('pyssize'      , 0) : 'Py_ssize_t',
+                  ('pytypeobject' , 0) : 'PyTypeObject'}
+
+# Number of elements of the array arguments above which the wrapper releases
+# the GIL while the translated function runs (the threshold used by numpy)
+nogil_threshold = 500
+
+# Flags of the wrappers, which use the vectorcall protocol (METH_FASTCALL).
+# Before python 3.7, METH_FASTCALL functions always receive the keywords
+method_flags_macro = """#if PY_VERSION_HEX >= 0x03070000
+#define PYCCEL_METH_FASTCALL (METH_FASTCALL | METH_KEYWORDS)
+#else
+#define PYCCEL_METH_FASTCALL METH_FASTCALL
+#endif"""
+
+# Function collecting the arguments passed to a wrapper with the vectorcall
+# protocol. The arguments passed by position are collected without parsing
+# any format string, the names of the keyword arguments are only compared
+# with the names of the arguments if keywords are provided
+argument_collection_functions = """static int32_t pyarg_collect(const char *fname, PyObject *const *args, Py_ssize_t nargs,
+        PyObject *kwnames, char **kwlist, Py_ssize_t nparams, Py_ssize_t npositional,
+        Py_ssize_t nrequired, PyObject **values[])
+{
+    Py_ssize_t nkwargs = kwnames == NULL ? 0 : PyTuple_GET_SIZE(kwnames);
+
+    if (nargs > npositional)
+    {
+        PyErr_Format(PyExc_TypeError, "%s() takes at most %zd positional arguments (%zd given)",
+                fname, npositional, nargs);
+        return 0;
+    }
+    for (Py_ssize_t i = 0; i < nargs; i++)
+    {
+        *values[i] = args[i];
+    }
+    if (nkwargs == 0 && nargs >= nrequired)
+    {
+        return 1;
+    }
+    for (Py_ssize_t i = nargs; i < nrequired; i++)
+    {
+        *values[i] = NULL;
+    }
+    for (Py_ssize_t k = 0; k < nkwargs; k++)
+    {
+        PyObject *key = PyTuple_GET_ITEM(kwnames, k);
+        Py_ssize_t i = 0;
+
+        while (i < nparams && PyUnicode_CompareWithASCIIString(key, kwlist[i]) != 0)
+        {
+            i++;
+        }
+        if (i == nparams)
+        {
+            PyErr_Format(PyExc_TypeError, "%s() got an unexpected keyword argument '%U'", fname, key);
+            return 0;
+        }
+        if (i < nargs)
+        {
+            PyErr_Format(PyExc_TypeError, "%s() got multiple values for argument '%s'", fname, kwlist[i]);
+            return 0;
+        }
+        *values[i] = args[nargs + k];
+    }
+    for (Py_ssize_t i = nargs; i < nrequired; i++)
+    {
+        if (*values[i] == NULL)
+        {
+            PyErr_Format(PyExc_TypeError, "%s() missing required argument '%s' (pos %zd)",
+                    fname, kwlist[i], i + 1);
+            return 0;
+        }
+    }
+    return 1;
+}"""
+
+# Functions describing the type of the arguments of an interface, which the
+# wrapper stores to jump directly to the function it called last time if the
+# next call passes arguments of the same types. The objects which are not
+# passed are NULL
+dispatch_cache_functions = """static PyTypeObject *pyarg_type(void *o)
+{
+    return o == NULL ? NULL : Py_TYPE((PyObject *)o);
+}"""
+
+# Function describing the dtype and the rank of an array argument of an
+# interface, only used if one of its functions takes arrays
+dispatch_cache_array_function = """static int32_t pyarg_array_type(void *o)
+{
+    if (o == NULL || !PyArray_Check((PyObject *)o))
+    {
+        return -1;
+    }
+    return PyArray_TYPE((PyArrayObject *)o) + NPY_NTYPES * PyArray_NDIM((PyArrayObject *)o);
+}"""
+
+# Functions converting the python objects passed to a wrapper into the
+# scalars expected by the translated function. The type of the object is
+# checked by the conversion itself, which returns 0 if it fails (with the
+# python exception set)
+pyarg_integer_function = """static int32_t pyarg_to_longlong(PyObject *o, long long *x)
+{
+    PyObject *index;
+
+    if (PyLong_Check(o))
+    {
+        *x = PyLong_AsLongLong(o);
+        return *x != -1 || !PyErr_Occurred();
+    }
+    /* Reject the floats but accept the numpy integers */
+    index = PyNumber_Index(o);
+    if (index == NULL)
+    {
+        return 0;
+    }
+    *x = PyLong_AsLongLong(index);
+    Py_DECREF(index);
+    return *x != -1 || !PyErr_Occurred();
+}"""
+
+pyarg_bounded_integer_function = """static int32_t pyarg_to_int{bits}(PyObject *o, int{bits}_t *x)
+{{
+    long long value;
+
+    if (!pyarg_to_longlong(o, &value))
+    {{
+        return 0;
+    }}
+    if (value < INT{bits}_MIN || value > INT{bits}_MAX)
+    {{
+        PyErr_SetString(PyExc_OverflowError, "Python int too large to convert to int{bits}");
+        return 0;
+    }}
+    *x = (int{bits}_t)value;
+    return 1;
+}}"""
+
+pyarg_converter_functions = {
+    'pyarg_to_int64'  : """static int32_t pyarg_to_int64(PyObject *o, int64_t *x)
+{
+    long long value;
+
+    if (!pyarg_to_longlong(o, &value))
+    {
+        return 0;
+    }
+    *x = (int64_t)value;
+    return 1;
+}""",
+    'pyarg_to_int32'  : pyarg_bounded_integer_function.format(bits = 32),
+    'pyarg_to_int16'  : pyarg_bounded_integer_function.format(bits = 16),
+    'pyarg_to_int8'   : pyarg_bounded_integer_function.format(bits = 8),
+    'pyarg_to_double' : """static int32_t pyarg_to_double(PyObject *o, double *x)
+{
+    if (PyFloat_Check(o))
+    {
+        *x = PyFloat_AS_DOUBLE(o);
+        return 1;
+    }
+    /* Any object defining __float__ or __index__ (raises a TypeError otherwise) */
+    *x = PyFloat_AsDouble(o);
+    return *x != -1.0 || !PyErr_Occurred();
+}""",
+    'pyarg_to_float'  : """static int32_t pyarg_to_float(PyObject *o, float *x)
+{
+    double value;
+
+    if (!pyarg_to_double(o, &value))
+    {
+        return 0;
+    }
+    *x = (float)value;
+    return 1;
+}""",
+    'pyarg_to_bool'   : """static int32_t pyarg_to_bool(PyObject *o, bool *x)
+{
+    long long value;
+
+    if (PyBool_Check(o) || PyArray_IsScalar(o, Bool))
+    {
+        *x = PyObject_IsTrue(o);
+        return 1;
+    }
+    /* The python and numpy integers are accepted as in C */
+    if (!PyLong_Check(o) && !PyArray_IsScalar(o, Integer))
+    {
+        PyErr_Format(PyExc_TypeError, "expected a bool or an int, got %s", Py_TYPE(o)->tp_name);
+        return 0;
+    }
+    if (!pyarg_to_longlong(o, &value))
+    {
+        return 0;
+    }
+    *x = value != 0;
+    return 1;
+}""",
+}
+
+# Function computing the memory spanned by an operand of a ufunc loop of n
+# iterations, used to run the loop in parallel only when its outputs do not
+# overlap its inputs (e.g. not for the reduce and accumulate methods)
+ufunc_bounds_function = """static void ufunc_operand_bounds(char *data, npy_intp n, npy_intp step, int32_t rank,
+        const npy_intp *shape, const npy_intp *strides, npy_intp item_size, char **lo, char **hi)
+{
+    npy_intp lo_offset = (n > 0 && step < 0) ? (n - 1) * step : 0;
+    npy_intp hi_offset = (n > 0 && step > 0) ? (n - 1) * step : 0;
+
+    for (int32_t d = 0; d < rank; d++)
+    {
+        if (strides[d] < 0)
+        {
+            lo_offset += (shape[d] - 1) * strides[d];
+        }
+        else
+        {
+            hi_offset += (shape[d] - 1) * strides[d];
+        }
+    }
+    *lo = data + lo_offset;
+    *hi = data + hi_offset + item_size;
+}"""
+
+# Functions handing the arrays returned by a function over to numpy without
+# copying their data. The numpy array is the owner of the memory through a
+# capsule (its base object) which releases it when the array is destroyed
+ndarray_result_functions = """static void ndarray_capsule_free(PyObject *capsule)
+{
+    t_ndarray *arr = PyCapsule_GetPointer(capsule, NULL);
+    free_array(*arr);
+    free(arr);
+}
+
+static PyObject *ndarray_to_pyarray(t_ndarray arr, int32_t typenum)
+{
+    npy_intp shape[MAX_NDIM];
+    npy_intp strides[MAX_NDIM];
+    t_ndarray *owner;
+    PyObject *capsule;
+    PyObject *result;
+
+    for (int32_t i = 0; i < arr.nd; i++)
+    {
+        shape[i] = arr.shape[i];
+        strides[i] = arr.strides[i] * arr.type_size;
+    }
+    owner = malloc(sizeof(t_ndarray));
+    if (owner == NULL)
+    {
+        free_array(arr);
+        return PyErr_NoMemory();
+    }
+    *owner = arr;
+    capsule = PyCapsule_New(owner, NULL, ndarray_capsule_free);
+    if (capsule == NULL)
+    {
+        free_array(arr);
+        free(owner);
+        return NULL;
+    }
+    result = PyArray_New(&PyArray_Type, arr.nd, shape, typenum, strides,
+            arr.raw_data, arr.type_size, NPY_ARRAY_WRITEABLE, NULL);
+    if (result == NULL)
+    {
+        Py_DECREF(capsule);
+        return NULL;
+    }
+    if (PyArray_SetBaseObject((PyArrayObject *)result, capsule) < 0)
+    {
+        Py_DECREF(result);
+        return NULL;
+    }
+    return result;
+}"""
+
+# Functions passing numpy arrays to the translated functions without copying
+# their data: the shape and the strides of the numpy array are used to
+# describe it. The data which cannot be described in this way (not aligned or
+# with strides which are not a multiple of the item size) is copied, and the
+# copy is written back into the numpy array if the function may modify it
+array_argument_functions = """static PyArrayObject *pyarray_get_view(PyArrayObject *arr, int32_t writeback, int32_t warn)
+{
+    int32_t copy = !PyArray_ISALIGNED(arr);
+    int flags = NPY_ARRAY_C_CONTIGUOUS | NPY_ARRAY_ALIGNED | NPY_ARRAY_ENSURECOPY;
+
+    for (int32_t i = 0; i < PyArray_NDIM(arr); i++)
+    {
+        if (PyArray_DIM(arr, i) > 1 && PyArray_STRIDE(arr, i) % PyArray_ITEMSIZE(arr) != 0)
+        {
+            copy = 1;
+        }
+    }
+    if (!copy)
+    {
+        Py_INCREF(arr);
+        return arr;
+    }
+    if (warn && PyErr_WarnEx(PyExc_RuntimeWarning, "An array argument is copied as its data "
+                "is not aligned or its strides are not a multiple of its item size", 1) < 0)
+    {
+        return NULL;
+    }
+    if (writeback)
+    {
+        flags |= NPY_ARRAY_WRITEBACKIFCOPY;
+    }
+    return (PyArrayObject *)PyArray_FromArray(arr, NULL, flags);
+}
+
+static void pyarray_release_view(PyArrayObject *view)
+{
+    if (view != NULL)
+    {
+        PyArray_ResolveWritebackIfCopy(view);
+        Py_DECREF(view);
+    }
+}"""
+
+ndarray_data_functions = """static t_ndarray ndarray_from_data(char *data, int32_t type, int32_t type_size, int32_t nd,
+        const npy_intp *shape, const npy_intp *strides)
+{
+    t_ndarray arr;
+
+    arr.raw_data = data;
+    arr.nd = nd;
+    arr.type = type;
+    arr.type_size = type_size;
+    arr.length = 1;
+    for (int32_t i = 0; i < nd; i++)
+    {
+        arr.shape[i] = shape[i];
+        arr.strides[i] = strides[i] / type_size;
+        arr.length *= shape[i];
+    }
+    arr.buffer_size = arr.length * type_size;
+    arr.alloc_size = 0;
+    arr.is_view = true;
+    return arr;
+}"""
+
+ndarray_argument_functions = """static t_ndarray pyarray_to_ndarray(PyArrayObject *arr, int32_t type)
+{
+    return ndarray_from_data(PyArray_DATA(arr), type, PyArray_ITEMSIZE(arr), PyArray_NDIM(arr),
+            PyArray_DIMS(arr), PyArray_STRIDES(arr));
+}"""
+
+cfi_array_typedef = "typedef CFI_CDESC_T(CFI_MAX_RANK) t_cfi_array;"
+
+cfi_array_data_functions = """static void cfi_array_establish(t_cfi_array *desc, char *data, int32_t type, int32_t type_size,
+        int32_t rank, const npy_intp *shape, const npy_intp *strides, int32_t c_order)
+{
+    CFI_index_t extents[CFI_MAX_RANK];
+
+    /* An array with C ordering is stored as its transpose in Fortran */
+    for (int32_t i = 0; i < rank; i++)
+    {
+        extents[i] = shape[c_order ? rank - 1 - i : i];
+    }
+    CFI_establish((CFI_cdesc_t *)desc, data, CFI_attribute_other,
+            (CFI_type_t)type, type_size, (CFI_rank_t)rank, extents);
+    /* CFI_establish describes contiguous data, the strides of the numpy
+     * array are used instead so that views are passed without copy */
+    for (int32_t i = 0; i < rank; i++)
+    {
+        desc->dim[i].sm = strides[c_order ? rank - 1 - i : i];
+    }
+}"""
+
+cfi_array_argument_functions = """static void pyarray_to_cfi_array(PyArrayObject *arr, t_cfi_array *desc, int32_t type, int32_t c_order)
+{
+    cfi_array_establish(desc, PyArray_DATA(arr), type, PyArray_ITEMSIZE(arr), PyArray_NDIM(arr),
+            PyArray_DIMS(arr), PyArray_STRIDES(arr), c_order);
+}"""
+
+cfi_array_result_functions = """static t_cfi_array *cfi_array_new(int32_t rank, int32_t type)
+{
+    t_cfi_array *desc = malloc(sizeof(t_cfi_array));
+    CFI_establish((CFI_cdesc_t *)desc, NULL, CFI_attribute_allocatable,
+            (CFI_type_t)type, 0, (CFI_rank_t)rank, NULL);
+    return desc;
+}
+
+static void cfi_array_capsule_free(PyObject *capsule)
+{
+    CFI_cdesc_t *desc = PyCapsule_GetPointer(capsule, NULL);
+    CFI_deallocate(desc);
+    free(desc);
+}
+
+static PyObject *cfi_array_to_pyarray(t_cfi_array *desc, int32_t typenum, int32_t c_order)
+{
+    npy_intp shape[CFI_MAX_RANK];
+    npy_intp strides[CFI_MAX_RANK];
+    PyObject *capsule;
+    PyObject *result;
+    int32_t rank = desc->rank;
+
+    /* An array with C ordering is stored as its transpose in Fortran */
+    for (int32_t i = 0; i < rank; i++)
+    {
+        int32_t j = c_order ? rank - 1 - i : i;
+        shape[i] = desc->dim[j].extent;
+        strides[i] = desc->dim[j].sm;
+    }
+    capsule = PyCapsule_New(desc, NULL, cfi_array_capsule_free);
+    if (capsule == NULL)
+    {
+        CFI_deallocate((CFI_cdesc_t *)desc);
+        free(desc);
+        return NULL;
+    }
+    result = PyArray_New(&PyArray_Type, rank, shape, typenum, strides,
+            desc->base_addr, (int)desc->elem_len, NPY_ARRAY_WRITEABLE, NULL);
+    if (result == NULL)
+    {
+        Py_DECREF(capsule);
+        return NULL;
+    }
+    if (PyArray_SetBaseObject((PyArrayObject *)result, capsule) < 0)
+    {
+        Py_DECREF(result);
+        return NULL;
+    }
+    return result;
+}"""
+
+def parse_gufunc_signature(signature):
+    """
+    Returns the core dimensions of the inputs and of the outputs of a
+    generalized ufunc, e.g. '(n),()->(n)' gives [('n',), ()] and [('n',)],
+    or None if the signature is not valid
+    """
+    signature = signature.replace(' ', '')
+    operands  = r'\((?:\w+(?:,\w+)*)?\)(?:,\((?:\w+(?:,\w+)*)?\))*'
+    if not re.fullmatch('{0}->{0}'.format(operands), signature):
+        return None
+    inputs, outputs = [[tuple(d for d in o.split(',') if d) for o in re.findall(r'\(([^)]*)\)', s)]
+                            for s in signature.split('->')]
+    return inputs, outputs
 
 class CWrapperCodePrinter(CCodePrinter):
     """A printer to convert a python module to strings of c code creating
     an interface between python and an implementation of the module in c"""
+    _default_settings = dict(CCodePrinter._default_settings,
+                             warn_array_copy = False,
+                             parallel_threshold = None)
+
     def __init__(self, parser, target_language, settings=None):
         CCodePrinter.__init__(self, parser,settings)
         self._target_language = target_language
@@ -60,6 +513,15 @@ class CWrapperCodePrinter(CCodePrinter):
         self._function_wrapper_names = dict()
         self._global_names = set()
         self._module_name = None
+        self._returns_arrays = False
+        self._passes_arrays = False
+        self._builds_arrays = False
+        self._collects_arguments = False
+        self._to_release_views = []
+        self._pyarg_converters = []
+        self._dispatch_cache = False
+        self._dispatch_cache_arrays = False
+        self._ufunc_bounds = False
 
     def stored_in_c_pointer(self, a):
         stored_in_c = CCodePrinter.stored_in_c_pointer(self, a)
@@ -86,6 +548,8 @@ class CWrapperCodePrinter(CCodePrinter):
             return CCodePrinter.function_signature(self, expr)
 
     def get_declare_type(self, expr):
+        if self._target_language == 'c' and expr.is_ndarray:
+            return CCodePrinter.get_declare_type(self, expr)
         dtype = self._print(expr.dtype)
         prec  = expr.precision
         dtype = self.find_in_dtype_registry(dtype, prec)
@@ -100,6 +564,21 @@ class CWrapperCodePrinter(CCodePrinter):
                         name=self.get_new_name(used_names, name),
                         is_pointer=True)
 
+    def get_wrapper_arguments(self, used_names):
+        """
+        Create the arguments of a wrapper called with the vectorcall protocol
+        (METH_FASTCALL) : self, the array of arguments, the number of
+        positional arguments and the names of the keyword arguments
+        """
+        python_func_selfarg = self.get_new_PyObject("self", used_names)
+        python_func_args    = Variable(dtype=PyccelPyArgs(),
+                                       name=self.get_new_name(used_names, "args"),
+                                       is_pointer=True)
+        python_func_nargs   = Variable(dtype=PyccelPySsize(),
+                                       name=self.get_new_name(used_names, "nargs"))
+        python_func_kwnames = self.get_new_PyObject("kwnames", used_names)
+        return [python_func_selfarg, python_func_args, python_func_nargs, python_func_kwnames]
+
     def find_in_dtype_registry(self, dtype, prec):
         try :
             return dtype_registry[(dtype, prec)]
@@ -132,38 +611,171 @@ class CWrapperCodePrinter(CCodePrinter):
 
     def _get_static_function(self, used_names, function, collect_dict):
         """
-        Create arguments and functioncall for arguments rank > 0 in fortran.
+        Create arguments and functioncall for arguments rank > 0.
         Format : a is numpy array
-        func(a) ==> static_func(a.DIM , a.DATA)
-        where a.DATA = buffer holding data
-              a.DIM = size of array
+        func(a) ==> static_func(a)
+        where a is a t_ndarray in c or the C descriptor of an assumed-shape
+        array in fortran. Both hold the shape and the strides of the numpy
+        array so that its data is used without copy.
+        The views collected in self._to_release_views must be released after
+        the call.
+
+        Returns
+        -------
+        static_function : FunctionDef
+            The function called by the wrapper
+        static_args : list
+            The arguments of the call
+        additional_body : list
+            The statements collecting the arguments
+        local_vars : list
+            The variables which must be declared by the wrapper
         """
         additional_body = []
-        if self._target_language == 'fortran':
-            static_args = []
-            for a in function.arguments:
-                if isinstance(a, Variable) and a.rank>0:
-                    # Add shape arguments for static function
-                    for i in range(collect_dict[a].rank):
-                        var = Variable(dtype=NativeInteger() ,name = self.get_new_name(used_names, a.name + "_dim"))
-                        body = FunctionCall(numpy_get_dim, [collect_dict[a], i])
-                        if a.is_optional:
-                            body = IfTernaryOperator(VariableAddress(collect_dict[a]), body , LiteralInteger(0))
-                        body = Assign(var, body)
-                        additional_body.append(body)
-                        static_args.append(var)
+        static_args = []
+        local_vars = []
+        for a, inout in zip(function.arguments, function.arguments_inout):
+            if isinstance(a, Variable) and a.rank>0:
+                collect_var = collect_dict[a]
+                view = Variable(dtype=PyccelPyArrayObject(), is_pointer=True,
+                                name=self.get_new_name(used_names, a.name+"_view"))
+                # Release the views collected so far if the view cannot be created
+                failure = If((PyccelNot(VariableAddress(view)),
+                    [FunctionCall(pyarray_release_view, [v]) for v in self._to_release_views]
+                    + [Return([Nil()])]))
+                body = [AliasAssign(view, FunctionCall(pyarray_get_view, [collect_var,
+                                LiteralInteger(int(inout)),
+                                LiteralInteger(int(self._settings['warn_array_copy']))])),
+                        failure]
+                if self._target_language == 'fortran':
+                    desc = Variable(dtype=PyccelCFIArray(),
+                                    name=self.get_new_name(used_names, a.name+"_desc"))
+                    arg = self.get_cfi_array(a)
+                    c_order = LiteralInteger(1 if a.order == 'C' else 0)
+                    body += [FunctionCall(pyarray_to_cfi_array, [view, desc,
+                                    self.find_in_cfi_type_registry(a), c_order]),
+                             AliasAssign(arg, VariableAddress(desc))]
+                    local_vars.extend([desc, arg])
+                    static_args.append(arg)
+                else:
+                    nd_type = Variable(dtype=NativeInteger(),
+                                name=ndarray_type_registry[(self._print(a.dtype), a.precision)])
+                    arg = a
+                    body += [Assign(arg, FunctionCall(pyarray_to_ndarray, [view, nd_type]))]
+                    static_args.append(arg)
+                if a.is_optional:
+                    body = [If((VariableAddress(collect_var), body),
+                               (LiteralTrue(), [AliasAssign(view, Nil()), AliasAssign(arg, Nil())]))]
+                additional_body.extend(body)
+                local_vars.append(view)
+                self._to_release_views.append(view)
+                self._passes_arrays = True
+            else:
                 static_args.append(a)
-            static_function = as_static_function_call(function, self._module_name, name=function.name)
+        if self._target_language == 'fortran':
+            static_function = self._as_static_function(function)
+            # Create the descriptors of the arrays allocated by the function
+            for r in function.results:
+                if r.rank > 0 and r not in function.arguments:
+                    desc = self.get_cfi_array(r)
+                    cfi_type = self.find_in_cfi_type_registry(r)
+                    additional_body.append(AliasAssign(desc,
+                        FunctionCall(cfi_array_new, [LiteralInteger(r.rank), cfi_type])))
+                    static_args.append(desc)
+                    local_vars.append(desc)
         else:
             static_function = function
-            static_args = function.arguments
-        return static_function, static_args, additional_body
+        return static_function, static_args, additional_body, local_vars
+
+    def _release_views(self):
+        """ Release the views of the numpy arrays passed to the function
+        (the data of a copy is written back into the original array)
+        """
+        body = [FunctionCall(pyarray_release_view, [v]) for v in self._to_release_views]
+        self._to_release_views.clear()
+        return body
 
-    def _get_check_type_statement(self, variable, collect_var):
+    def _release_gil(self, function, func_call):
+        """
+        Release the global interpreter lock while the translated function
+        runs, so that python threads calling compiled functions run in
+        parallel. The translated code never uses python objects. The GIL
+        is always released for the functions marked with the nogil decorator
+        and for the functions returning arrays. For the other functions
+        taking arrays it is released if the arrays contain at least
+        nogil_threshold elements, as releasing and acquiring the GIL costs
+        more than a call on small arrays. The GIL is kept for the other
+        functions, whose call is usually too short for the release to pay off.
+        This function must be called before the views are released
+
+        Returns
+        -------
+        func_call : Basic
+            The call, executed without the GIL if relevant
+        """
+        if 'nogil' in function.decorators or any(r.rank > 0 for r in function.results):
+            return PyAllowThreads([func_call])
+        arrays = [a for a in function.arguments if isinstance(a, Variable) and a.rank > 0]
+        if not arrays:
+            return func_call
+        sizes = [FunctionCall(numpy_get_size, [v]) for a, v in zip(arrays, self._to_release_views)
+                    if not a.is_optional]
+        if not sizes:
+            return PyAllowThreads([func_call])
+        size = sizes[0]
+        for s in sizes[1:]:
+            size = PyccelAdd(size, s)
+        return PyAllowThreads([func_call], PyccelGe(size, LiteralInteger(nogil_threshold)))
+
+    def _as_static_function(self, function):
+        """
+        Create the c-compatible version of a function of the fortran module.
+        The arrays are passed through C descriptors (ISO_Fortran_binding.h):
+        assumed-shape arrays for the arguments and allocatable arrays for the
+        arrays allocated by the function
+        """
+        static_function = as_static_function_call(function, self._module_name, name=function.name)
+        if any(isinstance(a, Variable) and a.rank > 0 for a in static_function.arguments):
+            arguments = [self.get_cfi_array(a) if isinstance(a, Variable) and a.rank > 0 else a
+                            for a in static_function.arguments]
+            static_function = FunctionDef(name = static_function.name,
+                    arguments = arguments,
+                    results = static_function.results,
+                    body = [])
+        return static_function
+
+    def get_cfi_array(self, variable):
+        """ The descriptor of an array passed to or returned by a fortran function """
+        return Variable(dtype=PyccelCFIArray(), name=variable.name, is_pointer=True)
+
+    def find_in_cfi_type_registry(self, var):
+        """ Find the type code of a C descriptor for a given variable
+        """
+        dtype = self._print(var.dtype)
+        prec  = var.precision
+        try :
+            return cfi_type_registry[(dtype, prec)]
+        except KeyError:
+            errors.report(PYCCEL_RESTRICTION_TODO,
+                    symbol = "{}[kind = {}]".format(dtype, prec),
+                    severity='fatal')
+
+    def _get_check_type_statement(self, variable, collect_var, allow_default = True):
+        """
+        Create the condition checking that the python object collect_var can be
+        passed as variable. The default value of the argument (None) is accepted
+        if the variable has one, unless allow_default is False
+        """
 
         if variable.rank > 0 :
             numpy_dtype = self.find_in_numpy_dtype_registry(variable)
-            check = PyccelEq(FunctionCall(numpy_get_type, [collect_var]), numpy_dtype)
+            checks = [FunctionCall(numpy_check_array, [collect_var]),
+                      PyccelEq(FunctionCall(numpy_get_ndims, [collect_var]), LiteralInteger(variable.rank)),
+                      PyccelEq(FunctionCall(numpy_get_type, [collect_var]), numpy_dtype)]
+            if isinstance(variable, ValuedVariable) and not allow_default:
+                # The array is NULL if it is not passed
+                checks.insert(0, VariableAddress(collect_var))
+            check = PyccelAssociativeParenthesis(PyccelAnd(*checks))
 
         else :
             python_check = PythonType_Check(variable, collect_var)
@@ -173,7 +785,7 @@ class CWrapperCodePrinter(CCodePrinter):
             else :
                 check = PyccelAssociativeParenthesis(PyccelAnd(PyccelNot(python_check), numpy_check))
 
-        if isinstance(variable, ValuedVariable):
+        if isinstance(variable, ValuedVariable) and allow_default:
             default = PyccelNot(VariableAddress(collect_var)) if variable.rank > 0 else PyccelEq(VariableAddress(collect_var), VariableAddress(Py_None))
             check = PyccelAssociativeParenthesis(PyccelOr(default, check))
 
@@ -225,8 +837,6 @@ class CWrapperCodePrinter(CCodePrinter):
         collect_var :
             the pyobject variable
         """
-        if variable.rank > 0 :
-            return FunctionCall(numpy_get_data,[collect_var])
         if isinstance(variable.dtype, NativeComplex):
             return self.get_cast_function_call('pycomplex_to_complex', collect_var)
 
@@ -266,6 +876,29 @@ class CWrapperCodePrinter(CCodePrinter):
 
         return FunctionCall(cast_function, [arg])
 
+    def get_pyarg_converter_call(self, variable, collect_var):
+        """
+        Represents a call to the function converting the python object collect_var
+        into the value of variable. The call returns 0 if the object does not have
+        the expected type (see pyarg_converter_functions)
+
+        Parameters:
+        ----------
+        variable: Variable
+            The scalar passed to the translated function
+        collect_var : Variable
+            The pyobject collected by the wrapper
+        """
+        try :
+            converter = pyarg_converter_registry[(variable.dtype, variable.precision)]
+        except KeyError:
+            errors.report(PYCCEL_RESTRICTION_TODO,
+                    symbol = "{}[kind = {}]".format(variable.dtype, variable.precision),
+                    severity='fatal')
+        if converter.name.name not in self._pyarg_converters:
+            self._pyarg_converters.append(converter.name.name)
+        return FunctionCall(converter, [collect_var, variable])
+
     # -------------------------------------------------------------------
     # Functions managing  the creation of wrapper body
     # -------------------------------------------------------------------
@@ -351,19 +984,21 @@ class CWrapperCodePrinter(CCodePrinter):
 
     def _body_array(self, variable, collect_var, check_type = False) :
         """
-        Responsible for collecting value and managing error and create the body
+        Responsible for managing error and create the body of the checks
         of arguments with rank greater than 0 in format
-                if (rank check == False){
+                if (array check == False){
+                    print TypeError Not an array
+                    return Null
+                }else if (rank check == False){
                     print TypeError Wrong rank
                     return Null
                 }else if(Type Check == False){
                     Print TypeError Wrong type
                     return Null
-                }else if (order check == False){ #check for order for rank > 1
-                    Print NotImplementedError Wrong Order
-                    return Null
                 }
-                collect the value from PyArrayObject
+        The checks are skipped if an optional argument is not provided.
+        Arrays with any ordering and strides are accepted, their value is
+        collected just before the function call (see _get_static_function)
 
         Parameters:
         ----------
@@ -380,15 +1015,14 @@ class CWrapperCodePrinter(CCodePrinter):
             A list of statements
         """
         body = []
-        #TODO create and extern rank and order check function
-        #check optional :
-        if variable.is_optional :
-            check = PyccelNot(VariableAddress(collect_var))
-            body += [(check, [Assign(VariableAddress(variable), Nil())])]
-
+        if check_type : #Array check
+            check = PyccelNot(FunctionCall(numpy_check_array, [collect_var]))
+            error = PyErr_SetString('PyExc_TypeError', '"{} must be a numpy array"'.format(variable))
+            body += [(check, [error, Return([Nil()])])]
+        #TODO create and extern rank check function
         #rank check :
-        check = PyccelNe(FunctionCall(numpy_get_ndims,[collect_var]), LiteralInteger(collect_var.rank))
-        error = PyErr_SetString('PyExc_TypeError', '"{} must have rank {}"'.format(collect_var, str(collect_var.rank)))
+        check = PyccelNe(FunctionCall(numpy_get_ndims,[collect_var]), LiteralInteger(variable.rank))
+        error = PyErr_SetString('PyExc_TypeError', '"{} must have rank {}"'.format(variable, str(variable.rank)))
         body  += [(check, [error, Return([Nil()])])]
         if check_type : #Type check
             numpy_dtype = self.find_in_numpy_dtype_registry(variable)
@@ -397,19 +1031,12 @@ class CWrapperCodePrinter(CCodePrinter):
             info_dump = PythonPrint([FunctionCall(numpy_get_type, [collect_var]), numpy_dtype])
             error = PyErr_SetString('PyExc_TypeError', '"{} must be {}"'.format(variable, arg_dtype))
             body += [(check, [info_dump, error, Return([Nil()])])]
-
-        if collect_var.rank > 1 and self._target_language == 'fortran' :#Order check
-            if collect_var.order == 'F':
-                check = FunctionCall(numpy_check_flag,[collect_var, numpy_flag_f_contig])
-            else:
-                check = FunctionCall(numpy_check_flag,[collect_var, numpy_flag_c_contig])
-                error = PyErr_SetString('PyExc_NotImplementedError',
-                        '"Argument does not have the expected ordering ({})"'.format(collect_var.order))
-                body += [(PyccelNot(check), [error, Return([Nil()])])]
-        body += [(LiteralTrue(), [Assign(VariableAddress(variable),
-                                self.get_collect_function_call(variable, collect_var))])]
         body = [If(*body)]
 
+        #check optional :
+        if variable.is_optional :
+            body = [If((VariableAddress(collect_var), body))]
+
         return body
 
     def _body_management(self, used_names, variable, collect_var, cast_function, check_type = False):
@@ -429,12 +1056,13 @@ class CWrapperCodePrinter(CCodePrinter):
         elif isinstance(variable, ValuedVariable):
             body = self._body_valued_variable(variable, collect_var, check_type)
 
+        elif cast_function is not None:
+            # The conversion checks the type of the python object
+            body = [If((PyccelNot(cast_function), [Return([Nil()])]))]
+
         elif isinstance(collect_var.dtype, PyccelPyObject):
             body = [self._create_collecting_value_body(variable, collect_var)]
 
-        elif cast_function is not None:
-            body = [Assign(variable, cast_function)]
-
         return body, tmp_variable
 
     # -------------------------------------------------------------------
@@ -443,7 +1071,7 @@ class CWrapperCodePrinter(CCodePrinter):
     def get_PyArgParseType(self, used_names, variable):
         """
         Responsible for creating any necessary intermediate variables which are used
-        to collect the result of PyArgParse, and collecting the required cast function
+        to collect the arguments, and collecting the required cast function
 
         Parameters:
         ----------
@@ -462,30 +1090,43 @@ class CWrapperCodePrinter(CCodePrinter):
             call to cast function responsible of the conversion of one data type into another
         """
         cast_function = None
-        collect_var = variable
 
         if variable.rank > 0:
             collect_type = PyccelPyArrayObject()
             collect_var = Variable(dtype= collect_type, is_pointer = True, rank = variable.rank,
                                     order= variable.order, name=self.get_new_name(used_names, variable.name+"_tmp"))
 
-        elif isinstance(variable, ValuedVariable):
+        else:
             collect_type = PyccelPyObject()
             collect_var = Variable(dtype=collect_type, is_pointer=True,
                 name = self.get_new_name(used_names, variable.name+"_tmp"))
+            if not isinstance(variable, ValuedVariable) and variable.dtype is not NativeComplex():
+                cast_function = self.get_pyarg_converter_call(variable, collect_var)
 
-        elif variable.dtype is NativeBool():
-            collect_type = NativeInteger()
-            collect_var = Variable(dtype=collect_type, precision=4,
-                name = self.get_new_name(used_names, variable.name+"_tmp"))
-            cast_function =  self.get_cast_function_call('pyint_to_bool', collect_var)
+        return collect_var, cast_function
 
-        elif variable.dtype is NativeComplex():
-            collect_type = PyccelPyObject()
-            collect_var = Variable(dtype=collect_type, is_pointer=True,
-                name = self.get_new_name(used_names, variable.name+"_tmp"))
+    def get_missing_arguments_checks(self, func_name, parse_node, c_func_args, parse_args):
+        """
+        Create the statements raising an error if the keyword only arguments
+        which have no default value are not passed. The other required
+        arguments are checked by pyarg_collect
 
-        return collect_var, cast_function
+        Returns
+        -------
+        init : list
+            The statements initialising the collect variables before the collection
+        checks : list
+            The statements checking the collect variables after the collection
+        """
+        init   = []
+        checks = []
+        for c_arg, p_arg in zip(c_func_args[parse_node.nrequired:], parse_args[parse_node.nrequired:]):
+            if not isinstance(c_arg, ValuedVariable):
+                error = PyErr_SetString('PyExc_TypeError',
+                        '"{}() missing required keyword-only argument \'{}\'"'.format(func_name, c_arg.name))
+                init.append(AliasAssign(p_arg, Nil()))
+                checks.append(If((PyccelNot(VariableAddress(p_arg)), [error, Return([Nil()])])))
+        return init, checks
 
     def get_PyBuildValue(self, used_names, variable):
         """
@@ -511,13 +1152,28 @@ class CWrapperCodePrinter(CCodePrinter):
         collect_var = variable
         cast_function = None
 
-        if variable.dtype is NativeBool():
+        if variable.rank > 0:
+            # The array allocated by the function is handed over to numpy
+            collect_type = PyccelPyObject()
+            collect_var = Variable(dtype=collect_type, is_pointer=True,
+                name = self.get_new_name(used_names, variable.name+"_tmp"))
+            numpy_dtype = self.find_in_numpy_dtype_registry(variable)
+            if self._target_language == 'fortran':
+                c_order = LiteralInteger(1 if variable.order == 'C' else 0)
+                cast_function = FunctionCall(cfi_array_to_pyarray,
+                        [self.get_cfi_array(variable), numpy_dtype, c_order])
+            else:
+                cast_function = FunctionCall(ndarray_to_pyarray, [variable, numpy_dtype])
+            self._to_free_PyObject_list.append(collect_var)
+            self._returns_arrays = True
+
+        elif variable.dtype is NativeBool():
             collect_type = PyccelPyObject()
             collect_var = Variable(dtype=collect_type, is_pointer=True,
                 name = self.get_new_name(used_names, variable.name+"_tmp"))
             cast_function = self.get_cast_function_call('bool_to_pyobj', variable)
 
-        if variable.dtype is NativeComplex():
+        elif variable.dtype is NativeComplex():
             collect_type = PyccelPyObject()
             collect_var = Variable(dtype=collect_type, is_pointer=True,
                 name = self.get_new_name(used_names, variable.name+"_tmp"))
@@ -537,33 +1193,23 @@ class CWrapperCodePrinter(CCodePrinter):
         wrapper_name = self._get_wrapper_name(used_names, expr)
         self._global_names.add(wrapper_name)
 
-        # Collect local variables
-        python_func_args    = self.get_new_PyObject("args"  , used_names)
-        python_func_kwargs  = self.get_new_PyObject("kwargs", used_names)
-        python_func_selfarg = self.get_new_PyObject("self"  , used_names)
-
         # Collect wrapper arguments and results
-        wrapper_args    = [python_func_selfarg, python_func_args, python_func_kwargs]
+        wrapper_args    = self.get_wrapper_arguments(used_names)
         wrapper_results = [self.get_new_PyObject("result", used_names)]
 
         # Collect parser arguments
         wrapper_vars = {}
 
-        # Collect argument names for PyArgParse
+        # Collect argument names for the keywords
         arg_names         = [a.name for a in funcs[0].arguments]
         keyword_list_name = self.get_new_name(used_names,'kwlist')
         keyword_list      = PyArgKeywords(keyword_list_name, arg_names)
         wrapper_body      = [keyword_list]
 
-        wrapper_body_translations = []
-        body_tmp = []
-
         # To store the mini function responsible of collecting value and calling interfaces functions and return the builded value
         funcs_def = []
-        default_value = {} # dict to collect all initialisation needed in the wrapper
         check_var = Variable(dtype = NativeInteger(), name = self.get_new_name(used_names , "check"))
         wrapper_vars[check_var.name] = check_var
-        types_dict = OrderedDict((a, set()) for a in funcs[0].arguments) #dict to collect each variable possible type and the corresponding flags
         # collect parse arg
         parse_args = [Variable(dtype= PyccelPyArrayObject(), is_pointer = True, rank = a.rank,
                             order= a.order,
@@ -571,43 +1217,52 @@ class CWrapperCodePrinter(CCodePrinter):
             Variable(dtype = PyccelPyObject() ,
                     name = self.get_new_name(used_names, a.name + "_tmp"),
                     is_pointer= True) for a in funcs[0].arguments]
+
+        # The types which each argument can take. The index of the function
+        # matching the types of the arguments is made of the positions of
+        # these types, as the digits of a number whose base is different for
+        # each argument, so that the index of every combination is different
+        types_dict = [OrderedDict() for a in funcs[0].arguments]
+        for func in funcs:
+            for types, f_arg in zip(types_dict, func.arguments):
+                types.setdefault((f_arg.dtype, f_arg.precision, f_arg.rank), f_arg)
+        strides = []
+        stride  = 1
+        for types in reversed(types_dict):
+            strides.insert(0, stride)
+            stride *= len(types)
+
+        cases = OrderedDict()
         # Managing the body of wrapper
         for func in funcs :
             mini_wrapper_func_body = []
             res_args = []
             mini_wrapper_func_vars = {a.name : a for a in func.arguments}
-            flags = 0
+            func_index = 0
             collect_vars = {}
 
             # Loop for all args in every functions and create the corresponding condition and body
-            for p_arg, f_arg in zip(parse_args, func.arguments):
+            for p_arg, f_arg, types, stride in zip(parse_args, func.arguments, types_dict, strides):
                 collect_vars[f_arg] = p_arg
                 body, tmp_variable = self._body_management(used_names, f_arg, p_arg, None)
                 if tmp_variable :
                     mini_wrapper_func_vars[tmp_variable.name] = tmp_variable
 
-                # get check type function
-                check = self._get_check_type_statement(f_arg, p_arg)
                 # If the variable cannot be collected from PyArgParse directly
                 wrapper_vars[p_arg.name] = p_arg
 
-                # Save the body
-                wrapper_body_translations.extend(body)
-
                 # Write default values
-                if isinstance(f_arg, ValuedVariable):
-                    wrapper_body.append(self.get_default_assign(parse_args[-1], f_arg))
+                if isinstance(f_arg, ValuedVariable) and func is funcs[0]:
+                    wrapper_body.append(self.get_default_assign(p_arg, f_arg))
 
-                flag_value = flags_registry[(f_arg.dtype, f_arg.precision)]
-                flags = (flags << 4) + flag_value  # shift by 4 to the left
-                types_dict[f_arg].add((f_arg, check, flag_value)) # collect variable type for each arguments
+                func_index += list(types).index((f_arg.dtype, f_arg.precision, f_arg.rank)) * stride
                 mini_wrapper_func_body += body
 
             # create the corresponding function call
-            static_function, static_args, additional_body = self._get_static_function(used_names, func, collect_vars)
+            static_function, static_args, additional_body, local_vars = self._get_static_function(used_names, func, collect_vars)
             mini_wrapper_func_body.extend(additional_body)
 
-            for var in static_args:
+            for var in static_args + local_vars:
                 mini_wrapper_func_vars[var.name] = var
 
             if len(func.results)==0:
@@ -616,7 +1271,8 @@ class CWrapperCodePrinter(CCodePrinter):
                 results   = func.results if len(func.results)>1 else func.results[0]
                 func_call = Assign(results,FunctionCall(static_function, static_args))
 
-            mini_wrapper_func_body.append(func_call)
+            mini_wrapper_func_body.append(self._release_gil(func, func_call))
+            mini_wrapper_func_body += self._release_views()
 
             # Loop for all res in every functions and create the corresponding body and cast
             for r in func.results :
@@ -643,31 +1299,44 @@ class CWrapperCodePrinter(CCodePrinter):
                 local_vars = mini_wrapper_func_vars.values())
             funcs_def.append(mini_wrapper_func_def)
 
-            # append check condition to the functioncall
-            body_tmp.append((PyccelEq(check_var, LiteralInteger(flags)), [AliasAssign(wrapper_results[0],
-                    FunctionCall(mini_wrapper_func_def, parse_args))]))
+            # jump to the function from the index of its types
+            cases.setdefault(func_index, [AliasAssign(wrapper_results[0],
+                    FunctionCall(mini_wrapper_func_def, parse_args)), Return(wrapper_results)])
 
         # Errors / Types management
         # Creating check_type function
-        check_func_def = self._create_wrapper_check(check_var, parse_args, types_dict, used_names, funcs[0].name.name)
+        check_func_def = self._create_wrapper_check(check_var, parse_args, types_dict, strides, used_names, funcs[0].name.name)
         funcs_def.append(check_func_def)
 
-        # Create the wrapper body with collected informations
-        body_tmp = [((PyccelNot(check_var), [Return([Nil()])]))] + body_tmp
-        body_tmp.append((LiteralTrue(),
-            [PyErr_SetString('PyExc_TypeError', '"Arguments combinations don\'t exist"'),
-            Return([Nil()])]))
-        wrapper_body_translations = [If(*body_tmp)]
-
         # Parsing Arguments
-        parse_node = PyArg_ParseTupleNode(python_func_args, python_func_kwargs, funcs[0].arguments, parse_args, keyword_list, True)
-        wrapper_body += list(default_value.values())
+        parse_node = PyArgCollectNode(expr.name, *wrapper_args[1:], funcs[0].arguments, parse_args, keyword_list)
+        init, checks = self.get_missing_arguments_checks(expr.name, parse_node, funcs[0].arguments, parse_args)
+        wrapper_body += init
         wrapper_body.append(If((PyccelNot(parse_node), [Return([Nil()])])))
+        wrapper_body += checks
+
+        # The index of the function called last time is reused if the
+        # arguments have the same types (and the same dtypes for arrays)
+        cache_vars = self._create_dispatch_cache(expr.name, check_var, funcs[0].arguments, types_dict)
+        cache_index = cache_vars[0]
+        cache_check = [PyccelGe(cache_index, LiteralInteger(0))]
+        cache_store = []
+        for p_arg, (cache_type, cache_array_type) in zip(parse_args, cache_vars[1:]):
+            cache_check.append(PyccelEq(FunctionCall(pyarg_type, [p_arg]), VariableAddress(cache_type)))
+            cache_store.append(AliasAssign(cache_type, FunctionCall(pyarg_type, [p_arg])))
+            if cache_array_type is not None:
+                cache_check.append(PyccelEq(FunctionCall(pyarg_array_type, [p_arg]), cache_array_type))
+                cache_store.append(Assign(cache_array_type, FunctionCall(pyarg_array_type, [p_arg])))
+        cache_store.append(Assign(cache_index, check_var))
 
         #finishing the wrapper body
-        wrapper_body.append(Assign(check_var, FunctionCall(check_func_def, parse_args)))
-        wrapper_body.extend(wrapper_body_translations)
-        wrapper_body.append(Return(wrapper_results)) # Return
+        wrapper_body.append(If((PyccelAnd(*cache_check), [Assign(check_var, cache_index)]),
+                (LiteralTrue(), [Assign(check_var, FunctionCall(check_func_def, parse_args)),
+                                 If((PyccelLt(check_var, LiteralInteger(0)), [Return([Nil()])]))]
+                                + cache_store)))
+        wrapper_body.append(Switch(check_var, list(cases.items()),
+            [PyErr_SetString('PyExc_TypeError', '"Arguments combinations don\'t exist"'),
+             Return([Nil()])]))
 
         # Create FunctionDef
         funcs_def.append(FunctionDef(name = wrapper_name,
@@ -678,29 +1347,61 @@ class CWrapperCodePrinter(CCodePrinter):
 
         sep = self._print(SeparatorComment(40))
 
-        return sep + '\n'.join(CCodePrinter._print_FunctionDef(self, f) for f in funcs_def)
-
-    def _create_wrapper_check(self, check_var, parse_args, types_dict, used_names, func_name):
-        check_func_body = []
-        flags = (len(types_dict) - 1) * 4
-        for arg in types_dict:
-            var_name = ""
-            body = []
-            types = []
-            arg_type_check_list = list(types_dict[arg])
-            arg_type_check_list.sort(key= lambda x : x[0].precision)
-            for elem in arg_type_check_list:
-                var_name = elem[0].name
-                value = elem[2] << flags
-                body.append((elem[1], [AugAssign(check_var, '+' ,value)]))
-                types.append(elem[0])
-            flags -= 4
-            error = ' or '.join(['{} bit {}'.format(v.precision * 8 , str_dtype(v.dtype)) if not isinstance(v.dtype, NativeBool)
-                            else  str_dtype(v.dtype) for v in types])
-            body.append((LiteralTrue(), [PyErr_SetString('PyExc_TypeError', '"{} must be {}"'.format(var_name, error)), Return([LiteralInteger(0)])]))
-            check_func_body += [If(*body)]
-
-        check_func_body = [Assign(check_var, LiteralInteger(0))] + check_func_body
+        cache_decl = ['static {}{}{};'.format(self.get_declare_type(v), v.name, ' = -1' if v is cache_index else '')
+                        for v in cache_vars[:1] + [v for c in cache_vars[1:] for v in c if v is not None]]
+
+        return sep + '\n' + '\n'.join(cache_decl) + '\n\n' + '\n'.join(CCodePrinter._print_FunctionDef(self, f) for f in funcs_def)
+
+    def _create_dispatch_cache(self, name, check_var, arguments, types_dict):
+        """
+        Create the global variables in which the wrapper of an interface
+        stores the index of the function called last time, and the types of
+        the arguments of this call
+
+        Returns
+        -------
+        cache_vars : list
+            The variable holding the index, followed by a tuple for each
+            argument with the variable holding its type and the variable
+            holding the dtype of an array (None if the argument cannot be an array)
+        """
+        used_names = self._global_names
+        cache_index = Variable(dtype = NativeInteger(), precision = check_var.precision,
+                               name = self.get_new_name(used_names, name + '_cache_index'))
+        cache_vars = [cache_index]
+        for a, types in zip(arguments, types_dict):
+            cache_type = Variable(dtype = PyccelPyTypeObject(), is_pointer = True,
+                                  name = self.get_new_name(used_names, '{}_cache_{}_type'.format(name, a.name)))
+            cache_array_type = None
+            if any(t.rank > 0 for t in types.values()):
+                cache_array_type = Variable(dtype = NativeInteger(), precision = 4,
+                                  name = self.get_new_name(used_names, '{}_cache_{}_array_type'.format(name, a.name)))
+                self._dispatch_cache_arrays = True
+            cache_vars.append((cache_type, cache_array_type))
+        self._dispatch_cache = True
+        return cache_vars
+
+    def _create_wrapper_check(self, check_var, parse_args, types_dict, strides, used_names, func_name):
+        """
+        Create the function computing the index of the function of an interface
+        matching the types of the arguments, or -1 (with a python exception set)
+        if an argument has none of the expected types
+        """
+        check_func_body = [Assign(check_var, LiteralInteger(0))]
+        for p_arg, types, stride in zip(parse_args, types_dict, strides):
+            types = list(types.values())
+            # The first type does not change the index so it is checked last
+            body = [(self._get_check_type_statement(t, p_arg, allow_default = False),
+                        [AugAssign(check_var, '+', LiteralInteger(i * stride))])
+                    for i, t in enumerate(types[1:], 1)]
+            check = self._get_check_type_statement(types[0], p_arg)
+            if not isinstance(check, PyccelAssociativeParenthesis):
+                check = PyccelAssociativeParenthesis(check)
+            error = ' or '.join(self._get_type_description(t) for t in types)
+            body.append((PyccelNot(check), [PyErr_SetString('PyExc_TypeError', '"{} must be {}"'.format(types[0].name, error)),
+                                             Return([LiteralInteger(-1)])]))
+            check_func_body.append(If(*body))
+
         check_func_body.append(Return([check_var]))
         # Creating check function definition
         check_func_name = self.get_new_name(used_names.union(self._global_names), 'type_check')
@@ -712,6 +1413,246 @@ class CWrapperCodePrinter(CCodePrinter):
             local_vars = [])
         return check_func_def
 
+    def _get_type_description(self, variable):
+        """ The description of the type of a variable used in the error messages """
+        if isinstance(variable.dtype, NativeBool):
+            description = str_dtype(variable.dtype)
+        else:
+            description = '{} bit {}'.format(variable.precision * 8, str_dtype(variable.dtype))
+        if variable.rank > 0:
+            description = 'array of {} (rank {})'.format(description, variable.rank)
+        return description
+
+    #--------------------------------------------------------------------
+    #                        Universal functions
+    #--------------------------------------------------------------------
+
+    def _is_ufunc(self, func):
+        """ True if the function (or interface) is exposed to python as a ufunc """
+        f = func if isinstance(func, FunctionDef) else func.functions[0]
+        return not f.is_private and ('vectorize' in f.decorators or 'guvectorize' in f.decorators)
+
+    def _get_ufunc_core_dims(self, func):
+        """
+        Returns the core dimensions of the inputs and of the outputs of the
+        ufunc exposing the function (they are empty for a ufunc created with
+        the vectorize decorator) after checking that they match the arguments
+        and the results of the function
+        """
+        if 'vectorize' in func.decorators:
+            if not func.results or any(not isinstance(a, Variable) or isinstance(a, ValuedVariable) \
+                    or a.rank > 0 for a in func.arguments) or any(r.rank > 0 for r in func.results):
+                errors.report(UFUNC_SCALAR_ARGUMENTS, symbol=func.name, severity='fatal')
+            return [()]*len(func.arguments), [()]*len(func.results)
+
+        signature = func.decorators['guvectorize']
+        core_dims = parse_gufunc_signature(signature[0]) if len(signature) == 1 else None
+        if core_dims is None or len(core_dims[0]) + len(core_dims[1]) != len(func.arguments):
+            errors.report(GUFUNC_INVALID_SIGNATURE, symbol=', '.join(signature), severity='fatal')
+        if func.results:
+            errors.report(GUFUNC_RESULTS, symbol=func.name, severity='fatal')
+        inputs, outputs = core_dims
+        # A scalar output is written into an array of size 1
+        ranks = [len(d) for d in inputs] + [max(len(d), 1) for d in outputs]
+        for a, rank in zip(func.arguments, ranks):
+            if not isinstance(a, Variable) or isinstance(a, ValuedVariable) or a.rank != rank:
+                errors.report(GUFUNC_ARGUMENT_RANK, symbol=a, severity='fatal')
+        return inputs, outputs
+
+    def _get_ufunc_element_type(self, variable):
+        """ The C type of an element of a numpy array containing the variable """
+        if isinstance(variable.dtype, NativeBool):
+            return 'npy_bool'
+        return self.find_in_dtype_registry(self._print(variable.dtype), variable.precision)
+
+    def _get_ufunc_loop(self, func, inputs, outputs):
+        """
+        Print the inner loop of the ufunc exposing the function. numpy calls
+        it with the pointers to the first elements of the (broadcast) operands
+        and their strides, the loop calls the translated function for each
+        element. The operands of a generalized ufunc with core dimensions are
+        passed to the function as views described by the core dimensions and
+        strides provided by numpy
+
+        Returns
+        -------
+        loop_name : str
+            The name of the loop
+        code : str
+            The code of the loop
+        """
+        used_names = set([a.name for a in func.arguments] + [r.name for r in func.results])
+        loop_name  = self.get_new_name(used_names.union(self._global_names), func.name.name + '_loop')
+        self._global_names.add(loop_name)
+        args_name  = self.get_new_name(used_names, 'args')
+        dims_name  = self.get_new_name(used_names, 'dimensions')
+        steps_name = self.get_new_name(used_names, 'steps')
+        data_name  = self.get_new_name(used_names, 'data')
+        index_name = self.get_new_name(used_names, 'i')
+
+        operands  = list(func.arguments) + list(func.results)
+        dim_names = list(OrderedDict.fromkeys(d for dims in inputs + outputs for d in dims))
+        core_step = len(operands)
+
+        local_vars  = []
+        arrays      = []
+        setup       = []
+        collect     = []
+        write_back  = []
+        static_args = []
+        # The arguments of ufunc_operand_bounds describing each operand
+        bounds      = []
+        for j, (var, dims) in enumerate(zip(operands, inputs + outputs)):
+            data = '{args}[{j}] + {i} * {steps}[{j}]'.format(args = args_name, j = j,
+                            i = index_name, steps = steps_name)
+            if var.rank == 0:
+                bounds.append('0, NULL, NULL, sizeof({})'.format(self._get_ufunc_element_type(var)))
+                element = '*({} *)({})'.format(self._get_ufunc_element_type(var), data)
+                local_vars.append(var)
+                if j < len(func.arguments):
+                    collect.append('{} = {};'.format(var.name, element))
+                    static_args.append(var)
+                else:
+                    write_back.append('{} = {};'.format(element, var.name))
+                continue
+
+            # The shape and the strides of the view of the operand
+            shape   = self.get_new_name(used_names, var.name + '_shape')
+            strides = self.get_new_name(used_names, var.name + '_strides')
+            c_type  = self.find_in_dtype_registry(self._print(var.dtype), var.precision)
+            arrays.append('npy_intp {}[{}];'.format(shape, var.rank))
+            arrays.append('npy_intp {}[{}];'.format(strides, var.rank))
+            if dims:
+                for d, dim in enumerate(dims):
+                    setup.append('{}[{}] = {}[{}];'.format(shape, d, dims_name, 1 + dim_names.index(dim)))
+                    setup.append('{}[{}] = {}[{}];'.format(strides, d, steps_name, core_step + d))
+                core_step += len(dims)
+            else:
+                setup.append('{}[0] = 1;'.format(shape))
+                setup.append('{}[0] = sizeof({});'.format(strides, c_type))
+            bounds.append('{}, {}, {}, sizeof({})'.format(max(len(dims), 1), shape, strides, c_type))
+
+            if self._target_language == 'fortran':
+                desc = Variable(dtype=PyccelCFIArray(), name=self.get_new_name(used_names, var.name + '_desc'))
+                arg  = self.get_cfi_array(var)
+                collect.append('cfi_array_establish(&{desc}, {data}, {type}, sizeof({c_type}), {rank}, '
+                                '{shape}, {strides}, {c_order});'.format(desc = desc.name, data = data,
+                                    type = self._print(self.find_in_cfi_type_registry(var)), c_type = c_type,
+                                    rank = var.rank, shape = shape, strides = strides,
+                                    c_order = 1 if var.order == 'C' else 0))
+                collect.append('{} = &{};'.format(arg.name, desc.name))
+                local_vars.extend([desc, arg])
+                static_args.append(arg)
+            else:
+                collect.append('{var} = ndarray_from_data({data}, {type}, sizeof({c_type}), {rank}, '
+                                '{shape}, {strides});'.format(var = var.name, data = data,
+                                    type = ndarray_type_registry[(self._print(var.dtype), var.precision)],
+                                    c_type = c_type, rank = var.rank, shape = shape, strides = strides))
+                local_vars.append(var)
+                static_args.append(var)
+            self._builds_arrays = True
+
+        static_function = self._as_static_function(func) if self._target_language == 'fortran' else func
+        if len(func.results) == 0:
+            func_call = FunctionCall(static_function, static_args)
+        else:
+            results   = func.results if len(func.results) > 1 else func.results[0]
+            func_call = Assign(results, FunctionCall(static_function, static_args))
+
+        # With openmp the iterations are shared between the threads when the
+        # number of elements of the operands is large enough, and when the
+        # outputs do not overlap the inputs (numpy passes overlapping operands
+        # to the loop e.g. for the reduce and accumulate methods)
+        threshold = self._settings['parallel_threshold']
+        if threshold is not None:
+            self._ufunc_bounds = True
+            parallel = self.get_new_name(used_names, 'parallel')
+            lo_name  = self.get_new_name(used_names, 'lo')
+            hi_name  = self.get_new_name(used_names, 'hi')
+            size = ' * '.join('{}[{}]'.format(dims_name, d) for d in range(1 + len(dim_names)))
+            arrays.append('char *{}[{}];'.format(lo_name, len(operands)))
+            arrays.append('char *{}[{}];'.format(hi_name, len(operands)))
+            arrays.append('bool {} = {} >= {};'.format(parallel, size, threshold))
+            for j, b in enumerate(bounds):
+                setup.append('ufunc_operand_bounds({args}[{j}], {dims}[0], {steps}[{j}], {b}, '
+                                '&{lo}[{j}], &{hi}[{j}]);'.format(args = args_name, dims = dims_name,
+                                    steps = steps_name, j = j, b = b, lo = lo_name, hi = hi_name))
+            nargs = len(func.arguments)
+            for o in range(nargs, len(operands)):
+                setup.append('{p} = {p} && {steps}[{o}] != 0;'.format(p = parallel, steps = steps_name, o = o))
+                for k in range(nargs):
+                    setup.append('{p} = {p} && ({hi}[{o}] <= {lo}[{k}] || {hi}[{k}] <= {lo}[{o}]);'.format(
+                                    p = parallel, lo = lo_name, hi = hi_name, o = o, k = k))
+            setup.append('#pragma omp parallel for if({}) private({})'.format(parallel,
+                            ', '.join(v.name for v in local_vars)))
+
+        code = ('static void {name}(char **{args}, const npy_intp *{dims}, const npy_intp *{steps}, void *{data})\n'
+                '{{\n'
+                '{declarations}\n'
+                '{setup}'
+                'for (npy_intp {i} = 0; {i} < {dims}[0]; {i}++)\n'
+                '{{\n'
+                '{body}\n'
+                '}}\n'
+                '}}').format(name = loop_name, args = args_name, dims = dims_name,
+                        steps = steps_name, data = data_name, i = index_name,
+                        declarations = '\n'.join([self._print(Declare(v.dtype, v)) for v in local_vars] + arrays),
+                        setup = ''.join(l + '\n' for l in setup),
+                        body = '\n'.join(collect + [self._print(func_call)] + write_back))
+        return loop_name, code
+
+    def _get_ufunc_definition(self, func):
+        """
+        Print the loops of the ufunc exposing the function (or interface),
+        one for each signature, and the tables passed to numpy to create it
+
+        Returns
+        -------
+        code : str
+            The definitions of the loops and of the tables
+        registration : str
+            The code creating the ufunc and adding it to the module m
+        """
+        funcs = [func] if isinstance(func, FunctionDef) else func.functions
+        name  = func.name.name if isinstance(func, FunctionDef) else func.name
+        # numpy uses the first loop to which the inputs can be safely cast,
+        # the loops are sorted by type as for the ufuncs of numpy so that
+        # the smallest type is chosen
+        type_nums = {v.name : k for k, v in numpy_num_to_type.items()}
+        funcs = sorted(funcs, key = lambda f: [type_nums[self.find_in_numpy_dtype_registry(a).name]
+                                                for a in list(f.arguments) + list(f.results)])
+        loops = []
+        codes = []
+        types = []
+        for f in funcs:
+            inputs, outputs = self._get_ufunc_core_dims(f)
+            loop_name, code = self._get_ufunc_loop(f, inputs, outputs)
+            loops.append(loop_name)
+            codes.append(code)
+            types.extend(self.find_in_numpy_dtype_registry(a).name for a in list(f.arguments) + list(f.results))
+
+        loops_name = self.get_new_name(self._global_names, '{}_loops'.format(name))
+        data_name  = self.get_new_name(self._global_names, '{}_data'.format(name))
+        types_name = self.get_new_name(self._global_names, '{}_types'.format(name))
+        codes.append('static PyUFuncGenericFunction {}[] = {{{}}};'.format(loops_name, ', '.join(loops)))
+        codes.append('static void *{}[] = {{{}}};'.format(data_name, ', '.join(['NULL']*len(loops))))
+        codes.append('static char {}[] = {{{}}};'.format(types_name, ', '.join(types)))
+
+        signature = funcs[0].decorators.get('guvectorize', None)
+        doc_string = funcs[0].doc_string
+        registration = ('ufunc = PyUFunc_FromFuncAndDataAndSignature({loops}, {data}, {types}, {ntypes}, {nin}, {nout}, '
+                        'PyUFunc_None, "{name}", {doc}, 0, {signature});\n'
+                        'if (ufunc == NULL || PyModule_AddObject(m, "{name}", ufunc) < 0)\n'
+                        '{{\n'
+                        'Py_XDECREF(ufunc);\n'
+                        'Py_DECREF(m);\n'
+                        'return NULL;\n'
+                        '}}').format(loops = loops_name, data = data_name, types = types_name,
+                                ntypes = len(loops), nin = len(inputs), nout = len(outputs), name = name,
+                                doc = self._print(LiteralString('\n'.join(doc_string.comments))) \
+                                        if doc_string else '""',
+                                signature = '"{}"'.format(signature[0].replace(' ', '')) if signature else 'NULL')
+        return '\n\n'.join(codes), registration
 
     def _get_wrapper_name(self, used_names, func):
         name = func.name.name if isinstance(func, FunctionDef) else func.name
@@ -734,29 +1675,55 @@ class CWrapperCodePrinter(CCodePrinter):
     def _print_PyccelPyArrayObject(self, expr):
         return 'pyarrayobject'
 
-    def _print_PyArg_ParseTupleNode(self, expr):
-        name    = 'PyArg_ParseTupleAndKeywords'
-        pyarg   = expr.pyarg
-        pykwarg = expr.pykwarg
-        flags   = expr.flags
+    def _print_PyccelCFIArray(self, expr):
+        return 'cfiarray'
+
+    def _print_PyccelPyArgs(self, expr):
+        return 'pyargs'
+
+    def _print_PyccelPySsize(self, expr):
+        return 'pyssize'
+
+    def _print_PyccelPyTypeObject(self, expr):
+        return 'pytypeobject'
+
+    def _print_Switch(self, expr):
+        lines = ['switch ({})\n{{'.format(self._print(expr.expr))]
+        for value, body in expr.cases:
+            lines.append('case {}:\n{{\n{}\n}}'.format(self._print(value), self._print(body)))
+        if expr.default.body:
+            lines.append('default:\n{{\n{}\n}}'.format(self._print(expr.default)))
+        lines.append('}')
+        return '\n'.join(lines)
+
+    def _print_PyAllowThreads(self, expr):
+        body = self._print(expr.body)
+        if expr.condition is None:
+            return 'Py_BEGIN_ALLOW_THREADS\n{}\nPy_END_ALLOW_THREADS'.format(body)
+        return ('{{\nPyThreadState *_save = {cond} ? PyEval_SaveThread() : NULL;\n{body}\n'
+                'if (_save)\n{{\nPyEval_RestoreThread(_save);\n}}\n}}').format(
+                        cond = self._print(expr.condition), body = body)
+
+    def _print_PyArgCollectNode(self, expr):
+        self._collects_arguments = True
         # All args are modified so even pointers are passed by address
-        args    = ', '.join(['&{}'.format(a.name) for a in expr.args])
-
         if expr.args:
-            code = '{name}({pyarg}, {pykwarg}, "{flags}", {kwlist}, {args})'.format(
-                            name=name,
-                            pyarg=pyarg,
-                            pykwarg=pykwarg,
-                            flags = flags,
-                            kwlist = expr.arg_names.name,
-                            args = args)
-        else :
-            code ='{name}({pyarg}, {pykwarg}, "", {kwlist})'.format(
-                    name=name,
-                    pyarg=pyarg,
-                    pykwarg=pykwarg,
-                    kwlist = expr.arg_names.name)
-
+            values = ', '.join('(PyObject **)&{}'.format(a.name) if a.dtype is PyccelPyArrayObject()
+                                else '&{}'.format(a.name) for a in expr.args)
+            values = '(PyObject **[]){{{}}}'.format(values)
+        else:
+            values = self._print(Nil())
+
+        code = 'pyarg_collect("{fname}", {pyarg}, {pynargs}, {pykwnames}, {kwlist}, {nparams}, {npositional}, {nrequired}, {values})'.format(
+                fname = expr.func_name,
+                pyarg = expr.pyarg,
+                pynargs = expr.pynargs,
+                pykwnames = expr.pykwnames,
+                kwlist = expr.arg_names.name,
+                nparams = len(expr.args),
+                npositional = expr.npositional,
+                nrequired = expr.nrequired,
+                values = values)
         return code
 
     def _print_PyBuildValueNode(self, expr):
@@ -786,12 +1753,9 @@ class CWrapperCodePrinter(CCodePrinter):
         # Collect local variables
         wrapper_vars        = {a.name : a for a in expr.arguments}
         wrapper_vars.update({r.name : r for r in expr.results})
-        python_func_args    = self.get_new_PyObject("args"  , used_names)
-        python_func_kwargs  = self.get_new_PyObject("kwargs", used_names)
-        python_func_selfarg = self.get_new_PyObject("self"  , used_names)
 
         # Collect arguments and results
-        wrapper_args    = [python_func_selfarg, python_func_args, python_func_kwargs]
+        wrapper_args    = self.get_wrapper_arguments(used_names)
         wrapper_results = [self.get_new_PyObject("result", used_names)]
 
         if expr.is_private:
@@ -810,8 +1774,24 @@ class CWrapperCodePrinter(CCodePrinter):
                         AliasAssign(wrapper_results[0], Nil()),
                         Return(wrapper_results)])
             return CCodePrinter._print_FunctionDef(self, wrapper_func)
+        if any(r.rank > 0 and r in expr.arguments for r in expr.results):
+            wrapper_func = FunctionDef(name = wrapper_name,
+                arguments = wrapper_args,
+                results = wrapper_results,
+                body = [PyErr_SetString('PyExc_NotImplementedError', '"Cannot return an array argument"'),
+                        AliasAssign(wrapper_results[0], Nil()),
+                        Return(wrapper_results)])
+            return CCodePrinter._print_FunctionDef(self, wrapper_func)
+        if self._target_language == 'c' and any(a.rank > 0 and a.is_optional for a in expr.arguments):
+            wrapper_func = FunctionDef(name = wrapper_name,
+                arguments = wrapper_args,
+                results = wrapper_results,
+                body = [PyErr_SetString('PyExc_NotImplementedError', '"Cannot pass an optional array as an argument"'),
+                        AliasAssign(wrapper_results[0], Nil()),
+                        Return(wrapper_results)])
+            return CCodePrinter._print_FunctionDef(self, wrapper_func)
 
-        # Collect argument names for PyArgParse
+        # Collect argument names for the keywords
         arg_names         = [a.name for a in expr.arguments]
         keyword_list_name = self.get_new_name(used_names,'kwlist')
         keyword_list      = PyArgKeywords(keyword_list_name, arg_names)
@@ -841,24 +1821,31 @@ class CWrapperCodePrinter(CCodePrinter):
             if isinstance(arg, ValuedVariable):
                 wrapper_body.append(self.get_default_assign(parse_args[-1], arg))
 
-        # Parse arguments
-        parse_node = PyArg_ParseTupleNode(python_func_args, python_func_kwargs, expr.arguments, parse_args, keyword_list)
+        # Collect arguments
+        parse_node = PyArgCollectNode(expr.name.name, *wrapper_args[1:], expr.arguments, parse_args, keyword_list)
+        init, checks = self.get_missing_arguments_checks(expr.name.name, parse_node, expr.arguments, parse_args)
+        wrapper_body.extend(init)
         wrapper_body.append(If((PyccelNot(parse_node), [Return([Nil()])])))
+        wrapper_body.extend(checks)
         wrapper_body.extend(wrapper_body_translations)
 
         # Call function
-        static_function, static_args, additional_body = self._get_static_function(used_names, expr, collect_vars)
+        static_function, static_args, additional_body, local_vars = self._get_static_function(used_names, expr, collect_vars)
         wrapper_body.extend(additional_body)
-        for var in static_args :
+        for var in static_args + local_vars:
             wrapper_vars[var.name] = var
 
-        if len(expr.results)==0:
+        # The arrays allocated by a fortran function are returned through
+        # the arguments of the static function
+        func_results = static_function.results if self._target_language == 'fortran' else expr.results
+        if len(func_results)==0:
             func_call = FunctionCall(static_function, static_args)
         else:
-            results   = expr.results if len(expr.results)>1 else expr.results[0]
+            results   = func_results if len(func_results)>1 else func_results[0]
             func_call = Assign(results,FunctionCall(static_function, static_args))
 
-        wrapper_body.append(func_call)
+        wrapper_body.append(self._release_gil(expr, func_call))
+        wrapper_body += self._release_views()
 
         # Loop over results to carry out necessary casts and collect Py_BuildValue type string
         res_args = []
@@ -888,10 +1875,17 @@ class CWrapperCodePrinter(CCodePrinter):
 
     def _print_Module(self, expr):
         self._global_names = set(f.name.name for f in expr.funcs)
+        self._global_names.update(('ndarray_to_pyarray', 'ndarray_capsule_free', 'cfi_array_new',
+                                   'cfi_array_capsule_free', 'cfi_array_to_pyarray', 't_cfi_array',
+                                   'pyarray_get_view', 'pyarray_release_view', 'pyarray_to_ndarray',
+                                   'pyarray_to_cfi_array', 'pyarg_collect', 'pyarg_to_longlong',
+                                   'pyarg_type', 'pyarg_array_type', 'ndarray_from_data',
+                                   'cfi_array_establish'))
+        self._global_names.update(f.name.name for f in pyarg_converter_registry.values())
         self._module_name  = expr.name
         sep = self._print(SeparatorComment(40))
         if self._target_language == 'fortran':
-            static_funcs = [as_static_function_call(f, expr.name, name=f.name) for f in expr.funcs]
+            static_funcs = [self._as_static_function(f) for f in expr.funcs]
         else:
             static_funcs = expr.funcs
         function_signatures = '\n'.join('{};'.format(self.function_signature(f)) for f in static_funcs)
@@ -900,26 +1894,76 @@ class CWrapperCodePrinter(CCodePrinter):
         interface_funcs = [f.name for i in interfaces for f in i.functions]
         funcs = interfaces + [f for f in expr.funcs if f.name not in interface_funcs]
 
-
-        function_defs = '\n\n'.join(self._print(f) for f in funcs)
+        # The functions exposed as ufuncs are added to the module by its init function
+        ufuncs = [f for f in funcs if self._is_ufunc(f)]
+        funcs  = [f for f in funcs if not self._is_ufunc(f)]
+
+        function_defs = [self._print(f) for f in funcs]
+        ufunc_registrations = []
+        for f in ufuncs:
+            code, registration = self._get_ufunc_definition(f)
+            function_defs.append(code)
+            ufunc_registrations.append(registration)
+        function_defs = '\n\n'.join(function_defs)
         cast_functions = '\n\n'.join(CCodePrinter._print_FunctionDef(self, f)
                                         for f in self._cast_functions_dict.values())
-        method_def_func = ',\n'.join(('{{\n'
+        self._additional_imports.update(('stdint', 'stdbool'))
+        argument_functions = [method_flags_macro]
+        if self._collects_arguments:
+            argument_functions.append(argument_collection_functions)
+        if any(c.startswith('pyarg_to_int') or c == 'pyarg_to_bool' for c in self._pyarg_converters):
+            argument_functions.append(pyarg_integer_function)
+        converters = list(self._pyarg_converters)
+        if 'pyarg_to_float' in converters:
+            # pyarg_to_float converts the object with pyarg_to_double
+            if 'pyarg_to_double' in converters:
+                converters.remove('pyarg_to_double')
+            converters.insert(0, 'pyarg_to_double')
+        argument_functions += [pyarg_converter_functions[c] for c in converters]
+        if self._dispatch_cache:
+            argument_functions.append(dispatch_cache_functions)
+        if self._dispatch_cache_arrays:
+            argument_functions.append(dispatch_cache_array_function)
+        if self._ufunc_bounds:
+            argument_functions.append(ufunc_bounds_function)
+        array_functions = []
+        if self._passes_arrays or self._returns_arrays or self._builds_arrays:
+            if self._target_language == 'fortran':
+                self._additional_imports.add('ISO_Fortran_binding')
+                array_functions.append(cfi_array_typedef)
+            else:
+                self._additional_imports.add('ndarrays')
+        if self._passes_arrays or self._builds_arrays:
+            if self._target_language == 'fortran':
+                array_functions.append(cfi_array_data_functions)
+            else:
+                array_functions.append(ndarray_data_functions)
+        if self._passes_arrays:
+            array_functions.append(array_argument_functions)
+            if self._target_language == 'fortran':
+                array_functions.append(cfi_array_argument_functions)
+            else:
+                array_functions.append(ndarray_argument_functions)
+        if self._returns_arrays:
+            if self._target_language == 'fortran':
+                array_functions.append(cfi_array_result_functions)
+            else:
+                array_functions.append(ndarray_result_functions)
+        method_def_func = ',\n'.join([('{{\n'
                                      '"{name}",\n'
-                                     '(PyCFunction){wrapper_name},\n'
-                                     'METH_VARARGS | METH_KEYWORDS,\n'
+                                     '(PyCFunction)(void (*)(void)){wrapper_name},\n'
+                                     'PYCCEL_METH_FASTCALL,\n'
                                      '{doc_string}\n'
                                      '}}').format(
                                             name = f.name,
                                             wrapper_name = self._function_wrapper_names[f.name],
                                             doc_string = self._print(LiteralString('\n'.join(f.doc_string.comments))) \
                                                         if f.doc_string else '""')
-                                     for f in funcs)
+                                     for f in funcs] + ['{ NULL, NULL, 0, NULL}'])
 
         method_def_name = self.get_new_name(self._global_names, '{}_methods'.format(expr.name))
         method_def = ('static PyMethodDef {method_def_name}[] = {{\n'
-                        '{method_def_func},\n'
-                        '{{ NULL, NULL, 0, NULL}}\n'
+                        '{method_def_func}\n'
                         '}};'.format(method_def_name = method_def_name ,method_def_func = method_def_func))
 
         module_def_name = self.get_new_name(self._global_names, '{}_module'.format(expr.name))
@@ -935,16 +1979,24 @@ class CWrapperCodePrinter(CCodePrinter):
                 '}};'.format(module_def_name = module_def_name, mod_name = expr.name, method_def_name = method_def_name))
 
         init_func = ('PyMODINIT_FUNC PyInit_{mod_name}(void)\n{{\n'
-                'PyObject *m;\n\n'
-                'import_array();\n\n'
+                'PyObject *m;\n'
+                '{ufunc_decl}\n'
+                'import_array();\n'
+                '{import_umath}\n'
                 'm = PyModule_Create(&{module_def_name});\n'
                 'if (m == NULL) return NULL;\n\n'
-                'return m;\n}}'.format(mod_name=expr.name, module_def_name = module_def_name))
+                '{ufuncs}'
+                'return m;\n}}'.format(mod_name=expr.name, module_def_name = module_def_name,
+                    ufunc_decl = 'PyObject *ufunc;\n' if ufuncs else '',
+                    import_umath = 'import_umath();\n' if ufuncs else '',
+                    ufuncs = ''.join(r + '\n\n' for r in ufunc_registrations)))
 
         # Print imports last to be sure that all additional_imports have been collected
         imports  = [Import(s) for s in self._additional_imports]
         imports += [Import('Python')]
         imports += [Import('numpy/arrayobject')]
+        if ufuncs:
+            imports += [Import('numpy/ufuncobject')]
         imports  = '\n'.join(self._print(i) for i in imports)
 
         numpy_max_acceptable_version = [1, 19]
@@ -956,6 +2008,8 @@ class CWrapperCodePrinter(CCodePrinter):
         return ('#define PY_SSIZE_T_CLEAN\n'
                 '{numpy_api_macro}\n'
                 '{imports}\n\n'
+                '{argument_functions}'
+                '{array_functions}'
                 '{function_signatures}\n\n'
                 '{sep}\n\n'
                 '{cast_functions}\n\n'
@@ -968,6 +2022,8 @@ class CWrapperCodePrinter(CCodePrinter):
                 '{init_func}\n'.format(
                     numpy_api_macro = numpy_api_macro,
                     imports = imports,
+                    argument_functions = ''.join(f + '\n\n' for f in argument_functions),
+                    array_functions = ''.join(f + '\n\n' for f in array_functions),
                     function_signatures = function_signatures,
                     sep = sep,
                     cast_functions = cast_functions,
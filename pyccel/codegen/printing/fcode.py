@@ -46,7 +46,8 @@ from pyccel.ast.core      import FunctionCall, DottedFunctionCall
 
 from pyccel.ast.builtins  import (PythonEnumerate, PythonInt, PythonLen,
                                   PythonMap, PythonPrint, PythonRange,
-                                  PythonZip, PythonFloat, PythonTuple)
+                                  PythonZip, PythonFloat, PythonTuple,
+                                  ParallelRange)
 from pyccel.ast.builtins  import PythonComplex, PythonBool
 from pyccel.ast.datatypes import is_pyccel_datatype
 from pyccel.ast.datatypes import is_iterable_datatype, is_with_construct_datatype
@@ -182,7 +183,9 @@ class FCodePrinter(CodePrinter):
         'source_format': 'fixed',
         'tabwidth': 2,
         'contract': True,
-        'standard': 77
+        'standard': 77,
+        'array_alignment': None,
+        'parallel_threshold': None
     }
 
     _operators = {
@@ -212,6 +215,7 @@ class FCodePrinter(CodePrinter):
         userfuncs = settings.get('user_functions', {})
         self.known_functions.update(userfuncs)
         self._current_function = None
+        self._in_pure_function = False
 
         self._additional_code = None
         self._additional_imports = set([])
@@ -1100,7 +1104,9 @@ class FCodePrinter(CodePrinter):
             if is_pointer:
                 allocatablestr = ', pointer'
 
-            elif allocatable and not intent:
+            elif allocatable and (not intent or (intent == 'out' and rank > 0)):
+                # Arrays allocated in a function and returned to the caller
+                # are allocatable dummy arguments
                 allocatablestr = ', allocatable'
 
             # ISSUES #177: var is allocatable and target
@@ -1129,7 +1135,7 @@ class FCodePrinter(CodePrinter):
                                                      self._print(i)) for i in shape)
             rankstr = '({rank})'.format(rank=rankstr)
 
-        elif (rank > 0) and allocatable and intent:
+        elif (rank > 0) and allocatable and intent and intent != 'out':
             rankstr = '({})'.format(','.join(['0:'] * rank))
 
         elif (rank > 0) and (allocatable or is_pointer):
@@ -1142,7 +1148,13 @@ class FCodePrinter(CodePrinter):
         # Construct declaration
         left  = dtype + intentstr + allocatablestr + optionalstr
         right = vstr + rankstr + code_value
-        return '{} :: {}\n'.format(left, right)
+        code  = '{} :: {}\n'.format(left, right)
+
+        # Request the alignment of the data of local allocatable arrays
+        alignment = self._settings['array_alignment']
+        if alignment and allocatable and not (is_static or is_pointer or intent):
+            code += '!DIR$ ATTRIBUTES ALIGN : {} :: {}\n'.format(alignment, vstr)
+        return code
 
     def _print_AliasAssign(self, expr):
         code = ''
@@ -1277,6 +1289,15 @@ class FCodePrinter(CodePrinter):
                 code = 'call {0}({1})\n'.format(rhs_code, call_args)
                 return self._get_statement(code)
 
+            # the array returned by the function is allocated in the lhs
+            elif isinstance(expr.lhs, Variable) and self._returns_allocated_array(rhs.funcdef):
+                rhs_code = self._print(rhs.func_name if not rhs.interface else rhs.interface_name)
+                code_args = [self._print(i) for i in rhs.args if not isinstance(i, Nil)]
+                result = '{0} = {1}'.format(self._print(rhs.funcdef.results[0]), lhs_code)
+
+                code = 'call {0}({1})\n'.format(rhs_code, ', '.join(code_args + [result]))
+                return self._get_statement(code)
+
         if (isinstance(expr.lhs, Variable) and
               expr.lhs.dtype == NativeSymbol()):
             return ''
@@ -1290,6 +1311,12 @@ class FCodePrinter(CodePrinter):
         #     code += self._print(stmt)
         #     code += '\n'
         code += '{0} = {1}'.format(lhs_code, rhs_code)
+        if self._is_parallel_array_assign(expr):
+            threshold = self._settings['parallel_threshold']
+            return ('!$omp parallel workshare if(size({lhs}) >= {threshold})\n'
+                    '{code}\n'
+                    '!$omp end parallel workshare\n').format(lhs = lhs_code,
+                            threshold = threshold, code = self._get_statement(code))
 #        else:
 #            code_args = ''
 #            func = expr.rhs
@@ -1320,6 +1347,21 @@ class FCodePrinter(CodePrinter):
 #            code = 'call {0}({1})'.format(rhs_code, code_args)
         return self._get_statement(code) + '\n'
 
+    def _is_parallel_array_assign(self, expr):
+        """ True if the assignment of a whole array is shared between the
+        threads of a parallel workshare construct. This is done when pyccel is
+        used with openmp (the parallel_threshold setting is set) for the
+        elementwise assignments: only elemental functions may be called in a
+        workshare construct
+        """
+        if self._settings['parallel_threshold'] is None or self._in_pure_function:
+            return False
+        lhs, rhs = expr.lhs, expr.rhs
+        if not isinstance(lhs, (Variable, IndexedElement)) or isinstance(lhs, TupleVariable) \
+                or lhs.rank == 0 or isinstance(rhs, NumpyNewArray):
+            return False
+        return all(f.funcdef.is_elemental for f in rhs.atoms(FunctionCall))
+
 #------------------------------------------------------------------------------
     def _print_Allocate(self, expr):
 
@@ -1474,6 +1516,7 @@ class FCodePrinter(CodePrinter):
             # exposed to python so there is no need to print their signature
             return ''
         arguments_inout = expr.arguments_inout
+        allocated_results = expr.allocated_results
         args_decs = OrderedDict()
         for i,arg in enumerate(arguments):
             if arguments_inout[i]:
@@ -1484,7 +1527,16 @@ class FCodePrinter(CodePrinter):
             if arg in results:
                 results.remove(i)
 
-            dec = Declare(arg.dtype, arg, intent=intent , static=True)
+            if arg in allocated_results:
+                # The array allocated by the function is handed over to the
+                # caller through an allocatable descriptor (ISO_Fortran_binding)
+                dec = Declare(arg.dtype, arg, intent='out')
+            elif isinstance(arg, Variable) and arg.rank > 0:
+                # Arrays are assumed-shape so that the C descriptor passed by
+                # the caller can describe strided data
+                dec = Declare(arg.dtype, arg, intent=intent)
+            else:
+                dec = Declare(arg.dtype, arg, intent=intent , static=True)
             args_decs[str(arg.name)] = dec
 
         for result in results:
@@ -1523,6 +1575,13 @@ class FCodePrinter(CodePrinter):
     def _print_FunctionAddress(self, expr):
         return expr.name
 
+    def _returns_allocated_array(self, func):
+        """ Functions returning an array which they allocate are printed
+        as subroutines with an allocatable intent(out) argument, so that
+        the array is allocated directly in the variable of the caller
+        """
+        return not func.is_header and len(func.results) == 1 and len(func.allocated_results) == 1
+
     def function_signature(self, expr, name):
         is_pure      = expr.is_pure
         is_elemental = expr.is_elemental
@@ -1538,7 +1597,7 @@ class FCodePrinter(CodePrinter):
 
         func_end  = ''
         rec = 'recursive' if expr.is_recursive else ''
-        if len(expr.results) != 1:
+        if len(expr.results) != 1 or self._returns_allocated_array(expr):
             func_type = 'subroutine'
             out_args = list(expr.results)
             for result in out_args:
@@ -1625,7 +1684,11 @@ class FCodePrinter(CodePrinter):
         decs = OrderedDict()
         functions = expr.functions
         func_interfaces = '\n'.join(self._print(i) for i in expr.interfaces)
+        # OpenMP directives are not allowed in pure and elemental procedures
+        in_pure_function = self._in_pure_function
+        self._in_pure_function = expr.is_pure or expr.is_elemental
         body_code = self._print(expr.body)
+        self._in_pure_function = in_pure_function
         doc_string = self._print(expr.doc_string) if expr.doc_string else ''
 
         for i in expr.local_vars:
@@ -1856,6 +1919,11 @@ class FCodePrinter(CodePrinter):
             prolog, epilog = _do_range(expr.target, itr_, \
                                        prolog, epilog)
 
+        # The iterations of a prange loop are shared between the threads
+        if isinstance(expr.iterable, ParallelRange):
+            prolog = '!$omp parallel do {}\n'.format(self._get_parallel_loop_clauses(expr.iterable)) + prolog
+            epilog = epilog + '!$omp end parallel do\n'
+
         body = self._print(expr.body)
 
         return ('{prolog}'
@@ -1872,6 +1940,9 @@ class FCodePrinter(CodePrinter):
 
     def _print_Omp_End_Clause(self, expr):
         omp_expr = str(expr.txt)
+        # A section ends where the next one begins in Fortran
+        if omp_expr == 'end section':
+            return ''
         omp_expr = omp_expr.replace("for", "do")
         ompexpr = '!$omp {}\n'.format(omp_expr)
         return ompexpr
@@ -1885,6 +1956,46 @@ class FCodePrinter(CodePrinter):
         omp_expr   = str(expr.txt)
         return '!$omp do{}\n'.format(omp_expr)
 
+    def _print_OMP_Parallel_For_Loop(self, expr):
+        omp_expr   = str(expr.txt)
+        return '!$omp parallel do{}\n'.format(omp_expr)
+
+    def _print_OMP_Simd_Construct(self, expr):
+        omp_expr   = str(expr.txt)
+        return '!$omp {}\n'.format(omp_expr)
+
+    def _print_OMP_Critical_Construct(self, expr):
+        omp_expr   = str(expr.txt)
+        return '!$omp {}\n'.format(omp_expr)
+
+    def _print_OMP_Atomic_Construct(self, expr):
+        omp_expr   = str(expr.txt)
+        return '!$omp {}\n'.format(omp_expr)
+
+    def _print_OMP_Barrier_Construct(self, expr):
+        omp_expr   = str(expr.txt)
+        return '!$omp {}\n'.format(omp_expr)
+
+    def _print_OMP_Sections_Construct(self, expr):
+        omp_expr   = str(expr.txt)
+        return '!$omp {}\n'.format(omp_expr)
+
+    def _print_OMP_Section_Construct(self, expr):
+        omp_expr   = str(expr.txt)
+        return '!$omp {}\n'.format(omp_expr)
+
+    def _print_OMP_Task_Construct(self, expr):
+        omp_expr   = str(expr.txt)
+        return '!$omp {}\n'.format(omp_expr)
+
+    def _print_OMP_TaskLoop_Construct(self, expr):
+        omp_expr   = str(expr.txt)
+        return '!$omp {}\n'.format(omp_expr)
+
+    def _print_OMP_TaskWait_Construct(self, expr):
+        omp_expr   = str(expr.txt)
+        return '!$omp {}\n'.format(omp_expr)
+
     # .....................................................
     def _print_OMP_Parallel(self, expr):
         clauses = ' '.join(self._print(i)  for i in expr.clauses)
@@ -2747,7 +2858,23 @@ class FCodePrinter(CodePrinter):
         args = [a for a in expr.args if not isinstance(a, Nil)]
         results = func.results
 
-        if len(results) == 1:
+        if len(results) == 1 and self._returns_allocated_array(func):
+            # The array is allocated in a temporary variable
+            if (not self._additional_code):
+                self._additional_code = ''
+            var = results[0].clone(name = self.parser.get_new_name())
+
+            if self._current_function:
+                name = self._current_function
+                func = self.get_function(name)
+                func.local_vars.append(var)
+            else:
+                self._namespace.variables[var.name] = var
+
+            self._additional_code = self._additional_code + self._print(Assign(var,expr))
+            return self._print(var)
+
+        elif len(results) == 1:
             args = ['{}'.format(self._print(a)) for a in args]
 
             args = ', '.join(args)
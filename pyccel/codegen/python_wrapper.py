@@ -8,6 +8,9 @@ import sys
 import subprocess
 import os
 import glob
+import shlex
+import shutil
+import sysconfig
 import warnings
 
 from pyccel.ast.bind_c                      import as_static_function_call
@@ -15,7 +18,11 @@ from pyccel.ast.core                        import SeparatorComment
 from pyccel.codegen.printing.fcode          import fcode
 from pyccel.codegen.printing.cwrappercode   import cwrappercode
 from pyccel.codegen.utilities               import compile_files, get_gfortran_library_dir
+from pyccel.codegen.utilities               import CompileGraph
+from pyccel.codegen.utilities               import parallel_threshold
+from pyccel.codegen.timings                 import timed
 from .cwrapper import create_c_setup
+from .extension import compile_extension_wrapper, link_extension, get_python_build_config
 
 from pyccel.errors.errors import Errors
 
@@ -29,6 +36,33 @@ PY_VERSION = sys.version_info[0:2]
 
 fortran_c_flag_equivalence = {'-Wconversion-extra' : '-Wconversion' }
 
+#==============================================================================
+def _build_with_setuptools(setup_filename, pyccel_dirpath, target, verbose = False):
+    """
+    Build a python extension module by running its setup file with setuptools,
+    then copy the shared library to target.
+    """
+    cmd = [sys.executable, setup_filename, "build"]
+
+    if verbose:
+        print(' '.join(cmd))
+    with timed('setuptools build', setup_filename):
+        p = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                             universal_newlines=True, cwd=pyccel_dirpath)
+        out, err = p.communicate()
+    if verbose:
+        print(out)
+    if p.returncode != 0:
+        err_msg = "Failed to build module"
+        if verbose:
+            err_msg += "\n" + err
+        raise RuntimeError(err_msg)
+    if err:
+        warnings.warn(UserWarning(err))
+
+    pattern = os.path.join(pyccel_dirpath, 'build', 'lib*', os.path.basename(target))
+    shutil.copyfile(glob.glob(pattern)[0], target)
+
 #==============================================================================
 def create_shared_library(codegen,
                           language,
@@ -42,121 +76,156 @@ def create_shared_library(codegen,
                           includes='',
                           flags = '',
                           sharedlib_modname=None,
-                          verbose = False):
-
+                          verbose = False,
+                          warn_array_copy = False,
+                          compile_graph = None,
+                          depends = (),
+                          module_job = None):
+    """
+    Create the python extension module of a compiled module: generate and
+    compile the Fortran interface (bind_c_MOD.f90) if needed, then generate
+    the C wrapper, compile it and link it with the module.
+
+    The C compiler is called directly using the information provided by
+    sysconfig. Setuptools is only used if this is not possible on the
+    current platform.
+
+    If warn_array_copy is True the wrapper emits a RuntimeWarning when a
+    numpy array argument must be copied.
+
+    The files are generated immediately but the compilation commands are
+    added as jobs to compile_graph, and the caller is then responsible for
+    running the graph. The jobs start once the jobs in depends (e.g. the
+    compilation of the internal libraries) are finished. The Fortran
+    interface and the link also wait for module_job, the job compiling the
+    module (None if the module is already compiled). If compile_graph is None
+    the commands are run before returning.
+
+    Returns the absolute path of the shared library.
+    """
     # Consistency checks
     if not codegen.is_module:
         raise TypeError('Expected Module')
 
+    if language not in ['c', 'fortran']:
+        raise NotImplementedError("Python extensions cannot be created from {} code".format(language))
+
+    run_graph = compile_graph is None
+    if run_graph:
+        compile_graph = CompileGraph()
+
     # Get module name
     module_name = codegen.name
 
-    # Change working directory to '__pyccel__'
-    base_dirpath = os.getcwd()
-    os.chdir(pyccel_dirpath)
-
     # Name of shared library
     if sharedlib_modname is None:
         sharedlib_modname = module_name
 
-    sharedlib_folder = ''
-
-    if language in ['c', 'fortran']:
-        extra_libs = []
-        extra_libdirs = []
-        if language == 'fortran':
-            # Construct static interface for passing array shapes and write it to file bind_c_MOD.f90
+    extra_libs = []
+    extra_libdirs = []
+    depends = list(depends)
+    module_depends = depends + ([module_job] if module_job is not None else [])
+    # Jobs which must be finished before linking
+    link_depends = list(module_depends)
+    if language == 'fortran':
+        # Construct static interface for passing array shapes and write it to file bind_c_MOD.f90
+        bind_c_filename = os.path.join(pyccel_dirpath, 'bind_c_{}.f90'.format(module_name))
+        with timed('bind_c', bind_c_filename):
             funcs = [f for f in codegen.routines if not f.is_private]
             sep = fcode(SeparatorComment(40), codegen.parser)
             bind_c_funcs = [as_static_function_call(f, module_name, name=f.name) for f in funcs]
             bind_c_code = '\n'.join([sep + fcode(f, codegen.parser) + sep for f in bind_c_funcs])
-            bind_c_filename = 'bind_c_{}.f90'.format(module_name)
 
             with open(bind_c_filename, 'w') as f:
                 f.writelines(bind_c_code)
 
-            compile_files(bind_c_filename, compiler, flags,
-                binary=None,
-                verbose=verbose,
-                is_module=True,
-                output=pyccel_dirpath,
-                libs=libs,
-                libdirs=libdirs,
-                language=language)
-
-            dep_mods = (os.path.join(pyccel_dirpath,'bind_c_{}'.format(module_name)), *dep_mods)
-            if compiler == 'gfortran':
-                extra_libs.append('gfortran')
-                extra_libdirs.append(get_gfortran_library_dir())
-            elif compiler == 'ifort':
-                extra_libs.append('ifcore')
-
-        if sys.platform == 'win32':
-            extra_libs.append('quadmath')
-
+        # The interface uses the .mod file of the module
+        compile_graph.add_job(bind_c_filename, compile_files, bind_c_filename, compiler, flags,
+            binary=None,
+            verbose=verbose,
+            is_module=True,
+            output=pyccel_dirpath,
+            libs=libs,
+            libdirs=libdirs,
+            language=language,
+            depends=module_depends)
+        link_depends.append(bind_c_filename)
+
+        dep_mods = (os.path.join(pyccel_dirpath,'bind_c_{}'.format(module_name)), *dep_mods)
+        if compiler == 'gfortran':
+            extra_libs.append('gfortran')
+            extra_libdirs.append(get_gfortran_library_dir())
+        elif compiler == 'ifort':
+            extra_libs.append('ifcore')
+        # The Fortran compiler links the math library implicitly (the
+        # vectorised functions of libmvec may be used) but the C linker does not
+        extra_libs.append('m')
+
+    if sys.platform == 'win32':
+        extra_libs.append('quadmath')
+
+    wrapper_filename_root = '{}_wrapper'.format(module_name)
+    wrapper_filename = os.path.join(pyccel_dirpath, '{}.c'.format(wrapper_filename_root))
+    with timed('wrapper', wrapper_filename):
         module_old_name = codegen.expr.name
         codegen.expr.set_name(sharedlib_modname)
-        wrapper_code = cwrappercode(codegen.expr, codegen.parser, language)
+        wrapper_code = cwrappercode(codegen.expr, codegen.parser, language,
+                                    warn_array_copy = warn_array_copy,
+                                    parallel_threshold = parallel_threshold \
+                                            if accelerator == 'openmp' else None)
         if errors.has_errors():
             return
 
         codegen.expr.set_name(module_old_name)
-        wrapper_filename_root = '{}_wrapper'.format(module_name)
-        wrapper_filename = '{}.c'.format(wrapper_filename_root)
 
         with open(wrapper_filename, 'w') as f:
             f.writelines(wrapper_code)
 
-        c_flags = [fortran_c_flag_equivalence[f] if f in fortran_c_flag_equivalence \
-                else f for f in flags.strip().split(' ') if f != '']
+    c_flags = [fortran_c_flag_equivalence[f] if f in fortran_c_flag_equivalence \
+            else f for f in shlex.split(flags, posix = sys.platform != 'win32')]
 
-        if sys.platform == "darwin" and "-fopenmp" in c_flags and "-Xpreprocessor" not in c_flags:
-            idx = 0
-            while idx < len(c_flags):
-                if c_flags[idx] == "-fopenmp":
-                    c_flags.insert(idx, "-Xpreprocessor")
-                    idx += 1
+    if sys.platform == "darwin" and "-fopenmp" in c_flags and "-Xpreprocessor" not in c_flags:
+        idx = 0
+        while idx < len(c_flags):
+            if c_flags[idx] == "-fopenmp":
+                c_flags.insert(idx, "-Xpreprocessor")
                 idx += 1
-
+            idx += 1
+
+    sharedlib_filepath = os.path.join(pyccel_dirpath,
+                                      sharedlib_modname + sysconfig.get_config_var('EXT_SUFFIX'))
+
+    if get_python_build_config() is not None:
+        # Call the compiler directly. The wrapper only needs the headers of the
+        # module and of the internal libraries so it is compiled at the same
+        # time as the module
+        obj_file = os.path.join(pyccel_dirpath, wrapper_filename_root + '.o')
+        compile_graph.add_job(wrapper_filename, compile_extension_wrapper,
+                wrapper_filename, obj_file, includes, c_flags,
+                verbose = verbose,
+                depends = depends)
+        link_depends.append(wrapper_filename)
+
+        compile_graph.add_job(sharedlib_filepath, link_extension, sharedlib_filepath, obj_file,
+                dep_mods, libs + extra_libs, libdirs + extra_libdirs, c_flags,
+                verbose = verbose,
+                depends = link_depends)
+    else:
+        # Fall back to setuptools
         setup_code = create_c_setup(sharedlib_modname, wrapper_filename,
                 dep_mods, compiler, includes, libs + extra_libs, libdirs + extra_libdirs, c_flags)
-        setup_filename = "setup_{}.py".format(module_name)
+        setup_filename = os.path.join(pyccel_dirpath, "setup_{}.py".format(module_name))
 
         with open(setup_filename, 'w') as f:
             f.writelines(setup_code)
 
-        setup_filename = os.path.join(pyccel_dirpath, setup_filename)
-        cmd = [sys.executable, setup_filename, "build"]
-
-        if verbose:
-            print(' '.join(cmd))
-        p = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, universal_newlines=True)
-        out, err = p.communicate()
-        if verbose:
-            print(out)
-        if p.returncode != 0:
-            err_msg = "Failed to build module"
-            if verbose:
-                err_msg += "\n" + err
-            raise RuntimeError(err_msg)
-        if err:
-            warnings.warn(UserWarning(err))
-
-        sharedlib_folder += 'build/lib*/'
-
-    # Obtain absolute path of newly created shared library
-
-    # Set file name extension of Python extension module
-    if os.name == 'nt':  # Windows
-        extext = 'pyd'
-    else:
-        extext = 'so'
-    pattern = '{}{}*.{}'.format(sharedlib_folder, sharedlib_modname, extext)
-    sharedlib_filename = glob.glob(pattern)[0]
-    sharedlib_filepath = os.path.abspath(sharedlib_filename)
+        compile_graph.add_job(sharedlib_filepath, _build_with_setuptools,
+                setup_filename, pyccel_dirpath, sharedlib_filepath,
+                verbose = verbose,
+                depends = link_depends)
 
-    # Change working directory back to starting point
-    os.chdir(base_dirpath)
+    if run_graph:
+        compile_graph.run()
 
     # Return absolute path of shared library
     return sharedlib_filepath
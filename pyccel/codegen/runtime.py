@@ -0,0 +1,285 @@
+# coding: utf-8
+#------------------------------------------------------------------------------------------#
+# This file is part of Pyccel which is released under MIT License. See the LICENSE file or #
+# go to https://github.com/pyccel/pyccel/blob/master/LICENSE for full license details.     #
+#------------------------------------------------------------------------------------------#
+
+"""
+This file contains the functions which build the runtime libraries of pyccel:
+the internal libraries found in pyccel/stdlib (ndarrays, pyc_math, ...).
+
+Each library is compiled once for each combination of pyccel version, sources,
+compiler and flags. The result (headers or .mod files and a static library
+libpyccel_rt_<name>.a) is stored in a versioned folder of the user cache
+($XDG_CACHE_HOME/pyccel/.runtime by default), and every generated file is
+compiled against this folder and linked with this library.
+
+It also contains the functions which read the memory statistics of the
+ndarrays library linked into a compiled module, and control its pool of
+data buffers.
+"""
+
+import ctypes
+import hashlib
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+from types import ModuleType
+
+from pyccel.version import __version__
+from pyccel.codegen.cache import get_default_cache_folder
+from pyccel.codegen.utilities import compile_files, get_fortran_module_dependencies
+from pyccel.codegen.utilities import language_extension
+
+__all__ = ['get_runtime_folder', 'get_runtime_library', 'build_runtime_library',
+           'library_stamp', 'get_memory_statistics', 'reset_memory_statistics',
+           'set_memory_pool']
+
+runtime_library_prefix = 'pyccel_rt_'
+
+#==============================================================================
+def get_runtime_folder():
+    """
+    Returns the folder where the runtime libraries are stored.
+    The environment variable PYCCEL_RUNTIME_DIR is used if it is defined,
+    otherwise the folder .runtime of the build cache folder is used.
+    """
+    folder = os.environ.get('PYCCEL_RUNTIME_DIR', None)
+    if not folder:
+        folder = os.path.join(get_default_cache_folder(), '.runtime')
+    return os.path.abspath(folder)
+
+#==============================================================================
+def library_stamp(lib_path, ext, *settings):
+    """
+    Returns a string identifying the build of an internal library:
+    the hash of its source files and of the settings used to compile them
+    """
+    hasher = hashlib.sha256(__version__.encode('utf-8'))
+    for f in sorted(os.listdir(lib_path)):
+        hasher.update(f.encode('utf-8'))
+        with open(os.path.join(lib_path, f), 'rb') as source:
+            hasher.update(source.read())
+    for s in settings:
+        hasher.update(repr(s).encode('utf-8'))
+    hasher.update(ext.encode('utf-8'))
+    return hasher.hexdigest()
+
+#==============================================================================
+def get_runtime_library(lib_name, lib_path, language, compiler, flags):
+    """
+    Returns the location of the runtime library built from the sources in
+    lib_path with the compiler and flags. The library is not built.
+
+    Parameters
+    ----------
+    lib_name : str
+        The name of the library (e.g. ndarrays)
+
+    lib_path : str
+        The folder containing the sources of the library
+
+    language : str
+        The language of the sources which are compiled
+
+    compiler : str
+        The compiler used to compile the sources
+
+    flags : str
+        The flags passed to the compiler
+
+    Returns
+    -------
+    folder : str
+        The folder containing the headers (or .mod files) and the library
+
+    library : str
+        The name of the library, as passed to the linker with -l
+    """
+    ext   = language_extension[language]
+    stamp = library_stamp(lib_path, ext, compiler, flags)
+    folder  = os.path.join(get_runtime_folder(), '{}-{}'.format(lib_name, stamp[:16]))
+    library = runtime_library_prefix + lib_name
+    return folder, library
+
+#==============================================================================
+def build_runtime_library(lib_name, lib_path, language, compiler, flags, verbose = False):
+    """
+    Build the runtime library described by get_runtime_library if it does
+    not exist yet. The library is built in a temporary folder which is then
+    renamed, so several processes can build the same library at the same time.
+
+    Parameters
+    ----------
+    See get_runtime_library
+
+    verbose : bool
+        Print the compiler commands
+
+    Returns
+    -------
+    folder : str
+        The folder containing the headers (or .mod files) and the library
+
+    library : str
+        The name of the library, as passed to the linker with -l
+    """
+    folder, library = get_runtime_library(lib_name, lib_path, language, compiler, flags)
+    archive_name = 'lib{}.a'.format(library)
+    if os.path.isfile(os.path.join(folder, archive_name)):
+        if verbose:
+            print('> Using runtime library: {}'.format(folder))
+        return folder, library
+
+    runtime_folder = os.path.dirname(folder)
+    os.makedirs(runtime_folder, exist_ok=True)
+    tmp_folder = tempfile.mkdtemp(prefix='.tmp-{}-'.format(lib_name), dir=runtime_folder)
+
+    try:
+        for f in os.listdir(lib_path):
+            shutil.copy2(os.path.join(lib_path, f), tmp_folder)
+
+        ext = '.' + language_extension[language]
+        source_files = sorted(os.path.join(tmp_folder, f) for f in os.listdir(tmp_folder)
+                                if f.endswith(ext))
+
+        # Fortran files must be compiled after the modules they use
+        if language == 'fortran':
+            source_dependencies = get_fortran_module_dependencies(source_files)
+            ordered = []
+            def visit(f):
+                if f not in ordered:
+                    for d in source_dependencies[f]:
+                        visit(d)
+                    ordered.append(f)
+            for f in source_files:
+                visit(f)
+            source_files = ordered
+
+        lib_flags = flags + ' -I"{}"'.format(tmp_folder)
+        for f in source_files:
+            compile_files(f, compiler, lib_flags,
+                            binary=None,
+                            verbose=verbose,
+                            is_module=True,
+                            output=tmp_folder,
+                            language=language)
+
+        objects = [os.path.splitext(f)[0] + '.o' for f in source_files]
+        cmd = ['ar', 'rcs', os.path.join(tmp_folder, archive_name), *objects]
+        if verbose:
+            print(' '.join(cmd))
+        subprocess.check_output(cmd, stderr=subprocess.STDOUT)
+
+        try:
+            os.rename(tmp_folder, folder)
+        except OSError:
+            # The library was built by another process in the meantime
+            if not os.path.isfile(os.path.join(folder, archive_name)):
+                raise
+            shutil.rmtree(tmp_folder, ignore_errors=True)
+    except Exception:
+        shutil.rmtree(tmp_folder, ignore_errors=True)
+        raise
+
+    if verbose:
+        print('> Runtime library has been created: {}'.format(folder))
+
+    return folder, library
+
+#==============================================================================
+class _NdarrayMemoryStats(ctypes.Structure):
+    """ The structure t_ndarray_memory_stats of ndarrays.h """
+    _fields_ = [('allocations',   ctypes.c_int64),
+                ('pool_hits',     ctypes.c_int64),
+                ('total_bytes',   ctypes.c_int64),
+                ('current_bytes', ctypes.c_int64),
+                ('peak_bytes',    ctypes.c_int64),
+                ('pooled_bytes',  ctypes.c_int64)]
+
+#==============================================================================
+def _get_module(module_or_function):
+    """ Returns the module containing a compiled function """
+    if isinstance(module_or_function, ModuleType):
+        return module_or_function
+    return sys.modules[module_or_function.__module__]
+
+#==============================================================================
+def _get_ndarrays_function(module, name):
+    """
+    Returns the function called name in the ndarrays library linked into the
+    compiled module (each module contains its own copy of the library).
+    """
+    library = ctypes.CDLL(module.__file__)
+    try:
+        return getattr(library, name)
+    except AttributeError:
+        raise ValueError('{} does not use the ndarrays library (only modules '
+                'translated to C which create arrays do)'.format(module.__name__)) from None
+
+#==============================================================================
+def get_memory_statistics(module):
+    """
+    Returns the statistics of the memory allocated for arrays by a module
+    translated to C.
+
+    Parameters
+    ----------
+    module : module
+        The module (e.g. returned by epyccel) or one of its functions
+
+    Returns
+    -------
+    stats : dict
+        allocations   : number of data buffers allocated
+        pool_hits     : number of those buffers recycled from the pool
+        total_bytes   : total number of bytes allocated
+        current_bytes : number of bytes currently allocated
+        peak_bytes    : maximum number of bytes allocated at the same time
+        pooled_bytes  : number of bytes kept by the pools of the threads
+    """
+    func = _get_ndarrays_function(_get_module(module), 'ndarray_memory_stats')
+    func.restype = _NdarrayMemoryStats
+    stats = func()
+    return {name : getattr(stats, name) for name, _ in _NdarrayMemoryStats._fields_}
+
+#==============================================================================
+def reset_memory_statistics(module):
+    """
+    Resets the statistics of the memory allocated for arrays by a module
+    translated to C. The peak is reset to the number of bytes currently
+    allocated.
+
+    Parameters
+    ----------
+    module : module
+        The module (e.g. returned by epyccel) or one of its functions
+    """
+    _get_ndarrays_function(_get_module(module), 'ndarray_memory_stats_reset')()
+
+#==============================================================================
+def set_memory_pool(module, enable):
+    """
+    Enables or disables the pool of data buffers of a module translated to C.
+
+    When the pool is enabled, the data buffers allocated by the module (up
+    to 1 MiB) are rounded up to a power of 2 (size class). When they are
+    freed they are kept by the thread which frees them, and are reused by
+    the next arrays of the same size class instead of being allocated again.
+    The buffers kept by a thread are released when the thread exits.
+    Disabling the pool releases the buffers kept by the calling thread.
+
+    Parameters
+    ----------
+    module : module
+        The module (e.g. returned by epyccel) or one of its functions
+
+    enable : bool
+        True to enable the pool, False to disable it
+    """
+    module = _get_module(module)
+    _get_ndarrays_function(module, 'ndarray_pool_enable')(ctypes.c_bool(enable))
+    if not enable:
+        _get_ndarrays_function(module, 'ndarray_pool_release')()
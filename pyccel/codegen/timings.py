@@ -0,0 +1,303 @@
+# coding: utf-8
+#------------------------------------------------------------------------------------------#
+# This file is part of Pyccel which is released under MIT License. See the LICENSE file or #
+# go to https://github.com/pyccel/pyccel/blob/master/LICENSE for full license details.     #
+#------------------------------------------------------------------------------------------#
+
+"""
+This file contains the tools used to measure the time and the memory spent in
+each stage of pyccel (imports, syntactic and semantic stages, code generation,
+compilation, ...). They are used by the --timings option of the pyccel command
+and by the timings option of epyccel.
+
+The stages are delimited with the context manager `timed`, which does nothing
+when no Timings object is recording, so it can be used anywhere in pyccel.
+
+The peak memory of a stage which runs in the python process is the peak of the
+memory allocated by python during the stage (measured with tracemalloc). The
+peak memory of a stage which runs an external command (compiler, linker) is the
+maximum resident set size of the command, when the platform provides it. On
+linux this size includes the memory of the pyccel process which started the
+command, so it is only known when the command uses more memory than pyccel.
+"""
+
+import json
+import os
+import subprocess
+import sys
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+
+try:
+    import resource
+except ImportError:
+    # The memory used by external commands is not measured on windows
+    resource = None
+
+__all__ = ['Timings', 'timed', 'run_command']
+
+# Timings object which is currently recording, if any
+_active_timings = None
+
+# tracemalloc.reset_peak is only available from python 3.9. Before that the peak
+# reported for a stage is the peak since the beginning of the recording
+_reset_peak = getattr(tracemalloc, 'reset_peak', lambda: None)
+
+#==============================================================================
+@contextmanager
+def timed(stage, target=None):
+    """
+    Measure the time and the peak memory of a stage of pyccel if a Timings
+    object is recording (see Timings.record). Otherwise nothing is done.
+
+    Parameters
+    ----------
+    stage : str
+        The name of the stage (e.g. 'syntax', 'compile')
+
+    target : str
+        The file treated by the stage (optional)
+    """
+    timings = _active_timings
+    if timings is None:
+        yield
+    else:
+        with timings.measure(stage, target):
+            yield
+
+def run_command(cmd, shell=False):
+    """
+    Run an external command (e.g. a compiler) and return its exit code and
+    its output (stdout and stderr). If a Timings object is recording, the
+    maximum resident set size of the command is stored in the current stage.
+
+    Parameters
+    ----------
+    cmd : str or list of str
+        The command
+
+    shell : bool
+        Boolean indicating whether the command is run through the shell
+
+    Returns
+    -------
+    returncode : int
+        The exit code of the command
+
+    output : str
+        The output of the command
+    """
+    timings = _active_timings
+    p = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+            shell=shell, universal_newlines=True)
+
+    if timings is None or resource is None:
+        output, _ = p.communicate()
+        return p.returncode, output
+
+    with p.stdout:
+        output = p.stdout.read()
+    # wait4 provides the resource usage of the command (and of its children)
+    _, status, usage = os.wait4(p.pid, 0)
+    p.returncode = -os.WTERMSIG(status) if os.WIFSIGNALED(status) else os.WEXITSTATUS(status)
+
+    # The resident set size of the process which was forked from pyccel
+    # includes the memory of pyccel until the command is started
+    memory = usage.ru_maxrss
+    if memory <= resource.getrusage(resource.RUSAGE_SELF).ru_maxrss:
+        memory = None
+    elif sys.platform != 'darwin':
+        # ru_maxrss is in bytes on macOS and in kilobytes on linux
+        memory *= 1024
+    timings.add_process_memory(memory)
+
+    return p.returncode, output
+
+#==============================================================================
+class Timings:
+    """
+    Record of the time and of the peak memory spent in each stage of pyccel.
+
+    Parameters
+    ----------
+    trace_memory : bool
+        Boolean indicating whether the memory allocated by python is traced
+        (with tracemalloc) to measure the peak memory of each stage. This
+        slows pyccel down. The memory used by external commands is always
+        measured when possible.
+        Default : True
+
+    Examples
+    --------
+    >>> timings = Timings()
+    >>> with timings.record():
+    ...     execute_pyccel('file.py')
+    >>> print(timings)
+    >>> timings.save('timings.json')
+    """
+    def __init__(self, trace_memory = True):
+        self._trace_memory = trace_memory
+        self._records      = []
+        self._total        = 0.0
+        self._lock         = threading.Lock()
+        # Stages which are running in each thread
+        self._local        = threading.local()
+        # Memory is only traced in the thread which started the recording
+        self._owner        = None
+        self._peaks        = []
+        self._start        = None
+        self._previous     = None
+        self._started_tracing = False
+
+    @property
+    def records(self):
+        """
+        The stages which were measured, in the order in which they finished.
+        Each stage is described by a dictionary containing its name ('stage'),
+        the file it treated ('target'), its duration in seconds ('time'),
+        its peak memory in bytes ('memory') and a boolean indicating whether
+        this memory was used by an external command ('external').
+        """
+        return list(self._records)
+
+    @property
+    def total(self):
+        """ Total time (in seconds) spent recording """
+        return self._total
+
+    def start(self):
+        """
+        Start recording the stages of pyccel. The recording must be
+        stopped with the method stop.
+        """
+        global _active_timings # pylint: disable=global-statement
+        self._previous = _active_timings
+        _active_timings = self
+
+        self._started_tracing = self._trace_memory and not tracemalloc.is_tracing()
+        if self._started_tracing:
+            tracemalloc.start()
+        self._owner = threading.get_ident()
+        self._start = time.perf_counter()
+
+    def stop(self):
+        """ Stop recording the stages of pyccel """
+        global _active_timings # pylint: disable=global-statement
+        self._total += time.perf_counter() - self._start
+        if self._started_tracing:
+            tracemalloc.stop()
+        self._owner = None
+        _active_timings = self._previous
+
+    @contextmanager
+    def record(self):
+        """
+        Context manager which makes this object record the stages of pyccel
+        run inside it.
+        """
+        self.start()
+        try:
+            yield self
+        finally:
+            self.stop()
+
+    def _stack(self):
+        """ Returns the stages which are running in the current thread """
+        if not hasattr(self._local, 'stack'):
+            self._local.stack = []
+        return self._local.stack
+
+    def _traces_memory(self):
+        """ Returns True if the memory of the stages of the current thread is traced """
+        return tracemalloc.is_tracing() and threading.get_ident() == self._owner
+
+    @contextmanager
+    def measure(self, stage, target=None):
+        """
+        Context manager measuring the time and the peak memory of a stage
+
+        Parameters
+        ----------
+        stage : str
+            The name of the stage
+
+        target : str
+            The file treated by the stage (optional)
+        """
+        record = {'stage'    : stage,
+                  'target'   : target,
+                  'time'     : None,
+                  'memory'   : None,
+                  'external' : False}
+        stack = self._stack()
+        stack.append(record)
+
+        traced = self._traces_memory()
+        if traced:
+            # Save the peak of the enclosing stage before starting a new one
+            peak = tracemalloc.get_traced_memory()[1]
+            if self._peaks:
+                self._peaks[-1] = max(self._peaks[-1], peak)
+            self._peaks.append(0)
+            _reset_peak()
+
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            record['time'] = time.perf_counter() - start
+            stack.pop()
+
+            if traced:
+                peak = max(self._peaks.pop(), tracemalloc.get_traced_memory()[1])
+                if self._peaks:
+                    self._peaks[-1] = max(self._peaks[-1], peak)
+                if not record['external']:
+                    record['memory'] = peak
+
+            with self._lock:
+                self._records.append(record)
+
+    def add_process_memory(self, memory):
+        """
+        Store the peak memory (in bytes) of an external command run
+        by the current stage. The memory is None if it is not known.
+        """
+        stack = self._stack()
+        if stack:
+            record = stack[-1]
+            if record['external'] and record['memory'] is not None:
+                memory = max(record['memory'], memory or 0)
+            record['memory']   = memory
+            record['external'] = True
+
+    def as_dict(self):
+        """ Returns a dictionary describing the measured stages, which can be saved as JSON """
+        return {'total'  : self._total,
+                'stages' : self.records}
+
+    def save(self, filename):
+        """ Save the measured stages in a JSON file """
+        with open(filename, 'w') as f:
+            json.dump(self.as_dict(), f, indent=1)
+
+    def __str__(self):
+        targets = [os.path.basename(r['target']) if r['target'] else '' for r in self._records]
+        width   = max([len('Target'), *(len(t) for t in targets)])
+        line    = '{:<22} {:<%d} {:>10} {:>12}' % width
+
+        lines = [line.format('Stage', 'Target', 'Time (s)', 'Memory (MB)')]
+        for r, target in zip(self._records, targets):
+            if r['memory'] is None:
+                memory = '-'
+            else:
+                memory = '{:.1f}'.format(r['memory'] / 2**20)
+                if r['external']:
+                    memory = '*' + memory
+            lines.append(line.format(r['stage'], target, '{:.3f}'.format(r['time']), memory))
+        lines.append(line.format('total', '', '{:.3f}'.format(self._total), ''))
+        if any(r['external'] and r['memory'] is not None for r in self._records):
+            lines.append('* maximum resident set size of the external command')
+        return '\n'.join(lines)
@@ -9,12 +9,18 @@ This file contains some useful functions to compile the generated fortran code
 """
 
 import os
+import re
 import shutil
 import subprocess
 import sys
 import warnings
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
 
-__all__ = ['construct_flags', 'compile_files', 'get_gfortran_library_dir']
+from pyccel.codegen.timings import timed, run_command
+
+__all__ = ['construct_flags', 'compile_files', 'get_gfortran_library_dir',
+           'get_jobs_number', 'get_fortran_module_dependencies', 'CompileGraph']
 
 #==============================================================================
 # TODO use constructor and a dict to map flags w.r.t the compiler
@@ -22,6 +28,12 @@ _avail_compilers = ['gfortran', 'mpif90', 'pgfortran', 'ifort', 'gcc', 'icc']
 
 language_extension = {'fortran':'f90', 'c':'c', 'python':'py'}
 
+# Number of elements above which the elementwise operations (loops of the
+# ufuncs and whole-array assignments) are shared between the threads when
+# pyccel is used with openmp. Below it the cost of starting a parallel region
+# (a few microseconds) is larger than the time gained
+parallel_threshold = 20000
+
 #==============================================================================
 # TODO add opt flags, etc... look at f2py interface in numpy
 def construct_flags(compiler,
@@ -134,6 +146,7 @@ def compile_files(filename, compiler, flags,
         flags += ''.join(' -L"{0}"'.format(i) for i in libdirs)
         libs_flags = ' '.join('-l{}'.format(i) for i in libs)
 
+    source_file = filename
     filename = '"{}"'.format(filename)  # in case of spaces in path
     binary = '"{}"'.format(binary)
 
@@ -147,10 +160,13 @@ def compile_files(filename, compiler, flags,
     if verbose:
         print(cmd)
 
-    output = subprocess.check_output(cmd, stderr=subprocess.STDOUT, shell=True)
+    with timed('compile', source_file):
+        returncode, output = run_command(cmd, shell=True)
+
+    if returncode != 0:
+        raise subprocess.CalledProcessError(returncode, cmd, output)
 
     if output:
-        output = output.decode("utf-8")
         warnings.warn(UserWarning(output))
 
     # TODO shall we uncomment this?
@@ -188,3 +204,150 @@ def get_gfortran_library_dir():
             # Add to sytem path
             sys.path.insert(0, lib_dir)
     return lib_dir
+
+#==============================================================================
+def get_jobs_number(jobs):
+    """
+    Returns the number of compilation jobs which can be run at the same time.
+    If jobs is None or 0, the number of available cpus is used.
+    """
+    if not jobs:
+        try:
+            return max(len(os.sched_getaffinity(0)), 1)
+        except AttributeError: # pragma: no cover
+            return os.cpu_count() or 1
+    if jobs < 0:
+        raise ValueError("The number of jobs must be positive")
+    return jobs
+
+#==============================================================================
+_fortran_module_def = re.compile(r'^\s*module\s+(?!procedure\b)(\w+)', re.IGNORECASE | re.MULTILINE)
+_fortran_module_use = re.compile(r'^\s*use\s*(?:,\s*\w+\s*::\s*|::\s*|\s)\s*(\w+)',
+                                 re.IGNORECASE | re.MULTILINE)
+
+def get_fortran_module_dependencies(filenames):
+    """
+    Determine the order in which Fortran files must be compiled so that
+    the .mod files they use exist.
+
+    Parameters
+    ----------
+    filenames : list of str
+        The Fortran files
+
+    Returns
+    -------
+    dependencies : dict
+        Maps each file to the list of files defining the modules it uses
+    """
+    defined_in = {}
+    used = {}
+    for f in filenames:
+        with open(f, 'r') as source:
+            code = source.read()
+        for m in _fortran_module_def.findall(code):
+            defined_in[m.lower()] = f
+        used[f] = [m.lower() for m in _fortran_module_use.findall(code)]
+
+    return {f : list(OrderedDict.fromkeys(defined_in[m] for m in used[f]
+                        if m in defined_in and defined_in[m] != f))
+            for f in filenames}
+
+#==============================================================================
+class CompileGraph:
+    """
+    Directed acyclic graph of compilation jobs.
+
+    A job is only started once all the jobs it depends on have finished
+    successfully. Independent jobs are run concurrently on a pool of
+    threads (the work is done by the compiler subprocesses).
+
+    Parameters
+    ----------
+    jobs : int
+        The maximum number of jobs which are run at the same time.
+        If None or 0, the number of available cpus is used.
+        Default : 1
+    """
+    def __init__(self, jobs = 1):
+        self._jobs       = get_jobs_number(jobs)
+        self._pending    = OrderedDict()
+        self._done       = set()
+        self._failed_job = None
+
+    @property
+    def jobs(self):
+        """ The maximum number of jobs which are run at the same time """
+        return self._jobs
+
+    @property
+    def failed_job(self):
+        """ The name of the job which caused the last call to run to fail """
+        return self._failed_job
+
+    def add_job(self, name, func, *args, depends = (), **kwargs):
+        """
+        Add a job to the graph.
+
+        Parameters
+        ----------
+        name : str
+            A unique name describing the job
+
+        func : callable
+            The function which is called (with args and kwargs) to run the job
+
+        depends : iterable of str
+            The names of the jobs which must be finished before this one starts.
+            These jobs must already have been added to the graph.
+
+        Returns
+        -------
+        name : str
+            The name of the job
+        """
+        if name in self._pending or name in self._done:
+            raise ValueError("Job {} already exists".format(name))
+        depends = tuple(depends)
+        unknown = [d for d in depends if d not in self._pending and d not in self._done]
+        if unknown:
+            raise ValueError("Job {} depends on unknown jobs {}".format(name, unknown))
+        self._pending[name] = (func, args, kwargs, depends)
+        return name
+
+    def run(self):
+        """
+        Run all the jobs which were added since the last call.
+        If a job fails, no new job is started and the exception raised by the
+        job is raised again once the running jobs have finished.
+        """
+        pending = self._pending
+        self._pending = OrderedDict()
+        self._failed_job = None
+
+        # Jobs are added after their dependencies so the order of insertion is valid
+        if self._jobs == 1 or len(pending) < 2:
+            for name, (func, args, kwargs, _) in pending.items():
+                self._failed_job = name
+                func(*args, **kwargs)
+                self._done.add(name)
+            self._failed_job = None
+            return
+
+        running = {}
+        with ThreadPoolExecutor(max_workers = self._jobs) as pool:
+            while pending or running:
+                ready = [n for n, (_, _, _, deps) in pending.items()
+                            if all(d in self._done for d in deps)]
+                for name in ready:
+                    func, args, kwargs, _ = pending.pop(name)
+                    running[pool.submit(func, *args, **kwargs)] = name
+
+                finished, _ = wait(running, return_when = FIRST_COMPLETED)
+                for future in finished:
+                    name = running.pop(future)
+                    if future.exception() is not None:
+                        self._failed_job = name
+                        wait(running)
+                        raise future.exception()
+                    self._done.add(name)
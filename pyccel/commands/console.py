@@ -56,7 +56,7 @@ def pyccel(files=None, openmp=None, openacc=None, output_dir=None, compiler=None
     parser = MyParser(description='pyccel command line')
 
     parser.add_argument('files', metavar='N', type=str, nargs='+',
-                        help='a Pyccel file')
+                        help='a Pyccel file or a folder containing Pyccel files')
 
     #... Version
     import pyccel
@@ -119,6 +119,12 @@ def pyccel(files=None, openmp=None, openacc=None, output_dir=None, compiler=None
     group.add_argument('--output', type=str, default = '',\
                        help='folder in which the output is stored.')
 
+    group.add_argument('--array-alignment', type=int, metavar='BYTES', \
+                       help='alignment requested for the allocatable arrays in Fortran (ifort only).')
+
+    group.add_argument('--warn-array-copy', action='store_true', \
+                       help='warn when a numpy array argument is copied by the python wrapper.')
+
     # ...
 
     # ... Accelerators
@@ -127,6 +133,9 @@ def pyccel(files=None, openmp=None, openacc=None, output_dir=None, compiler=None
                        help='uses openmp')
     group.add_argument('--openacc', action='store_true', \
                        help='uses openacc')
+    group.add_argument('--auto-parallel', action='store_true', \
+                       help='parallelises the loops whose iterations are independent with openmp '
+                            '(implies --openmp) and reports which loops were parallelised.')
     # ...
 
     # ... Other options
@@ -135,6 +144,14 @@ def pyccel(files=None, openmp=None, openacc=None, output_dir=None, compiler=None
                         help='enables verbose mode.')
     group.add_argument('--developer-mode', action='store_true', \
                         help='shows internal messages')
+    group.add_argument('--cache', action='store_true', \
+                        help='reuses the results of identical builds stored in the pyccel cache.')
+    group.add_argument('--incremental', action='store_true', \
+                        help='only rebuilds the files whose inputs changed since the last build.')
+    group.add_argument('-j', '--jobs', type=int, nargs='?', default=1, const=0, \
+                        help='number of files compiled at the same time (all available cpus if no number is given).')
+    group.add_argument('--timings', '--profile', type=str, nargs='?', const='', metavar='JSON_FILE', \
+                        help='prints the time and the peak memory spent in each stage (and saves them in JSON_FILE if given).')
     # ...
 
     # TODO move to another cmd line
@@ -146,11 +163,19 @@ def pyccel(files=None, openmp=None, openacc=None, output_dir=None, compiler=None
     args = parser.parse_args()
     # ...
 
+    # The time spent in each stage (including the imports) is recorded if requested
+    from pyccel.codegen.timings   import Timings, timed
+    timings = None
+    if args.timings is not None:
+        timings = Timings()
+        timings.start()
+
     # Imports
-    from pyccel.errors.errors     import Errors, PyccelError
-    from pyccel.errors.errors     import ErrorsMode
-    from pyccel.errors.messages   import INVALID_FILE_DIRECTORY, INVALID_FILE_EXTENSION
-    from pyccel.codegen.pipeline  import execute_pyccel
+    with timed('import'):
+        from pyccel.errors.errors     import Errors, PyccelError
+        from pyccel.errors.errors     import ErrorsMode
+        from pyccel.errors.messages   import INVALID_FILE_DIRECTORY, INVALID_FILE_EXTENSION
+        from pyccel.codegen.pipeline  import execute_pyccel_files, get_package_files
 
     # ...
     if not files:
@@ -171,36 +196,44 @@ def pyccel(files=None, openmp=None, openacc=None, output_dir=None, compiler=None
 
     # ...
 
-    if len(files) > 1:
-        errors = Errors()
-        # severity is error to avoid needing to catch exception
-        errors.report('Pyccel can currently only handle 1 file at a time',
-                      severity='error')
-        errors.check()
-        sys.exit(1)
+    # ... folders are replaced by the python files of the package they contain
+    filenames = []
+    for filename in files:
+        if os.path.isdir(filename):
+            filenames.extend(get_package_files(filename))
+        else:
+            filenames.append(filename)
     # ...
 
-    filename = files[0]
-
     # ... report error
-    if os.path.isfile(filename):
-        # we don't use is_valid_filename_py since it uses absolute path
-        # file extension
-        ext = filename.split('.')[-1]
-        if not(ext in ['py', 'pyh']):
+    for filename in filenames:
+        if os.path.isfile(filename):
+            # we don't use is_valid_filename_py since it uses absolute path
+            # file extension
+            ext = filename.split('.')[-1]
+            if not(ext in ['py', 'pyh']):
+                errors = Errors()
+                # severity is error to avoid needing to catch exception
+                errors.report(INVALID_FILE_EXTENSION,
+                              symbol=ext,
+                              severity='error')
+                errors.check()
+                sys.exit(1)
+        else:
+            # we use Pyccel error manager, although we can do it in other ways
             errors = Errors()
             # severity is error to avoid needing to catch exception
-            errors.report(INVALID_FILE_EXTENSION,
-                          symbol=ext,
+            errors.report(INVALID_FILE_DIRECTORY,
+                          symbol=filename,
                           severity='error')
             errors.check()
             sys.exit(1)
-    else:
-        # we use Pyccel error manager, although we can do it in other ways
+
+    if not filenames:
         errors = Errors()
         # severity is error to avoid needing to catch exception
-        errors.report(INVALID_FILE_DIRECTORY,
-                      symbol=filename,
+        errors.report('No python file found',
+                      symbol=', '.join(files),
                       severity='error')
         errors.check()
         sys.exit(1)
@@ -240,26 +273,37 @@ def pyccel(files=None, openmp=None, openacc=None, output_dir=None, compiler=None
 
     try:
         # TODO: prune options
-        execute_pyccel(filename,
-                       syntax_only   = args.syntax_only,
-                       semantic_only = args.semantic_only,
-                       convert_only  = args.convert_only,
-                       verbose       = args.verbose,
-                       language      = args.language,
-                       compiler      = compiler,
-                       mpi_compiler  = args.mpi_compiler,
-                       fflags        = args.flags,
-                       includes      = args.includes,
-                       libdirs       = args.libdirs,
-                       modules       = (),
-                       libs          = args.libs,
-                       debug         = args.debug,
-                       accelerator   = accelerator,
-                       folder        = args.output)
+        execute_pyccel_files(filenames,
+                             syntax_only   = args.syntax_only,
+                             semantic_only = args.semantic_only,
+                             convert_only  = args.convert_only,
+                             verbose       = args.verbose,
+                             language      = args.language,
+                             compiler      = compiler,
+                             mpi_compiler  = args.mpi_compiler,
+                             fflags        = args.flags,
+                             includes      = args.includes,
+                             libdirs       = args.libdirs,
+                             modules       = (),
+                             libs          = args.libs,
+                             debug         = args.debug,
+                             accelerator   = accelerator,
+                             array_alignment = args.array_alignment,
+                             warn_array_copy = args.warn_array_copy,
+                             auto_parallel = args.auto_parallel,
+                             folder        = args.output,
+                             cache         = args.cache,
+                             incremental   = args.incremental,
+                             jobs          = args.jobs)
     except PyccelError:
         sys.exit(1)
     finally:
         os.chdir(base_dirpath)
+        if timings is not None:
+            timings.stop()
+            print(timings)
+            if args.timings:
+                timings.save(args.timings)
 
     return
 
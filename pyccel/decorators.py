@@ -19,8 +19,12 @@ __all__ = (
     'pure',
     'private',
     'elemental',
+    'nogil',
+    'vectorize',
+    'guvectorize',
     'stack_array',
-    'allow_negative_index'
+    'allow_negative_index',
+    'prange'
 )
 
 def lambdify(f):
@@ -63,6 +67,56 @@ def private(f):
 def elemental(f):
     return f
 
+def nogil(f):
+    """
+    Decorator indicates that the global interpreter lock is released while
+    the translated function runs, so that it can be called from several
+    python threads at the same time. Without the decorator the lock is also
+    released for the functions returning arrays, and for the functions
+    taking arrays when their arrays contain at least 500 elements in total
+    (nogil_threshold in pyccel.codegen.printing.cwrappercode)
+
+    Parameters
+    ----------
+    f : Function
+        The function to which the decorator is applied
+    """
+    return f
+
+def vectorize(f):
+    """
+    Decorator indicates that the scalar function is exposed to python as a
+    numpy universal function (ufunc), with one loop for each signature given
+    in the types decorator. The ufunc supports broadcasting, the out argument
+    and the ufunc methods (e.g. reduce). In python the decorator does nothing
+
+    Parameters
+    ----------
+    f : Function
+        The function to which the decorator is applied
+    """
+    return f
+
+def guvectorize(signature):
+    """
+    Decorator indicates that the function is exposed to python as a
+    generalized numpy universal function (gufunc) with the given signature,
+    e.g. '(n),()->(n)'. The function takes one argument for each input and
+    each output of the signature, the outputs are the last arguments and
+    are arrays into which the results are written (a scalar output '()' is
+    an array of size 1). The rank of each argument is the number of its
+    core dimensions. In python the decorator does nothing
+
+    Parameters
+    ----------
+    signature : str
+        The signature of the gufunc, with the core dimensions of the inputs
+        and of the outputs
+    """
+    def identity(f):
+        return f
+    return identity
+
 def stack_array(f, *args):
     """
     Decorator indicates that all arrays mentioned as args should be stored
@@ -96,3 +150,18 @@ def allow_negative_index(f,*args):
     def identity(f):
         return f
     return identity
+
+def prange(*args):
+    """
+    Range of a loop whose iterations are shared between the threads when
+    pyccel is used with openmp. The scalars assigned in the loop are private
+    to each iteration (their value after the loop is undefined) and the
+    scalars updated with +=, -= or *= are reductions. In python, and without
+    accelerator, it is the builtin range.
+
+    Parameters
+    ----------
+    args : int
+        The start, stop and step of the range, as for range
+    """
+    return range(*args)
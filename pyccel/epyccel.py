@@ -11,14 +11,16 @@ import sys
 import os
 import string
 import random
+import hashlib
 
 from types import ModuleType, FunctionType
 from importlib.machinery import ExtensionFileLoader
 
 from pyccel.codegen.pipeline import execute_pyccel
+from pyccel.codegen.timings  import Timings, timed
 from pyccel.errors.errors import PyccelError
 
-__all__ = ['random_string', 'get_source_function', 'epyccel_seq', 'epyccel']
+__all__ = ['random_string', 'hash_string', 'get_source_function', 'epyccel_seq', 'epyccel']
 
 #==============================================================================
 random_selector = random.SystemRandom()
@@ -27,6 +29,13 @@ def random_string( n ):
     chars    = string.ascii_lowercase + string.digits
     return ''.join( random_selector.choice( chars ) for _ in range(n) )
 
+def hash_string( code, n, **options ):
+    """ Returns a tag of length n which identifies the code and the options """
+    hasher = hashlib.sha256(code.encode('utf-8'))
+    for key in sorted(options):
+        hasher.update('{}={!r}'.format(key, options[key]).encode('utf-8'))
+    return hasher.hexdigest()[:n]
+
 #==============================================================================
 def get_source_function(func):
     if not callable(func):
@@ -54,26 +63,51 @@ def epyccel_seq(function_or_module, *,
                 mpi_compiler = None,
                 fflags       = None,
                 accelerator  = None,
+                array_alignment = None,
+                warn_array_copy = False,
+                auto_parallel = False,
                 verbose      = False,
                 debug        = False,
                 includes     = (),
                 libdirs      = (),
                 modules      = (),
                 libs         = (),
-                folder       = None):
+                folder       = None,
+                cache        = False,
+                jobs         = 1):
+
+    # Options which change the generated shared library
+    options = dict(language     = language,
+                   compiler     = compiler,
+                   mpi_compiler = mpi_compiler,
+                   fflags       = fflags,
+                   accelerator  = accelerator,
+                   array_alignment = array_alignment,
+                   warn_array_copy = warn_array_copy,
+                   auto_parallel = auto_parallel,
+                   debug        = debug,
+                   includes     = includes,
+                   libdirs      = libdirs,
+                   modules      = modules,
+                   libs         = libs)
 
     # ... get the module source code
     if isinstance(function_or_module, FunctionType):
         pyfunc = function_or_module
         code = get_source_function(pyfunc)
 
-        tag = random_string(8)
-        module_name = 'mod_{}'.format(tag)
-
-        while module_name in sys.modules.keys():
+        if cache:
+            # The name must be reproducible so the cached library can be imported
+            tag = hash_string(code, 8, **options)
+            module_name = 'mod_{}'.format(tag)
+        else:
             tag = random_string(8)
             module_name = 'mod_{}'.format(tag)
 
+            while module_name in sys.modules.keys():
+                tag = random_string(8)
+                module_name = 'mod_{}'.format(tag)
+
         pymod_filename = '{}.py'.format(module_name)
         pymod_filepath = os.path.abspath(pymod_filename)
 
@@ -84,10 +118,13 @@ def epyccel_seq(function_or_module, *,
         lines = inspect.getsourcelines(pymod)[0]
         code = ''.join(lines)
 
-        tag = random_string(8)
-        module_import_prefix = pymod.__name__ + '_'
-        while module_import_prefix + tag in sys.modules.keys():
-            tag = random_string(n=8)
+        if cache:
+            tag = hash_string(code, 8, **options)
+        else:
+            tag = random_string(8)
+            module_import_prefix = pymod.__name__ + '_'
+            while module_import_prefix + tag in sys.modules.keys():
+                tag = random_string(n=8)
 
         module_name = pymod.__name__.split('.')[-1] + '_' + tag
 
@@ -133,7 +170,12 @@ def epyccel_seq(function_or_module, *,
                        libs        = libs,
                        debug       = debug,
                        accelerator = accelerator,
-                       output_name = module_name)
+                       array_alignment = array_alignment,
+                       warn_array_copy = warn_array_copy,
+                       auto_parallel = auto_parallel,
+                       output_name = module_name,
+                       cache       = cache,
+                       jobs        = jobs)
     finally:
         # Change working directory back to starting point
         os.chdir(base_dirpath)
@@ -146,7 +188,8 @@ def epyccel_seq(function_or_module, *,
     # https://docs.python.org/3/library/importlib.html#importlib.invalidate_caches
     importlib.invalidate_caches()
 
-    package = importlib.import_module(module_name)
+    with timed('load', module_name):
+        package = importlib.import_module(module_name)
     sys.path.remove(epyccel_dirpath)
 
     if language != 'python':
@@ -184,6 +227,22 @@ def epyccel( python_function_or_module, **kwargs ):
         Parallel multi-threading acceleration strategy
         (currently supported: 'openmp', 'openacc').
 
+    array_alignment : int, optional
+        Alignment in bytes requested for the local allocatable arrays in
+        Fortran, only supported by ifort (arrays created in C are always
+        aligned on 64 bytes).
+
+    warn_array_copy : bool, optional
+        Emit a RuntimeWarning when a numpy array argument must be copied
+        (default: False). Strided arrays are passed without copy, only the
+        data which is not aligned or whose strides are not a multiple of
+        the item size is copied.
+
+    auto_parallel : bool, optional
+        Parallelise the loops whose iterations are independent with OpenMP
+        and print which loops were parallelised (default: False). This
+        implies accelerator='openmp'.
+
     Options for parallel mode
     -------------------------
     comm : mpi4py.MPI.Comm, optional
@@ -203,6 +262,20 @@ def epyccel( python_function_or_module, **kwargs ):
     mpi_compiler : str, optional
         Compiler for MPI parallel code.
 
+    cache : bool or BuildCache, optional
+        If True, the shared library is stored in the pyccel build cache
+        (see pyccel.codegen.cache), and reused by later calls on the same code
+        with the same options instead of being rebuilt (default: False).
+
+    jobs : int, optional
+        Maximum number of files compiled at the same time. If None or 0,
+        the number of available cpus is used (default: 1).
+
+    timings : bool or Timings, optional
+        If True, the time and the peak memory spent in each stage of pyccel
+        are printed. If a Timings object is provided, they are stored in it
+        instead, and can be saved as JSON with Timings.save (default: False).
+
     Returns
     -------
     res : object
@@ -218,6 +291,17 @@ def epyccel( python_function_or_module, **kwargs ):
     """
     assert isinstance( python_function_or_module, (FunctionType, ModuleType) )
 
+    # Record the time spent in each stage if requested
+    timings = kwargs.pop('timings', False)
+    if timings:
+        recorder = timings if isinstance(timings, Timings) else Timings()
+        with recorder.record():
+            res = epyccel( python_function_or_module, **kwargs )
+        comm = kwargs.get('comm', None)
+        if timings is True and (comm is None or comm.rank == kwargs.get('root', 0)):
+            print(recorder)
+        return res
+
     comm  = kwargs.pop('comm', None)
     root  = kwargs.pop('root', 0)
     bcast = kwargs.pop('bcast', True)
@@ -25,7 +25,9 @@ INCOMPATIBLE_REDEFINITION = 'Incompatible redefinition'
 INCOMPATIBLE_REDEFINITION_STACK_ARRAY = 'Cannot change shape of stack array, because it does not support memory reallocation. Avoid redefinition, or use standard heap array.'
 STACK_ARRAY_DEFINITION_IN_LOOP = 'Cannot create stack array in loop, because if does not support memory reallocation. Create array before loop, or use standard heap array.'
 
-UNSUPPORTED_ARRAY_RETURN_VALUE = 'Array return arguments are currently not supported'
+UNSUPPORTED_ARRAY_RETURN_VALUE = 'Returning a pointer to an array is currently not supported'
+UNSUPPORTED_STACK_ARRAY_RETURN_VALUE = 'Returning an array allocated on the stack is not supported'
+ARRAY_RETURN_IN_EXPRESSION = 'An array returned by a function must be assigned to a variable before it is used in an expression'
 
 INCOMPATIBLE_TYPES_IN_STR_INTERPOLATION = 'Incompatible types in string interpolation'
 MUST_HAVE_NONE_RETURN_TYPE = 'The return type of "{}" must be None'
@@ -109,6 +111,17 @@ FORTRAN_ALLOCATABLE_IN_EXPRESSION = 'An allocatable function cannot be used in a
 FORTRAN_RANDINT_ALLOCATABLE_IN_EXPRESSION = "Numpy's randint function does not have a fortran equivalent. It can be expressed as '(high-low)*rand(size)+low' using numpy's rand, however allocatable function cannot be used in an expression"
 FORTRAN_ELEMENTAL_SINGLE_ARGUMENT = 'Elemental functions are defined as scalar operators, with a single dummy argument'
 
+# Universal functions
+UFUNC_SCALAR_ARGUMENTS = 'The arguments and the results of a vectorized function must be scalars, without default values'
+GUFUNC_INVALID_SIGNATURE = "The signature of a generalized ufunc must look like '(n),()->(n)'"
+GUFUNC_RESULTS = 'A generalized ufunc returns its results through its last arguments'
+GUFUNC_ARGUMENT_RANK = 'The rank of the argument does not match the number of its core dimensions in the signature'
+
+# Parallel loops
+PRANGE_ARRAY_ALLOCATION = 'Arrays cannot be allocated in a prange loop. Consider creating the array before the loop'
+PRANGE_PRIVATE_POINTER = 'A variable passed by address cannot be private to the iterations of a prange loop'
+PRANGE_INVALID_REDUCTION = 'A variable updated with +=, -= or *= in a prange loop cannot be assigned or updated with another operator in the loop, unless it is assigned before it is used in each iteration'
+
 # other Pyccel messages
 PYCCEL_INVALID_HEADER = 'Annotated comments must start with omp, acc or header'
 PYCCEL_MISSING_HEADER = 'Cannot find associated header'
@@ -145,3 +158,4 @@ ARRAY_REALLOCATION = 'Array redefinition may cause memory reallocation at runtim
 ARRAY_DEFINITION_IN_LOOP = 'Array definition in for loop may cause memory reallocation at each cycle. Consider creating the array before the loop'
 TEMPLATE_IN_UNIONTYPE = 'Cannot use templates in a union type'
 DUPLICATED_SIGNATURE = 'Same signature defined for the same function multiple times'
+ARRAY_ALIGNMENT_IGNORED = 'The array alignment is only supported by ifort, it is ignored with {}'
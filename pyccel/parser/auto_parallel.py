@@ -0,0 +1,583 @@
+# coding: utf-8
+#------------------------------------------------------------------------------------------#
+# This file is part of Pyccel which is released under MIT License. See the LICENSE file or #
+# go to https://github.com/pyccel/pyccel/blob/master/LICENSE for full license details.     #
+#------------------------------------------------------------------------------------------#
+
+"""
+Automatic parallelisation of the loops of the annotated AST (--auto-parallel).
+
+A loop over a range whose iterations are independent is replaced by a loop
+over a ParallelRange, which is printed with the OpenMP worksharing directives
+(as a prange loop). The iterations of a loop are independent if:
+
+- each array element which is written by an iteration is not accessed by the
+  other iterations. The indices must be affine functions of the loop index
+  and of variables which are not modified in the loop. The accesses are
+  compared dimension by dimension with the ZIV, strong SIV and GCD tests;
+- the array arguments which may be views on the same data are disjoint. A
+  loop writing an array argument and accessing another one (or a pointer)
+  only runs in parallel if their memory does not overlap, which is checked
+  at run time in C (in Fortran a modified dummy argument cannot be aliased);
+- each scalar which is assigned in the loop is assigned before it is read in
+  every iteration and its value is not used after the loop (it is private),
+  or it is a reduction: a scalar which is only updated with +=, -= or *=, or
+  which is the maximum (minimum) computed by `if x > m: m = x` (`x < m`).
+
+The loops which contain a return, a break, a print, a pointer, an OpenMP
+directive or a call to a function modifying its arguments are not
+parallelised, nor the loops whose private scalars are stored in pointers in
+C (the optional arguments and the results of a function returning several
+results).
+"""
+
+from collections import OrderedDict, namedtuple
+from math        import gcd
+
+from sympy                  import preorder_traversal
+from sympy                  import Tuple
+from sympy.core.basic       import Basic as sp_Basic
+
+from pyccel.ast.builtins  import PythonRange, ParallelRange, PythonLen, PythonPrint, PythonTuple
+from pyccel.ast.core      import For, While, If, CodeBlock, Assign, AugAssign, AliasAssign
+from pyccel.ast.core      import AnnotatedComment, Return, Break, Continue, Pass
+from pyccel.ast.core      import Comment, CommentBlock, EmptyNode, FunctionCall
+from pyccel.ast.core      import Variable, DottedVariable, IndexedElement, Slice
+from pyccel.ast.core      import AddOp, SubOp, MulOp
+from pyccel.ast.datatypes import NativeInteger, NativeReal
+from pyccel.ast.internals import PyccelArraySize
+from pyccel.ast.literals  import LiteralInteger, LiteralTrue
+from pyccel.ast.operators import PyccelAdd, PyccelMinus, PyccelMul, PyccelUnarySub
+from pyccel.ast.operators import PyccelAssociativeParenthesis
+from pyccel.ast.operators import PyccelGt, PyccelGe, PyccelLt, PyccelLe
+
+__all__ = ('LoopReport', 'parallelise_loops')
+
+#==============================================================================
+class LoopReport(namedtuple('LoopReport', ['line', 'index', 'loop', 'reason'])):
+    """
+    Result of the analysis of a loop over a range
+
+    Parameters
+    ----------
+    line : int
+        The line of the loop in the python file (None if unknown)
+
+    index : str
+        The name of the index of the loop
+
+    loop : For
+        The parallel loop, None if the loop is not parallelised
+
+    reason : str
+        The reason why the loop is not parallelised
+    """
+    __slots__ = ()
+
+    def __str__(self):
+        location = 'line {}: '.format(self.line) if self.line else ''
+        if self.loop is None:
+            return '{}the loop over {} is not parallelised: {}'.format(location, self.index, self.reason)
+
+        parallel_range = self.loop.iterable
+        clauses = []
+        if parallel_range.private:
+            clauses.append('private({})'.format(', '.join(str(v.name) for v in parallel_range.private)))
+        for op, var in parallel_range.reductions:
+            clauses.append('reduction({}: {})'.format(op, var.name))
+        if parallel_range.disjoint:
+            clauses.append('if {} do not overlap'.format(', '.join('{} and {}'.format(a.name, b.name)
+                                                                   for a, b in parallel_range.disjoint)))
+        return '{}the loop over {} is parallelised {}'.format(location, self.index, ' '.join(clauses)).rstrip()
+
+#==============================================================================
+def _is_range_loop(stmt):
+    """ True if stmt is a sequential loop over a range """
+    return type(stmt) is For and type(stmt.iterable) is PythonRange # pylint: disable=unidiomatic-typecheck
+
+def _targets(stmt):
+    """ Returns the variables which are assigned by an Assign or a For """
+    lhs = stmt.target if isinstance(stmt, For) else stmt.lhs
+    return list(lhs) if isinstance(lhs, (list, tuple, Tuple, PythonTuple)) else [lhs]
+
+def _names(expr):
+    """ Returns the names of the variables which appear in an expression or a statement """
+    return set(str(v.name) for v in preorder_traversal(expr) if isinstance(v, Variable))
+
+def _accesses(expr):
+    """
+    Returns the variables, the array elements and the function calls which
+    are read by an expression (the shape of an array is not an access to its
+    data)
+    """
+    if isinstance(expr, (PyccelArraySize, PythonLen)):
+        return
+    if isinstance(expr, IndexedElement):
+        yield expr
+        for i in expr.indices:
+            yield from _accesses(i)
+    elif isinstance(expr, Variable):
+        yield expr
+    elif isinstance(expr, (list, tuple, Tuple)):
+        for a in expr:
+            yield from _accesses(a)
+    elif isinstance(expr, sp_Basic):
+        if isinstance(expr, FunctionCall):
+            yield expr
+        for a in expr.args:
+            yield from _accesses(a)
+
+def _extremum(stmt):
+    """
+    Returns the operator and the variable of a maximum or a minimum computed
+    by an If statement (`if x > m: m = x`), or None
+    """
+    branches = stmt.args
+    if not branches or any(b.body for _, b in branches[1:]):
+        return None
+    cond, body = branches[0]
+    if len(body.body) != 1 or type(body.body[0]) is not Assign: # pylint: disable=unidiomatic-typecheck
+        return None
+    assign = body.body[0]
+    var    = assign.lhs
+    if not isinstance(var, Variable) or isinstance(var, DottedVariable) or var.rank > 0:
+        return None
+    if not isinstance(cond, (PyccelGt, PyccelGe, PyccelLt, PyccelLe)):
+        return None
+    greater = isinstance(cond, (PyccelGt, PyccelGe))
+    left, right = cond.args
+    if left == assign.rhs and right == var:
+        op = 'max' if greater else 'min'
+    elif right == assign.rhs and left == var:
+        op = 'min' if greater else 'max'
+    else:
+        return None
+    if str(var.name) in _names(assign.rhs):
+        return None
+    return op, var
+
+#==============================================================================
+def _affine(expr, variant):
+    """
+    Returns the affine form of an index as a dictionary mapping the names of
+    the variables to their coefficients (the constant is stored with the key
+    None), or None if the index is not an affine function of the loop index
+    and of the variables which are not modified in the loop
+    """
+    if isinstance(expr, LiteralInteger):
+        return {None: expr.python_value}
+    elif isinstance(expr, Variable):
+        name = str(expr.name)
+        if isinstance(expr, DottedVariable) or expr.rank > 0 or \
+                not isinstance(expr.dtype, NativeInteger) or name in variant:
+            return None
+        return {name: 1}
+    elif isinstance(expr, PyccelAssociativeParenthesis):
+        return _affine(expr.args[0], variant)
+    elif isinstance(expr, PyccelUnarySub):
+        form = _affine(expr.args[0], variant)
+        return None if form is None else {k: -v for k, v in form.items()}
+    elif isinstance(expr, (PyccelAdd, PyccelMinus)):
+        left, right = [_affine(a, variant) for a in expr.args]
+        if left is None or right is None:
+            return None
+        sign = 1 if isinstance(expr, PyccelAdd) else -1
+        form = dict(left)
+        for k, v in right.items():
+            form[k] = form.get(k, 0) + sign * v
+        return form
+    elif isinstance(expr, PyccelMul):
+        left, right = [_affine(a, variant) for a in expr.args]
+        if left is None or right is None:
+            return None
+        if set(left) <= {None}:
+            left, right = right, left
+        if not set(right) <= {None}:
+            return None
+        factor = right.get(None, 0)
+        return {k: factor * v for k, v in left.items()}
+    return None
+
+def _independent_dimension(write, access, index, step):
+    """
+    True if the indices write and access (affine forms) of a dimension of an
+    array never designate the same element in two different iterations
+    """
+    if write is None or access is None:
+        return False
+    c_w = write.get(index, 0)
+    c_a = access.get(index, 0)
+    rest_w = {k: v for k, v in write.items()  if k not in (index, None) and v}
+    rest_a = {k: v for k, v in access.items() if k not in (index, None) and v}
+    if rest_w != rest_a:
+        return False
+    # The same element is accessed if c_w*i1 - c_a*i2 == diff
+    diff = access.get(None, 0) - write.get(None, 0)
+    if c_w == c_a:
+        if c_w == 0:
+            # ZIV test
+            return diff != 0
+        if diff == 0:
+            # Only accessed by the same iteration
+            return True
+        # Strong SIV test: the distance i1 - i2 is a multiple of the step
+        return step is not None and diff % (c_w * step) != 0
+    # GCD test
+    return diff % gcd(c_w, c_a) != 0
+
+#==============================================================================
+class _LoopAnalysis:
+    """
+    Dependence analysis of the iterations of a loop over a range. The reason
+    attribute is None if the iterations are independent
+    """
+    def __init__(self, loop):
+        step = loop.iterable.step
+
+        self._index      = str(loop.target.name)
+        self._step       = step.python_value if isinstance(step, LiteralInteger) else None
+        self._arrays     = OrderedDict() # name -> [(indices, is_write)]
+        self._array_vars = OrderedDict() # name -> the accessed array
+        self._scalars    = OrderedDict() # the assigned scalars
+        self._reads      = set()         # the scalars read outside of the reductions
+        self._reductions = OrderedDict() # name -> [(op, variable)]
+        self.reason      = None
+
+        self._collect(loop.body.body)
+
+        # A scalar which is read or assigned elsewhere in the loop, or which
+        # is updated with different operators is not a reduction
+        for name, ops in list(self._reductions.items()):
+            if name in self._scalars or name in self._reads or len(set(op for op, _ in ops)) > 1:
+                self._reject('the value of {} is used by the next iterations'.format(name))
+                break
+            if ops[0][0] in ('+', '*') and not isinstance(ops[0][1].dtype, (NativeInteger, NativeReal)):
+                self._reject('{} is not a reduction of integers or reals'.format(name))
+
+        self._check_definitions(loop.body.body, {self._index})
+        self._check_arrays()
+
+    @property
+    def private(self):
+        """ The scalars which are private to each iteration (except the index) """
+        return [v for name, v in self._scalars.items() if name != self._index]
+
+    @property
+    def reductions(self):
+        """ The reductions of the loop, as (operator, variable) pairs """
+        return [ops[0] for ops in self._reductions.values()]
+
+    def aliases(self, arguments):
+        """
+        The pairs of arrays which may be views on the same data: an array
+        argument written in the loop and another array argument or pointer
+        accessed in the loop. The arguments are the names of the array
+        arguments of the function
+        """
+        written = [name for name, accesses in self._arrays.items()
+                   if name in arguments and any(is_write for _, is_write in accesses)]
+        others  = [name for name, var in self._array_vars.items()
+                   if name in arguments or var.is_pointer]
+        pairs = OrderedDict()
+        for w in written:
+            for o in others:
+                if o != w:
+                    pairs.setdefault(frozenset((w, o)), (self._array_vars[w], self._array_vars[o]))
+        return list(pairs.values())
+
+    def _reject(self, reason):
+        """ Keep the first reason why the loop cannot be parallelised """
+        if self.reason is None:
+            self.reason = reason
+
+    #--------------------------------------------------------------------------
+    def _read(self, expr):
+        """ Collect the accesses of an expression """
+        for a in _accesses(expr):
+            if isinstance(a, IndexedElement):
+                self._arrays.setdefault(str(a.base.name), []).append((a.indices, False))
+                self._array_vars[str(a.base.name)] = a.base
+            elif isinstance(a, FunctionCall):
+                if any(a.funcdef.arguments_inout):
+                    self._reject('the function {} modifies its arguments'.format(a.funcdef.name))
+            elif a.rank > 0:
+                # The whole array is read (or passed to a function)
+                self._arrays.setdefault(str(a.name), []).append((None, False))
+                self._array_vars[str(a.name)] = a
+            else:
+                self._reads.add(str(a.name))
+
+    def _write(self, var):
+        """ Collect an assigned variable or array element """
+        if isinstance(var, IndexedElement):
+            if var.base.is_pointer or var.base.is_target:
+                self._reject('the array {} may be accessed through a pointer'.format(var.base.name))
+            self._arrays.setdefault(str(var.base.name), []).append((var.indices, True))
+            self._array_vars[str(var.base.name)] = var.base
+            self._read(var.indices)
+        elif isinstance(var, DottedVariable) or not isinstance(var, Variable):
+            self._reject('the attribute {} is assigned'.format(var))
+        elif var.rank > 0:
+            self._reject('the array {} is assigned'.format(var.name))
+        else:
+            self._scalars[str(var.name)] = var
+
+    def _collect(self, stmts):
+        """ Collect the accesses of the statements of the loop """
+        for stmt in stmts:
+            if isinstance(stmt, (Comment, CommentBlock, EmptyNode, Pass, Continue)):
+                continue
+            elif isinstance(stmt, CodeBlock):
+                self._collect(stmt.body)
+            elif isinstance(stmt, Return):
+                self._reject('the loop contains a return statement')
+            elif isinstance(stmt, Break):
+                self._reject('the loop contains a break statement')
+            elif isinstance(stmt, PythonPrint):
+                self._reject('the loop prints')
+            elif isinstance(stmt, AnnotatedComment):
+                self._reject('the loop contains an OpenMP directive')
+            elif isinstance(stmt, AliasAssign):
+                self._reject('the pointer {} is assigned'.format(stmt.lhs.name))
+            elif isinstance(stmt, For):
+                if isinstance(stmt.iterable, ParallelRange):
+                    self._reject('the loop contains a parallel loop')
+                for var in _targets(stmt):
+                    self._write(var)
+                self._read(stmt.iterable)
+                self._collect(stmt.body.body)
+            elif isinstance(stmt, While):
+                self._read(stmt.test)
+                self._collect(stmt.body.body)
+            elif isinstance(stmt, If):
+                extremum = _extremum(stmt)
+                if extremum:
+                    op, var = extremum
+                    self._reductions.setdefault(str(var.name), []).append((op, var))
+                    # The condition compares the variable with the assigned value
+                    self._read(stmt.args[0][1].body[0].rhs)
+                    continue
+                for cond, body in stmt.args:
+                    self._read(cond)
+                    self._collect(body.body)
+            elif isinstance(stmt, Assign):
+                lhs = _targets(stmt)
+                var = lhs[0]
+                if isinstance(stmt, AugAssign) and isinstance(stmt.op, (AddOp, SubOp, MulOp)) and \
+                        isinstance(var, Variable) and not isinstance(var, DottedVariable) and var.rank == 0:
+                    # A difference is the reduction of a sum
+                    op = '*' if isinstance(stmt.op, MulOp) else '+'
+                    self._reductions.setdefault(str(var.name), []).append((op, var))
+                    self._read(stmt.rhs)
+                    continue
+                if isinstance(stmt, AugAssign):
+                    self._read(lhs)
+                self._read(stmt.rhs)
+                for var in lhs:
+                    self._write(var)
+            else:
+                self._read(stmt)
+
+    #--------------------------------------------------------------------------
+    def _check_reads(self, expr, defined):
+        """ Check that the assigned scalars read by expr are defined in the iteration """
+        for a in _accesses(expr):
+            if isinstance(a, Variable) and a.rank == 0:
+                name = str(a.name)
+                if name in self._scalars and name not in defined:
+                    self._reject('the value of {} is used by the next iterations'.format(name))
+
+    def _check_definitions(self, stmts, defined):
+        """
+        Check that each assigned scalar is assigned before it is read in each
+        iteration. defined contains the scalars which are certainly assigned
+        before the statements
+        """
+        for stmt in stmts:
+            if isinstance(stmt, CodeBlock):
+                self._check_definitions(stmt.body, defined)
+            elif isinstance(stmt, For):
+                self._check_reads(stmt.iterable, defined)
+                inner = set(defined)
+                inner.update(str(v.name) for v in _targets(stmt))
+                self._check_definitions(stmt.body.body, inner)
+            elif isinstance(stmt, While):
+                self._check_reads(stmt.test, defined)
+                self._check_definitions(stmt.body.body, set(defined))
+            elif isinstance(stmt, If):
+                branches = []
+                for cond, body in stmt.args:
+                    self._check_reads(cond, defined)
+                    branches.append(set(defined))
+                    self._check_definitions(body.body, branches[-1])
+                # The scalars assigned in all the branches are defined
+                if isinstance(stmt.args[-1][0], LiteralTrue):
+                    defined.update(set.intersection(*branches))
+            elif isinstance(stmt, Assign):
+                lhs = _targets(stmt)
+                self._check_reads(stmt.rhs, defined)
+                for var in lhs:
+                    if isinstance(var, IndexedElement):
+                        self._check_reads(var.indices, defined)
+                    elif isinstance(stmt, AugAssign):
+                        self._check_reads(var, defined)
+                defined.update(str(v.name) for v in lhs if isinstance(v, Variable))
+            elif not isinstance(stmt, (Comment, CommentBlock, EmptyNode)):
+                self._check_reads(stmt, defined)
+
+    #--------------------------------------------------------------------------
+    def _check_arrays(self):
+        """
+        Check that the elements written by an iteration are not accessed by
+        the other iterations
+        """
+        variant = set(self._scalars) | set(self._reductions)
+        variant.discard(self._index)
+
+        def affine(indices):
+            if indices is None:
+                return None
+            return [None if isinstance(i, Slice) else _affine(i, variant) for i in indices]
+
+        for name, accesses in self._arrays.items():
+            forms = [(affine(indices), is_write) for indices, is_write in accesses]
+            for write, _ in (f for f in forms if f[1]):
+                for access, _ in forms:
+                    if write is None or access is None or len(write) != len(access) or \
+                            not any(_independent_dimension(w, a, self._index, self._step)
+                                    for w, a in zip(write, access)):
+                        self._reject('the iterations may access the same element of {}'.format(name))
+                        return
+
+#==============================================================================
+def _first_use(stmts, name, loop = None):
+    """
+    Returns 'write' if the first statement of stmts which uses the variable
+    assigns it without reading it, 'read' if it may read it and None if the
+    variable is not used. The loop is considered as an assignment of its
+    private variables
+    """
+    for stmt in stmts:
+        if stmt is loop:
+            return 'write'
+        if type(stmt) is Assign and name in (str(v.name) for v in _targets(stmt) # pylint: disable=unidiomatic-typecheck
+                                             if isinstance(v, Variable)):
+            return 'read' if name in _names(stmt.rhs) else 'write'
+        if isinstance(stmt, (For, While, If)) and \
+                not (loop is not None and any(s is loop for s in preorder_traversal(stmt))):
+            # The body of a block may not be executed so the statements
+            # after the block are also examined
+            if isinstance(stmt, If):
+                parts = [([cond], body) for cond, body in stmt.args]
+            else:
+                parts = [([stmt.iterable if isinstance(stmt, For) else stmt.test], stmt.body)]
+            for exprs, body in parts:
+                if name in _names(exprs):
+                    return 'read'
+                # The index of a loop is assigned before the body
+                if isinstance(stmt, For) and name in (str(v.name) for v in _targets(stmt)):
+                    continue
+                if _first_use(body.body, name) == 'read':
+                    return 'read'
+            continue
+        if name in _names(stmt):
+            return 'read'
+    return None
+
+def _is_used_after(name, loop, frames):
+    """
+    True if the value of the variable at the end of the loop may be read.
+    frames contains the statements around the loop as (statements, position,
+    is_loop_body) tuples, from the outermost to the innermost block
+    """
+    for stmts, pos, is_loop_body in reversed(frames):
+        use = _first_use(stmts[pos+1:], name)
+        if use is not None:
+            return use == 'read'
+        # The next iteration of the enclosing loop
+        if is_loop_body and _first_use(stmts[:pos+1], name, loop) == 'read':
+            return True
+    return False
+
+def _parallelise_block(block, frames, reports, pointers, arguments, is_loop_body = False):
+    """ Returns the block in which the independent loops are parallelised """
+    stmts = list(block.body)
+    body  = [_parallelise_statement(s, frames + [(stmts, i, is_loop_body)], reports, pointers, arguments)
+             for i, s in enumerate(stmts)]
+    new_block = CodeBlock(body)
+    new_block.set_fst(block.fst)
+    return new_block
+
+def _parallelise_statement(stmt, frames, reports, pointers, arguments):
+    """ Returns the statement in which the independent loops are parallelised """
+    if _is_range_loop(stmt):
+        analysis = _LoopAnalysis(stmt)
+        reason   = analysis.reason
+        if reason is None:
+            index = stmt.target
+            for var in [index] + analysis.private:
+                if var.is_pointer or var.is_optional or str(var.name) in pointers:
+                    reason = '{} is stored in a pointer in C'.format(var.name)
+                    break
+                if _is_used_after(str(var.name), stmt, frames):
+                    reason = 'the value of {} is used after the loop'.format(var.name)
+                    break
+
+        line = getattr(stmt.fst, 'lineno', None)
+        if reason is None:
+            iterable = ParallelRange(*stmt.iterable.args, private = analysis.private,
+                                     reductions = analysis.reductions,
+                                     disjoint = analysis.aliases(arguments))
+            new_stmt = For(stmt.target, iterable, stmt.body, local_vars = stmt.local_vars)
+            reports.append(LoopReport(line, str(stmt.target.name), new_stmt, None))
+        else:
+            reports.append(LoopReport(line, str(stmt.target.name), None, reason))
+            body     = _parallelise_block(stmt.body, frames, reports, pointers, arguments, True)
+            new_stmt = For(stmt.target, stmt.iterable, body, local_vars = stmt.local_vars)
+    elif type(stmt) is For: # pylint: disable=unidiomatic-typecheck
+        body     = _parallelise_block(stmt.body, frames, reports, pointers, arguments, True)
+        new_stmt = For(stmt.target, stmt.iterable, body, local_vars = stmt.local_vars)
+    elif type(stmt) is While: # pylint: disable=unidiomatic-typecheck
+        body     = _parallelise_block(stmt.body, frames, reports, pointers, arguments, True)
+        new_stmt = While(stmt.test, body, stmt.local_vars)
+    elif type(stmt) is If: # pylint: disable=unidiomatic-typecheck
+        new_stmt = If(*[(cond, _parallelise_block(body, frames, reports, pointers, arguments)) for cond, body in stmt.args])
+    else:
+        return stmt
+
+    new_stmt.set_fst(stmt.fst)
+    return new_stmt
+
+def parallelise_loops(body, pointers = (), arguments = ()):
+    """
+    Returns the body of a function in which the loops over a range whose
+    iterations are independent are parallelised, and the list of the
+    LoopReport of the loops over a range
+
+    Parameters
+    ----------
+    body : CodeBlock
+        The annotated body of a function
+
+    pointers : iterable of Variable
+        The scalars of the function which are stored in pointers in the
+        generated code (e.g. the results of a C function returning several
+        results). They cannot be private to the threads
+
+    arguments : iterable of Variable
+        The arguments of the function. The array arguments may be views on
+        the same data, so a loop writing one of them and accessing another
+        one only runs in parallel if they do not overlap
+    """
+    pointers  = {str(v.name) for v in pointers}
+    arguments = {str(v.name) for v in arguments if isinstance(v, Variable) and v.rank > 0}
+    reports = []
+    if any(isinstance(s, (AnnotatedComment, ParallelRange)) for s in preorder_traversal(body)):
+        # The parallelism is managed by the user
+        for loop in preorder_traversal(body):
+            if _is_range_loop(loop):
+                reports.append(LoopReport(getattr(loop.fst, 'lineno', None), str(loop.target.name),
+                                          None, 'the function contains OpenMP directives or parallel loops'))
+        return body, reports
+
+    return _parallelise_block(body, [], reports, pointers, arguments), reports
@@ -0,0 +1,272 @@
+# -*- coding: utf-8 -*-
+#------------------------------------------------------------------------------------------#
+# This file is part of Pyccel which is released under MIT License. See the LICENSE file or #
+# go to https://github.com/pyccel/pyccel/blob/master/LICENSE for full license details.     #
+#------------------------------------------------------------------------------------------#
+
+"""
+Module containing the ModuleInterface object, which describes everything that a
+python module exposes to the modules which import it: its variables, the
+signatures of its functions, its classes and its metavars.
+
+The interface of a module is saved at the end of its semantic analysis in the
+file __pyccel__/<name>.pyccel next to the module. When the module is imported,
+this interface is loaded instead of parsing and annotating the module again.
+The file is only used if it was created by the same pyccel sources from the
+same source code and from the same imported modules. The interfaces are only
+saved and loaded when the build cache or the incremental build is used.
+"""
+
+import hashlib
+import os
+import pickle
+from collections import OrderedDict
+from functools   import lru_cache
+
+from pyccel.version         import __version__
+from pyccel.ast.core        import FunctionDef, Interface, ClassDef
+from pyccel.ast.datatypes   import CustomDataType, DataTypeFactory
+from pyccel.codegen.cache   import get_imported_files
+from pyccel.codegen.timings import timed
+from pyccel.parser.base     import Scope
+
+__all__ = ['ModuleInterface', 'get_interface_filename']
+
+#==============================================================================
+def get_interface_filename(filename):
+    """
+    Returns the file where the interface of the python module is stored:
+    __pyccel__/<name>.pyccel in the folder of the module
+    """
+    folder, basename = os.path.split(os.path.abspath(filename))
+    name = os.path.splitext(basename)[0]
+    return os.path.join(folder, '__pyccel__', '{}.pyccel'.format(name))
+
+@lru_cache(maxsize=None)
+def _pyccel_sources_hash():
+    """
+    Returns the hash of the source files of pyccel, so that the interfaces
+    saved by a different pyccel (whose AST classes may differ) are not used
+    """
+    package = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    hasher  = hashlib.sha256(__version__.encode('utf-8'))
+    for root, dirs, files in os.walk(package):
+        dirs[:] = sorted(d for d in dirs if d != '__pycache__')
+        for f in sorted(files):
+            if f.endswith(('.py', '.tx')):
+                path = os.path.join(root, f)
+                hasher.update(os.path.relpath(path, package).encode('utf-8'))
+                with open(path, 'rb') as source:
+                    hasher.update(source.read())
+    return hasher.digest()
+
+def _interface_key(filename):
+    """
+    Returns the hash of all the inputs of the semantic analysis of a module:
+    the pyccel sources, the source code of the module and the source code
+    of all the user modules it imports (directly or indirectly)
+    """
+    hasher = hashlib.sha256(_pyccel_sources_hash())
+    for f in [filename, *get_imported_files(filename)]:
+        hasher.update(f.encode('utf-8'))
+        with open(f, 'rb') as source:
+            hasher.update(hashlib.sha256(source.read()).digest())
+    return hasher.hexdigest()
+
+#==============================================================================
+def _signature(expr):
+    """
+    Returns a copy of a function, an interface or a class, where the
+    functions only contain what is needed to call them (their arguments,
+    results and properties) but not their body.
+    """
+    if isinstance(expr, Interface):
+        return Interface(expr.name, [_signature(f) for f in expr.functions],
+                         is_argument = expr.is_argument)
+
+    elif isinstance(expr, ClassDef):
+        return ClassDef(expr.name,
+                        attributes = expr.attributes,
+                        methods    = [_signature(f) for f in expr.methods],
+                        options    = expr.options,
+                        parent     = expr.parent,
+                        interfaces = [_signature(i) for i in expr.interfaces])
+
+    elif type(expr) is FunctionDef:
+        args, kwargs = expr.__getnewargs__()
+        name, arguments, results = args[:3]
+        return FunctionDef(name, arguments, results, [],
+                           cls_name        = kwargs['cls_name'],
+                           is_static       = kwargs['is_static'],
+                           is_recursive    = kwargs['is_recursive'],
+                           is_pure         = kwargs['is_pure'],
+                           is_elemental    = kwargs['is_elemental'],
+                           is_private      = kwargs['is_private'],
+                           is_header       = kwargs['is_header'],
+                           arguments_inout = kwargs['arguments_inout'],
+                           doc_string      = kwargs['doc_string'])
+
+    return expr
+
+#==============================================================================
+class _InterfacePickler(pickle.Pickler):
+    """
+    Pickler which saves the classes created by DataTypeFactory (the datatypes
+    of the user classes) with the arguments needed to create them again,
+    as they cannot be found by their name.
+    """
+    def persistent_id(self, obj):
+        if isinstance(obj, type) and issubclass(obj, CustomDataType) and 'prefix' in obj.__dict__:
+            prefix = obj.prefix[len('Pyccel'):] or None
+            return ('datatype', obj._name, prefix, obj.alias, obj.is_iterable,
+                    obj.is_with_construct, obj.is_polymorphic)
+        return None
+
+class _InterfaceUnpickler(pickle.Unpickler):
+    """
+    Unpickler which creates the datatypes saved by _InterfacePickler.
+    Each datatype is only created once.
+    """
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._datatypes = {}
+
+    def persistent_load(self, pid):
+        if pid[0] != 'datatype':
+            raise pickle.UnpicklingError('Unknown persistent id {}'.format(pid[0]))
+        if pid not in self._datatypes:
+            _, name, prefix, alias, is_iterable, is_with_construct, is_polymorphic = pid
+            self._datatypes[pid] = DataTypeFactory(name, '_name',
+                                                   prefix            = prefix,
+                                                   alias             = alias,
+                                                   is_iterable       = is_iterable,
+                                                   is_with_construct = is_with_construct,
+                                                   is_polymorphic    = is_polymorphic)
+        return self._datatypes[pid]
+
+#==============================================================================
+class ModuleInterface(object):
+    """
+    Description of what a python module exposes to the modules which import it.
+    A ModuleInterface can be used instead of the semantic parser of an
+    imported module.
+
+    Parameters
+    ----------
+    filename : str
+        The python file containing the module
+
+    namespace : Scope
+        The scope containing the variables, functions, classes, class
+        constructs, macros and imports of the module
+
+    metavars : dict
+        The metavars of the module
+    """
+    def __init__(self, filename, namespace, metavars):
+        self._filename  = filename
+        self._namespace = namespace
+        self._metavars  = metavars
+
+    @property
+    def filename(self):
+        """ Python file containing the module """
+        return self._filename
+
+    @property
+    def namespace(self):
+        """ Scope containing the objects exposed by the module """
+        return self._namespace
+
+    @property
+    def metavars(self):
+        """ Metavars of the module """
+        return self._metavars
+
+    @classmethod
+    def from_parser(cls, semantic_parser, imports):
+        """
+        Create the interface of a module from its semantic parser.
+
+        Parameters
+        ----------
+        semantic_parser : SemanticParser
+            The parser which annotated the module
+
+        imports : OrderedDict
+            The modules imported by the module, as found by the syntactic
+            stage (the name of each module and the list of imported objects)
+        """
+        namespace = semantic_parser.namespace
+        scope = Scope()
+        scope.variables.update(namespace.variables)
+        scope.classes.update((k, _signature(v)) for k, v in namespace.classes.items())
+        scope.functions.update((k, _signature(v)) for k, v in namespace.functions.items())
+        scope.cls_constructs.update(namespace.cls_constructs)
+        scope.macros.update(namespace.macros)
+        scope.imports['imports'] = OrderedDict(imports)
+
+        return cls(semantic_parser.filename, scope, dict(semantic_parser.metavars))
+
+    def save(self):
+        """
+        Save the interface in the __pyccel__ folder of the module.
+        Nothing is saved if this folder does not exist or if the interface
+        cannot be pickled.
+
+        Returns
+        -------
+        interface_file : str
+            The file where the interface was saved, or None
+        """
+        interface_file = get_interface_filename(self._filename)
+        if not os.path.isdir(os.path.dirname(interface_file)):
+            return None
+
+        tmp_file = '{}.{}.tmp'.format(interface_file, os.getpid())
+        try:
+            key = _interface_key(self._filename)
+            with open(tmp_file, 'wb') as f:
+                pickler = _InterfacePickler(f, pickle.HIGHEST_PROTOCOL)
+                pickler.dump(key)
+                pickler.dump(self)
+            os.replace(tmp_file, interface_file)
+        except Exception: # pylint: disable=broad-except
+            # Some objects cannot be pickled, the module will be parsed when it is imported
+            if os.path.exists(tmp_file):
+                os.remove(tmp_file)
+            return None
+
+        return interface_file
+
+    @classmethod
+    def load(cls, filename):
+        """
+        Load the interface of the module saved in the file `filename`.
+
+        Returns
+        -------
+        interface : ModuleInterface
+            The interface of the module, or None if no valid interface
+            exists for the current version of the module
+        """
+        interface_file = get_interface_filename(filename)
+        if not os.path.isfile(interface_file):
+            return None
+
+        try:
+            with timed('interface', filename):
+                key = _interface_key(filename)
+                with open(interface_file, 'rb') as f:
+                    unpickler = _InterfaceUnpickler(f)
+                    if unpickler.load() != key:
+                        return None
+                    interface = unpickler.load()
+        except Exception: # pylint: disable=broad-except
+            # A corrupted or incompatible file is ignored, the module is parsed instead
+            return None
+
+        if not isinstance(interface, cls):
+            return None
+
+        return cls(os.path.abspath(filename), interface.namespace, interface.metavars)
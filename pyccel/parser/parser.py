@@ -12,19 +12,26 @@ import os
 import copy
 from collections import OrderedDict
 
+from pyccel.errors.errors    import Errors
 from pyccel.parser.base      import get_filename_from_import
 from pyccel.parser.syntactic import SyntaxParser
 from pyccel.parser.semantic  import SemanticParser
+from pyccel.parser.interface import ModuleInterface
+from pyccel.codegen.timings  import timed
 
 # TODO [AR, 18.11.2018] to be modified as a function
 # TODO [YG, 28.01.2020] maybe pass filename to the parse method?
 class Parser(object):
 
-    def __init__(self, filename, **kwargs):
+    def __init__(self, filename, use_interfaces = False, **kwargs):
 
         self._filename = filename
         self._kwargs   = kwargs
 
+        # save the interfaces of the modules and use them when the modules
+        # are imported (only with the build cache or the incremental build)
+        self._use_interfaces = use_interfaces
+
         # we use it to store the imports
         self._parents = []
 
@@ -37,6 +44,10 @@ class Parser(object):
         self._semantic_parser = None
         self._module_parser   = None
 
+        # the modules imported by a python module (and not a program),
+        # saved in its interface after the semantic stage
+        self._module_imports  = None
+
         self._input_folder = os.path.dirname(filename)
 
     @property
@@ -111,6 +122,12 @@ class Parser(object):
     def fst(self):
         return self._syntax_parser.fst
 
+    @property
+    def from_interface(self):
+        """ True if the module was loaded from its interface file
+        instead of being parsed """
+        return isinstance(self._semantic_parser, ModuleInterface)
+
     @property
     def module_parser(self):
         """Returns the module parser if the parsed object is a program with a module.
@@ -141,9 +158,11 @@ class Parser(object):
         if self._syntax_parser:
             return self._syntax_parser.ast
 
-        parser             = SyntaxParser(self._filename, **self._kwargs)
+        with timed('syntax', self._filename):
+            parser         = SyntaxParser(self._filename, **self._kwargs)
         self.syntax_parser = parser
         parse_result       = parser.ast
+        imports            = self.imports
 
         if d_parsers is None:
             d_parsers = self._d_parsers
@@ -155,7 +174,7 @@ class Parser(object):
             new_prog_filename = os.path.join(os.path.dirname(self._filename),parse_result.prog_name+'.py')
             self._filename    = new_prog_filename
 
-            q                                = Parser(new_mod_filename)
+            q                                = Parser(new_mod_filename, use_interfaces=self._use_interfaces)
             q.syntax_parser                  = copy.copy(parser)
             q.syntax_parser.namespace        = copy.deepcopy(parser.namespace)
             q.d_parsers                      = q.parse_sons(self.d_parsers)
@@ -171,9 +190,50 @@ class Parser(object):
         else:
             parser.ast         = parse_result.get_focus()
             self.module_parser = None
+            if not parse_result.is_program() and self._filename.endswith('.py'):
+                self._module_imports = imports
 
         return parser.ast
 
+    def load_interface(self, d_parsers=None, verbose=False):
+        """
+          Use the interface of the module saved by a previous semantic
+          analysis instead of parsing the module. The imported modules
+          are still parsed (or loaded from their interface).
+
+          Parameters
+          ----------
+          d_parsers : dict
+            A dictionary of parsed sons.
+
+          verbose: bool
+            Determine the verbosity.
+
+          Returns
+          -------
+          loaded : bool
+           True if a valid interface was found (always False if the
+           parser does not use the interfaces).
+          """
+        if not self._use_interfaces or self._syntax_parser or self._semantic_parser:
+            return False
+
+        interface = ModuleInterface.load(self._filename)
+        if interface is None:
+            return False
+
+        if verbose:
+            print ('>>> using the interface of :: {}'.format(self._filename))
+
+        self._semantic_parser = interface
+
+        if d_parsers is None:
+            d_parsers = self._d_parsers
+
+        self._d_parsers = self.parse_sons(d_parsers, verbose=verbose)
+
+        return True
+
     def annotate(self, **settings):
 
         # If the semantic parser already exists, do nothing
@@ -185,12 +245,18 @@ class Parser(object):
         self._annotate_sons(verbose=verbose)
 
         # Create a new semantic parser and store it in object
-        parser = SemanticParser(self._syntax_parser,
-                                d_parsers=self.d_parsers,
-                                parents=self.parents,
-                                **settings)
+        with timed('semantic', self._filename):
+            parser = SemanticParser(self._syntax_parser,
+                                    d_parsers=self.d_parsers,
+                                    parents=self.parents,
+                                    **settings)
         self._semantic_parser = parser
 
+        # Save the interface of a module so that it is not annotated again
+        # the next time it is imported
+        if self._use_interfaces and self._module_imports is not None and not Errors().has_errors():
+            ModuleInterface.from_parser(parser, self._module_imports).save()
+
         # Return the new semantic parser (maybe used by codegen)
         return parser
 
@@ -239,8 +305,9 @@ class Parser(object):
             # get the absolute path corresponding to source
 
             filename = get_filename_from_import(source, self._input_folder)
-            q = Parser(filename)
-            q.parse(d_parsers=d_parsers)
+            q = Parser(filename, use_interfaces=self._use_interfaces)
+            if not q.load_interface(d_parsers=d_parsers, verbose=verbose):
+                q.parse(d_parsers=d_parsers)
             if q.module_parser:
                 d_parsers[source] = q.module_parser
             else:
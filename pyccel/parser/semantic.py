@@ -18,6 +18,7 @@ from sympy import Indexed, IndexedBase
 from sympy import ceiling
 from sympy import oo  as INF
 from sympy import Tuple
+from sympy import preorder_traversal
 from sympy import Lambda
 from sympy.core import cache
 
@@ -32,6 +33,7 @@ from pyccel.ast.core import TupleVariable
 from pyccel.ast.core import DottedName, DottedVariable
 from pyccel.ast.core import Assign, AliasAssign, SymbolicAssign
 from pyccel.ast.core import AugAssign, CodeBlock
+from pyccel.ast.core import AddOp, SubOp, MulOp
 from pyccel.ast.core import Return
 from pyccel.ast.core import ConstructorCall
 from pyccel.ast.core import ValuedFunctionAddress
@@ -81,7 +83,7 @@ from pyccel.ast.builtins import PythonPrint
 from pyccel.ast.builtins import PythonInt, PythonBool, PythonFloat, PythonComplex
 from pyccel.ast.builtins import python_builtin_datatype
 from pyccel.ast.builtins import (PythonRange, PythonZip, PythonEnumerate,
-                                 PythonMap, PythonTuple)
+                                 PythonMap, PythonTuple, ParallelRange)
 
 from pyccel.ast.numpyext import NumpyZeros
 from pyccel.ast.numpyext import NumpyInt, NumpyInt32, NumpyInt64
@@ -103,6 +105,7 @@ from pyccel.errors.messages import *
 from pyccel.parser.base      import BasicParser, Scope
 from pyccel.parser.base      import get_filename_from_import
 from pyccel.parser.syntactic import SyntaxParser
+from pyccel.parser.auto_parallel import parallelise_loops, _first_use
 
 import pyccel.decorators as def_decorators
 #==============================================================================
@@ -140,6 +143,9 @@ class SemanticParser(BasicParser):
         self._parents = kwargs.pop('parents', [])
         self._d_parsers = kwargs.pop('d_parsers', OrderedDict())
 
+        # parallelise the loops whose iterations are independent
+        self._auto_parallel = kwargs.pop('auto_parallel', False)
+
         # ...
         if not isinstance(inputs, SyntaxParser):
             raise TypeError('> Expecting a syntactic parser as input')
@@ -1160,6 +1166,13 @@ class SemanticParser(BasicParser):
         #if stmts:
         #    stmts = [self._visit(i, **settings) for i in stmts]
         args     = [self._visit(a, **settings) for a in expr.args]
+        for a in args:
+            # The shape of an array allocated by a function is only known
+            # once it is stored in a variable
+            if isinstance(a, FunctionCall) and a.rank > 0 and a.funcdef.allocated_results:
+                errors.report(ARRAY_RETURN_IN_EXPRESSION, symbol=a.funcdef.name,
+                    bounding_box=(self._current_fst_node.lineno, self._current_fst_node.col_offset),
+                    severity='fatal', blocker=True)
         try:
             expr_new = expr.func(*args)
         except PyccelSemanticError as err:
@@ -1412,6 +1425,12 @@ class SemanticParser(BasicParser):
             # ISSUES #177: lhs must be a pointer when rhs is allocatable array
             self._ensure_target(rhs, d_lhs)
 
+            # The shape of an array returned by a function is expressed in
+            # terms of the function's variables, it must be read from the lhs
+            if isinstance(rhs, FunctionCall) and rhs.funcdef.allocated_results:
+                d_lhs['shape'] = tuple(s if isinstance(s, LiteralInteger) else None
+                                        for s in d_lhs['shape'])
+
             var = self.get_variable_from_scope(name)
 
             # Variable not yet declared (hence array not yet allocated)
@@ -1436,7 +1455,8 @@ class SemanticParser(BasicParser):
 
                 # ...
                 # Add memory allocation if needed
-                if lhs.allocatable:
+                # (an array returned by a function is allocated by the function)
+                if lhs.allocatable and not (isinstance(rhs, FunctionCall) and rhs.funcdef.allocated_results):
                     if self._namespace.is_loop:
                         # Array defined in a loop may need reallocation at every cycle
                         errors.report(ARRAY_DEFINITION_IN_LOOP, symbol=name,
@@ -1469,7 +1489,7 @@ class SemanticParser(BasicParser):
                 # Not yet supported for arrays: x=y+z, x=b[:]
                 # Because we cannot infer shape of right-hand side yet
                 know_lhs_shape = all(sh is not None for sh in lhs.alloc_shape) \
-                    or (lhs.rank == 0)
+                    or (lhs.rank == 0) or (isinstance(rhs, FunctionCall) and rhs.funcdef.allocated_results)
 
                 if not know_lhs_shape:
                     msg = "Cannot infer shape of right-hand side for expression {} = {}".format(lhs, rhs)
@@ -2066,7 +2086,59 @@ class SemanticParser(BasicParser):
         if isinstance(iterable, Variable):
             return ForIterator(target, iterable, body)
 
-        return For(target, iterable, body, local_vars=local_vars)
+        if isinstance(iterable, ParallelRange):
+            iterable = self._get_parallel_range(iterable, target, body)
+
+        for_loop = For(target, iterable, body, local_vars=local_vars)
+        for_loop.set_fst(expr.fst)
+        return for_loop
+
+    def _get_parallel_range(self, iterable, target, body):
+        """
+        Returns the range of a prange loop with the variables which are
+        private to each iteration (the scalars assigned in the loop and the
+        indices of the inner loops) and the reductions (the scalars which
+        are only updated with +=, -= or *=)
+        """
+        assigned   = OrderedDict()
+        reductions = OrderedDict()
+        for stmt in preorder_traversal(CodeBlock(body)):
+            if isinstance(stmt, For):
+                indices = stmt.target if isinstance(stmt.target, (list, tuple, Tuple)) else [stmt.target]
+                assigned.update((str(i.name), i) for i in indices)
+            elif isinstance(stmt, AliasAssign):
+                assigned[str(stmt.lhs.name)] = stmt.lhs
+            elif isinstance(stmt, Assign):
+                lhs = stmt.lhs if isinstance(stmt.lhs, (list, tuple, Tuple, PythonTuple)) else [stmt.lhs]
+                for var in lhs:
+                    if not isinstance(var, Variable) or isinstance(var, DottedVariable):
+                        continue
+                    if var.rank > 0:
+                        errors.report(PRANGE_ARRAY_ALLOCATION, symbol=var.name,
+                            bounding_box=(self._current_fst_node.lineno, self._current_fst_node.col_offset),
+                            severity='error', blocker=self.blocking)
+                    elif isinstance(stmt, AugAssign) and isinstance(stmt.op, (AddOp, SubOp, MulOp)):
+                        # A difference is the reduction of a sum
+                        op = '*' if isinstance(stmt.op, MulOp) else '+'
+                        reductions.setdefault(str(var.name), []).append((op, var))
+                    else:
+                        assigned[str(var.name)] = var
+
+        # A variable which is also assigned or updated with different
+        # operators is not a reduction. It is private if it is assigned
+        # before it is used in each iteration
+        for name, ops in list(reductions.items()):
+            if name in assigned or len(set(op for op, _ in ops)) > 1:
+                if _first_use(body, name) != 'write':
+                    errors.report(PRANGE_INVALID_REDUCTION, symbol=name,
+                        bounding_box=(self._current_fst_node.lineno, self._current_fst_node.col_offset),
+                        severity='error', blocker=self.blocking)
+                assigned.setdefault(name, ops[0][1])
+                reductions.pop(name)
+
+        private = [v for name, v in assigned.items() if name != str(target.name)]
+        return ParallelRange(*iterable.args, private = private,
+                reductions = [ops[0] for ops in reductions.values()])
 
 
     def _visit_GeneratorComprehension(self, expr, **settings):
@@ -2350,7 +2422,8 @@ class SemanticParser(BasicParser):
         results = [self._visit_Symbol(i, **settings) for i in return_vars]
 
         #add the Deallocate node before the Return node
-        code = assigns + [Deallocate(i) for i in self._allocs[-1]]
+        #(the arrays which are returned are owned by the caller)
+        code = assigns + [Deallocate(i) for i in self._allocs[-1] if i not in results]
         if code:
             expr  = Return(results, CodeBlock(code))
         else:
@@ -2555,6 +2628,17 @@ class SemanticParser(BasicParser):
             args    = [self.get_variable(a.name) if isinstance(a, Variable) else self.get_function(str(a.name)) for a in args]
             results = list(OrderedDict((a.name,self.get_variable(a.name)) for a in results).values())
 
+            # Share the independent loops between the threads (--auto-parallel)
+            if self._auto_parallel and not (is_pure or is_elemental):
+                # In C the optional arguments and the results of a function
+                # returning several results are stored in pointers
+                pointers = [a for a in args if isinstance(a, Variable) and a.is_optional]
+                if len(results) > 1:
+                    pointers += results
+                body, reports = parallelise_loops(body, pointers, args)
+                for report in reports:
+                    print('> auto-parallel: {}, function {}, {}'.format(self.filename, name, report))
+
             if arg and cls_name:
                 dt       = self.get_class_construct(cls_name)()
                 cls_base = self.get_class(cls_name)
@@ -2632,16 +2716,16 @@ class SemanticParser(BasicParser):
                             severity='fatal', blocker=self.blocking)
             # ...
 
-            # Raise an error if one of the return arguments is either:
-            #   a) a pointer
-            #   b) array which is not among arguments, hence intent(out)
+            # Raise an error if one of the return arguments is a pointer
+            # or an array allocated on the stack (arrays allocated in the
+            # function are returned to the caller which becomes their owner)
             for r in results:
                 if r.is_pointer:
                     errors.report(UNSUPPORTED_ARRAY_RETURN_VALUE,
                     symbol=r,bounding_box=(self._current_fst_node.lineno, self._current_fst_node.col_offset),
                     severity='fatal')
-                elif (r not in args) and r.rank > 0:
-                    errors.report(UNSUPPORTED_ARRAY_RETURN_VALUE,
+                elif r.is_stack_array:
+                    errors.report(UNSUPPORTED_STACK_ARRAY_RETURN_VALUE,
                     symbol=r,bounding_box=(self._current_fst_node.lineno, self._current_fst_node.col_offset),
                     severity='fatal')
 
@@ -686,6 +686,10 @@ class SyntaxParser(BasicParser):
         if 'allow_negative_index' in decorators:
             decorators['allow_negative_index'] = tuple(str(b) for a in decorators['allow_negative_index'] for b in a.args)
 
+        if 'guvectorize' in decorators:
+            decorators['guvectorize'] = tuple(str(b).strip("'").strip('"') for a in decorators['guvectorize']
+                if isinstance(a, FunctionCall) for b in a.args)
+
         # extract the templates
         if 'template' in decorators:
             for comb_types in decorators['template']:
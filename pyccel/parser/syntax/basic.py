@@ -4,7 +4,32 @@
 # go to https://github.com/pyccel/pyccel/blob/master/LICENSE for full license details.     #
 #------------------------------------------------------------------------------------------#
 
-__all__ = ["BasicStmt"]
+__all__ = ["BasicStmt", "get_metamodel"]
+
+# The textX metamodels which have already been built, for each grammar file
+_metamodels = {}
+
+def get_metamodel(grammar, classes, **kwargs):
+    """
+    Returns the textX metamodel described by a grammar file.
+
+    Building a metamodel is expensive, so it is only done the first time the
+    grammar is used (i.e. when the first pragma or header of this kind is
+    found), and textX itself is only imported at this point.
+
+    Parameters
+    ==========
+    grammar : str
+        the .tx file containing the grammar
+    classes : list
+        the classes used to create the objects of the model
+    kwargs : dict
+        additional arguments passed to metamodel_from_file
+    """
+    if grammar not in _metamodels:
+        from textx.metamodel import metamodel_from_file
+        _metamodels[grammar] = metamodel_from_file(grammar, classes=classes, **kwargs)
+    return _metamodels[grammar]
 
 class BasicStmt(object):
     """
@@ -11,9 +11,7 @@ from sympy.core import Symbol
 from sympy import sympify
 from sympy import Tuple
 
-from textx.metamodel import metamodel_from_file
-
-from pyccel.parser.syntax.basic import BasicStmt
+from pyccel.parser.syntax.basic import BasicStmt, get_metamodel
 from pyccel.ast.headers   import FunctionHeader, ClassHeader, MethodHeader, VariableHeader, Template
 from pyccel.ast.headers   import MetaVariable , UnionType, InterfaceHeader
 from pyccel.ast.headers   import construct_macro, MacroFunction, MacroVariable
@@ -524,11 +522,9 @@ hdr_classes = [Header, TypeHeader,
 
 this_folder = dirname(__file__)
 
-# Get meta-model from language description
+# Language description, the meta-model is only built when it is first used
 grammar = join(this_folder, '../grammar/headers.tx')
 
-meta = metamodel_from_file(grammar, classes=hdr_classes)
-
 def parse(filename=None, stmts=None):
     """ Parse header pragmas
 
@@ -545,6 +541,8 @@ def parse(filename=None, stmts=None):
       stmts  : list
 
     """
+    meta = get_metamodel(grammar, hdr_classes)
+
     # Instantiate model
     if filename:
         model = meta.model_from_file(filename)
@@ -8,9 +8,7 @@
 
 from os.path import join, dirname
 
-from textx.metamodel import metamodel_from_file
-
-from pyccel.parser.syntax.basic import BasicStmt
+from pyccel.parser.syntax.basic import BasicStmt, get_metamodel
 from pyccel.ast.core import AnnotatedComment
 
 DEBUG = False
@@ -1310,11 +1308,9 @@ acc_classes = [Openacc, OpenaccStmt] + acc_directives + acc_clauses
 
 this_folder = dirname(__file__)
 
-# Get meta-model from language description
+# Language description, the meta-model is only built when it is first used
 grammar = join(this_folder, '../grammar/openacc.tx')
 
-meta = metamodel_from_file(grammar, classes=acc_classes)
-
 def parse(filename=None, stmts=None):
     """ Parse openacc pragmas
 
@@ -1331,6 +1327,8 @@ def parse(filename=None, stmts=None):
       stmts  : list
 
     """
+    meta = get_metamodel(grammar, acc_classes)
+
     # Instantiate model
     if filename:
         model = meta.model_from_file(filename)
@@ -8,10 +8,12 @@
 
 from os.path import join, dirname
 
-from textx.metamodel import metamodel_from_file
-
-from pyccel.parser.syntax.basic import BasicStmt
+from pyccel.parser.syntax.basic import BasicStmt, get_metamodel
 from pyccel.ast.core import OMP_For_Loop, OMP_Parallel_Construct, OMP_Single_Construct, Omp_End_Clause
+from pyccel.ast.core import OMP_Parallel_For_Loop, OMP_Simd_Construct, OMP_Critical_Construct
+from pyccel.ast.core import OMP_Atomic_Construct, OMP_Barrier_Construct, OMP_Sections_Construct
+from pyccel.ast.core import OMP_Section_Construct, OMP_Task_Construct, OMP_TaskLoop_Construct
+from pyccel.ast.core import OMP_TaskWait_Construct
 
 DEBUG = False
 
@@ -39,13 +41,7 @@ class OpenmpStmt(BasicStmt):
             print("> OpenmpStmt: expr")
 
         stmt = self.stmt
-        if isinstance(stmt, OmpEndClause):
-            return stmt.expr
-        elif isinstance(stmt, OmpParallelConstruct):
-            return stmt.expr
-        elif isinstance(stmt, OmpLoopConstruct):
-            return stmt.expr
-        elif isinstance(stmt, OmpSingleConstruct):
+        if isinstance(stmt, tuple(omp_directives)):
             return stmt.expr
         else:
             raise TypeError('Wrong stmt for OpenmpStmt')
@@ -87,6 +83,7 @@ class OmpLoopConstruct(BasicStmt):
     def __init__(self, **kwargs):
         """
         """
+        self.simd    = kwargs.pop('simd', '')
         self.clauses = kwargs.pop('clauses')
 
         super(OmpLoopConstruct, self).__init__(**kwargs)
@@ -103,9 +100,12 @@ class OmpLoopConstruct(BasicStmt):
                          OmpSchedule, \
                          OmpCollapse, \
                          OmpLinear, \
-                         OmpOrdered)
+                         OmpOrdered, \
+                         OmpSafeLen, \
+                         OmpSimdLen, \
+                         OmpAligned)
 
-        txt = ''
+        txt = ' simd' if self.simd else ''
         for clause in self.clauses:
             if isinstance(clause, _valid_clauses):
                 txt = '{0} {1}'.format(txt, clause.expr)
@@ -140,6 +140,245 @@ class OmpSingleConstruct(BasicStmt):
 
         return OMP_Single_Construct(txt)
 
+class OmpParallelLoopConstruct(BasicStmt):
+    """Class representing a combined parallel loop construct."""
+    def __init__(self, **kwargs):
+        """
+        """
+        self.simd    = kwargs.pop('simd', '')
+        self.clauses = kwargs.pop('clauses')
+
+        super(OmpParallelLoopConstruct, self).__init__(**kwargs)
+
+    @property
+    def expr(self):
+        if DEBUG:
+            print("> OmpParallelLoopConstruct: expr")
+
+        _valid_clauses = (OmpNumThread, \
+                         OmpDefault, \
+                         OmpPrivate, \
+                         OmpShared, \
+                         OmpFirstPrivate, \
+                         OmpLastPrivate, \
+                         OmpCopyin, \
+                         OmpReduction, \
+                         OmpProcBind, \
+                         OmpSchedule, \
+                         OmpCollapse, \
+                         OmpLinear, \
+                         OmpOrdered, \
+                         OmpSafeLen, \
+                         OmpSimdLen, \
+                         OmpAligned)
+
+        txt = ' simd' if self.simd else ''
+        for clause in self.clauses:
+            if isinstance(clause, _valid_clauses):
+                txt = '{0} {1}'.format(txt, clause.expr)
+            else:
+                raise TypeError('Wrong clause for OmpParallelLoopConstruct')
+
+        return OMP_Parallel_For_Loop(txt)
+
+class OmpSimdConstruct(BasicStmt):
+    """Class representing a simd construct."""
+    def __init__(self, **kwargs):
+        """
+        """
+        self.clauses = kwargs.pop('clauses')
+
+        super(OmpSimdConstruct, self).__init__(**kwargs)
+
+    @property
+    def expr(self):
+        if DEBUG:
+            print("> OmpSimdConstruct: expr")
+
+        _valid_clauses = (OmpPrivate, \
+                         OmpLastPrivate, \
+                         OmpLinear, \
+                         OmpReduction, \
+                         OmpCollapse, \
+                         OmpSafeLen, \
+                         OmpSimdLen, \
+                         OmpAligned)
+
+        txt = 'simd'
+        for clause in self.clauses:
+            if isinstance(clause, _valid_clauses):
+                txt = '{0} {1}'.format(txt, clause.expr)
+            else:
+                raise TypeError('Wrong clause for OmpSimdConstruct')
+
+        return OMP_Simd_Construct(txt)
+
+class OmpCriticalConstruct(BasicStmt):
+    """Class representing a critical construct."""
+    def __init__(self, **kwargs):
+        """
+        """
+        self.name = kwargs.pop('name', '')
+
+        super(OmpCriticalConstruct, self).__init__(**kwargs)
+
+    @property
+    def expr(self):
+        if DEBUG:
+            print("> OmpCriticalConstruct: expr")
+
+        txt = 'critical'
+        if self.name:
+            txt = '{0} ({1})'.format(txt, self.name)
+
+        return OMP_Critical_Construct(txt)
+
+class OmpAtomicConstruct(BasicStmt):
+    """Class representing an atomic construct."""
+    def __init__(self, **kwargs):
+        """
+        """
+        self.clause = kwargs.pop('clause', '')
+
+        super(OmpAtomicConstruct, self).__init__(**kwargs)
+
+    @property
+    def expr(self):
+        if DEBUG:
+            print("> OmpAtomicConstruct: expr")
+
+        txt = 'atomic'
+        if self.clause:
+            txt = '{0} {1}'.format(txt, self.clause)
+
+        return OMP_Atomic_Construct(txt)
+
+class OmpBarrierConstruct(BasicStmt):
+    """Class representing a barrier directive."""
+
+    @property
+    def expr(self):
+        if DEBUG:
+            print("> OmpBarrierConstruct: expr")
+
+        return OMP_Barrier_Construct('barrier')
+
+class OmpSectionsConstruct(BasicStmt):
+    """Class representing a sections construct."""
+    def __init__(self, **kwargs):
+        """
+        """
+        self.clauses = kwargs.pop('clauses')
+
+        super(OmpSectionsConstruct, self).__init__(**kwargs)
+
+    @property
+    def expr(self):
+        if DEBUG:
+            print("> OmpSectionsConstruct: expr")
+
+        _valid_clauses = (OmpPrivate, \
+                         OmpFirstPrivate, \
+                         OmpLastPrivate, \
+                         OmpReduction)
+
+        txt = 'sections'
+        for clause in self.clauses:
+            if isinstance(clause, _valid_clauses):
+                txt = '{0} {1}'.format(txt, clause.expr)
+            else:
+                raise TypeError('Wrong clause for OmpSectionsConstruct')
+
+        return OMP_Sections_Construct(txt)
+
+class OmpSectionConstruct(BasicStmt):
+    """Class representing a section of a sections construct."""
+
+    @property
+    def expr(self):
+        if DEBUG:
+            print("> OmpSectionConstruct: expr")
+
+        return OMP_Section_Construct('section')
+
+class OmpTaskConstruct(BasicStmt):
+    """Class representing a task construct."""
+    def __init__(self, **kwargs):
+        """
+        """
+        self.clauses = kwargs.pop('clauses')
+
+        super(OmpTaskConstruct, self).__init__(**kwargs)
+
+    @property
+    def expr(self):
+        if DEBUG:
+            print("> OmpTaskConstruct: expr")
+
+        _valid_clauses = (OmpDefault, \
+                         OmpPrivate, \
+                         OmpShared, \
+                         OmpFirstPrivate, \
+                         OmpPriority, \
+                         OmpUntied)
+
+        txt = 'task'
+        for clause in self.clauses:
+            if isinstance(clause, _valid_clauses):
+                txt = '{0} {1}'.format(txt, clause.expr)
+            else:
+                raise TypeError('Wrong clause for OmpTaskConstruct')
+
+        return OMP_Task_Construct(txt)
+
+class OmpTaskLoopConstruct(BasicStmt):
+    """Class representing a taskloop construct."""
+    def __init__(self, **kwargs):
+        """
+        """
+        self.simd    = kwargs.pop('simd', '')
+        self.clauses = kwargs.pop('clauses')
+
+        super(OmpTaskLoopConstruct, self).__init__(**kwargs)
+
+    @property
+    def expr(self):
+        if DEBUG:
+            print("> OmpTaskLoopConstruct: expr")
+
+        _valid_clauses = (OmpDefault, \
+                         OmpPrivate, \
+                         OmpShared, \
+                         OmpFirstPrivate, \
+                         OmpLastPrivate, \
+                         OmpCollapse, \
+                         OmpGrainSize, \
+                         OmpNumTasks, \
+                         OmpPriority, \
+                         OmpUntied, \
+                         OmpSafeLen, \
+                         OmpSimdLen, \
+                         OmpAligned)
+
+        txt = 'taskloop simd' if self.simd else 'taskloop'
+        for clause in self.clauses:
+            if isinstance(clause, _valid_clauses):
+                txt = '{0} {1}'.format(txt, clause.expr)
+            else:
+                raise TypeError('Wrong clause for OmpTaskLoopConstruct')
+
+        return OMP_TaskLoop_Construct(txt)
+
+class OmpTaskWaitConstruct(BasicStmt):
+    """Class representing a taskwait directive."""
+
+    @property
+    def expr(self):
+        if DEBUG:
+            print("> OmpTaskWaitConstruct: expr")
+
+        return OMP_TaskWait_Construct('taskwait')
+
 class OmpEndClause(BasicStmt):
     """Class representing a ."""
     def __init__(self, **kwargs):
@@ -147,6 +386,7 @@ class OmpEndClause(BasicStmt):
         """
         self.construct = kwargs.pop('construct')
         self.simd      = kwargs.pop('simd', '')
+        self.name      = kwargs.pop('name', '')
         self.nowait    = kwargs.pop('nowait', '')
 
         super(OmpEndClause, self).__init__(**kwargs)
@@ -156,7 +396,9 @@ class OmpEndClause(BasicStmt):
         if DEBUG:
             print("> OmpEndClause: expr")
 
-        txt = 'end {0} {1} {2}'.format(self.construct, self.simd, self.nowait)
+        construct = ' '.join(self.construct.split())
+        name      = '({})'.format(self.name) if self.name else ''
+        txt = ' '.join(s for s in ('end', construct, self.simd, name, self.nowait) if s)
         return Omp_End_Clause(txt)
 
 class OmpNumThread(BasicStmt):
@@ -390,14 +632,142 @@ class OmpSchedule(BasicStmt):
             return 'schedule({0}, {1})'.format(self.kind, self.chunk_size)
         else:
             return 'schedule({0})'.format(self.kind)
+
+class OmpSafeLen(BasicStmt):
+    """Class representing a ."""
+    def __init__(self, **kwargs):
+        """
+        """
+        self.n = kwargs.pop('n')
+
+        super(OmpSafeLen, self).__init__(**kwargs)
+
+    @property
+    def expr(self):
+        if DEBUG:
+            print("> OmpSafeLen: expr")
+
+        return 'safelen({})'.format(self.n)
+
+class OmpSimdLen(BasicStmt):
+    """Class representing a ."""
+    def __init__(self, **kwargs):
+        """
+        """
+        self.n = kwargs.pop('n')
+
+        super(OmpSimdLen, self).__init__(**kwargs)
+
+    @property
+    def expr(self):
+        if DEBUG:
+            print("> OmpSimdLen: expr")
+
+        return 'simdlen({})'.format(self.n)
+
+class OmpAligned(BasicStmt):
+    """Class representing a ."""
+    def __init__(self, **kwargs):
+        """
+        """
+        self.args      = kwargs.pop('args')
+        self.alignment = kwargs.pop('alignment', None)
+
+        super(OmpAligned, self).__init__(**kwargs)
+
+    @property
+    def expr(self):
+        if DEBUG:
+            print("> OmpAligned: expr")
+
+        # TODO check if variable exist in namespace
+        args = ', '.join(str(arg) for arg in self.args)
+        if self.alignment:
+            return 'aligned({0}: {1})'.format(args, self.alignment)
+        else:
+            return 'aligned({})'.format(args)
+
+class OmpPriority(BasicStmt):
+    """Class representing a ."""
+    def __init__(self, **kwargs):
+        """
+        """
+        self.n = kwargs.pop('n')
+
+        super(OmpPriority, self).__init__(**kwargs)
+
+    @property
+    def expr(self):
+        if DEBUG:
+            print("> OmpPriority: expr")
+
+        return 'priority({})'.format(self.n)
+
+class OmpGrainSize(BasicStmt):
+    """Class representing a ."""
+    def __init__(self, **kwargs):
+        """
+        """
+        self.n = kwargs.pop('n')
+
+        super(OmpGrainSize, self).__init__(**kwargs)
+
+    @property
+    def expr(self):
+        if DEBUG:
+            print("> OmpGrainSize: expr")
+
+        return 'grainsize({})'.format(self.n)
+
+class OmpNumTasks(BasicStmt):
+    """Class representing a ."""
+    def __init__(self, **kwargs):
+        """
+        """
+        self.n = kwargs.pop('n')
+
+        super(OmpNumTasks, self).__init__(**kwargs)
+
+    @property
+    def expr(self):
+        if DEBUG:
+            print("> OmpNumTasks: expr")
+
+        return 'num_tasks({})'.format(self.n)
+
+class OmpUntied(BasicStmt):
+    """Class representing a ."""
+    def __init__(self, **kwargs):
+        """
+        """
+        self.untied = kwargs.pop('untied')
+
+        super(OmpUntied, self).__init__(**kwargs)
+
+    @property
+    def expr(self):
+        if DEBUG:
+            print("> OmpUntied: expr")
+
+        return 'untied'
 #################################################
 
 #################################################
 # whenever a new rule is added in the grammar, we must update the following
 # lists.
-omp_directives = [OmpParallelConstruct,
+omp_directives = [OmpParallelLoopConstruct,
+                  OmpParallelConstruct,
                   OmpLoopConstruct,
+                  OmpSimdConstruct,
                   OmpSingleConstruct,
+                  OmpCriticalConstruct,
+                  OmpAtomicConstruct,
+                  OmpBarrierConstruct,
+                  OmpSectionsConstruct,
+                  OmpSectionConstruct,
+                  OmpTaskLoopConstruct,
+                  OmpTaskWaitConstruct,
+                  OmpTaskConstruct,
                   OmpEndClause]
 
 omp_clauses = [OmpCollapse,
@@ -413,18 +783,23 @@ omp_clauses = [OmpCollapse,
                OmpPrivate,
                OmpReduction,
                OmpSchedule,
-               OmpShared]
+               OmpShared,
+               OmpSafeLen,
+               OmpSimdLen,
+               OmpAligned,
+               OmpPriority,
+               OmpGrainSize,
+               OmpNumTasks,
+               OmpUntied]
 
 omp_classes = [Openmp, OpenmpStmt] + omp_directives + omp_clauses
 
 
 this_folder = dirname(__file__)
 
-# Get meta-model from language description
+# Language description, the meta-model is only built when it is first used
 grammar = join(this_folder, '../grammar/openmp.tx')
 
-meta = metamodel_from_file(grammar, classes=omp_classes)
-
 def parse(filename=None, stmts=None):
     """ Parse openmp pragmas
 
@@ -441,6 +816,8 @@ def parse(filename=None, stmts=None):
       stmts : list
 
     """
+    meta = get_metamodel(grammar, omp_classes)
+
     # Instantiate model
     if filename:
         model = meta.model_from_file(filename)
@@ -4,12 +4,195 @@
 /* --------------------------------------------------------------------------------------- */
 
 #include "ndarrays.h"
+#ifndef _WIN32
+# include <pthread.h>
+#endif
+
+/*
+** memory
+**
+** The data buffers are aligned on NDARRAY_ALIGNMENT bytes. When the pool is
+** enabled, the buffers of up to 1 MiB are rounded up to a power of 2 (size
+** class), so that the buffers released by free_array can be kept by the
+** thread and reused by the next array_create of the same size class. The
+** buffers kept by a thread are released when the thread exits (or by
+** ndarray_pool_release).
+*/
+
+# define NDARRAY_POOL_CLASSES 15
+# define NDARRAY_POOL_DEPTH 8
+
+static atomic_bool          pool_enabled = false;
+static _Thread_local void   *pool[NDARRAY_POOL_CLASSES][NDARRAY_POOL_DEPTH];
+static _Thread_local int32_t pool_size[NDARRAY_POOL_CLASSES];
+
+static atomic_int_least64_t stats_allocations = 0;
+static atomic_int_least64_t stats_pool_hits = 0;
+static atomic_int_least64_t stats_total_bytes = 0;
+static atomic_int_least64_t stats_current_bytes = 0;
+static atomic_int_least64_t stats_peak_bytes = 0;
+static atomic_int_least64_t stats_pooled_bytes = 0;
+
+#ifndef _WIN32
+static pthread_key_t        pool_key;
+static pthread_once_t       pool_key_once = PTHREAD_ONCE_INIT;
+static _Thread_local bool   pool_registered = false;
+
+static void     pool_thread_exit(void *value)
+{
+    (void)value;
+    ndarray_pool_release();
+}
+
+static void     pool_key_create(void)
+{
+    pthread_key_create(&pool_key, pool_thread_exit);
+}
+
+/* the buffers kept by the thread are released when it exits */
+static void     pool_register_thread(void)
+{
+    if (pool_registered)
+        return;
+    pthread_once(&pool_key_once, pool_key_create);
+    pthread_setspecific(pool_key, &pool_registered);
+    pool_registered = true;
+}
+#else
+static void     pool_register_thread(void)
+{
+}
+#endif
+
+static int32_t  size_class(int64_t size)
+{
+    int32_t c = 0;
+
+    while (c < NDARRAY_POOL_CLASSES && ((int64_t)NDARRAY_ALIGNMENT << c) < size)
+        c++;
+    return (c < NDARRAY_POOL_CLASSES ? c : -1);
+}
+
+static int64_t  allocated_size(int64_t size, int32_t c)
+{
+    if (c >= 0)
+        return ((int64_t)NDARRAY_ALIGNMENT << c);
+    return ((size + NDARRAY_ALIGNMENT - 1) / NDARRAY_ALIGNMENT * NDARRAY_ALIGNMENT);
+}
+
+static void     *aligned_malloc(int64_t size)
+{
+    void *ptr;
+
+#ifdef _WIN32
+    ptr = _aligned_malloc(size, NDARRAY_ALIGNMENT);
+#else
+    if (posix_memalign(&ptr, NDARRAY_ALIGNMENT, size) != 0)
+        ptr = NULL;
+#endif
+    return (ptr);
+}
+
+static void     aligned_free(void *ptr)
+{
+#ifdef _WIN32
+    _aligned_free(ptr);
+#else
+    free(ptr);
+#endif
+}
+
+void    *ndarray_alloc(int64_t size, int64_t *allocated)
+{
+    /* the buffers are only rounded up to their size class for the pool */
+    int32_t c = atomic_load_explicit(&pool_enabled, memory_order_relaxed) ? size_class(size) : -1;
+    void    *ptr = NULL;
+    int64_t current;
+    int64_t peak;
+
+    size = allocated_size(size, c);
+    if (c >= 0 && pool_size[c] > 0)
+    {
+        ptr = pool[c][--pool_size[c]];
+        atomic_fetch_add_explicit(&stats_pool_hits, 1, memory_order_relaxed);
+        atomic_fetch_sub_explicit(&stats_pooled_bytes, size, memory_order_relaxed);
+    }
+    else
+        ptr = aligned_malloc(size);
+    *allocated = size;
+    atomic_fetch_add_explicit(&stats_allocations, 1, memory_order_relaxed);
+    atomic_fetch_add_explicit(&stats_total_bytes, size, memory_order_relaxed);
+    current = atomic_fetch_add_explicit(&stats_current_bytes, size, memory_order_relaxed) + size;
+    peak = atomic_load_explicit(&stats_peak_bytes, memory_order_relaxed);
+    while (current > peak && !atomic_compare_exchange_weak_explicit(&stats_peak_bytes,
+                &peak, current, memory_order_relaxed, memory_order_relaxed))
+        ;
+    return (ptr);
+}
+
+void    ndarray_free(void *ptr, int64_t allocated)
+{
+    int32_t c = size_class(allocated);
+
+    atomic_fetch_sub_explicit(&stats_current_bytes, allocated, memory_order_relaxed);
+    /* only the buffers whose size is exactly a size class can be reused */
+    if (c >= 0 && allocated == allocated_size(allocated, c) && pool_size[c] < NDARRAY_POOL_DEPTH
+            && atomic_load_explicit(&pool_enabled, memory_order_relaxed))
+    {
+        pool_register_thread();
+        pool[c][pool_size[c]++] = ptr;
+        atomic_fetch_add_explicit(&stats_pooled_bytes, allocated, memory_order_relaxed);
+    }
+    else
+        aligned_free(ptr);
+}
+
+void    ndarray_pool_enable(bool enable)
+{
+    atomic_store(&pool_enabled, enable);
+}
+
+void    ndarray_pool_release(void)
+{
+    /* only the buffers kept by the calling thread are released */
+    for (int32_t c = 0; c < NDARRAY_POOL_CLASSES; c++)
+    {
+        while (pool_size[c] > 0)
+        {
+            aligned_free(pool[c][--pool_size[c]]);
+            atomic_fetch_sub_explicit(&stats_pooled_bytes, allocated_size(0, c), memory_order_relaxed);
+        }
+    }
+}
+
+t_ndarray_memory_stats  ndarray_memory_stats(void)
+{
+    t_ndarray_memory_stats stats;
+
+    stats.allocations = atomic_load(&stats_allocations);
+    stats.pool_hits = atomic_load(&stats_pool_hits);
+    stats.total_bytes = atomic_load(&stats_total_bytes);
+    stats.current_bytes = atomic_load(&stats_current_bytes);
+    stats.peak_bytes = atomic_load(&stats_peak_bytes);
+    stats.pooled_bytes = atomic_load(&stats_pooled_bytes);
+    return (stats);
+}
+
+void    ndarray_memory_stats_reset(void)
+{
+    int64_t current = atomic_load(&stats_current_bytes);
+
+    atomic_store(&stats_allocations, 0);
+    atomic_store(&stats_pool_hits, 0);
+    atomic_store(&stats_total_bytes, 0);
+    atomic_store(&stats_peak_bytes, current);
+}
 
 /*
 ** allocation
 */
 
-t_ndarray   array_create(int32_t nd, int32_t *shape, enum e_types type)
+t_ndarray   array_create(int32_t nd, int64_t *shape, enum e_types type)
 {
     t_ndarray arr;
 
@@ -47,21 +230,19 @@ t_ndarray   array_create(int32_t nd, int32_t *shape, enum e_types type)
     }
     arr.is_view = false;
     arr.length = 1;
-    arr.shape = malloc(arr.nd * sizeof(int32_t));
     for (int32_t i = 0; i < arr.nd; i++)
     {
         arr.length *= shape[i];
         arr.shape[i] = shape[i];
     }
     arr.buffer_size = arr.length * arr.type_size;
-    arr.strides = malloc(nd * sizeof(int32_t));
     for (int32_t i = 0; i < arr.nd; i++)
     {
         arr.strides[i] = 1;
         for (int32_t j = i + 1; j < arr.nd; j++)
             arr.strides[i] *= arr.shape[j];
     }
-    arr.raw_data = malloc(arr.buffer_size);
+    arr.raw_data = ndarray_alloc(arr.buffer_size, &arr.alloc_size);
     return (arr);
 }
 
@@ -70,7 +251,7 @@ void   _array_fill_int8(int8_t c, t_ndarray arr)
     if (c == 0)
         memset(arr.raw_data, 0, arr.buffer_size);
     else
-        for (int32_t i = 0; i < arr.length; i++)
+        for (int64_t i = 0; i < arr.length; i++)
             arr.nd_int8[i] = c;
 }
 
@@ -79,7 +260,7 @@ void   _array_fill_int16(int16_t c, t_ndarray arr)
     if (c == 0)
         memset(arr.raw_data, 0, arr.buffer_size);
     else
-        for (int32_t i = 0; i < arr.length; i++)
+        for (int64_t i = 0; i < arr.length; i++)
             arr.nd_int16[i] = c;
 }
 
@@ -88,7 +269,7 @@ void   _array_fill_int32(int32_t c, t_ndarray arr)
     if (c == 0)
         memset(arr.raw_data, 0, arr.buffer_size);
     else
-        for (int32_t i = 0; i < arr.length; i++)
+        for (int64_t i = 0; i < arr.length; i++)
             arr.nd_int32[i] = c;
 }
 
@@ -97,7 +278,7 @@ void   _array_fill_int64(int64_t c, t_ndarray arr)
     if (c == 0)
         memset(arr.raw_data, 0, arr.buffer_size);
     else
-        for (int32_t i = 0; i < arr.length; i++)
+        for (int64_t i = 0; i < arr.length; i++)
             arr.nd_int64[i] = c;
 }
 
@@ -106,7 +287,7 @@ void   _array_fill_bool(bool c, t_ndarray arr)
     if (c == 0)
         memset(arr.raw_data, 0, arr.buffer_size);
     else
-        for (int32_t i = 0; i < arr.length; i++)
+        for (int64_t i = 0; i < arr.length; i++)
             arr.nd_bool[i] = c;
 }
 
@@ -115,7 +296,7 @@ void   _array_fill_float(float c, t_ndarray arr)
     if (c == 0)
         memset(arr.raw_data, 0, arr.buffer_size);
     else
-        for (int32_t i = 0; i < arr.length; i++)
+        for (int64_t i = 0; i < arr.length; i++)
             arr.nd_float[i] = c;
 }
 
@@ -124,7 +305,7 @@ void   _array_fill_double(double c, t_ndarray arr)
     if (c == 0)
         memset(arr.raw_data, 0, arr.buffer_size);
     else
-        for (int32_t i = 0; i < arr.length; i++)
+        for (int64_t i = 0; i < arr.length; i++)
             arr.nd_double[i] = c;
 }
 
@@ -133,7 +314,7 @@ void   _array_fill_cfloat(float complex c, t_ndarray arr)
     if (c == 0)
         memset(arr.raw_data, 0, arr.buffer_size);
     else
-        for (int32_t i = 0; i < arr.length; i++)
+        for (int64_t i = 0; i < arr.length; i++)
             arr.nd_cfloat[i] = c;
 }
 
@@ -143,7 +324,7 @@ void   _array_fill_cdouble(double complex c, t_ndarray arr)
     if (c == 0)
         memset(arr.raw_data, 0, arr.buffer_size);
     else
-        for (int32_t i = 0; i < arr.length; i++)
+        for (int64_t i = 0; i < arr.length; i++)
             arr.nd_cdouble[i] = c;
 }
 
@@ -153,25 +334,10 @@ void   _array_fill_cdouble(double complex c, t_ndarray arr)
 
 int32_t free_array(t_ndarray arr)
 {
-    if (arr.shape == NULL)
+    if (arr.raw_data == NULL)
         return (0);
-    free(arr.raw_data);
+    ndarray_free(arr.raw_data, arr.alloc_size);
     arr.raw_data = NULL;
-    free(arr.shape);
-    arr.shape = NULL;
-    free(arr.strides);
-    arr.strides = NULL;
-    return (1);
-}
-
-int32_t free_pointer(t_ndarray arr)
-{
-    if (arr.is_view == false || arr.shape == NULL)
-        return (0);
-    free(arr.shape);
-    arr.shape = NULL;
-    free(arr.strides);
-    arr.strides = NULL;
     return (1);
 }
 
@@ -179,7 +345,7 @@ int32_t free_pointer(t_ndarray arr)
 ** slices
 */
 
-t_slice new_slice(int32_t start, int32_t end, int32_t step)
+t_slice new_slice(int64_t start, int64_t end, int64_t step)
 {
     t_slice slice;
 
@@ -194,14 +360,12 @@ t_ndarray array_slicing(t_ndarray arr, ...)
     t_ndarray view;
     va_list  va;
     t_slice slice;
-    int32_t start = 0;
+    int64_t start = 0;
 
     view.nd = arr.nd;
     view.type = arr.type;
     view.type_size = arr.type_size;
-    view.shape = malloc(sizeof(int32_t) * arr.nd);
-    view.strides = malloc(sizeof(int32_t) * arr.nd);
-    memcpy(view.strides, arr.strides, sizeof(int32_t) * arr.nd);
+    memcpy(view.strides, arr.strides, sizeof(int64_t) * arr.nd);
     view.is_view = true;
     va_start(va, arr);
     for (int32_t i = 0; i < arr.nd ; i++)
@@ -227,15 +391,11 @@ void        alias_assign(t_ndarray *dest, t_ndarray src)
 {
     /*
     ** copy src to dest
-    ** allocate new memory for shape and strides
-    ** setting is_view to true for the garbage collector to deallocate
+    ** the shape and the strides are copied with the structure
+    ** setting is_view to true as dest does not own the data
     */
 
     *dest = src;
-    dest->shape = malloc(sizeof(int32_t) * src.nd);
-    memcpy(dest->shape, src.shape, sizeof(int32_t) * src.nd);
-    dest->strides = malloc(sizeof(int32_t) * src.nd);
-    memcpy(dest->strides, src.strides, sizeof(int32_t) * src.nd);
     dest->is_view = true;
 }
 
@@ -243,17 +403,55 @@ void        alias_assign(t_ndarray *dest, t_ndarray src)
 ** indexing
 */
 
-int32_t     get_index(t_ndarray arr, ...)
+int64_t     get_index(t_ndarray arr, ...)
 {
     va_list va;
-    int32_t index;
+    int64_t index;
 
     va_start(va, arr);
     index = 0;
     for (int32_t i = 0; i < arr.nd; i++)
     {
-        index += va_arg(va, int32_t) * arr.strides[i];
+        index += va_arg(va, int64_t) * arr.strides[i];
     }
     va_end(va);
     return (index);
 }
+
+/*
+** aliasing
+*/
+
+static void array_bounds(t_ndarray arr, char **lo, char **hi)
+{
+    int64_t lo_offset = 0;
+    int64_t hi_offset = 0;
+
+    for (int32_t i = 0; i < arr.nd; i++)
+    {
+        if (arr.strides[i] < 0)
+            lo_offset += (arr.shape[i] - 1) * arr.strides[i];
+        else
+            hi_offset += (arr.shape[i] - 1) * arr.strides[i];
+    }
+    *lo = arr.raw_data + lo_offset * arr.type_size;
+    *hi = arr.raw_data + (hi_offset + 1) * arr.type_size;
+}
+
+bool        ndarray_overlap(t_ndarray a, t_ndarray b)
+{
+    /*
+    ** true if the memory spanned by the elements of the two arrays
+    ** (views) may overlap
+    */
+    char *a_lo;
+    char *a_hi;
+    char *b_lo;
+    char *b_hi;
+
+    if (a.length == 0 || b.length == 0)
+        return (false);
+    array_bounds(a, &a_lo, &a_hi);
+    array_bounds(b, &b_lo, &b_hi);
+    return (a_lo < b_hi && b_lo < a_hi);
+}
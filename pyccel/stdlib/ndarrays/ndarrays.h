@@ -13,6 +13,14 @@
 # include <stdarg.h>
 # include <stdbool.h>
 # include <stdint.h>
+# include <stdatomic.h>
+
+/* maximum number of dimensions of an array, the shape and the strides are
+** stored inside t_ndarray so that creating a view does not allocate */
+# define MAX_NDIM 8
+
+/* alignment in bytes of the data buffers allocated by array_create */
+# define NDARRAY_ALIGNMENT 64
 
 /* mapping the function array_fill to the correct type */
 # define array_fill(c, arr) _Generic((c), int64_t : _array_fill_int64,\
@@ -27,9 +35,9 @@
 
 typedef struct  s_slice
 {
-    int32_t start;
-    int32_t end;
-    int32_t step;
+    int64_t start;
+    int64_t end;
+    int64_t step;
 }               t_slice;
 
 enum e_types
@@ -63,25 +71,51 @@ typedef struct  s_ndarray
     /* number of dimensions */
     int32_t                 nd;
     /* shape 'size of each dimension' */
-    int32_t                 *shape;
-    /* strides 'number of bytes to skip to get the next element' */
-    int32_t                 *strides;
+    int64_t                 shape[MAX_NDIM];
+    /* strides 'number of elements to skip to get the next element' */
+    int64_t                 strides[MAX_NDIM];
     /* type of the array elements */
     enum e_types            type;
     /* type size of the array elements */
     int32_t                 type_size;
     /* number of element in the array */
-    int32_t                 length;
+    int64_t                 length;
     /* size of the array */
-    int32_t                 buffer_size;
+    int64_t                 buffer_size;
+    /* number of bytes allocated for the data (at least buffer_size) */
+    int64_t                 alloc_size;
     /* True if the array does not own the data */
     bool                    is_view;
 }               t_ndarray;
 
+typedef struct  s_ndarray_memory_stats
+{
+    /* number of data buffers allocated */
+    int64_t                 allocations;
+    /* number of those buffers which were recycled from the pool */
+    int64_t                 pool_hits;
+    /* total number of bytes allocated */
+    int64_t                 total_bytes;
+    /* number of bytes currently allocated */
+    int64_t                 current_bytes;
+    /* maximum number of bytes allocated at the same time */
+    int64_t                 peak_bytes;
+    /* number of bytes kept by the pools of the threads */
+    int64_t                 pooled_bytes;
+}               t_ndarray_memory_stats;
+
 /* functions prototypes */
 
+/* memory */
+void        *ndarray_alloc(int64_t size, int64_t *allocated);
+void        ndarray_free(void *ptr, int64_t allocated);
+void        ndarray_pool_enable(bool enable);
+void        ndarray_pool_release(void);
+t_ndarray_memory_stats  ndarray_memory_stats(void);
+void        ndarray_memory_stats_reset(void);
+
 /* allocations */
-t_ndarray   array_create(int32_t nd, int32_t *shape, enum e_types type);
+t_ndarray   array_create(int32_t nd, int64_t *shape, enum e_types type);
 void        _array_fill_int8(int8_t c, t_ndarray arr);
 void        _array_fill_int16(int16_t c, t_ndarray arr);
 void        _array_fill_int32(int32_t c, t_ndarray arr);
@@ -94,7 +128,7 @@ void        _array_fill_cdouble(double complex c, t_ndarray arr);
 
 /* slicing */
                 /* creating a Slice object */
-t_slice     new_slice(int32_t start, int32_t end, int32_t step);
+t_slice     new_slice(int64_t start, int64_t end, int64_t step);
                 /* creating an array view */
 t_ndarray   array_slicing(t_ndarray p, ...);
 
@@ -103,9 +137,11 @@ void        alias_assign(t_ndarray *dest, t_ndarray src);
 
 /* free */
 int32_t         free_array(t_ndarray dump);
-int32_t         free_pointer(t_ndarray dump);
 
 /* indexing */
-int32_t         get_index(t_ndarray arr, ...);
+int64_t         get_index(t_ndarray arr, ...);
+
+/* aliasing */
+bool            ndarray_overlap(t_ndarray a, t_ndarray b);
 
 #endif
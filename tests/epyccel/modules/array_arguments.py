@@ -0,0 +1,42 @@
+# pylint: disable=missing-function-docstring, missing-module-docstring/
+from pyccel.decorators import types
+
+#==============================================================================
+
+@types( 'real[:]' )
+def weighted_sum_1d( x ):
+    s = 0.0
+    for i in range( x.shape[0] ):
+        s += (i + 1) * x[i]
+    return s
+
+@types( 'real[:,:]' )
+def weighted_sum_2d( x ):
+    s = 0.0
+    for i in range( x.shape[0] ):
+        for j in range( x.shape[1] ):
+            s += (10 * i + j + 1) * x[i, j]
+    return s
+
+@types( 'int[:,:](order=F)' )
+def weighted_sum_2d_F( x ):
+    s = 0
+    for i in range( x.shape[0] ):
+        for j in range( x.shape[1] ):
+            s += (10 * i + j + 1) * x[i, j]
+    return s
+
+@types( 'complex[:,:,:]' )
+def weighted_sum_3d( x ):
+    s = 0.0j
+    for i in range( x.shape[0] ):
+        for j in range( x.shape[1] ):
+            for k in range( x.shape[2] ):
+                s += (100 * i + 10 * j + k + 1) * x[i, j, k]
+    return s
+
+@types( 'real[:,:]', 'real' )
+def scale_2d( x, a ):
+    for i in range( x.shape[0] ):
+        for j in range( x.shape[1] ):
+            x[i, j] = a * x[i, j]
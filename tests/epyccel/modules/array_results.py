@@ -0,0 +1,45 @@
+# pylint: disable=missing-function-docstring, missing-module-docstring/
+from pyccel.decorators import types
+
+#==============================================================================
+
+@types( int )
+def arange_1d( n ):
+    from numpy import empty
+    x = empty( n )
+    for i in range( n ):
+        x[i] = 2.0 * i
+    return x
+
+@types( int, int )
+def index_2d( n, m ):
+    from numpy import empty
+    x = empty( (n, m), dtype=int )
+    for i in range( n ):
+        for j in range( m ):
+            x[i, j] = 10 * i + j
+    return x
+
+@types( int, 'complex' )
+def full_3d_F( n, a ):
+    from numpy import full
+    x = full( (n, 2, 3), a, order='F' )
+    x[n-1, 1, 2] = 0.0
+    return x
+
+@types( int )
+def array_and_scalar( n ):
+    from numpy import zeros
+    x = zeros( (n, 2) )
+    for i in range( n ):
+        x[i, 1] = 1.0
+    s = 0.5 * n
+    return s, x
+
+@types( int )
+def reuse_returned_array( n ):
+    s = 0.0
+    for k in range( 4 ):
+        y = index_2d( n + k, 3 )
+        s = s + y[1, 2] + y.shape[0]
+    return s
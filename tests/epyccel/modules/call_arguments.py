@@ -0,0 +1,53 @@
+# pylint: disable=missing-function-docstring, missing-module-docstring/
+from pyccel.decorators import types, template
+
+def no_arguments():
+    return 0
+
+@types('int', 'real', 'bool', 'complex')
+def mixed(n, x, b, z):
+    if b:
+        return n + x + z
+    return z
+
+@types('int32', 'int16', 'int8', 'float32')
+def narrow(a, b, c, d):
+    return a + b + c + d
+
+@types('real', 'real', 'int')
+def defaults(x, y = 1.0, n = 2):
+    return x + y + n
+
+@types('real', 'int', 'int')
+def keyword_only(x, m = 3, *, n):
+    return x + n + m
+
+@types('real[:]')
+def first(x):
+    return x[0]
+
+@types('int')
+@types('real')
+@types('complex')
+def overloaded(x):
+    y = x * 2
+    return y
+
+@types('real[:]')
+@types('int[:]')
+@types('int[:,:]')
+def length(x):
+    return x.shape[0]
+
+@template('T', types=['int', 'real', 'complex'])
+@template('Z', types=['int', 'real', 'complex', 'bool'])
+@types('T', 'Z', 'T')
+def templated(x, y, z):
+    if y:
+        return x + z
+    return z
+
+@types('int', 'int')
+@types('real', 'real')
+def overloaded_default(x, y = 2):
+    return x * y
@@ -1,6 +1,6 @@
 # pylint: disable=missing-function-docstring, missing-module-docstring/
 # pylint: disable=wildcard-import
-from pyccel.decorators import types
+from pyccel.decorators import types, vectorize, prange
 
 @types(int)
 def set_num_threads(n):
@@ -275,3 +275,159 @@ def omp_arraysum_single(x):
     #$ omp end single
     #$ omp end parallel
     return result
+
+@vectorize
+@types('real', 'real')
+def omp_ufunc(x, y):
+    return x * y + 1.0
+
+@types('real[:]', 'real[:]', 'real[:]')
+def omp_array_expression(x, y, z):
+    z[:] = x * y + 1.0
+
+@types('real[:]', 'real[:]')
+def prange_private(x, y):
+    for i in prange(x.shape[0]):
+        t = 2.0 * x[i]
+        y[i] = t + 1.0
+
+@types('real[:,:]')
+def prange_reduction(a):
+    s = 0.0
+    p = 1.0
+    n, m = a.shape
+    for i in prange(n):
+        for j in range(m):
+            s -= a[i, j]
+        p *= 0.5
+    return s, p
+
+@types('real[:]', 'real[:]', 'real')
+def omp_simd(x, y, a):
+    #$ omp simd safelen(8)
+    for i in range(x.shape[0]):
+        y[i] = y[i] + a * x[i]
+    #$ omp end simd
+
+@types('real[:]')
+def omp_parallel_for_simd(x):
+    result = 0.0
+    #$ omp parallel for simd reduction(+: result)
+    for i in range(x.shape[0]):
+        result += x[i]
+    #$ omp end parallel for simd
+    return result
+
+@types('int[:]', 'int[:]')
+def omp_atomic(x, hist):
+    #$ omp parallel private(i)
+    #$ omp for
+    for i in range(x.shape[0]):
+        #$ omp atomic update
+        hist[x[i]] += 1
+        #$ omp end atomic
+    #$ omp end for
+    #$ omp end parallel
+
+@types('real[:]')
+def omp_critical(x):
+    result = x[0]
+    #$ omp parallel private(i, local_max)
+    local_max = x[0]
+    #$ omp for
+    for i in range(x.shape[0]):
+        if x[i] > local_max:
+            local_max = x[i]
+    #$ omp end for nowait
+    #$ omp critical (update_max)
+    if local_max > result:
+        result = local_max
+    #$ omp end critical (update_max)
+    #$ omp end parallel
+    return result
+
+@types('int')
+def omp_sections(n):
+    a = 0
+    b = 0
+    #$ omp parallel
+    #$ omp sections private(i, j)
+    #$ omp section
+    for i in range(n):
+        a += i
+    #$ omp end section
+    #$ omp section
+    for j in range(n):
+        b += 2 * j
+    #$ omp end section
+    #$ omp end sections
+    #$ omp barrier
+    #$ omp end parallel
+    return a + b
+
+@types('int')
+def omp_tasks(n):
+    a = 0
+    b = 0
+    #$ omp parallel
+    #$ omp single
+    #$ omp task shared(a) private(i)
+    for i in range(n):
+        a += i
+    #$ omp end task
+    #$ omp task shared(b) private(j)
+    for j in range(n):
+        b += 2 * j
+    #$ omp end task
+    #$ omp taskwait
+    #$ omp end single
+    #$ omp end parallel
+    return a + b
+
+@types('real[:]')
+def omp_taskloop(x):
+    #$ omp parallel
+    #$ omp single
+    #$ omp taskloop grainsize(16)
+    for i in range(x.shape[0]):
+        x[i] = 2.0 * x[i]
+    #$ omp end taskloop
+    #$ omp end single
+    #$ omp end parallel
+
+@types('real[:,:]', 'real[:,:]')
+def auto_parallel_stencil(x, y):
+    n, m = x.shape
+    for i in range(1, n - 1):
+        for j in range(1, m - 1):
+            t = x[i - 1, j] + x[i + 1, j] + x[i, j - 1] + x[i, j + 1]
+            y[i, j] = 0.25 * t
+
+@types('real[:]')
+def auto_parallel_reductions(x):
+    s = 0.0
+    m = x[0]
+    for i in range(x.shape[0]):
+        s += x[i]
+        if x[i] > m:
+            m = x[i]
+    return s, m
+
+@types('real[:]')
+def auto_parallel_prefix_sum(x):
+    for i in range(1, x.shape[0]):
+        x[i] = x[i - 1] + x[i]
+
+@types('real[:]', 'real[:]')
+def auto_parallel_shift(x, y):
+    for i in range(x.shape[0]):
+        y[i + 1] = x[i]
+
+@types('real[:]')
+def auto_parallel_pointer_results(x):
+    for i in range(x.shape[0]):
+        t = x[i]
+        x[i] = t * 2
+    t = 1.0
+    u = 2.0
+    return t, u
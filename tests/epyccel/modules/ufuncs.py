@@ -0,0 +1,64 @@
+# pylint: disable=missing-function-docstring, missing-module-docstring/
+from pyccel.decorators import types, template, vectorize, guvectorize
+
+@vectorize
+@types('real', 'real')
+@types('int', 'int')
+def add(x, y):
+    return x + y
+
+@vectorize
+@types('real')
+def clip(x):
+    """Clip the values to the interval [0, 1]"""
+    if x < 0.0:
+        return 0.0
+    if x > 1.0:
+        return 1.0
+    return x
+
+@vectorize
+@template('T', ['complex', 'int32', 'real'])
+@types('T')
+def twice(x):
+    y = x + x
+    return y
+
+@vectorize
+@types('bool', 'real', 'real')
+def where(c, x, y):
+    if c:
+        return x
+    return y
+
+@vectorize
+@types('real')
+def bounds(x):
+    return x - 1.0, x + 1.0
+
+@guvectorize('(n),()->(n)')
+@types('real[:]', 'real', 'real[:]')
+def scale(x, a, y):
+    for i in range(x.shape[0]):
+        y[i] = a * x[i]
+
+@guvectorize('(n)->()')
+@types('real[:]', 'real[:]')
+@types('int[:]', 'int[:]')
+def total(x, s):
+    s[0] = 0
+    for i in range(x.shape[0]):
+        s[0] += x[i]
+
+@guvectorize('(m,n),(n)->(m)')
+@types('real[:,:]', 'real[:]', 'real[:]')
+def matvec(a, x, y):
+    m, n = a.shape
+    for i in range(m):
+        y[i] = 0.0
+        for j in range(n):
+            y[i] += a[i, j] * x[j]
+
+@types('int')
+def increment(n):
+    return n + 1
@@ -0,0 +1,89 @@
+# pylint: disable=missing-function-docstring, missing-module-docstring/
+import warnings
+import numpy as np
+import pytest
+from pyccel.epyccel import epyccel
+
+import modules.array_arguments as mod
+
+@pytest.fixture(scope="module", params=[
+        pytest.param("fortran", marks = pytest.mark.fortran),
+        pytest.param("c", marks = pytest.mark.c),
+    ]
+)
+def language(request):
+    return request.param
+
+@pytest.fixture(scope="module")
+def modnew(language):
+    return epyccel(mod, language=language)
+
+@pytest.fixture(scope="module")
+def modwarn(language):
+    return epyccel(mod, language=language, warn_array_copy=True)
+
+def check_no_copy(f, x):
+    # The arrays are passed without copy, even if they are not contiguous
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        return f(x)
+
+def test_views_1d(modnew, modwarn):
+    x = np.arange(20.)
+    for v in [x, x[::3], x[5:1:-2], x[:0]]:
+        assert np.isclose(modnew.weighted_sum_1d(v), mod.weighted_sum_1d(v))
+        assert np.isclose(check_no_copy(modwarn.weighted_sum_1d, v), mod.weighted_sum_1d(v))
+
+def test_views_2d(modnew, modwarn):
+    x = np.arange(60.).reshape(6, 10)
+    for v in [x, x.T, x[::2, 1::3], x[::-1, ::-2], x[2:3, :],
+              np.asfortranarray(x), np.broadcast_to(x[0], (4, 10))]:
+        assert np.isclose(modnew.weighted_sum_2d(v), mod.weighted_sum_2d(v))
+        assert np.isclose(check_no_copy(modwarn.weighted_sum_2d, v), mod.weighted_sum_2d(v))
+
+def test_views_2d_F(modnew, modwarn):
+    x = np.asfortranarray(np.arange(60).reshape(6, 10))
+    for v in [x, x.T, np.ascontiguousarray(x), x[1::2, ::-3]]:
+        assert modnew.weighted_sum_2d_F(v) == mod.weighted_sum_2d_F(v)
+        assert check_no_copy(modwarn.weighted_sum_2d_F, v) == mod.weighted_sum_2d_F(v)
+
+def test_views_3d(modnew, modwarn):
+    x = np.arange(120.).reshape(4, 5, 6) * (1+2j)
+    for v in [x, x.transpose(1, 2, 0), x[::2, :, ::-3], x[..., 1:2]]:
+        assert np.isclose(modnew.weighted_sum_3d(v), mod.weighted_sum_3d(v))
+        assert np.isclose(check_no_copy(modwarn.weighted_sum_3d, v), mod.weighted_sum_3d(v))
+
+def test_modify_view(modnew):
+    x = np.arange(60.).reshape(6, 10)
+    x_expected = x.copy()
+    modnew.scale_2d(x[1::2, ::-3], 2.0)
+    mod.scale_2d(x_expected[1::2, ::-3], 2.0)
+    assert np.array_equal(x, x_expected)
+
+def test_copy_of_unaligned_data(modnew, modwarn):
+    # The data of a field of a packed structured array is not aligned on
+    # the size of its items: it is copied, and written back after the call
+    rec = np.zeros((3, 4), dtype=[('a', np.int32), ('b', np.float64)])
+    rec['b'] = np.arange(12.).reshape(3, 4)
+    x = rec['b']
+    assert np.isclose(modnew.weighted_sum_2d(x), mod.weighted_sum_2d(x))
+
+    x_expected = x.copy()
+    mod.scale_2d(x_expected, 3.0)
+    modnew.scale_2d(x, 3.0)
+    assert np.array_equal(rec['b'], x_expected)
+
+    with pytest.warns(RuntimeWarning):
+        modwarn.scale_2d(x, 2.0)
+    assert np.array_equal(rec['b'], 2.0 * x_expected)
+
+def test_read_only_copy(modnew):
+    # A read-only array can be copied if the function does not modify it
+    rec = np.zeros(5, dtype=[('a', np.int32), ('b', np.float64)])
+    rec['b'] = np.arange(5.)
+    x = rec['b']
+    x.flags.writeable = False
+    assert np.isclose(modnew.weighted_sum_1d(x), mod.weighted_sum_1d(x))
+    # but it cannot be written back into
+    with pytest.raises(ValueError):
+        modnew.scale_2d(x.reshape(1, 5), 1.0)
@@ -0,0 +1,50 @@
+# pylint: disable=missing-function-docstring, missing-module-docstring/
+import numpy as np
+import pytest
+from pyccel.epyccel import epyccel
+
+import modules.array_results as mod
+
+@pytest.fixture(scope="module", params=[
+        pytest.param("fortran", marks = pytest.mark.fortran),
+        pytest.param("c", marks = pytest.mark.c),
+    ]
+)
+def modnew(request):
+    return epyccel(mod, language=request.param)
+
+def check_returned_array(x, x_expected):
+    assert x.dtype == x_expected.dtype
+    assert x.shape == x_expected.shape
+    assert np.array_equal(x, x_expected)
+    # The data allocated by the compiled function is not copied,
+    # it is owned by the base of the returned array
+    assert not x.flags['OWNDATA']
+    assert x.base is not None
+
+def test_array_1d(modnew):
+    check_returned_array(modnew.arange_1d(7), mod.arange_1d(7))
+
+def test_array_2d(modnew):
+    check_returned_array(modnew.index_2d(4, 5), mod.index_2d(4, 5))
+
+def test_array_3d_F(modnew):
+    check_returned_array(modnew.full_3d_F(3, 1+2j), mod.full_3d_F(3, 1+2j))
+
+def test_array_and_scalar(modnew):
+    s, x = modnew.array_and_scalar(5)
+    s_expected, x_expected = mod.array_and_scalar(5)
+    assert s == s_expected
+    check_returned_array(x, x_expected)
+
+def test_empty_array(modnew):
+    check_returned_array(modnew.arange_1d(0), mod.arange_1d(0))
+
+def test_reuse_returned_array(modnew):
+    assert modnew.reuse_returned_array(5) == mod.reuse_returned_array(5)
+
+def test_returned_array_lifetime(modnew):
+    # The memory is released with the last reference to the array
+    views = [modnew.index_2d(100, 100)[1:3] for _ in range(100)]
+    for v in views:
+        assert np.array_equal(v, mod.index_2d(100, 100)[1:3])
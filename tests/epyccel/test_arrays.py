@@ -3,6 +3,7 @@ import pytest
 import numpy as np
 
 from pyccel.epyccel import epyccel
+from pyccel.decorators import types
 from modules        import arrays
 
 #==============================================================================
@@ -2608,3 +2609,40 @@ def test_array_2d_C_slice_stride_23():
 #    filelist = glob.glob( pattern )
 #    for f in filelist:
 #        os.remove( f )
+
+#==============================================================================
+# TEST : ARRAY ARGUMENTS WHICH ARE ONLY INDEXED
+#==============================================================================
+
+@pytest.mark.parametrize( 'language', [
+        pytest.param("c", marks = pytest.mark.c),
+        pytest.param("fortran", marks = pytest.mark.fortran)
+    ]
+)
+def test_array_arguments_indexed(language):
+    @types('real[:]', 'real[:]')
+    def dot(x, y):
+        s = 0.0
+        for i in range(x.shape[0]):
+            s = s + x[i] * y[i]
+        return s
+
+    @types('real[:]', 'real[:]', 'real[:]')
+    def exp_norm(x, y, z):
+        from numpy import sqrt, exp
+        for i in range(x.shape[0]):
+            z[i] = sqrt(x[i] * x[i] + y[i] * y[i]) * exp(-x[i])
+
+    f1 = epyccel(dot, language = language)
+    f2 = epyccel(exp_norm, language = language)
+
+    x = np.random.random(100)
+    y = np.random.random(100)
+    z1 = np.empty(100)
+    z2 = np.empty(100)
+
+    assert np.isclose(f1(x, y), dot(x, y), rtol=1e-13, atol=1e-14)
+
+    exp_norm(x, y, z1)
+    f2(x, y, z2)
+    assert np.allclose(z1, z2, rtol=1e-13, atol=1e-14)
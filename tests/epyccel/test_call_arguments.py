@@ -0,0 +1,135 @@
+# pylint: disable=missing-function-docstring, missing-module-docstring/
+import numpy as np
+import pytest
+from pyccel.epyccel import epyccel
+
+import modules.call_arguments as mod
+
+@pytest.fixture(scope="module", params=[
+        pytest.param("fortran", marks = pytest.mark.fortran),
+        pytest.param("c", marks = pytest.mark.c),
+    ]
+)
+def modnew(request):
+    return epyccel(mod, language=request.param)
+
+def test_positional(modnew):
+    assert modnew.no_arguments() == mod.no_arguments()
+    assert modnew.mixed(1, 2.0, True, 1+2j) == mod.mixed(1, 2.0, True, 1+2j)
+    assert modnew.mixed(3, 2, False, 1j) == mod.mixed(3, 2, False, 1j)
+    assert modnew.narrow(1, 2, -128, 4.5) == mod.narrow(1, 2, -128, 4.5)
+
+def test_keywords(modnew):
+    assert modnew.mixed(1, 2.0, b=True, z=3j) == mod.mixed(1, 2.0, b=True, z=3j)
+    assert modnew.mixed(z=1j, b=True, x=1.0, n=2) == mod.mixed(z=1j, b=True, x=1.0, n=2)
+    assert modnew.defaults(1.0) == mod.defaults(1.0)
+    assert modnew.defaults(1.0, 2.0) == mod.defaults(1.0, 2.0)
+    assert modnew.defaults(1.0, n=5) == mod.defaults(1.0, n=5)
+    assert modnew.keyword_only(1.0, n=2) == mod.keyword_only(1.0, n=2)
+    assert modnew.keyword_only(1.0, 5, n=2) == mod.keyword_only(1.0, 5, n=2)
+
+def test_numpy_scalars(modnew):
+    args = (np.int32(1), np.float32(2.5), np.bool_(True), np.complex128(1j))
+    assert modnew.mixed(*args) == mod.mixed(*args)
+
+@pytest.mark.parametrize('args,kwargs', [
+        ((1,), {}),
+        ((), {'x' : 1}),
+    ])
+def test_wrong_arguments_no_arguments(modnew, args, kwargs):
+    with pytest.raises(TypeError):
+        modnew.no_arguments(*args, **kwargs)
+
+@pytest.mark.parametrize('args,kwargs', [
+        ((1, 2.0, True), {}),
+        ((1, 2.0, True, 1j, 1j), {}),
+        ((1, 2.0, True, 1j), {'z' : 1j}),
+        ((1, 2.0, True), {'w' : 1j}),
+        ((1.5, 2.0, True, 1j), {}),
+        ((1, 'a', True, 1j), {}),
+    ])
+def test_wrong_arguments_mixed(modnew, args, kwargs):
+    with pytest.raises(TypeError):
+        modnew.mixed(*args, **kwargs)
+
+@pytest.mark.parametrize('x', ['no', None, [], 1j])
+def test_wrong_type_real(modnew, x):
+    with pytest.raises(TypeError):
+        modnew.mixed(1, x, True, 1j)
+    with pytest.raises(TypeError):
+        modnew.narrow(1, 2, 3, x)
+
+def test_real_conversion(modnew):
+    # The objects defining __float__ are accepted
+    assert modnew.mixed(1, np.array(2.5), True, 1j) == mod.mixed(1, np.array(2.5), True, 1j)
+    assert modnew.narrow(1, 2, 3, np.array(4.5)) == mod.narrow(1, 2, 3, np.array(4.5))
+
+def test_int_to_bool(modnew):
+    for b in [1, 0, 2, np.int32(1), np.int64(0)]:
+        assert modnew.mixed(1, 2.0, b, 1j) == mod.mixed(1, 2.0, b, 1j)
+
+@pytest.mark.parametrize('x', ['no', None, [], 1.0, np.float64(1.0)])
+def test_wrong_type_bool(modnew, x):
+    with pytest.raises(TypeError):
+        modnew.mixed(1, 2.0, x, 1j)
+
+def test_wrong_arguments_keyword_only(modnew):
+    with pytest.raises(TypeError):
+        modnew.keyword_only(1.0)
+    with pytest.raises(TypeError):
+        modnew.keyword_only(1.0, 2, 3)
+    with pytest.raises(TypeError):
+        modnew.defaults(y=2.0)
+
+def test_overflow(modnew):
+    with pytest.raises(OverflowError):
+        modnew.narrow(2**31, 2, 3, 4.5)
+    with pytest.raises(OverflowError):
+        modnew.narrow(1, 2**15, 3, 4.5)
+    with pytest.raises(OverflowError):
+        modnew.narrow(1, 2, 128, 4.5)
+
+def test_not_an_array(modnew):
+    assert modnew.first(np.ones(3)) == mod.first(np.ones(3))
+    with pytest.raises(TypeError):
+        modnew.first([1.0, 2.0])
+    with pytest.raises(TypeError):
+        modnew.first(np.ones(3, dtype=int))
+
+def test_overloaded(modnew):
+    # Alternate the types so that the dispatch does not always reuse the last function
+    for _ in range(2):
+        for x in [1, 2.5, np.int64(3), np.float64(1.5), 1+2j]:
+            assert modnew.overloaded(x) == mod.overloaded(x)
+            assert np.array(modnew.overloaded(x)).dtype.kind == np.array(mod.overloaded(x)).dtype.kind
+
+def test_overloaded_arrays(modnew):
+    for _ in range(2):
+        for x in [np.arange(3.), np.arange(4), np.arange(10).reshape(5, 2)]:
+            assert modnew.length(x) == mod.length(x)
+
+@pytest.mark.parametrize('x', [np.ones(2, dtype=int), 'a', None])
+def test_overloaded_wrong_type(modnew, x):
+    with pytest.raises(TypeError):
+        modnew.overloaded(x)
+    # The error does not break the next calls
+    assert modnew.overloaded(1.5) == mod.overloaded(1.5)
+
+@pytest.mark.parametrize('x', [np.ones((2, 2)), np.ones(2, dtype=np.int32), np.ones((2, 2, 2), dtype=int), 1])
+def test_overloaded_arrays_wrong_type(modnew, x):
+    with pytest.raises(TypeError):
+        modnew.length(x)
+
+def test_templated(modnew):
+    for x, y, z in [(1, 2, 3), (1, 2.0, 3), (1.5, 1j, 2.5), (1j, True, 2j), (2.0, False, 1.0)]:
+        assert modnew.templated(x, y, z) == mod.templated(x, y, z)
+    with pytest.raises(TypeError):
+        modnew.templated(1, 2, 3.0)
+
+def test_overloaded_default(modnew):
+    for x, y in [(1, 3), (1.5, 2.5)]:
+        assert modnew.overloaded_default(x, y) == mod.overloaded_default(x, y)
+        assert modnew.overloaded_default(x, y = y) == mod.overloaded_default(x, y = y)
+    assert modnew.overloaded_default(3) == mod.overloaded_default(3)
+    with pytest.raises(TypeError):
+        modnew.overloaded_default(1, 2.5)
@@ -0,0 +1,178 @@
+# pylint: disable=missing-function-docstring, missing-module-docstring/
+# coding: utf-8
+import os
+import threading
+import time
+
+import pytest
+
+import pyccel.codegen.python_wrapper as python_wrapper
+from pyccel.epyccel import epyccel
+from pyccel.codegen.pipeline import execute_pyccel
+from pyccel.codegen.timings import Timings
+from pyccel.codegen.runtime import get_memory_statistics, reset_memory_statistics
+from pyccel.codegen.runtime import set_memory_pool
+from pyccel.decorators import types
+
+#------------------------------------------------------------------------------
+def test_native_build(language, tmp_path):
+    @types('int')
+    def f1(x):
+        y = x * 2
+        return y
+
+    f = epyccel(f1, language = language, folder = str(tmp_path))
+    assert f(3) == f1(3)
+
+    # setuptools is not used
+    pyccel_files = os.listdir(str(tmp_path / '__epyccel__' / '__pyccel__'))
+    assert not any(p.startswith('setup_') for p in pyccel_files)
+
+#------------------------------------------------------------------------------
+def test_setuptools_fallback(language, tmp_path, monkeypatch):
+    monkeypatch.setattr(python_wrapper, 'get_python_build_config', lambda : None)
+
+    @types('int')
+    def f1(x):
+        y = x * 2
+        return y
+
+    f = epyccel(f1, language = language, folder = str(tmp_path))
+    assert f(3) == f1(3)
+
+    pyccel_files = os.listdir(str(tmp_path / '__epyccel__' / '__pyccel__'))
+    assert any(p.startswith('setup_') for p in pyccel_files)
+
+#------------------------------------------------------------------------------
+def test_runtime_library(language, tmp_path, monkeypatch):
+    runtime_dir = tmp_path / 'runtime'
+    monkeypatch.setenv('PYCCEL_RUNTIME_DIR', str(runtime_dir))
+
+    @types('int')
+    def f1(n):
+        import numpy as np
+        x = np.ones(n)
+        return x[0] * n
+
+    @types('int')
+    def f2(n):
+        import numpy as np
+        x = np.zeros(n)
+        return x[0] + n
+
+    if language == 'fortran':
+        # ndarrays is only used by the C code
+        expected = 0
+    else:
+        expected = 1
+
+    f = epyccel(f1, language = language, folder = str(tmp_path / 'f1'))
+    g = epyccel(f2, language = language, folder = str(tmp_path / 'f2'))
+    assert f(3) == f1(3)
+    assert g(3) == f2(3)
+
+    # The runtime library is only built once and is not copied next to the generated files
+    libs = [d for d in os.listdir(str(runtime_dir)) if not d.startswith('.')] \
+            if runtime_dir.exists() else []
+    assert len(libs) == expected
+    for d in libs:
+        assert os.path.isfile(str(runtime_dir / d / 'libpyccel_rt_ndarrays.a'))
+    assert not (tmp_path / 'f1' / '__epyccel__' / '__pyccel__' / 'ndarrays').exists()
+
+#------------------------------------------------------------------------------
+def test_timings(language, tmp_path):
+    @types('int')
+    def f1(x):
+        y = x * 2
+        return y
+
+    timings = Timings()
+    f = epyccel(f1, language = language, folder = str(tmp_path), timings = timings)
+    assert f(3) == f1(3)
+
+    stages = [r['stage'] for r in timings.records]
+    assert stages[:3] == ['syntax', 'semantic', 'codegen']
+    assert 'compile' in stages
+    assert stages[-1] == 'load'
+    assert ('bind_c' in stages) == (language == 'fortran')
+
+    # The memory allocated by python is measured in the stages of pyccel
+    assert all(r['memory'] is not None for r in timings.records if not r['external'])
+    assert 'semantic' in str(timings)
+
+#------------------------------------------------------------------------------
+@pytest.mark.c
+def test_memory_statistics(tmp_path):
+    @types('int', 'int')
+    def f1(n, m):
+        import numpy as np
+        s = 0.0
+        for i in range(m):
+            x = np.ones(n)
+            s = s + x[i]
+        return s
+
+    f = epyccel(f1, language = 'c', folder = str(tmp_path))
+
+    reset_memory_statistics(f)
+    assert f(100, 4) == f1(100, 4)
+    stats = get_memory_statistics(f)
+    assert stats['allocations'] == 4
+    assert stats['pool_hits'] == 0
+    assert stats['current_bytes'] == 0
+    # The buffers are only rounded up to the alignment
+    assert stats['peak_bytes'] == 832
+
+    set_memory_pool(f, True)
+    reset_memory_statistics(f)
+    assert f(100, 4) == f1(100, 4)
+    stats = get_memory_statistics(f)
+    assert stats['allocations'] == 4
+    assert stats['pool_hits'] == 3
+    # The buffers of the pool are rounded up to a size class
+    assert stats['peak_bytes'] == 1024
+    set_memory_pool(f, False)
+
+    assert get_memory_statistics(f)['pooled_bytes'] == 0
+
+    # The buffers kept by a thread are released when it exits
+    pooled = []
+    def run():
+        f(100, 4)
+        pooled.append(get_memory_statistics(f)['pooled_bytes'])
+
+    set_memory_pool(f, True)
+    thread = threading.Thread(target = run)
+    thread.start()
+    thread.join()
+    assert pooled[0] == 1024
+    # join may return before the thread is destroyed
+    for _ in range(100):
+        if get_memory_statistics(f)['pooled_bytes'] == 0:
+            break
+        time.sleep(0.05)
+    assert get_memory_statistics(f)['pooled_bytes'] == 0
+    set_memory_pool(f, False)
+
+#------------------------------------------------------------------------------
+@pytest.mark.fortran
+def test_array_alignment(tmp_path, capsys):
+    code = ("import numpy as np\n"
+            "def f(n : int):\n"
+            "    x = np.ones(n)\n"
+            "    return x[0] * n\n")
+    filename = str(tmp_path / 'alignment.py')
+    with open(filename, 'w') as f:
+        f.write(code)
+
+    # The directives are only honoured by ifort
+    execute_pyccel(filename, language = 'fortran', compiler = 'ifort', convert_only = True,
+                   array_alignment = 64, folder = str(tmp_path))
+    assert '!DIR$ ATTRIBUTES ALIGN : 64 :: x' in (tmp_path / '__pyccel__' / 'alignment.f90').read_text()
+
+    # The alignment is ignored with a warning with the other compilers
+    capsys.readouterr()
+    execute_pyccel(filename, language = 'fortran', compiler = 'gfortran', convert_only = True,
+                   array_alignment = 64, folder = str(tmp_path))
+    assert '!DIR$' not in (tmp_path / '__pyccel__' / 'alignment.f90').read_text()
+    assert 'only supported by ifort' in capsys.readouterr().out
@@ -0,0 +1,86 @@
+# pylint: disable=missing-function-docstring, missing-module-docstring/
+# coding: utf-8
+import os
+import shutil
+import sys
+
+from pyccel.epyccel import epyccel
+from pyccel.decorators import types
+from pyccel.codegen.cache import BuildCache, compute_cache_key
+
+#------------------------------------------------------------------------------
+def test_cache_hit(language, tmp_path):
+    @types('int')
+    def f1(x):
+        y = x - 1
+        return y
+
+    cache  = BuildCache(folder = str(tmp_path / 'cache'))
+    folder = str(tmp_path / 'build')
+
+    f = epyccel(f1, language = language, cache = cache, folder = folder)
+    assert f(2) == f1(2)
+    assert (cache.hits, cache.misses) == (0, 1)
+
+    # Remove all traces of the first build
+    del sys.modules[f.__module__]
+    shutil.rmtree(folder)
+
+    g = epyccel(f1, language = language, cache = cache, folder = folder)
+    assert g(5) == f1(5)
+    assert (cache.hits, cache.misses) == (1, 1)
+
+    stats = cache.stats()
+    assert stats['entries'] == 1
+    assert stats['hits'] == 1
+    assert stats['misses'] == 1
+
+#------------------------------------------------------------------------------
+def test_cache_eviction(tmp_path):
+    cache = BuildCache(folder = str(tmp_path / 'cache'), max_size = 1500)
+
+    for i in range(3):
+        f = tmp_path / 'file_{}.txt'.format(i)
+        f.write_text('x'*1000)
+        cache.store('key_{}'.format(i), [str(f)], str(tmp_path))
+
+    # Only the most recent entry fits in the cache
+    assert cache.entries() == ['key_2']
+
+    dest = tmp_path / 'restored'
+    assert cache.fetch('key_0', str(dest)) is None
+    restored = cache.fetch('key_2', str(dest))
+    assert restored == [str(dest / 'file_2.txt')]
+    assert (dest / 'file_2.txt').read_text() == 'x'*1000
+
+#------------------------------------------------------------------------------
+def test_cache_fetch_replaces_file(tmp_path):
+    cache = BuildCache(folder = str(tmp_path / 'cache'))
+    f = tmp_path / 'lib.so'
+    f.write_text('new')
+    cache.store('key', [str(f)], str(tmp_path))
+
+    # A file which is already in use (e.g. a loaded library) is replaced by
+    # a new file instead of being overwritten in place
+    dest = tmp_path / 'restored'
+    dest.mkdir()
+    target = dest / 'lib.so'
+    target.write_text('old')
+    with open(str(target), 'r') as in_use:
+        assert cache.fetch('key', str(dest)) == [str(target)]
+        assert in_use.read() == 'old'
+    assert target.read_text() == 'new'
+
+#------------------------------------------------------------------------------
+def test_cache_key_compiler_version(tmp_path):
+    source = tmp_path / 'mod.py'
+    source.write_text('x = 1\n')
+    compiler = tmp_path / 'compiler'
+    keys = []
+    for i, version in enumerate(('1.0', '2.0')):
+        # The same compiler is upgraded
+        compiler.write_text('#!/bin/sh\necho "compiler {}"\n'.format(version))
+        compiler.chmod(0o755)
+        os.utime(str(compiler), ns = (i, i))
+        keys.append(compute_cache_key(str(source), compiler = str(compiler)))
+    assert keys[0] != keys[1]
@@ -1,9 +1,13 @@
 # pylint: disable=missing-function-docstring, missing-module-docstring/
 # coding: utf-8
 
+from concurrent.futures import ThreadPoolExecutor
+
 import pytest
+import numpy as np
+
 from pyccel.epyccel import epyccel
-from pyccel.decorators import private
+from pyccel.decorators import private, nogil, types
 
 def test_private(language):
     @private
@@ -15,3 +19,36 @@ def test_private(language):
     with pytest.raises(NotImplementedError):
         g()
 
+
+def test_nogil(language):
+    @nogil
+    @types('int')
+    def f(n):
+        s = 0
+        for i in range(n):
+            s += i % 7
+        return s
+
+    g = epyccel(f, language=language)
+
+    with ThreadPoolExecutor(4) as executor:
+        results = list(executor.map(g, range(1000)))
+    assert results == [f(n) for n in range(1000)]
+
+def test_nogil_arrays(language):
+    @types('real[:]', 'real')
+    def f(x, a):
+        for i in range(x.shape[0]):
+            x[i] = x[i] * a
+        return x.shape[0]
+
+    g = epyccel(f, language=language)
+
+    # The GIL is only released for the large arrays
+    sizes  = [10, 1000] * 100
+    arrays = [np.ones(n) for n in sizes]
+    with ThreadPoolExecutor(4) as executor:
+        results = list(executor.map(g, arrays, [float(i) for i in range(200)]))
+    assert results == sizes
+    for i, x in enumerate(arrays):
+        assert np.array_equal(x, np.full(x.shape[0], float(i)))
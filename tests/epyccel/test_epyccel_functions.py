@@ -6,7 +6,6 @@ import numpy as np
 
 from pyccel.epyccel import epyccel
 from pyccel.decorators import types
-from pyccel.errors.errors import PyccelError
 
 def test_func_no_args_1(language):
     '''test function with return value but no args'''
@@ -115,8 +114,9 @@ def test_decorator_f3():
         y[:] = x - 1
         return y
 
-    with pytest.raises(PyccelError):
-        epyccel(f3)
+    f = epyccel(f3)
+    x = np.arange(5)
+    assert np.array_equal(f(x), f3(x))
 
 #------------------------------------------------------------------------------
 def test_decorator_f4():
@@ -127,8 +127,9 @@ def test_decorator_f4():
         y[:] = x - 1.0
         return y
 
-    with pytest.raises(PyccelError):
-        epyccel(f4)
+    f = epyccel(f4)
+    x = np.arange(12.).reshape(3, 4)
+    assert np.array_equal(f(x), f4(x))
 
 #------------------------------------------------------------------------------
 def test_decorator_f5(language):
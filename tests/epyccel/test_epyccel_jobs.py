@@ -0,0 +1,62 @@
+# pylint: disable=missing-function-docstring, missing-module-docstring/
+# coding: utf-8
+import threading
+import numpy as np
+import pytest
+
+from pyccel.epyccel import epyccel
+from pyccel.decorators import types
+from pyccel.codegen.utilities import CompileGraph
+
+#------------------------------------------------------------------------------
+def test_parallel_compilation(language):
+    @types('int')
+    def f1(n):
+        import numpy as np
+        x = np.ones(n)
+        s = 0.0
+        for i in range(n):
+            s += x[i]*i
+        return s
+
+    f = epyccel(f1, language = language, jobs = 4)
+    assert np.isclose(f(5), f1(5))
+
+#------------------------------------------------------------------------------
+def test_compile_graph_order():
+    order = []
+    # a and b can only pass the barrier if they run at the same time
+    barrier = threading.Barrier(2, timeout = 60)
+    def job(name, sync = False):
+        if sync:
+            barrier.wait()
+        order.append(name)
+
+    graph = CompileGraph(jobs = 3)
+    graph.add_job('a', job, 'a', sync = True)
+    graph.add_job('b', job, 'b', sync = True)
+    graph.add_job('c', job, 'c', depends = ['a', 'b'])
+    graph.run()
+
+    assert sorted(order) == ['a', 'b', 'c']
+    assert order.index('c') > order.index('a')
+    assert order.index('c') > order.index('b')
+
+    # Jobs which ran in a previous call can be used as dependencies
+    graph.add_job('d', job, 'd', depends = ['c'])
+    graph.run()
+    assert order[-1] == 'd'
+
+#------------------------------------------------------------------------------
+def test_compile_graph_failure():
+    def fail():
+        raise RuntimeError('compilation failed')
+
+    graph = CompileGraph(jobs = 2)
+    graph.add_job('ok', lambda : None)
+    graph.add_job('fail', fail)
+    graph.add_job('after', lambda : None, depends = ['fail'])
+
+    with pytest.raises(RuntimeError):
+        graph.run()
+    assert graph.failed_job == 'fail'
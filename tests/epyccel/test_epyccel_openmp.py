@@ -241,13 +241,6 @@ def test_omp_matmul_2d_2d(language):
 
     assert np.array_equal(y1, y2)
 
-@pytest.mark.parametrize( 'language', [
-        pytest.param("c", marks = [
-            pytest.mark.xfail(reason="Numpy Arrays not implemented in C !"),
-            pytest.mark.c]),
-        pytest.param("fortran", marks = pytest.mark.fortran)
-    ]
-)
 def test_omp_arraysum(language):
     f1 = epyccel(openmp.omp_arraysum, accelerator='openmp', language=language)
     set_num_threads = epyccel(openmp.set_num_threads, accelerator='openmp', language=language)
@@ -258,9 +251,7 @@ def test_omp_arraysum(language):
     assert f1(x) == np.sum(x)
 
 @pytest.mark.parametrize( 'language', [
-        pytest.param("c", marks = [
-            pytest.mark.xfail(reason="Numpy Arrays not implemented in C !"),
-            pytest.mark.c]),
+        pytest.param("c", marks = pytest.mark.c),
         pytest.param("fortran", marks = pytest.mark.fortran)
     ]
 )
@@ -272,3 +263,148 @@ def test_omp_arraysum_single(language):
     x = random.randint(20, size=(10))
 
     assert f1(x) == np.sum(x)
+
+def test_omp_ufunc(language):
+    f1 = epyccel(openmp.omp_ufunc, accelerator='openmp', language=language)
+    set_num_threads = epyccel(openmp.set_num_threads, accelerator='openmp', language=language)
+    set_num_threads(4)
+    # Below and above the size from which the loop runs in parallel
+    for n in (10, 100001):
+        x = np.random.random(n)
+        y = np.random.random(n)
+        assert np.allclose(f1(x, y), x * y + 1.0)
+    # The output overlaps the inputs: the loop must not run in parallel
+    x = np.ones(100001)
+    assert np.allclose(f1.accumulate(x), np.arange(1, 100002))
+    assert f1.reduce(x) == 100001
+
+@pytest.mark.parametrize( 'language', [
+        pytest.param("c", marks = [
+            pytest.mark.xfail(reason="Numpy Arrays not implemented in C !"),
+            pytest.mark.c]),
+        pytest.param("fortran", marks = pytest.mark.fortran)
+    ]
+)
+def test_omp_array_expression(language):
+    f1 = epyccel(openmp.omp_array_expression, accelerator='openmp', language=language)
+    set_num_threads = epyccel(openmp.set_num_threads, accelerator='openmp', language=language)
+    set_num_threads(4)
+    for n in (10, 100001):
+        x = np.random.random(n)
+        y = np.random.random(n)
+        z = np.zeros(n)
+        f1(x, y, z)
+        assert np.allclose(z, x * y + 1.0)
+
+@pytest.mark.parametrize( 'accelerator', [None, 'openmp'] )
+def test_prange(language, accelerator):
+    f1 = epyccel(openmp.prange_private, accelerator=accelerator, language=language)
+    f2 = epyccel(openmp.prange_reduction, accelerator=accelerator, language=language)
+    if accelerator:
+        set_num_threads = epyccel(openmp.set_num_threads, accelerator='openmp', language=language)
+        set_num_threads(4)
+    x = np.random.random(1001)
+    y1 = np.zeros(1001)
+    y2 = np.zeros(1001)
+    f1(x, y1)
+    openmp.prange_private(x, y2)
+    assert np.allclose(y1, y2)
+
+    a = np.random.random((101, 7))
+    assert np.allclose(f2(a), openmp.prange_reduction(a))
+
+def test_omp_simd(language):
+    f1 = epyccel(openmp.omp_simd, accelerator='openmp', language=language)
+    f2 = epyccel(openmp.omp_parallel_for_simd, accelerator='openmp', language=language)
+    set_num_threads = epyccel(openmp.set_num_threads, accelerator='openmp', language=language)
+    set_num_threads(4)
+    x = np.random.random(1001)
+    y1 = np.random.random(1001)
+    y2 = np.copy(y1)
+    f1(x, y1, 2.0)
+    openmp.omp_simd(x, y2, 2.0)
+    assert np.allclose(y1, y2)
+    assert np.isclose(f2(x), np.sum(x))
+
+def test_omp_atomic_critical(language):
+    f1 = epyccel(openmp.omp_atomic, accelerator='openmp', language=language)
+    f2 = epyccel(openmp.omp_critical, accelerator='openmp', language=language)
+    set_num_threads = epyccel(openmp.set_num_threads, accelerator='openmp', language=language)
+    set_num_threads(4)
+    x = np.random.randint(10, size=1000)
+    hist = np.zeros(10, dtype=int)
+    f1(x, hist)
+    assert np.array_equal(hist, np.bincount(x, minlength=10))
+
+    y = np.random.random(1000)
+    assert f2(y) == np.max(y)
+
+def test_omp_sections_tasks(language):
+    f1 = epyccel(openmp.omp_sections, accelerator='openmp', language=language)
+    f2 = epyccel(openmp.omp_tasks, accelerator='openmp', language=language)
+    f3 = epyccel(openmp.omp_taskloop, accelerator='openmp', language=language)
+    set_num_threads = epyccel(openmp.set_num_threads, accelerator='openmp', language=language)
+    set_num_threads(4)
+    assert f1(100) == openmp.omp_sections(100)
+    assert f2(100) == openmp.omp_tasks(100)
+
+    x1 = np.random.random(1000)
+    x2 = np.copy(x1)
+    f3(x1)
+    assert np.allclose(x1, 2.0 * x2)
+
+def test_auto_parallel(language, capsys):
+    f1 = epyccel(openmp.auto_parallel_stencil, auto_parallel=True, language=language)
+    f2 = epyccel(openmp.auto_parallel_reductions, auto_parallel=True, language=language)
+    f3 = epyccel(openmp.auto_parallel_prefix_sum, auto_parallel=True, language=language)
+    f4 = epyccel(openmp.auto_parallel_pointer_results, auto_parallel=True, language=language)
+    report = capsys.readouterr().out
+    assert 'the loop over i is parallelised private(j, t) if y and x do not overlap' in report
+    assert 'the loop over i is parallelised reduction(+: s) reduction(max: m)' in report
+    assert 'the loop over i is not parallelised: the iterations may access the same element of x' in report
+    assert 'the loop over i is not parallelised: t is stored in a pointer in C' in report
+
+    set_num_threads = epyccel(openmp.set_num_threads, accelerator='openmp', language=language)
+    set_num_threads(4)
+    x = np.random.random((101, 53))
+    y1 = np.zeros_like(x)
+    y2 = np.zeros_like(x)
+    f1(x, y1)
+    openmp.auto_parallel_stencil(x, y2)
+    assert np.allclose(y1, y2)
+
+    z = np.random.random(1001)
+    assert np.allclose(f2(z), openmp.auto_parallel_reductions(z))
+
+    z1 = np.random.random(1001)
+    z2 = np.copy(z1)
+    f3(z1)
+    openmp.auto_parallel_prefix_sum(z2)
+    assert np.allclose(z1, z2)
+
+    z1 = np.random.random(1001)
+    z2 = np.copy(z1)
+    assert f4(z1) == openmp.auto_parallel_pointer_results(z2)
+    assert np.allclose(z1, z2)
+
+@pytest.mark.c
+def test_auto_parallel_aliased_arguments(capsys):
+    f1 = epyccel(openmp.auto_parallel_shift, auto_parallel=True, language='c')
+    report = capsys.readouterr().out
+    assert 'the loop over i is parallelised if y and x do not overlap' in report
+
+    set_num_threads = epyccel(openmp.set_num_threads, accelerator='openmp', language='c')
+    set_num_threads(4)
+    # The arguments are views on the same data: the loop runs serially
+    x1 = np.arange(100001.)
+    x2 = np.copy(x1)
+    f1(x1[:-1], x1)
+    openmp.auto_parallel_shift(x2[:-1], x2)
+    assert np.array_equal(x1, x2)
+
+    # The arguments are disjoint
+    y1 = np.zeros(100002)
+    y2 = np.zeros(100002)
+    f1(x1, y1)
+    openmp.auto_parallel_shift(x1, y2)
+    assert np.array_equal(y1, y2)
@@ -0,0 +1,78 @@
+# pylint: disable=missing-function-docstring, missing-module-docstring/
+import numpy as np
+import pytest
+from pyccel.epyccel import epyccel
+
+import modules.ufuncs as mod
+
+@pytest.fixture(scope="module", params=[
+        pytest.param("fortran", marks = pytest.mark.fortran),
+        pytest.param("c", marks = pytest.mark.c),
+    ]
+)
+def modnew(request):
+    return epyccel(mod, language=request.param)
+
+def test_ufunc(modnew):
+    assert isinstance(modnew.add, np.ufunc)
+    assert (modnew.add.nin, modnew.add.nout) == (2, 1)
+    assert modnew.add.types == ['ll->l', 'dd->d']
+    assert modnew.clip.__doc__.strip().endswith('Clip the values to the interval [0, 1]')
+    # The other functions are still exposed as usual
+    assert modnew.increment(1) == mod.increment(1)
+
+def test_broadcasting(modnew):
+    x = np.linspace(-1.0, 2.0, 12).reshape(3, 4)
+    assert np.array_equal(modnew.add(x, 1.0), mod.add(x, 1.0))
+    assert np.array_equal(modnew.add(x, x[0]), mod.add(x, x[0]))
+    assert np.array_equal(modnew.add(x[:, ::-2], x[:, :1]), mod.add(x[:, ::-2], x[:, :1]))
+    assert np.array_equal(modnew.add(np.arange(3), np.arange(4)[:, None]),
+                          mod.add(np.arange(3), np.arange(4)[:, None]))
+    assert np.array_equal(modnew.clip(x), np.vectorize(mod.clip)(x))
+    assert modnew.clip(2.5) == mod.clip(2.5)
+
+def test_types(modnew):
+    for x in [np.arange(3, dtype=np.int32), np.linspace(0.0, 1.0, 3), np.array([1+2j, 3j])]:
+        y = modnew.twice(x)
+        assert y.dtype == x.dtype
+        assert np.array_equal(y, x + x)
+    # The inputs are cast to the smallest type of the signatures
+    assert modnew.twice(np.arange(3)).dtype == np.float64
+    assert modnew.add(np.arange(3), np.ones(3)).dtype == np.float64
+    c = np.array([True, False, True])
+    assert np.array_equal(modnew.where(c, 1.0, np.arange(3.0)), np.where(c, 1.0, np.arange(3.0)))
+    with pytest.raises(TypeError):
+        modnew.clip(np.array(['a']))
+
+def test_out(modnew):
+    x = np.linspace(-1.0, 2.0, 7)
+    out = np.empty(7)
+    assert modnew.clip(x, out=out) is out
+    assert np.array_equal(out, np.vectorize(mod.clip)(x))
+    low, high = modnew.bounds(x)
+    assert np.array_equal(low, x - 1.0)
+    assert np.array_equal(high, x + 1.0)
+
+def test_methods(modnew):
+    x = np.arange(10)
+    assert modnew.add.reduce(x) == np.add.reduce(x)
+    assert np.array_equal(modnew.add.reduce(np.ones((3, 4)), axis=1), np.full(3, 4.0))
+    assert np.array_equal(modnew.add.accumulate(x), np.add.accumulate(x))
+    assert np.array_equal(modnew.add.outer(x, x), np.add.outer(x, x))
+
+def test_gufunc(modnew):
+    assert modnew.matvec.signature == '(m,n),(n)->(m)'
+    x = np.arange(12.0).reshape(3, 4)
+    a = np.array([1.0, -2.0, 0.5])
+    assert np.array_equal(modnew.scale(x, a), x * a[:, None])
+    assert np.array_equal(modnew.total(x), x.sum(axis=1))
+    assert np.array_equal(modnew.total(x[:, ::-2]), x[:, ::-2].sum(axis=1))
+    assert np.array_equal(modnew.total(np.arange(6).reshape(2, 3)), np.arange(6).reshape(2, 3).sum(axis=1))
+
+    m = np.random.random((5, 3, 4))
+    v = np.random.random(4)
+    assert np.allclose(modnew.matvec(m, v), m @ v)
+    assert np.allclose(modnew.matvec(np.asfortranarray(m[0]), v), m[0] @ v)
+    assert np.allclose(modnew.matvec(m[:, ::-1, ::2], v[::2]), m[:, ::-1, ::2] @ v[::2])
+    with pytest.raises(ValueError):
+        modnew.matvec(m, np.ones(3))
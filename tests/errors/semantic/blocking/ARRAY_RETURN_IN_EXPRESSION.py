@@ -0,0 +1,13 @@
+# pylint: disable=missing-function-docstring, missing-module-docstring/
+from pyccel.decorators import types
+
+@types('int')
+def f(n):
+    from numpy import zeros
+    x = zeros(n)
+    return x
+
+@types('int')
+def g(n):
+    y = f(n) + 1.0
+    return y
@@ -0,0 +1,9 @@
+# pylint: disable=missing-function-docstring, missing-module-docstring/
+from pyccel.decorators import types, stack_array
+
+@stack_array('x')
+@types('int')
+def f(n):
+    from numpy import zeros
+    x = zeros(n)
+    return x
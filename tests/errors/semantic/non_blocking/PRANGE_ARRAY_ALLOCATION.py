@@ -0,0 +1,9 @@
+# pylint: disable=missing-function-docstring, missing-module-docstring/
+from numpy import zeros
+from pyccel.decorators import types, prange
+
+@types('real[:]')
+def f(x):
+    for i in prange(x.shape[0]):
+        y = zeros(3)
+        y[0] = x[i]
@@ -0,0 +1,10 @@
+# pylint: disable=missing-function-docstring, missing-module-docstring/
+from pyccel.decorators import types, prange
+
+@types('real[:]')
+def f(x):
+    s = 0.0
+    for i in prange(x.shape[0]):
+        s += x[i]
+        s = s * 1.0
+    return s
@@ -149,10 +149,10 @@ int32_t test_indexing_int64(void)
                 1, 0, 0, 1, 200, 33, 5, 57,
                 62, 70, 103, 141, 122, 26, 36, 82,
                 8, 10, 4115, 22, 1, 11, 1, 19};
-    int32_t m_1_shape[] = {5, 8};
+    int64_t m_1_shape[] = {5, 8};
     t_ndarray x;
-    int32_t index;
-    int32_t c_index;
+    int64_t index;
+    int64_t c_index;
     int64_t value;
     int64_t c_value;
 
@@ -162,7 +162,7 @@ int32_t test_indexing_int64(void)
     index = 3 * x.strides[0] + 2 * x.strides[1];
     c_index = 26;
     my_assert(index , c_index, "testing the strides");
-    my_assert(get_index(x, 3, 2) , c_index, "testing the indexing function");
+    my_assert(get_index(x, (int64_t)3, (int64_t)2) , c_index, "testing the indexing function");
     // testing the value with the index [3, 2]
     value = x.nd_int64[index];
     c_value = 103;
@@ -178,10 +178,10 @@ int32_t test_indexing_int32(void)
                 1, 0, 0, 1, 200, 33, 5, 57,
                 62, 70, 103, 141, 122, 26, 36, 82,
                 8, 10, 4115, 22, 1, 11, 1, 19};
-    int32_t m_1_shape[] = {5, 8};
+    int64_t m_1_shape[] = {5, 8};
     t_ndarray x;
-    int32_t index;
-    int32_t c_index;
+    int64_t index;
+    int64_t c_index;
     int32_t value;
     int32_t c_value;
 
@@ -191,7 +191,7 @@ int32_t test_indexing_int32(void)
     index = 3 * x.strides[0] + 2 * x.strides[1];
     c_index = 26;
     my_assert(index , c_index, "testing the strides");
-    my_assert(get_index(x, 3, 2) , c_index, "testing the indexing function");
+    my_assert(get_index(x, (int64_t)3, (int64_t)2) , c_index, "testing the indexing function");
     // testing the value with the index [3, 2]
     value = x.nd_int32[index];
     c_value = 103;
@@ -207,10 +207,10 @@ int32_t test_indexing_int16(void)
                 1, 0, 0, 1, 200, 33, 5, 57,
                 62, 70, 103, 141, 122, 26, 36, 82,
                 8, 10, 4115, 22, 1, 11, 1, 19};
-    int32_t m_1_shape[] = {5, 8};
+    int64_t m_1_shape[] = {5, 8};
     t_ndarray x;
-    int32_t index;
-    int32_t c_index;
+    int64_t index;
+    int64_t c_index;
     int16_t value;
     int16_t c_value;
 
@@ -220,7 +220,7 @@ int32_t test_indexing_int16(void)
     index = 3 * x.strides[0] + 2 * x.strides[1];
     c_index = 26;
     my_assert(index , c_index, "testing the strides");
-    my_assert(get_index(x, 3, 2) , c_index, "testing the indexing function");
+    my_assert(get_index(x, (int64_t)3, (int64_t)2) , c_index, "testing the indexing function");
     // testing the value with the index [3, 2]
     value = x.nd_int16[index];
     c_value = 103;
@@ -236,10 +236,10 @@ int32_t test_indexing_int8(void)
                 1, 0, 0, 1, 200, 33, 5, 57,
                 62, 70, 103, 141, 122, 26, 36, 82,
                 8, 10, 251, 22, 1, 11, 1, 19};
-    int32_t m_1_shape[] = {5, 8};
+    int64_t m_1_shape[] = {5, 8};
     t_ndarray x;
-    int32_t index;
-    int32_t c_index;
+    int64_t index;
+    int64_t c_index;
     int8_t value;
     int8_t c_value;
 
@@ -249,7 +249,7 @@ int32_t test_indexing_int8(void)
     index = 3 * x.strides[0] + 2 * x.strides[1];
     c_index = 26;
     my_assert(index , c_index, "testing the strides");
-    my_assert(get_index(x, 3, 2) , c_index, "testing the indexing function");
+    my_assert(get_index(x, (int64_t)3, (int64_t)2) , c_index, "testing the indexing function");
     // testing the value with the index [3, 2]
     value = x.nd_int8[index];
     c_value = 103;
@@ -265,10 +265,10 @@ int32_t test_indexing_double(void)
                     1.02, 0.25, 0.00005, 1, 200, 33, 5, 57,
                     62, 70, 103.009, 141, 122, 26.50, 36.334, 82,
                     8.44002, 10.056, 4115, 22.1, 1.1102, 011.25, 1.01110005, 19};
-    int32_t m_1_shape[] = {5, 8};
+    int64_t m_1_shape[] = {5, 8};
     t_ndarray x;
-    int32_t index;
-    int32_t c_index;
+    int64_t index;
+    int64_t c_index;
     double value;
     double c_value;
 
@@ -278,7 +278,7 @@ int32_t test_indexing_double(void)
     index = 3 * x.strides[0] + 2 * x.strides[1];
     c_index = 26;
     my_assert(index , c_index, "testing the strides");
-    my_assert(get_index(x, 3, 2) , c_index, "testing the indexing function");
+    my_assert(get_index(x, (int64_t)3, (int64_t)2) , c_index, "testing the indexing function");
     // testing the value with the index [3, 2]
     value = x.nd_double[index];
     c_value = 103.009;
@@ -294,10 +294,10 @@ int32_t test_indexing_cdouble(void)
                             0.02827254+0.00432899*I,  0.06873651+0.24810741*I,
                             0.94040543+0.43508215*I,  0.58532094+0.67890618*I,
                             0.68742283+0.64951155*I,  0.15372315+0.89699101*I};
-    int32_t m_1_shape[] = {5, 2};
+    int64_t m_1_shape[] = {5, 2};
     t_ndarray x;
-    int32_t index;
-    int32_t c_index;
+    int64_t index;
+    int64_t c_index;
     double complex value;
     double complex c_value;
 
@@ -307,7 +307,7 @@ int32_t test_indexing_cdouble(void)
     index = 3 * x.strides[0] + 1 * x.strides[1];
     c_index = 7;
     my_assert(index , c_index, "testing the strides");
-    my_assert(get_index(x, 3, 1) , c_index, "testing the indexing function");
+    my_assert(get_index(x, (int64_t)3, (int64_t)1) , c_index, "testing the indexing function");
     // testing the value with the index [3, 1]
     value = x.nd_cdouble[index];
     c_value = 0.58532094+0.67890618*I;
@@ -323,10 +323,10 @@ int32_t test_indexing_cfloat(void)
                             0.02827254+0.00432899*I,  0.06873651+0.24810741*I,
                             0.94040543+0.43508215*I,  0.58532094+0.67890618*I,
                             0.68742283+0.64951155*I,  0.15372315+0.89699101*I};
-    int32_t m_1_shape[] = {5, 2};
+    int64_t m_1_shape[] = {5, 2};
     t_ndarray x;
-    int32_t index;
-    int32_t c_index;
+    int64_t index;
+    int64_t c_index;
     float complex value;
     float complex c_value;
 
@@ -336,7 +336,7 @@ int32_t test_indexing_cfloat(void)
     index = 3 * x.strides[0] + 1 * x.strides[1];
     c_index = 7;
     my_assert(index , c_index, "testing the strides");
-    my_assert(get_index(x, 3, 1) , c_index, "testing the indexing function");
+    my_assert(get_index(x, (int64_t)3, (int64_t)1) , c_index, "testing the indexing function");
     // testing the value with the index [3, 1]
     value = x.nd_cfloat[index];
     c_value = 0.58532094+0.67890618*I;
@@ -345,6 +345,27 @@ int32_t test_indexing_cfloat(void)
     return (0);
 }
 
+int32_t test_indexing_large_shape(void)
+{
+    int64_t m_1_shape[] = {3, 3000000000};
+    t_ndarray x;
+    int64_t index;
+    int64_t c_index;
+
+    // only the shape and the strides are computed, the data is not allocated
+    x.nd = 2;
+    x.shape[0] = m_1_shape[0];
+    x.shape[1] = m_1_shape[1];
+    x.strides[0] = m_1_shape[1];
+    x.strides[1] = 1;
+    // testing the index [2, 2999999999]
+    index = 2 * x.strides[0] + 2999999999 * x.strides[1];
+    c_index = 8999999999;
+    my_assert(index , c_index, "testing the strides of an array with more than 2^31 elements");
+    my_assert(get_index(x, (int64_t)2, (int64_t)2999999999) , c_index, "testing the indexing function on an array with more than 2^31 elements");
+    return (0);
+}
+
 /* 
 **  slicing tests
 */
@@ -359,10 +380,10 @@ int32_t test_slicing_int64(void)
                 70, 103, 141, 122, 26,
                 36, 82, 8, 10, 4115,
                 22, 1, 11, 1, 19};
-    int32_t m_1_shape[] = {8, 5};
+    int64_t m_1_shape[] = {8, 5};
     t_ndarray x;
     t_ndarray xview;
-    int32_t c_index;
+    int64_t c_index;
     int64_t value;
     int64_t c_value;
 
@@ -370,9 +391,9 @@ int32_t test_slicing_int64(void)
     memcpy(x.raw_data, m_1, x.buffer_size);
     xview = array_slicing(x, new_slice(1, 2, 1), new_slice(0, 5, 2));
     c_index = 5;
-    for (int32_t i = 0; i < xview.shape[0]; i++)
+    for (int64_t i = 0; i < xview.shape[0]; i++)
     {
-        for (int32_t j = 0; j < xview.shape[1]; j++)
+        for (int64_t j = 0; j < xview.shape[1]; j++)
         {
             value = xview.nd_int64[get_index(xview, i, j)];
             c_value = m_1[c_index];
@@ -382,11 +403,10 @@ int32_t test_slicing_int64(void)
         }
     }
     c_value = 1337;
-    xview.nd_int64[get_index(xview, 0, 1)] = c_value;
-    value = x.nd_int64[get_index(x, 1, 2)];
+    xview.nd_int64[get_index(xview, (int64_t)0, (int64_t)1)] = c_value;
+    value = x.nd_int64[get_index(x, (int64_t)1, (int64_t)2)];
     my_assert(value , c_value, "testing xview assignment");
     free_array(x);
-    free_pointer(xview);
     return (0);
 }
 
@@ -400,10 +420,10 @@ int32_t test_slicing_int32(void)
                 70, 103, 141, 122, 26,
                 36, 82, 8, 10, 4115,
                 22, 1, 11, 1, 19};
-    int32_t m_1_shape[] = {8, 5};
+    int64_t m_1_shape[] = {8, 5};
     t_ndarray x;
     t_ndarray xview;
-    int32_t c_index;
+    int64_t c_index;
     int32_t value;
     int32_t c_value;
 
@@ -411,9 +431,9 @@ int32_t test_slicing_int32(void)
     memcpy(x.raw_data, m_1, x.buffer_size);
     xview = array_slicing(x, new_slice(1, 2, 1), new_slice(0, 5, 2));
     c_index = 5;
-    for (int32_t i = 0; i < xview.shape[0]; i++)
+    for (int64_t i = 0; i < xview.shape[0]; i++)
     {
-        for (int32_t j = 0; j < xview.shape[1]; j++)
+        for (int64_t j = 0; j < xview.shape[1]; j++)
         {
             value = xview.nd_int32[get_index(xview, i, j)];
             c_value = m_1[c_index];
@@ -423,11 +443,10 @@ int32_t test_slicing_int32(void)
         }
     }
     c_value = 1337;
-    xview.nd_int32[get_index(xview, 0, 1)] = c_value;
-    value = x.nd_int32[get_index(x, 1, 2)];
+    xview.nd_int32[get_index(xview, (int64_t)0, (int64_t)1)] = c_value;
+    value = x.nd_int32[get_index(x, (int64_t)1, (int64_t)2)];
     my_assert(value , c_value, "testing xview assignment");
     free_array(x);
-    free_pointer(xview);
     return (0);
 }
 int32_t test_slicing_int16(void)
@@ -440,10 +459,10 @@ int32_t test_slicing_int16(void)
                 70, 103, 141, 122, 26,
                 36, 82, 8, 10, 4115,
                 22, 1, 11, 1, 19};
-    int32_t m_1_shape[] = {8, 5};
+    int64_t m_1_shape[] = {8, 5};
     t_ndarray x;
     t_ndarray xview;
-    int32_t c_index;
+    int64_t c_index;
     int16_t value;
     int16_t c_value;
 
@@ -451,9 +470,9 @@ int32_t test_slicing_int16(void)
     memcpy(x.raw_data, m_1, x.buffer_size);
     xview = array_slicing(x, new_slice(1, 2, 1), new_slice(0, 5, 2));
     c_index = 5;
-    for (int32_t i = 0; i < xview.shape[0]; i++)
+    for (int64_t i = 0; i < xview.shape[0]; i++)
     {
-        for (int32_t j = 0; j < xview.shape[1]; j++)
+        for (int64_t j = 0; j < xview.shape[1]; j++)
         {
             value = xview.nd_int16[get_index(xview, i, j)];
             c_value = m_1[c_index];
@@ -463,11 +482,10 @@ int32_t test_slicing_int16(void)
         }
     }
     c_value = 1337;
-    xview.nd_int16[get_index(xview, 0, 1)] = c_value;
-    value = x.nd_int16[get_index(x, 1, 2)];
+    xview.nd_int16[get_index(xview, (int64_t)0, (int64_t)1)] = c_value;
+    value = x.nd_int16[get_index(x, (int64_t)1, (int64_t)2)];
     my_assert(value , c_value, "testing xview assignment");
     free_array(x);
-    free_pointer(xview);
     return (0);
 }
 
@@ -481,10 +499,10 @@ int32_t test_slicing_int8(void)
                 70, 103, 141, 122, 26,
                 36, 82, 8, 10, 251,
                 22, 1, 11, 1, 19};
-    int32_t m_1_shape[] = {8, 5};
+    int64_t m_1_shape[] = {8, 5};
     t_ndarray x;
     t_ndarray xview;
-    int32_t c_index;
+    int64_t c_index;
     int8_t value;
     int8_t c_value;
 
@@ -492,9 +510,9 @@ int32_t test_slicing_int8(void)
     memcpy(x.raw_data, m_1, x.buffer_size);
     xview = array_slicing(x, new_slice(1, 2, 1), new_slice(0, 5, 2));
     c_index = 5;
-    for (int32_t i = 0; i < xview.shape[0]; i++)
+    for (int64_t i = 0; i < xview.shape[0]; i++)
     {
-        for (int32_t j = 0; j < xview.shape[1]; j++)
+        for (int64_t j = 0; j < xview.shape[1]; j++)
         {
             value = xview.nd_int8[get_index(xview, i, j)];
             c_value = m_1[c_index];
@@ -504,11 +522,10 @@ int32_t test_slicing_int8(void)
         }
     }
     c_value = 133;
-    xview.nd_int8[get_index(xview, 0, 1)] = c_value;
-    value = x.nd_int8[get_index(x, 1, 2)];
+    xview.nd_int8[get_index(xview, (int64_t)0, (int64_t)1)] = c_value;
+    value = x.nd_int8[get_index(x, (int64_t)1, (int64_t)2)];
     my_assert(value , c_value, "testing xview assignment");
     free_array(x);
-    free_pointer(xview);
     return (0);
 }
 
@@ -522,10 +539,10 @@ int32_t test_slicing_double(void)
                     103.009, 141, 122, 26.50, 36.334,
                     82, 8.44002, 10.056, 4115, 22.1,
                     1.1102, 011.25, 1.01110005, 19, 70};
-    int32_t m_1_shape[] = {8, 5};
+    int64_t m_1_shape[] = {8, 5};
     t_ndarray x;
     t_ndarray xview;
-    int32_t c_index;
+    int64_t c_index;
     double value;
     double c_value;
 
@@ -533,9 +550,9 @@ int32_t test_slicing_double(void)
     memcpy(x.raw_data, m_1, x.buffer_size);
     xview = array_slicing(x, new_slice(1, 2, 1), new_slice(0, 5, 2));
     c_index = 5;
-    for (int32_t i = 0; i < xview.shape[0]; i++)
+    for (int64_t i = 0; i < xview.shape[0]; i++)
     {
-        for (int32_t j = 0; j < xview.shape[1]; j++)
+        for (int64_t j = 0; j < xview.shape[1]; j++)
         {
             value = xview.nd_double[get_index(xview, i, j)];
             c_value = m_1[c_index];
@@ -545,11 +562,10 @@ int32_t test_slicing_double(void)
         }
     }
     c_value = 0.1337;
-    xview.nd_double[get_index(xview, 0, 1)] = c_value;
-    value = x.nd_double[get_index(x, 1, 2)];
+    xview.nd_double[get_index(xview, (int64_t)0, (int64_t)1)] = c_value;
+    value = x.nd_double[get_index(x, (int64_t)1, (int64_t)2)];
     my_assert(value, c_value, "testing xview assignment");
     free_array(x);
-    free_pointer(xview);
     return (0);
 }
 
@@ -559,10 +575,10 @@ int32_t test_slicing_cdouble(void)
                     0.37 + 0.588*I,  0.92+0.57*I, 0.93+0.30*I,  0.54+0.09*I, 0.02+0.01*I,
                     0.03+0.24*I, 0.94+0.43*I,  0.58+0.67*I, 0.68+0.64*I,  0.15+0.89*I
                     };
-    int32_t m_1_shape[] = {2, 5};
+    int64_t m_1_shape[] = {2, 5};
     t_ndarray x;
     t_ndarray xview;
-    int32_t c_index;
+    int64_t c_index;
     double complex value;
     double complex c_value;
 
@@ -570,9 +586,9 @@ int32_t test_slicing_cdouble(void)
     memcpy(x.raw_data, m_1, x.buffer_size);
     xview = array_slicing(x, new_slice(1, 2, 1), new_slice(0, 5, 2));
     c_index = 5;
-    for (int32_t i = 0; i < xview.shape[0]; i++)
+    for (int64_t i = 0; i < xview.shape[0]; i++)
     {
-        for (int32_t j = 0; j < xview.shape[1]; j++)
+        for (int64_t j = 0; j < xview.shape[1]; j++)
         {
             value = xview.nd_cdouble[get_index(xview, i, j)];
             c_value = m_1[c_index];
@@ -582,11 +598,72 @@ int32_t test_slicing_cdouble(void)
         }
     }
     c_value = 0.13 + 0.37*I;
-    xview.nd_cdouble[get_index(xview, 0, 1)] = c_value;
-    value = x.nd_cdouble[get_index(x, 1, 2)];
+    xview.nd_cdouble[get_index(xview, (int64_t)0, (int64_t)1)] = c_value;
+    value = x.nd_cdouble[get_index(x, (int64_t)1, (int64_t)2)];
     my_assert(value, c_value, "testing xview assignment");
     free_array(x);
-    free_pointer(xview);
+    return (0);
+}
+
+int32_t test_slicing_view_descriptor(void)
+{
+    int64_t m_1_shape[] = {8, 5};
+    t_ndarray x;
+    t_ndarray xview;
+    t_ndarray xalias;
+
+    x = array_create(2, m_1_shape, nd_int64);
+    xview = array_slicing(x, new_slice(1, 7, 2), new_slice(0, 5, 1));
+    // the view has its own shape and strides, the array is unchanged
+    my_assert(xview.shape[0], (int64_t)3, "testing the shape of the view");
+    my_assert(xview.strides[0], (int64_t)10, "testing the strides of the view");
+    my_assert(x.shape[0], (int64_t)8, "testing the shape of the array after slicing");
+    my_assert(x.strides[0], (int64_t)5, "testing the strides of the array after slicing");
+    alias_assign(&xalias, xview);
+    xview.shape[0] = 0;
+    my_assert(xalias.shape[0], (int64_t)3, "testing the shape of a pointer to the view");
+    my_assert((int32_t)(xalias.raw_data == xview.raw_data), (int32_t)1, "testing the data of a pointer to the view");
+    free_array(x);
+    return (0);
+}
+
+/* memory tests */
+
+int32_t test_array_create_aligned(void)
+{
+    int64_t m_1_shape[] = {3, 7};
+    t_ndarray x;
+
+    x = array_create(2, m_1_shape, nd_float);
+    my_assert((int64_t)((uintptr_t)x.raw_data % NDARRAY_ALIGNMENT), (int64_t)0, "testing the alignment of the data");
+    free_array(x);
+    return (0);
+}
+
+int32_t test_memory_pool(void)
+{
+    int64_t m_1_shape[] = {10, 10};
+    t_ndarray x;
+    t_ndarray y;
+    t_ndarray_memory_stats stats;
+    char *data;
+
+    ndarray_memory_stats_reset();
+    ndarray_pool_enable(true);
+    x = array_create(2, m_1_shape, nd_double);
+    data = x.raw_data;
+    free_array(x);
+    y = array_create(2, m_1_shape, nd_int64);
+    my_assert((int32_t)(y.raw_data == data), (int32_t)1, "testing the reuse of a buffer of the pool");
+    free_array(y);
+    stats = ndarray_memory_stats();
+    my_assert(stats.allocations, (int64_t)2, "testing the number of allocations");
+    my_assert(stats.pool_hits, (int64_t)1, "testing the number of buffers reused");
+    my_assert(stats.total_bytes, (int64_t)2048, "testing the number of bytes allocated");
+    my_assert(stats.peak_bytes, (int64_t)1024, "testing the peak of the memory allocated");
+    my_assert(stats.current_bytes, (int64_t)0, "testing the memory allocated after free");
+    ndarray_pool_enable(false);
+    ndarray_pool_release();
     return (0);
 }
 
@@ -594,10 +671,10 @@ int32_t test_slicing_cdouble(void)
 
 int32_t test_array_fill_int64(void)
 {
-    int32_t m_1_shape[] = {5, 2};
+    int64_t m_1_shape[] = {5, 2};
     t_ndarray x;
-    int32_t index;
-    int32_t c_index;
+    int64_t index;
+    int64_t c_index;
     int64_t value;
     int64_t c_value;
 
@@ -607,7 +684,7 @@ int32_t test_array_fill_int64(void)
     index = 3 * x.strides[0] + 1 * x.strides[1];
     c_index = 7;
     my_assert(index , c_index, "testing the strides");
-    my_assert(get_index(x, 3, 1) , c_index, "testing the indexing function");
+    my_assert(get_index(x, (int64_t)3, (int64_t)1) , c_index, "testing the indexing function");
     // testing the value with the index [3, 1]
     value = x.nd_int64[index];
     c_value = 32;
@@ -618,10 +695,10 @@ int32_t test_array_fill_int64(void)
 
 int32_t test_array_fill_int32(void)
 {
-    int32_t m_1_shape[] = {5, 2};
+    int64_t m_1_shape[] = {5, 2};
     t_ndarray x;
-    int32_t index;
-    int32_t c_index;
+    int64_t index;
+    int64_t c_index;
     int32_t value;
     int32_t c_value;
 
@@ -631,7 +708,7 @@ int32_t test_array_fill_int32(void)
     index = 3 * x.strides[0] + 1 * x.strides[1];
     c_index = 7;
     my_assert(index , c_index, "testing the strides");
-    my_assert(get_index(x, 3, 1) , c_index, "testing the indexing function");
+    my_assert(get_index(x, (int64_t)3, (int64_t)1) , c_index, "testing the indexing function");
     // testing the value with the index [3, 1]
     value = x.nd_int32[index];
     c_value = 32;
@@ -642,10 +719,10 @@ int32_t test_array_fill_int32(void)
 
 int32_t test_array_fill_int16(void)
 {
-    int32_t m_1_shape[] = {5, 2};
+    int64_t m_1_shape[] = {5, 2};
     t_ndarray x;
-    int32_t index;
-    int32_t c_index;
+    int64_t index;
+    int64_t c_index;
     int16_t value;
     int16_t c_value;
 
@@ -655,7 +732,7 @@ int32_t test_array_fill_int16(void)
     index = 3 * x.strides[0] + 1 * x.strides[1];
     c_index = 7;
     my_assert(index , c_index, "testing the strides");
-    my_assert(get_index(x, 3, 1) , c_index, "testing the indexing function");
+    my_assert(get_index(x, (int64_t)3, (int64_t)1) , c_index, "testing the indexing function");
     // testing the value with the index [3, 1]
     value = x.nd_int16[index];
     c_value = 32;
@@ -666,10 +743,10 @@ int32_t test_array_fill_int16(void)
 
 int32_t test_array_fill_int8(void)
 {
-    int32_t m_1_shape[] = {5, 2};
+    int64_t m_1_shape[] = {5, 2};
     t_ndarray x;
-    int32_t index;
-    int32_t c_index;
+    int64_t index;
+    int64_t c_index;
     int8_t value;
     int8_t c_value;
 
@@ -679,7 +756,7 @@ int32_t test_array_fill_int8(void)
     index = 3 * x.strides[0] + 1 * x.strides[1];
     c_index = 7;
     my_assert(index , c_index, "testing the strides");
-    my_assert(get_index(x, 3, 1) , c_index, "testing the indexing function");
+    my_assert(get_index(x, (int64_t)3, (int64_t)1) , c_index, "testing the indexing function");
     // testing the value with the index [3, 1]
     value = x.nd_int8[index];
     c_value = 32;
@@ -690,10 +767,10 @@ int32_t test_array_fill_int8(void)
 
 int32_t test_array_fill_double(void)
 {
-    int32_t m_1_shape[] = {5, 2};
+    int64_t m_1_shape[] = {5, 2};
     t_ndarray x;
-    int32_t index;
-    int32_t c_index;
+    int64_t index;
+    int64_t c_index;
     double value;
     double c_value;
 
@@ -703,7 +780,7 @@ int32_t test_array_fill_double(void)
     index = 3 * x.strides[0] + 1 * x.strides[1];
     c_index = 7;
     my_assert(index , c_index, "testing the strides");
-    my_assert(get_index(x, 3, 1) , c_index, "testing the indexing function");
+    my_assert(get_index(x, (int64_t)3, (int64_t)1) , c_index, "testing the indexing function");
     // testing the value with the index [3, 1]
     value = x.nd_double[index];
     c_value = 2.;
@@ -714,10 +791,10 @@ int32_t test_array_fill_double(void)
 
 int32_t test_array_fill_cdouble(void)
 {
-    int32_t m_1_shape[] = {5, 2};
+    int64_t m_1_shape[] = {5, 2};
     t_ndarray x;
-    int32_t index;
-    int32_t c_index;
+    int64_t index;
+    int64_t c_index;
     double complex value;
     double complex c_value;
 
@@ -727,7 +804,7 @@ int32_t test_array_fill_cdouble(void)
     index = 3 * x.strides[0] + 1 * x.strides[1];
     c_index = 7;
     my_assert(index , c_index, "testing the strides");
-    my_assert(get_index(x, 3, 1) , c_index, "testing the indexing function");
+    my_assert(get_index(x, (int64_t)3, (int64_t)1) , c_index, "testing the indexing function");
     // testing the value with the index [3, 1]
     value = x.nd_cdouble[index];
     c_value = 0.3+0.54*I;
@@ -740,10 +817,10 @@ int32_t test_array_fill_cdouble(void)
 
 int32_t test_array_zeros_double(void)
 {
-    int32_t m_1_shape[] = {5, 2};
+    int64_t m_1_shape[] = {5, 2};
     t_ndarray x;
-    int32_t index;
-    int32_t c_index;
+    int64_t index;
+    int64_t c_index;
     double value;
     double c_value;
 
@@ -753,7 +830,7 @@ int32_t test_array_zeros_double(void)
     index = 3 * x.strides[0] + 1 * x.strides[1];
     c_index = 7;
     my_assert(index , c_index, "testing the strides");
-    my_assert(get_index(x, 3, 1) , c_index, "testing the indexing function");
+    my_assert(get_index(x, (int64_t)3, (int64_t)1) , c_index, "testing the indexing function");
     // testing the value with the index [3, 1]
     value = x.nd_double[index];
     c_value = 0.;
@@ -764,10 +841,10 @@ int32_t test_array_zeros_double(void)
 
 int32_t test_array_zeros_int32(void)
 {
-    int32_t m_1_shape[] = {5, 2};
+    int64_t m_1_shape[] = {5, 2};
     t_ndarray x;
-    int32_t index;
-    int32_t c_index;
+    int64_t index;
+    int64_t c_index;
     int32_t value;
     int32_t c_value;
 
@@ -777,7 +854,7 @@ int32_t test_array_zeros_int32(void)
     index = 3 * x.strides[0] + 1 * x.strides[1];
     c_index = 7;
     my_assert(index , c_index, "testing the strides");
-    my_assert(get_index(x, 3, 1) , c_index, "testing the indexing function");
+    my_assert(get_index(x, (int64_t)3, (int64_t)1) , c_index, "testing the indexing function");
     // testing the value with the index [3, 1]
     value = x.nd_int32[index];
     c_value = 0;
@@ -788,10 +865,10 @@ int32_t test_array_zeros_int32(void)
 
 int32_t test_array_zeros_cdouble(void)
 {
-    int32_t m_1_shape[] = {5, 2};
+    int64_t m_1_shape[] = {5, 2};
     t_ndarray x;
-    int32_t index;
-    int32_t c_index;
+    int64_t index;
+    int64_t c_index;
     double complex value;
     double complex c_value;
 
@@ -801,7 +878,7 @@ int32_t test_array_zeros_cdouble(void)
     index = 3 * x.strides[0] + 1 * x.strides[1];
     c_index = 7;
     my_assert(index , c_index, "testing the strides");
-    my_assert(get_index(x, 3, 1) , c_index, "testing the indexing function");
+    my_assert(get_index(x, (int64_t)3, (int64_t)1) , c_index, "testing the indexing function");
     // testing the value with the index [3, 1]
     value = x.nd_cdouble[index];
     c_value = 0+0*I;
@@ -819,6 +896,7 @@ int32_t main(void)
     test_indexing_int16();
     test_indexing_int8();
     test_indexing_cdouble();
+    test_indexing_large_shape();
     /* slicing tests */
     test_slicing_double();
     test_slicing_int64();
@@ -826,6 +904,10 @@ int32_t main(void)
     test_slicing_int16();
     test_slicing_int8();
     test_slicing_cdouble();
+    test_slicing_view_descriptor();
+    /* memory tests */
+    test_array_create_aligned();
+    test_memory_pool();
     /* array_fill tests */
     test_array_fill_int64();
     test_array_fill_int32();
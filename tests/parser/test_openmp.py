@@ -1,11 +1,61 @@
 # pylint: disable=missing-function-docstring, missing-module-docstring/
 # coding: utf-8
 
-from pyccel.parser.syntax.openmp import parse
+from pyccel.parser.syntax.openmp import parse, grammar, omp_classes
+from pyccel.parser.syntax.basic  import get_metamodel
+from pyccel.ast.core import OMP_For_Loop, OMP_Parallel_For_Loop, OMP_Simd_Construct
+from pyccel.ast.core import OMP_Sections_Construct, OMP_Section_Construct
+from pyccel.ast.core import OMP_Task_Construct, OMP_TaskLoop_Construct, Omp_End_Clause
 
 def test_parallel():
     d = parse(stmts='#$ omp parallel private(idx)')
 
+def test_loop():
+    d = parse(stmts='#$ omp parallel for simd reduction(max: m) num_threads(4)')
+    assert isinstance(d, OMP_Parallel_For_Loop)
+    assert d.txt == ' simd reduction(max: m) num_threads(4)'
+
+    d = parse(stmts='#$ omp for simdlen(4)')
+    assert isinstance(d, OMP_For_Loop)
+    assert d.txt == ' simdlen(4)'
+
+    d = parse(stmts='#$ omp simd aligned(x, y: 64) safelen(8)')
+    assert isinstance(d, OMP_Simd_Construct)
+    assert d.txt == 'simd aligned(x, y: 64) safelen(8)'
+
+    d = parse(stmts='#$ omp end parallel for simd')
+    assert isinstance(d, Omp_End_Clause)
+    assert d.txt == 'end parallel for simd'
+
+def test_sections():
+    assert isinstance(parse(stmts='#$ omp sections private(i)'), OMP_Sections_Construct)
+    assert isinstance(parse(stmts='#$ omp section'), OMP_Section_Construct)
+    assert parse(stmts='#$ omp end sections nowait').txt == 'end sections nowait'
+
+def test_tasks():
+    d = parse(stmts='#$ omp task shared(a) untied')
+    assert isinstance(d, OMP_Task_Construct)
+    assert d.txt == 'task shared(a) untied'
+
+    d = parse(stmts='#$ omp taskloop simd grainsize(16)')
+    assert isinstance(d, OMP_TaskLoop_Construct)
+    assert d.txt == 'taskloop simd grainsize(16)'
+
+def test_critical():
+    assert parse(stmts='#$ omp critical (update)').txt == 'critical (update)'
+    assert parse(stmts='#$ omp end critical (update)').txt == 'end critical (update)'
+
+def test_metamodel_built_once():
+    parse(stmts='#$ omp parallel')
+    meta = get_metamodel(grammar, omp_classes)
+    parse(stmts='#$ omp end parallel')
+    assert get_metamodel(grammar, omp_classes) is meta
+
 ######################
 if __name__ == '__main__':
     test_parallel()
+    test_loop()
+    test_sections()
+    test_tasks()
+    test_critical()
+    test_metamodel_built_once()
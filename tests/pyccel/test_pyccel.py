@@ -294,6 +294,32 @@ def test_absolute_imports_in_project(language):
 
     compare_pyth_fort_output(pyth_out, fort_out)
 
+#------------------------------------------------------------------------------
+def test_package_translation(language):
+
+    base_dir = os.path.dirname(os.path.realpath(__file__))
+    path_dir = os.path.join(base_dir, "project_rel_imports")
+    pyth_out = get_python_output('runtest.py', cwd=path_dir)
+
+    compile_pyccel(path_dir, 'project', '--language={}'.format(language))
+    fort_out = get_python_output('runtest.py', cwd=path_dir)
+
+    compare_pyth_fort_output(pyth_out, fort_out)
+
+#------------------------------------------------------------------------------
+def test_multiple_files(language):
+
+    base_dir = os.path.dirname(os.path.realpath(__file__))
+    path_dir = os.path.join(base_dir, "project_abs_imports")
+    pyth_out = get_python_output('runtest.py', cwd=path_dir)
+
+    # Files are given in an order where the imported modules come last
+    compile_pyccel(path_dir, 'project/folder2/mod3.py', 'project/folder2/mod2.py '
+            'project/folder1/mod1.py --language={}'.format(language))
+    fort_out = get_python_output('runtest.py', cwd=path_dir)
+
+    compare_pyth_fort_output(pyth_out, fort_out)
+
 #------------------------------------------------------------------------------
 def test_rel_imports_python_accessible_folder(language):
     # pyccel is called on scripts/folder2/runtest_rel_imports.py from the scripts folder
@@ -330,6 +356,64 @@ def test_imports(language):
     pyccel_test("scripts/runtest_imports.py","scripts/funcs.py",
             language = language)
 
+#------------------------------------------------------------------------------
+def test_incremental_imports(language):
+    pyccel_test("scripts/runtest_imports.py","scripts/funcs.py",
+            pyccel_commands = "--incremental", language = language)
+
+    # A second build with unchanged inputs must not modify the executable
+    path_dir = get_abs_path("scripts")
+    exe_file = get_exe(get_abs_path("scripts/runtest_imports.py"))
+    exe_time = os.path.getmtime(exe_file)
+    compile_pyccel(path_dir, "runtest_imports.py", "--incremental --language="+language)
+    assert os.path.getmtime(exe_file) == exe_time
+
+#------------------------------------------------------------------------------
+def test_module_interface(language):
+    from pyccel.parser.parser import Parser
+
+    interface_file = get_abs_path("scripts/__pyccel__/funcs.pyccel")
+    if os.path.exists(interface_file):
+        os.remove(interface_file)
+
+    # The interfaces are only used with the caches
+    pyccel_test("scripts/runtest_imports.py","scripts/funcs.py",
+            language = language)
+    assert not os.path.isfile(interface_file)
+
+    # The interface of the imported module is saved during its translation
+    pyccel_test("scripts/runtest_imports.py","scripts/funcs.py",
+            pyccel_commands = "--incremental", language = language)
+    assert os.path.isfile(interface_file)
+
+    # and it is used instead of the module when the module is imported
+    parser = Parser(get_abs_path("scripts/runtest_imports.py"), use_interfaces = True)
+    parser.parse()
+    assert len(parser.sons) == 1
+    assert parser.sons[0].from_interface
+    assert 'sum_to_n' in parser.sons[0].namespace.functions
+
+    parser = Parser(get_abs_path("scripts/runtest_imports.py"))
+    parser.parse()
+    assert not parser.sons[0].from_interface
+
+#------------------------------------------------------------------------------
+def test_timings(language):
+    import json
+
+    path_dir = get_abs_path("scripts")
+    compile_pyccel(path_dir, "funcs.py",
+            "--timings __pyccel__/funcs_timings.json --language="+language)
+
+    with open(os.path.join(path_dir, "__pyccel__", "funcs_timings.json")) as f:
+        timings = json.load(f)
+
+    stages = [r['stage'] for r in timings['stages']]
+    for stage in ('import', 'syntax', 'semantic', 'codegen', 'compile', 'wrapper', 'link'):
+        assert stage in stages
+    assert all(r['time'] >= 0 for r in timings['stages'])
+    assert timings['total'] >= sum(r['time'] for r in timings['stages'])
+
 #------------------------------------------------------------------------------
 def test_folder_imports_python_accessible_folder(language):
     # pyccel is called on scripts/folder2/runtest_imports2.py from the scripts folder
@@ -381,6 +465,12 @@ def test_folder_imports(language):
 def test_funcs():
     pyccel_test("scripts/runtest_funcs.py")
 
+#------------------------------------------------------------------------------
+def test_funcs_jobs(language):
+    # The module and the program are compiled by the same graph of jobs
+    pyccel_test("scripts/runtest_funcs.py", pyccel_commands = "--jobs 4",
+            language = language)
+
 #------------------------------------------------------------------------------
 def test_inout_func():
     pyccel_test("scripts/runtest_inoutfunc.py")